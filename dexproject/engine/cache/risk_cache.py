@@ -9,7 +9,8 @@ Key Features:
 - Sub-50ms risk score retrieval for fast lane decisions
 - Intelligent cache warming based on trading patterns  
 - Multi-tier cache architecture (Memory + Redis)
-- Risk data staleness detection and refresh
+- Probabilistic early refresh of hot entries before they expire
+- Single-flight lookups and risk computations per token
 - Cache hit ratio optimization
 - Emergency risk overrides and blacklist support
 - Statistical risk pattern learning
@@ -19,17 +20,19 @@ File: dexproject/engine/cache/risk_cache.py
 """
 
 import asyncio
+import bisect
 import logging
+import math
+import random
 import time
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Tuple, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
 from enum import Enum
 import json
 import hashlib
-import statistics
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
 
 # Redis for persistent caching
 import redis.asyncio as redis
@@ -63,6 +66,19 @@ class RiskCacheLevel(Enum):
     DATABASE = "database"    # Database fallback (slow)
 
 
+# Upper bounds (ms) of the per-lookup latency histogram buckets
+LOOKUP_LATENCY_BUCKETS_MS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 50.0)
+
+# Early refresh: an entry is refreshed ahead of expiry when
+# -delta * beta * ln(U) >= seconds_to_expiry, U ~ Uniform(0, 1]. delta is the
+# entry's measured compute time, floored at EARLY_REFRESH_MIN_DELTA_SECONDS.
+EARLY_REFRESH_BETA = 1.0
+EARLY_REFRESH_MIN_DELTA_SECONDS = 60.0
+
+# Async callable computing fresh risk data for a token (None if unavailable)
+RiskFetcher = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+
 @dataclass
 class RiskCacheEntry:
     """Single risk cache entry with metadata."""
@@ -92,6 +108,7 @@ class RiskCacheEntry:
     
     # Performance tracking
     retrieval_time_ms: float = 0.0
+    compute_time_ms: float = 0.0
     cache_level: RiskCacheLevel = RiskCacheLevel.MEMORY
     
     def is_expired(self) -> bool:
@@ -134,6 +151,7 @@ class RiskCacheEntry:
             "source": self.source,
             "confidence": self.confidence,
             "retrieval_time_ms": self.retrieval_time_ms,
+            "compute_time_ms": self.compute_time_ms,
             "cache_level": self.cache_level.value
         }
     
@@ -160,6 +178,7 @@ class RiskCacheEntry:
             source=data["source"],
             confidence=data["confidence"],
             retrieval_time_ms=data["retrieval_time_ms"],
+            compute_time_ms=data.get("compute_time_ms", 0.0),
             cache_level=RiskCacheLevel(data["cache_level"])
         )
         return entry
@@ -172,6 +191,8 @@ class CacheStatistics:
     cache_misses: int = 0
     cache_refreshes: int = 0
     cache_evictions: int = 0
+    early_refreshes: int = 0
+    coalesced_requests: int = 0
     
     # Timing metrics
     avg_retrieval_time_ms: float = 0.0
@@ -180,9 +201,25 @@ class CacheStatistics:
     
     # Hit ratios by cache level
     memory_hits: int = 0
+    memory_misses: int = 0
     redis_hits: int = 0
     database_hits: int = 0
     
+    # Per-lookup latency histogram (hits and misses); last bucket is overflow
+    lookup_latency_counts: List[int] = field(
+        default_factory=lambda: [0] * (len(LOOKUP_LATENCY_BUCKETS_MS) + 1)
+    )
+    
+    def record_lookup_latency(self, latency_ms: float) -> None:
+        """Count one lookup in the latency histogram."""
+        self.lookup_latency_counts[bisect.bisect_left(LOOKUP_LATENCY_BUCKETS_MS, latency_ms)] += 1
+    
+    def get_latency_histogram(self) -> Dict[str, int]:
+        """Lookup counts keyed by bucket upper bound (ms)."""
+        labels = [f"<={bound}" for bound in LOOKUP_LATENCY_BUCKETS_MS]
+        labels.append(f">{LOOKUP_LATENCY_BUCKETS_MS[-1]}")
+        return dict(zip(labels, self.lookup_latency_counts))
+    
     def get_hit_ratio(self) -> float:
         """Calculate overall cache hit ratio."""
         total_requests = self.cache_hits + self.cache_misses
@@ -200,11 +237,17 @@ class CacheStatistics:
             "cache_misses": self.cache_misses,
             "cache_refreshes": self.cache_refreshes,
             "cache_evictions": self.cache_evictions,
+            "early_refreshes": self.early_refreshes,
+            "coalesced_requests": self.coalesced_requests,
+            "memory_hits": self.memory_hits,
+            "memory_misses": self.memory_misses,
+            "redis_hits": self.redis_hits,
             "hit_ratio_percent": round(self.get_hit_ratio(), 2),
             "memory_hit_ratio_percent": round(self.get_memory_hit_ratio(), 2),
             "avg_retrieval_time_ms": round(self.avg_retrieval_time_ms, 2),
             "max_retrieval_time_ms": round(self.max_retrieval_time_ms, 2),
-            "min_retrieval_time_ms": round(self.min_retrieval_time_ms, 2) if self.min_retrieval_time_ms != float('inf') else 0.0
+            "min_retrieval_time_ms": round(self.min_retrieval_time_ms, 2) if self.min_retrieval_time_ms != float('inf') else 0.0,
+            "lookup_latency_histogram_ms": self.get_latency_histogram()
         }
 
 
@@ -216,42 +259,53 @@ class FastRiskCache:
     - Multi-tier caching (Memory -> Redis -> Database)
     - Sub-50ms risk score retrieval for cached data
     - Intelligent cache warming based on trading patterns
-    - Risk data staleness detection and background refresh
-    - LRU eviction with access pattern optimization
+    - Probabilistic early refresh so hot entries never expire together
+    - Single-flight Redis lookups and risk computations per token
+    - O(1) LRU memory tier with size-bounded eviction
     - Emergency override system for known threats
     - Performance monitoring and optimization
     """
     
-    def __init__(self, chain_id: int):
+    def __init__(self, chain_id: int, risk_fetcher: Optional[RiskFetcher] = None):
         """
         Initialize fast risk cache for specific chain.
         
         Args:
             chain_id: Blockchain network identifier
+            risk_fetcher: Async callable computing risk data for a token,
+                used by the warming and refresh workers
         """
         self.chain_id = chain_id
+        self.risk_fetcher = risk_fetcher
         self.logger = logging.getLogger(f"{__name__}.chain_{chain_id}")
         
-        # Multi-tier cache storage
-        self.memory_cache: Dict[str, RiskCacheEntry] = {}
-        self.access_order: deque = deque()  # For LRU eviction
+        # Multi-tier cache storage; memory tier is kept in LRU order
+        # (least recently used first) so hits and evictions are O(1)
+        self.memory_cache: OrderedDict[str, RiskCacheEntry] = OrderedDict()
         self.redis_client: Optional[redis.Redis] = None
         
         # Cache configuration
         self.max_memory_entries = 10000  # Maximum entries in memory cache
         self.default_ttl_hours = 1       # Default cache TTL
-        self.stale_threshold_minutes = 30 # Consider data stale after this time
-        self.refresh_threshold_minutes = 45 # Background refresh trigger
+        self.early_refresh_beta = EARLY_REFRESH_BETA  # >1 refreshes earlier
+        self.early_refresh_min_delta_seconds = EARLY_REFRESH_MIN_DELTA_SECONDS
         
         # Performance tracking
         self.statistics = CacheStatistics()
         self.retrieval_times: deque = deque(maxlen=1000)  # Recent retrieval times
+        self._retrieval_time_sum = 0.0  # Running sum of retrieval_times
         
         # Cache warming and patterns
         self.access_patterns: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
         self.warming_queue: asyncio.Queue = asyncio.Queue(maxsize=1000)
         self.refresh_queue: asyncio.Queue = asyncio.Queue(maxsize=500)
         
+        # Single-flight: tokens queued or being computed, and in-flight
+        # fetches keyed by "redis:<cache_key>" / "compute:<token>"
+        self._warming_pending: Set[str] = set()
+        self._refresh_pending: Set[str] = set()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        
         # Emergency overrides
         self.blacklisted_tokens: Set[str] = set()
         self.whitelisted_tokens: Set[str] = set()
@@ -355,54 +409,46 @@ class FastRiskCache:
             override = await self._check_emergency_overrides(token_address)
             if override:
                 retrieval_time = (time.perf_counter() - start_time) * 1000
-                self._update_retrieval_stats(retrieval_time, CacheLevel.MEMORY)
+                self._update_retrieval_stats(retrieval_time, RiskCacheLevel.MEMORY)
                 return override
             
             # Try memory cache first (fastest)
             cache_key = f"risk:{self.chain_id}:{token_address}"
             
-            if cache_key in self.memory_cache:
-                entry = self.memory_cache[cache_key]
+            entry = self.memory_cache.get(cache_key)
+            if entry is not None:
                 entry.update_access()
                 
-                # Move to front of access order for LRU
-                if cache_key in self.access_order:
-                    self.access_order.remove(cache_key)
-                self.access_order.append(cache_key)
+                # Mark as most recently used
+                self.memory_cache.move_to_end(cache_key)
                 
                 retrieval_time = (time.perf_counter() - start_time) * 1000
                 self._update_retrieval_stats(retrieval_time, RiskCacheLevel.MEMORY)
                 
-                # Trigger background refresh if stale
-                if entry.is_stale(self.stale_threshold_minutes):
+                # Refresh hot entries ahead of expiry
+                if self._should_refresh_early(entry):
                     await self._queue_for_refresh(token_address)
                 
                 self.logger.debug(f"Memory cache hit for {token_address} ({retrieval_time:.1f}ms)")
                 return self._entry_to_risk_data(entry)
             
-            # Try Redis cache (fast)
+            self.statistics.memory_misses += 1
+            
+            # Try Redis cache (fast); concurrent misses share one fetch
             if self.redis_client:
-                redis_data = await self.redis_client.get(cache_key)
-                if redis_data:
-                    try:
-                        entry_data = json.loads(redis_data)
-                        entry = RiskCacheEntry.from_dict(entry_data)
-                        
-                        # Store in memory cache for next time
-                        await self._store_in_memory_cache(entry)
-                        
-                        retrieval_time = (time.perf_counter() - start_time) * 1000
-                        self._update_retrieval_stats(retrieval_time, RiskCacheLevel.REDIS)
-                        
-                        # Trigger background refresh if stale
-                        if entry.is_stale(self.stale_threshold_minutes):
-                            await self._queue_for_refresh(token_address)
-                        
-                        self.logger.debug(f"Redis cache hit for {token_address} ({retrieval_time:.1f}ms)")
-                        return self._entry_to_risk_data(entry)
-                        
-                    except (json.JSONDecodeError, Exception) as e:
-                        self.logger.error(f"Failed to deserialize Redis cache entry: {e}")
+                entry = await self._single_flight(
+                    f"redis:{cache_key}",
+                    lambda: self._load_from_redis(cache_key)
+                )
+                if entry is not None:
+                    retrieval_time = (time.perf_counter() - start_time) * 1000
+                    self._update_retrieval_stats(retrieval_time, RiskCacheLevel.REDIS)
+                    
+                    if self._should_refresh_early(entry):
+                        await self._queue_for_refresh(token_address)
+                    
+                    self.logger.debug(f"Redis cache hit for {token_address} ({retrieval_time:.1f}ms)")
+                    return self._entry_to_risk_data(entry)
             
             # Cache miss - queue for warming if this token is frequently accessed
             await self._record_access_pattern(token_address)
@@ -410,6 +456,7 @@ class FastRiskCache:
             
             retrieval_time = (time.perf_counter() - start_time) * 1000
             self.statistics.cache_misses += 1
+            self.statistics.record_lookup_latency(retrieval_time)
             
             self.logger.debug(f"Cache miss for {token_address} ({retrieval_time:.1f}ms)")
             return None
@@ -423,7 +470,8 @@ class FastRiskCache:
         token_address: str, 
         risk_data: Dict[str, Any],
         source: str = "risk_engine",
-        ttl_hours: Optional[int] = None
+        ttl_hours: Optional[int] = None,
+        compute_time_ms: float = 0.0
     ) -> bool:
         """
         Store risk data in cache with specified TTL.
@@ -433,6 +481,8 @@ class FastRiskCache:
             risk_data: Risk assessment data
             source: Data source identifier
             ttl_hours: Cache TTL in hours (uses default if None)
+            compute_time_ms: Time taken to compute risk_data, used to
+                schedule its early refresh
             
         Returns:
             True if stored successfully, False otherwise
@@ -457,7 +507,8 @@ class FastRiskCache:
                 is_blacklisted=risk_data.get("is_blacklisted", False),
                 expires_at=datetime.now(timezone.utc) + timedelta(hours=ttl),
                 source=source,
-                confidence=risk_data.get("confidence", 1.0)
+                confidence=risk_data.get("confidence", 1.0),
+                compute_time_ms=compute_time_ms
             )
             
             # Store in memory cache
@@ -497,10 +548,7 @@ class FastRiskCache:
             cache_key = f"risk:{self.chain_id}:{token_address}"
             
             # Remove from memory cache
-            if cache_key in self.memory_cache:
-                del self.memory_cache[cache_key]
-                if cache_key in self.access_order:
-                    self.access_order.remove(cache_key)
+            self.memory_cache.pop(cache_key, None)
             
             # Remove from Redis cache
             if self.redis_client:
@@ -609,14 +657,15 @@ class FastRiskCache:
             },
             "configuration": {
                 "default_ttl_hours": self.default_ttl_hours,
-                "stale_threshold_minutes": self.stale_threshold_minutes,
-                "refresh_threshold_minutes": self.refresh_threshold_minutes,
+                "early_refresh_beta": self.early_refresh_beta,
+                "early_refresh_min_delta_seconds": self.early_refresh_min_delta_seconds,
                 "max_memory_entries": self.max_memory_entries
             },
             "performance": self.statistics.to_dict(),
             "queues": {
                 "warming_queue_size": self.warming_queue.qsize(),
-                "refresh_queue_size": self.refresh_queue.qsize()
+                "refresh_queue_size": self.refresh_queue.qsize(),
+                "in_flight": len(self._in_flight)
             }
         }
     
@@ -625,31 +674,24 @@ class FastRiskCache:
     # =========================================================================
     
     async def _store_in_memory_cache(self, entry: RiskCacheEntry) -> None:
-        """Store entry in memory cache with LRU eviction."""
+        """Store entry in memory cache as most recently used, evicting LRU entries."""
         cache_key = entry.get_cache_key()
         
-        # Check if cache is full and needs eviction
-        if len(self.memory_cache) >= self.max_memory_entries:
-            await self._evict_lru_entries(1)
+        if cache_key in self.memory_cache:
+            self.memory_cache.move_to_end(cache_key)
+        elif len(self.memory_cache) >= self.max_memory_entries:
+            await self._evict_lru_entries(len(self.memory_cache) - self.max_memory_entries + 1)
         
-        # Store entry
         self.memory_cache[cache_key] = entry
-        
-        # Update access order
-        if cache_key in self.access_order:
-            self.access_order.remove(cache_key)
-        self.access_order.append(cache_key)
     
     async def _evict_lru_entries(self, count: int) -> None:
         """Evict least recently used entries from memory cache."""
         evicted = 0
         
-        while evicted < count and self.access_order:
-            lru_key = self.access_order.popleft()
-            if lru_key in self.memory_cache:
-                del self.memory_cache[lru_key]
-                evicted += 1
-                self.statistics.cache_evictions += 1
+        while evicted < count and self.memory_cache:
+            self.memory_cache.popitem(last=False)
+            evicted += 1
+            self.statistics.cache_evictions += 1
         
         if evicted > 0:
             self.logger.debug(f"Evicted {evicted} LRU entries from memory cache")
@@ -709,7 +751,11 @@ class FastRiskCache:
             self.statistics.database_hits += 1
         
         # Update timing stats
+        self.statistics.record_lookup_latency(retrieval_time_ms)
+        if len(self.retrieval_times) == self.retrieval_times.maxlen:
+            self._retrieval_time_sum -= self.retrieval_times[0]
         self.retrieval_times.append(retrieval_time_ms)
+        self._retrieval_time_sum += retrieval_time_ms
         
         if retrieval_time_ms > self.statistics.max_retrieval_time_ms:
             self.statistics.max_retrieval_time_ms = retrieval_time_ms
@@ -717,9 +763,8 @@ class FastRiskCache:
         if retrieval_time_ms < self.statistics.min_retrieval_time_ms:
             self.statistics.min_retrieval_time_ms = retrieval_time_ms
         
-        # Calculate rolling average
-        if self.retrieval_times:
-            self.statistics.avg_retrieval_time_ms = statistics.mean(self.retrieval_times)
+        # Rolling average over the recent window (running sum, O(1))
+        self.statistics.avg_retrieval_time_ms = self._retrieval_time_sum / len(self.retrieval_times)
     
     async def _record_access_pattern(self, token_address: str) -> None:
         """Record access pattern for cache warming decisions."""
@@ -740,7 +785,12 @@ class FastRiskCache:
                 ]
                 
                 if len(recent_accesses) >= 2:  # 2+ recent accesses
-                    await self.warming_queue.put(token_address)
+                    # Skip tokens already queued or being computed
+                    if token_address in self._warming_pending:
+                        self.statistics.coalesced_requests += 1
+                        return
+                    self.warming_queue.put_nowait(token_address)
+                    self._warming_pending.add(token_address)
         
         except asyncio.QueueFull:
             pass  # Queue full, skip warming
@@ -748,15 +798,122 @@ class FastRiskCache:
             self.logger.error(f"Error queuing for warming: {e}")
     
     async def _queue_for_refresh(self, token_address: str) -> None:
-        """Queue token for background refresh."""
+        """Queue token for background refresh (once until it is processed)."""
         try:
+            if token_address in self._refresh_pending:
+                self.statistics.coalesced_requests += 1
+                return
             if not self.refresh_queue.full():
-                await self.refresh_queue.put(token_address)
+                self.refresh_queue.put_nowait(token_address)
+                self._refresh_pending.add(token_address)
+                self.statistics.early_refreshes += 1
         except asyncio.QueueFull:
             pass  # Queue full, skip refresh
         except Exception as e:
             self.logger.error(f"Error queuing for refresh: {e}")
     
+    def _should_refresh_early(self, entry: RiskCacheEntry) -> bool:
+        """
+        Decide whether a cache hit should trigger a background refresh.
+        
+        Probabilistic early expiration (XFetch): the chance of refreshing
+        grows as the entry nears expiry and with how often it is read, so
+        hot tokens are refreshed ahead of time by a single reader while
+        cold ones are left to expire.
+        
+        Args:
+            entry: Cache entry that was just hit
+            
+        Returns:
+            True if the entry should be refreshed now
+        """
+        remaining = (entry.expires_at - datetime.now(timezone.utc)).total_seconds()
+        if remaining <= 0:
+            return True
+        
+        delta = max(entry.compute_time_ms / 1000, self.early_refresh_min_delta_seconds)
+        return -delta * self.early_refresh_beta * math.log(1.0 - random.random()) >= remaining
+    
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fetch once per key; concurrent callers await the same result.
+        
+        Args:
+            key: In-flight key
+            fetch: Zero-argument coroutine factory performing the work
+            
+        Returns:
+            Result of fetch, or None if it failed or was cancelled
+        """
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.statistics.coalesced_requests += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    return None  # Leader was cancelled, not this caller
+                raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        result = None
+        try:
+            result = await fetch()
+        except Exception as e:
+            self.logger.error(f"Single-flight fetch {key} failed: {e}")
+        finally:
+            self._in_flight.pop(key, None)
+            if not future.done():
+                # Set even when the leader is cancelled so waiters never hang
+                future.set_result(result)
+        return result
+    
+    async def _load_from_redis(self, cache_key: str) -> Optional[RiskCacheEntry]:
+        """Load an entry from Redis into the memory tier."""
+        redis_data = await self.redis_client.get(cache_key)
+        if not redis_data:
+            return None
+        
+        try:
+            entry = RiskCacheEntry.from_dict(json.loads(redis_data))
+        except (json.JSONDecodeError, Exception) as e:
+            self.logger.error(f"Failed to deserialize Redis cache entry: {e}")
+            return None
+        
+        # Store in memory cache for next time
+        await self._store_in_memory_cache(entry)
+        return entry
+    
+    async def _compute_risk(self, token_address: str, source: str) -> bool:
+        """
+        Compute and store fresh risk data for a token, once per token at a time.
+        
+        Args:
+            token_address: Token to compute
+            source: Data source recorded on the cache entry
+            
+        Returns:
+            True if fresh data was stored, False otherwise
+        """
+        if self.risk_fetcher is None:
+            self.logger.debug(f"No risk fetcher configured, skipping {source} for {token_address}")
+            return False
+        
+        async def compute() -> bool:
+            started = time.perf_counter()
+            risk_data = await self.risk_fetcher(token_address)
+            if risk_data is None:
+                return False
+            return await self.store_risk_data(
+                token_address,
+                risk_data,
+                source=source,
+                compute_time_ms=(time.perf_counter() - started) * 1000
+            )
+        
+        return bool(await self._single_flight(f"compute:{token_address}", compute))
+    
     # =========================================================================
     # PRIVATE METHODS - Background Tasks
     # =========================================================================
@@ -773,11 +930,13 @@ class FastRiskCache:
                     timeout=10.0
                 )
                 
-                # TODO: Implement actual risk data fetching from risk engine
-                # For now, simulate warming
-                self.logger.debug(f"Would warm cache for token: {token_address}")
-                
-                await asyncio.sleep(0.1)  # Prevent tight loop
+                try:
+                    # Another caller may have filled the entry since it was queued
+                    entry = self.memory_cache.get(f"risk:{self.chain_id}:{token_address}")
+                    if entry is None or entry.is_expired():
+                        await self._compute_risk(token_address, source="warming")
+                finally:
+                    self._warming_pending.discard(token_address)
                 
             except asyncio.TimeoutError:
                 continue  # Normal timeout, check is_active
@@ -801,12 +960,11 @@ class FastRiskCache:
                     timeout=30.0
                 )
                 
-                # TODO: Implement actual risk data refresh
-                # For now, simulate refresh
-                self.statistics.cache_refreshes += 1
-                self.logger.debug(f"Would refresh cache for token: {token_address}")
-                
-                await asyncio.sleep(0.1)  # Prevent tight loop
+                try:
+                    if await self._compute_risk(token_address, source="refresh"):
+                        self.statistics.cache_refreshes += 1
+                finally:
+                    self._refresh_pending.discard(token_address)
                 
             except asyncio.TimeoutError:
                 continue  # Normal timeout, check is_active
@@ -835,8 +993,6 @@ class FastRiskCache:
                 # Remove expired entries
                 for cache_key in expired_keys:
                     del self.memory_cache[cache_key]
-                    if cache_key in self.access_order:
-                        self.access_order.remove(cache_key)
                 
                 if expired_keys:
                     self.logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
@@ -15,13 +15,14 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 import websockets
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from web3.contract import Contract
 from web3.exceptions import Web3Exception, BlockNotFound, TransactionNotFound
 from eth_utils import is_address, to_checksum_address
 
 from .config import config, ChainConfig
-from .utils import ProviderManager, setup_logging, get_token_info, get_latest_block
+from .utils import ProviderManager, setup_logging, get_latest_block
+from .multicall import MulticallRequest, fetch_token_metadata
 from . import EngineStatus
 
 logger = logging.getLogger(__name__)
@@ -215,7 +216,7 @@ class PairDiscoveryService:
         
         try:
             # Initialize Web3 connection using provider manager
-            w3 = await self.provider_manager.get_web3()
+            w3 = await self.provider_manager.get_async_web3()
             if not w3:
                 raise Exception("Failed to establish Web3 connection")
             
@@ -348,8 +349,13 @@ class PairDiscoveryService:
                 await asyncio.sleep(1)
     
     async def _process_event_batch(self, events: List[tuple]) -> None:
-        """Process a batch of events efficiently."""
-        for event_type, event_data in events:
+        """
+        Process a batch of events efficiently.
+        
+        Events are handled concurrently so their RPC reads land in the same
+        JSON-RPC batch window and share HTTP requests.
+        """
+        async def process(event_type: str, event_data: Dict[str, Any]) -> None:
             try:
                 if event_type == "log_event":
                     await self._handle_factory_event(event_data)
@@ -358,6 +364,8 @@ class PairDiscoveryService:
                 
             except Exception as e:
                 self.logger.error(f"Error processing {event_type}: {e}")
+        
+        await asyncio.gather(*(process(event_type, event_data) for event_type, event_data in events))
     
     async def _handle_factory_event(self, log_data: Dict[str, Any]) -> None:
         """Handle Uniswap V3 factory events with enhanced error handling."""
@@ -380,7 +388,7 @@ class PairDiscoveryService:
         
         try:
             # Decode event using provider manager
-            async def decode_event(w3: Web3) -> NewPairEvent:
+            async def decode_event(w3: AsyncWeb3) -> NewPairEvent:
                 # Create factory contract instance
                 factory_contract = w3.eth.contract(
                     address=self.chain_config.uniswap_v3_factory,
@@ -389,10 +397,10 @@ class PairDiscoveryService:
                 
                 # Get transaction receipt
                 tx_hash = log_data["transactionHash"]
-                receipt = w3.eth.get_transaction_receipt(tx_hash)
+                receipt = await w3.eth.get_transaction_receipt(tx_hash)
                 
                 # Process the event
-                events = factory_contract.events.PoolCreated().processReceipt(receipt)
+                events = factory_contract.events.PoolCreated().process_receipt(receipt)
                 
                 if not events:
                     raise Exception("No PoolCreated events found in receipt")
@@ -415,8 +423,8 @@ class PairDiscoveryService:
                 
                 return pair_event
             
-            # Decode the event
-            pair_event = await self.provider_manager.execute_with_failover(decode_event)
+            # Decode the event (receipt fetch joins the current RPC batch)
+            pair_event = await self.provider_manager.execute_batched(decode_event)
             if not pair_event:
                 self.logger.warning("Failed to decode PoolCreated event")
                 return
@@ -470,38 +478,50 @@ class PairDiscoveryService:
         )
     
     async def _enrich_pair_event(self, pair_event: NewPairEvent) -> None:
-        """Enrich pair event with comprehensive token metadata."""
+        """
+        Enrich pair event with comprehensive token metadata.
+        
+        Both tokens' metadata and the pool's initial liquidity are read in a
+        single Multicall3 call; each call fails independently. The eth_call
+        joins the current JSON-RPC batch, so pairs enriched together share
+        one HTTP request.
+        """
         try:
-            # Get token info for both tokens in parallel
-            token0_info, token1_info = await asyncio.gather(
-                get_token_info(self.provider_manager, pair_event.token0_address),
-                get_token_info(self.provider_manager, pair_event.token1_address),
-                return_exceptions=True
+            liquidity_request = MulticallRequest(
+                pair_event.pool_address, 'liquidity()', ('uint128',), default=0
+            )
+            token_metadata, (liquidity_result,) = await fetch_token_metadata(
+                self.provider_manager.execute_batched,
+                [pair_event.token0_address, pair_event.token1_address],
+                extra_requests=[liquidity_request]
             )
             
+            token0_info = token_metadata.get(to_checksum_address(pair_event.token0_address))
+            token1_info = token_metadata.get(to_checksum_address(pair_event.token1_address))
+            
             # Process token0 info
-            if isinstance(token0_info, dict):
-                pair_event.token0_symbol = token0_info.get("symbol", "UNKNOWN")
-                pair_event.token0_decimals = token0_info.get("decimals", 18)
+            if token0_info:
+                pair_event.token0_symbol = token0_info["symbol"]
+                pair_event.token0_decimals = token0_info["decimals"]
             else:
                 pair_event.token0_symbol = "UNKNOWN"
                 pair_event.token0_decimals = 18
-                self.logger.debug(f"Failed to get token0 info: {token0_info}")
+                self.logger.debug(f"Failed to get token0 info for {pair_event.token0_address}")
             
             # Process token1 info
-            if isinstance(token1_info, dict):
-                pair_event.token1_symbol = token1_info.get("symbol", "UNKNOWN")
-                pair_event.token1_decimals = token1_info.get("decimals", 18)
+            if token1_info:
+                pair_event.token1_symbol = token1_info["symbol"]
+                pair_event.token1_decimals = token1_info["decimals"]
             else:
                 pair_event.token1_symbol = "UNKNOWN"
                 pair_event.token1_decimals = 18
-                self.logger.debug(f"Failed to get token1 info: {token1_info}")
+                self.logger.debug(f"Failed to get token1 info for {pair_event.token1_address}")
             
-            # Try to get initial liquidity (optional, might fail for new pools)
-            try:
-                await self._get_initial_liquidity(pair_event)
-            except Exception as e:
-                self.logger.debug(f"Could not get initial liquidity for new pair: {e}")
+            # Initial liquidity is optional (might not be set yet for new pools).
+            # This is a rough approximation - actual USD value calculation
+            # would require price feeds
+            if liquidity_result.success and liquidity_result.value > 0:
+                pair_event.initial_liquidity_usd = Decimal(str(liquidity_result.value))
                 
         except Exception as e:
             self.logger.error(f"Error enriching pair event: {e}")
@@ -511,29 +531,6 @@ class PairDiscoveryService:
             pair_event.token0_decimals = 18
             pair_event.token1_decimals = 18
     
-    async def _get_initial_liquidity(self, pair_event: NewPairEvent) -> None:
-        """Get initial liquidity for the pool (if available)."""
-        async def get_liquidity(w3: Web3) -> Optional[Decimal]:
-            pool_contract = w3.eth.contract(
-                address=pair_event.pool_address,
-                abi=self.pool_abi
-            )
-            
-            try:
-                liquidity = pool_contract.functions.liquidity().call()
-                if liquidity > 0:
-                    # This is a rough approximation - actual USD value calculation 
-                    # would require price feeds
-                    return Decimal(str(liquidity))
-            except:
-                pass
-            
-            return None
-        
-        liquidity = await self.provider_manager.execute_with_failover(get_liquidity)
-        if liquidity:
-            pair_event.initial_liquidity_usd = liquidity
-    
     async def _http_polling_task(self) -> None:
         """HTTP polling fallback for missed events."""
         self.logger.info("Starting HTTP polling fallback task")
@@ -549,8 +546,8 @@ class PairDiscoveryService:
     
     async def _poll_for_missed_events(self) -> None:
         """Poll for events that may have been missed via WebSocket."""
-        async def poll_events(w3: Web3) -> None:
-            current_block = w3.eth.block_number
+        async def poll_events(w3: AsyncWeb3) -> None:
+            current_block = await w3.eth.block_number
             
             # Look back a few blocks to catch missed events
             from_block = max(self.last_processed_block - 10, 0)
@@ -566,10 +563,10 @@ class PairDiscoveryService:
             
             # Get recent PoolCreated events
             try:
-                events = factory_contract.events.PoolCreated.createFilter(
-                    fromBlock=from_block,
-                    toBlock=current_block
-                ).get_all_entries()
+                events = await factory_contract.events.PoolCreated.get_logs(
+                    from_block=from_block,
+                    to_block=current_block
+                )
                 
                 for event in events:
                     # Create synthetic log data for processing
@@ -590,7 +587,7 @@ class PairDiscoveryService:
             except Exception as e:
                 self.logger.debug(f"HTTP polling query failed: {e}")
         
-        await self.provider_manager.execute_with_failover(poll_events)
+        await self.provider_manager.execute_with_retry(poll_events)
     
     async def _log_performance_metrics(self) -> None:
         """Log performance metrics for monitoring."""
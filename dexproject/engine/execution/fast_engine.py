@@ -33,11 +33,23 @@ from ..utils import ProviderManager, safe_decimal, format_currency
 from .gas_optimizer import GasOptimizationEngine as GasOptimizer
 from .nonce_manager import NonceManager
 from ..cache.risk_cache import FastRiskCache
+from ..smart_lane import RiskCategory as SmartLaneRiskCategory
+from ..smart_lane.pipeline import SmartLanePipeline
 
 
 logger = logging.getLogger(__name__)
 
 
+# Smart Lane categories recorded on fast risk cache entries
+RISK_CACHE_CATEGORIES = {
+    SmartLaneRiskCategory.HONEYPOT_DETECTION: "honeypot",
+    SmartLaneRiskCategory.LIQUIDITY_ANALYSIS: "liquidity",
+    SmartLaneRiskCategory.CONTRACT_SECURITY: "contract",
+    SmartLaneRiskCategory.TECHNICAL_ANALYSIS: "technical",
+    SmartLaneRiskCategory.MARKET_STRUCTURE: "market",
+}
+
+
 class FastLaneStatus(Enum):
     """Fast lane engine status states."""
     STOPPED = "STOPPED"
@@ -133,6 +145,7 @@ class FastLaneExecutionEngine:
         self.gas_optimizer: Optional[GasOptimizer] = None
         self.nonce_manager: Optional[NonceManager] = None
         self.risk_cache: Optional[FastRiskCache] = None
+        self.risk_pipeline: Optional[SmartLanePipeline] = None
         self.redis_client: Optional[redis.Redis] = None
         
         # Wallet configuration
@@ -227,6 +240,10 @@ class FastLaneExecutionEngine:
             await self._wait_for_pending_executions(timeout_seconds=10)
             
             # Close connections
+            if self.risk_cache:
+                await self.risk_cache.stop()
+            if self.risk_pipeline:
+                await self.risk_pipeline.shutdown()
             if self.redis_client:
                 await self.redis_client.close()
             
@@ -356,8 +373,12 @@ class FastLaneExecutionEngine:
         self.nonce_manager = NonceManager(chain_id=self.chain_id, web3=self.web3)
         await self.nonce_manager.start()
         
-        # Fast risk cache
-        self.risk_cache = FastRiskCache(chain_id=self.chain_id)
+        # Fast risk cache, warmed and refreshed from Smart Lane risk analysis
+        self.risk_pipeline = SmartLanePipeline(
+            chain_id=self.chain_id,
+            read_executor=self.provider_manager.execute_with_retry
+        )
+        self.risk_cache = FastRiskCache(chain_id=self.chain_id, risk_fetcher=self._fetch_token_risk)
         await self.risk_cache.start()
         
         # Redis connection
@@ -370,6 +391,59 @@ class FastLaneExecutionEngine:
         
         self.logger.debug("All components initialized successfully")
     
+    async def _fetch_token_risk(self, token_address: str) -> Optional[Dict[str, Any]]:
+        """
+        Compute risk data for the fast risk cache with the Smart Lane pipeline.
+        
+        Runs at background priority, so cache warming never delays analyses
+        of held positions or new pairs.
+        
+        Args:
+            token_address: Token to assess
+            
+        Returns:
+            Risk data in the FastRiskCache format, or None if unavailable
+        """
+        try:
+            analysis = await self.risk_pipeline.analyze_token(
+                token_address, context={'cache_warming': True}
+            )
+        except Exception as e:
+            self.logger.debug(f"Risk analysis unavailable for {token_address}: {e}")
+            return None
+        
+        if not analysis.risk_scores:
+            return None
+        
+        threshold = self.risk_pipeline.config.critical_risk_threshold
+        
+        def category_score(category: SmartLaneRiskCategory) -> float:
+            risk_score = analysis.risk_scores.get(category)
+            return risk_score.score if risk_score else 0.0
+        
+        overall = analysis.overall_risk_score
+        if overall >= 0.8:
+            risk_level = "critical"
+        elif overall >= 0.6:
+            risk_level = "high"
+        elif overall >= 0.3:
+            risk_level = "medium"
+        else:
+            risk_level = "low"
+        
+        return {
+            "overall_risk_score": overall * 100,
+            "risk_level": risk_level,
+            "risk_categories": {
+                name: analysis.risk_scores[category].score * 100
+                for category, name in RISK_CACHE_CATEGORIES.items()
+                if category in analysis.risk_scores
+            },
+            "is_honeypot": category_score(SmartLaneRiskCategory.HONEYPOT_DETECTION) >= threshold,
+            "is_scam": category_score(SmartLaneRiskCategory.CONTRACT_SECURITY) >= threshold,
+            "confidence": analysis.overall_confidence,
+        }
+    
     async def _validate_wallet(self) -> bool:
         """Validate wallet configuration and connectivity."""
         try:
@@ -20,6 +20,7 @@ from web3 import Web3
 from web3.contract import Contract
 
 from engine.mempool.monitor import MempoolTransaction, MempoolEventType
+from engine.mempool.decoder import SwapParams, get_calldata_decoder
 from shared.schemas import ChainType
 
 
@@ -111,25 +112,8 @@ class MempoolAnalyzer:
         self.token_cache: Dict[str, Dict] = {}
         self.pair_cache: Dict[str, Dict] = {}
         
-        # Known function signatures for fast identification
-        self.dex_function_sigs = {
-            # Uniswap V2 Router
-            '0x7ff36ab5': 'swapExactETHForTokens',
-            '0x18cbafe5': 'swapExactTokensForETH',
-            '0x38ed1739': 'swapExactTokensForTokens',
-            '0x8803dbee': 'swapTokensForExactTokens',
-            '0xf305d719': 'addLiquidityETH',
-            '0xe8e33700': 'addLiquidity',
-            '0x02751cec': 'removeLiquidityETH',
-            '0xbaa2abde': 'removeLiquidity',
-            
-            # Uniswap V3 Router
-            '0x414bf389': 'exactInputSingle',
-            '0xc04b8d59': 'exactInput',
-            '0xdb3e2198': 'exactOutputSingle',
-            '0x09b81346': 'exactOutput',
-            '0xac9650d8': 'multicall',
-        }
+        # Shared selector-indexed decoder (calldata is decoded once at ingest)
+        self.decoder = get_calldata_decoder()
         
         # Performance tracking
         self.stats = {
@@ -199,15 +183,11 @@ class MempoolAnalyzer:
         Returns:
             TransactionType enum value
         """
-        if not transaction.input_data or len(transaction.input_data) < 10:
-            return TransactionType.NON_DEX
+        swap_params = self._get_swap_params(transaction)
         
-        # Extract function signature (first 4 bytes)
-        func_sig = transaction.input_data[:10].lower()
-        
-        # Check against known DEX function signatures
-        if func_sig in self.dex_function_sigs:
-            func_name = self.dex_function_sigs[func_sig]
+        # Known router function, decoded via the selector table
+        if swap_params is not None:
+            func_name = swap_params.function_name
             
             # Map function names to transaction types
             if 'swapExact' in func_name and 'ETH' in func_name and 'Tokens' in func_name:
@@ -224,6 +204,7 @@ class MempoolAnalyzer:
                 return TransactionType.REMOVE_LIQUIDITY
             elif func_name == 'multicall':
                 return TransactionType.MULTICALL
+            return TransactionType.UNKNOWN_DEX
             
         # Check if targeting known DEX router (fallback identification)
         if transaction.to_address:
@@ -268,40 +249,33 @@ class MempoolAnalyzer:
             logger.debug(f"Error in DEX transaction analysis: {e}")
             analysis.confidence_score = 0.0
     
+    def _get_swap_params(self, transaction: MempoolTransaction) -> Optional[SwapParams]:
+        """
+        Get the structured swap parameters for a transaction.
+        
+        Uses the parameters attached at ingest when present; otherwise the
+        shared decoder (memoized by transaction hash) decodes them.
+        """
+        if transaction.swap_params is not None:
+            return transaction.swap_params
+        return self.decoder.decode(transaction)
+    
     async def _decode_transaction_params(self, transaction: MempoolTransaction, analysis: TransactionAnalysis) -> None:
         """
-        Decode transaction parameters to extract token addresses and amounts.
+        Populate token addresses and amounts from the decoded swap parameters.
         
-        This is a simplified implementation - in production, you'd want to use
-        proper ABI decoding for accurate parameter extraction.
+        Args:
+            transaction: Transaction to analyze
+            analysis: Analysis object to populate
         """
-        try:
-            input_data = transaction.input_data
-            
-            if analysis.transaction_type == TransactionType.SWAP_EXACT_ETH_FOR_TOKENS:
-                # Extract amountOutMin and path from function call
-                # Simplified - proper ABI decoding would be more accurate
-                if len(input_data) >= 138:  # Minimum length for this function
-                    # Amount out min is typically at offset 32-64
-                    analysis.estimated_amount_out = int(input_data[74:138], 16)
-                    # Token address is in the path (last 40 chars of path)
-                    if len(input_data) >= 202:
-                        analysis.target_token = '0x' + input_data[162:202].lower()
-                
-            elif analysis.transaction_type == TransactionType.SWAP_EXACT_TOKENS_FOR_TOKENS:
-                # Extract amounts and token addresses from path
-                if len(input_data) >= 202:
-                    analysis.estimated_amount_in = int(input_data[10:74], 16)
-                    analysis.estimated_amount_out = int(input_data[74:138], 16)
-                    # Extract token addresses from path
-                    analysis.input_token = '0x' + input_data[202:242].lower()
-                    if len(input_data) >= 282:
-                        analysis.target_token = '0x' + input_data[242:282].lower()
-            
-            # For other transaction types, add similar decoding logic
-            
-        except (ValueError, IndexError) as e:
-            logger.debug(f"Error decoding transaction parameters: {e}")
+        swap_params = self._get_swap_params(transaction)
+        if swap_params is None:
+            return
+        
+        analysis.estimated_amount_in = swap_params.amount_in
+        analysis.estimated_amount_out = swap_params.amount_out
+        analysis.input_token = swap_params.token_in
+        analysis.target_token = swap_params.token_out
     
     async def _estimate_price_impact(self, chain_id: int, token_address: str, amount_in: int) -> float:
         """
@@ -372,7 +346,7 @@ class MempoolAnalyzer:
             analysis.is_front_run_opportunity = True
         
         # Flash loan detection (simplified)
-        if transaction.input_data and len(transaction.input_data) > 1000:
+        if len(transaction.calldata) > 500:
             # Complex transaction - might be flash loan
             risk_flags.add(RiskFlag.FLASH_LOAN)
             risk_score += 0.2
@@ -0,0 +1,400 @@
+"""
+Selector-Indexed Calldata Decoder
+
+This module decodes DEX router calldata once, when a pending transaction is
+ingested, and hands structured swap parameters to every downstream consumer
+(monitor classification, MEV protection and the Fast Lane analyzer) instead of
+each of them re-parsing the same hex string.
+
+Key Features:
+- Precomputed 4-byte selector table for Uniswap V2/V3, SushiSwap and Aerodrome
+- Direct 32-byte word decoding of raw calldata bytes (no ABI round trip)
+- Decoded swap parameters memoized by transaction hash (bounded LRU)
+- Router address lookup to tell V2 forks (SushiSwap) apart from Uniswap
+
+File: dexproject/engine/mempool/decoder.py
+Django App: N/A (Pure engine component)
+"""
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from .records import CompactTransaction
+
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# SELECTOR TABLE
+# =============================================================================
+
+class CalldataKind(str, Enum):
+    """Kind of DEX router call identified from the function selector."""
+    SWAP = "swap"
+    ADD_LIQUIDITY = "add_liquidity"
+    REMOVE_LIQUIDITY = "remove_liquidity"
+    MULTICALL = "multicall"
+
+
+class SelectorSpec(NamedTuple):
+    """Static description of a known router function."""
+    function_name: str
+    dex_name: str
+    kind: CalldataKind
+    layout: Optional[str]  # Decoding routine, None if only classified
+
+
+SELECTOR_TABLE: Dict[bytes, SelectorSpec] = {
+    # Uniswap V2 Router (also SushiSwap and other V2 forks)
+    bytes.fromhex('7ff36ab5'): SelectorSpec('swapExactETHForTokens', 'uniswap_v2', CalldataKind.SWAP, 'v2_eth_in'),
+    bytes.fromhex('b6f9de95'): SelectorSpec('swapExactETHForTokensSupportingFeeOnTransferTokens', 'uniswap_v2', CalldataKind.SWAP, 'v2_eth_in'),
+    bytes.fromhex('fb3bdb41'): SelectorSpec('swapETHForExactTokens', 'uniswap_v2', CalldataKind.SWAP, 'v2_eth_in'),
+    bytes.fromhex('18cbafe5'): SelectorSpec('swapExactTokensForETH', 'uniswap_v2', CalldataKind.SWAP, 'v2_exact_in'),
+    bytes.fromhex('791ac947'): SelectorSpec('swapExactTokensForETHSupportingFeeOnTransferTokens', 'uniswap_v2', CalldataKind.SWAP, 'v2_exact_in'),
+    bytes.fromhex('38ed1739'): SelectorSpec('swapExactTokensForTokens', 'uniswap_v2', CalldataKind.SWAP, 'v2_exact_in'),
+    bytes.fromhex('5c11d795'): SelectorSpec('swapExactTokensForTokensSupportingFeeOnTransferTokens', 'uniswap_v2', CalldataKind.SWAP, 'v2_exact_in'),
+    bytes.fromhex('8803dbee'): SelectorSpec('swapTokensForExactTokens', 'uniswap_v2', CalldataKind.SWAP, 'v2_exact_out'),
+    bytes.fromhex('4a25d94a'): SelectorSpec('swapTokensForExactETH', 'uniswap_v2', CalldataKind.SWAP, 'v2_exact_out'),
+    bytes.fromhex('f305d719'): SelectorSpec('addLiquidityETH', 'uniswap_v2', CalldataKind.ADD_LIQUIDITY, 'v2_add_liquidity_eth'),
+    bytes.fromhex('e8e33700'): SelectorSpec('addLiquidity', 'uniswap_v2', CalldataKind.ADD_LIQUIDITY, 'v2_add_liquidity'),
+    bytes.fromhex('02751cec'): SelectorSpec('removeLiquidityETH', 'uniswap_v2', CalldataKind.REMOVE_LIQUIDITY, None),
+    bytes.fromhex('baa2abde'): SelectorSpec('removeLiquidity', 'uniswap_v2', CalldataKind.REMOVE_LIQUIDITY, None),
+
+    # Uniswap V3 SwapRouter
+    bytes.fromhex('414bf389'): SelectorSpec('exactInputSingle', 'uniswap_v3', CalldataKind.SWAP, 'v3_exact_in_single'),
+    bytes.fromhex('c04b8d59'): SelectorSpec('exactInput', 'uniswap_v3', CalldataKind.SWAP, 'v3_exact_in'),
+    bytes.fromhex('db3e2198'): SelectorSpec('exactOutputSingle', 'uniswap_v3', CalldataKind.SWAP, 'v3_exact_out_single'),
+    bytes.fromhex('f28c0498'): SelectorSpec('exactOutput', 'uniswap_v3', CalldataKind.SWAP, 'v3_exact_out'),
+
+    # Uniswap V3 SwapRouter02 (no deadline in the params struct)
+    bytes.fromhex('04e45aaf'): SelectorSpec('exactInputSingle', 'uniswap_v3', CalldataKind.SWAP, 'v3_02_exact_in_single'),
+    bytes.fromhex('b858183f'): SelectorSpec('exactInput', 'uniswap_v3', CalldataKind.SWAP, 'v3_02_exact_in'),
+    bytes.fromhex('09b81346'): SelectorSpec('exactOutput', 'uniswap_v3', CalldataKind.SWAP, 'v3_02_exact_out'),
+    bytes.fromhex('ac9650d8'): SelectorSpec('multicall', 'uniswap_v3', CalldataKind.MULTICALL, None),
+    bytes.fromhex('5ae401dc'): SelectorSpec('multicall', 'uniswap_v3', CalldataKind.MULTICALL, None),
+
+    # Uniswap Universal Router
+    bytes.fromhex('24856bc3'): SelectorSpec('execute', 'uniswap_universal', CalldataKind.MULTICALL, None),
+    bytes.fromhex('3593564c'): SelectorSpec('execute', 'uniswap_universal', CalldataKind.MULTICALL, None),
+
+    # Aerodrome Router (Base) - routes are (from, to, stable, factory) tuples
+    bytes.fromhex('903638a4'): SelectorSpec('swapExactETHForTokens', 'aerodrome', CalldataKind.SWAP, 'aero_eth_in'),
+    bytes.fromhex('3da5acba'): SelectorSpec('swapExactETHForTokensSupportingFeeOnTransferTokens', 'aerodrome', CalldataKind.SWAP, 'aero_eth_in'),
+    bytes.fromhex('c6b7f1b6'): SelectorSpec('swapExactTokensForETH', 'aerodrome', CalldataKind.SWAP, 'aero_exact_in'),
+    bytes.fromhex('12bc3aca'): SelectorSpec('swapExactTokensForETHSupportingFeeOnTransferTokens', 'aerodrome', CalldataKind.SWAP, 'aero_exact_in'),
+    bytes.fromhex('cac88ea9'): SelectorSpec('swapExactTokensForTokens', 'aerodrome', CalldataKind.SWAP, 'aero_exact_in'),
+    bytes.fromhex('88cd821e'): SelectorSpec('swapExactTokensForTokensSupportingFeeOnTransferTokens', 'aerodrome', CalldataKind.SWAP, 'aero_exact_in'),
+}
+
+# Known router deployments whose selectors are shared with another DEX
+ROUTER_DEX_NAMES: Dict[str, str] = {
+    '0x7a250d5630b4cf539739df2c5dacb4c659f2488d': 'uniswap_v2',  # Ethereum
+    '0xd9e1ce17f2641f24ae83637ab66a2cca9c378b9f': 'sushiswap',   # Ethereum
+    '0x1b02da8cb0d097eb8d57a175b88c7d8b47997506': 'sushiswap',   # Arbitrum / Polygon
+    '0xe592427a0aece92de3edee1f18e0157c05861564': 'uniswap_v3',  # SwapRouter
+    '0x68b3465833fb72a70ecdf485e0e4c7bd8665fc45': 'uniswap_v3',  # SwapRouter02
+    '0xcf77a3ba9a5ca399b7c97c74d54e5b1beb874e43': 'aerodrome',   # Base
+}
+
+DEFAULT_CACHE_SIZE = 20000
+
+_WORD = 32
+_ARGS = 4  # Arguments start after the 4-byte selector
+
+
+# =============================================================================
+# DECODED PARAMETERS
+# =============================================================================
+
+@dataclass
+class SwapParams:
+    """Structured parameters decoded from a DEX router call."""
+
+    function_name: str
+    dex_name: str
+    kind: CalldataKind
+    selector: bytes
+    path: Tuple[str, ...] = ()
+    amount_in: Optional[int] = None  # Wei (exact in, or max in for exact-out)
+    amount_out: Optional[int] = None  # Wei (min out, or exact out)
+    recipient: Optional[str] = None
+
+    @property
+    def is_swap(self) -> bool:
+        """True for swap calls (as opposed to liquidity or multicall)."""
+        return self.kind == CalldataKind.SWAP
+
+    @property
+    def token_in(self) -> Optional[str]:
+        """First token of the swap path."""
+        return self.path[0] if self.path else None
+
+    @property
+    def token_out(self) -> Optional[str]:
+        """Last token of the swap path."""
+        return self.path[-1] if self.path else None
+
+
+# =============================================================================
+# WORD DECODING
+# =============================================================================
+
+def _uint(data: bytes, offset: int) -> int:
+    """Read a 32-byte big-endian word at an absolute byte offset."""
+    word = data[offset:offset + _WORD]
+    if len(word) != _WORD:
+        raise ValueError("Calldata truncated")
+    return int.from_bytes(word, 'big')
+
+
+def _address(data: bytes, offset: int) -> str:
+    """Read an ABI-encoded address at an absolute byte offset."""
+    word = data[offset:offset + _WORD]
+    if len(word) != _WORD:
+        raise ValueError("Calldata truncated")
+    return '0x' + word[12:].hex()
+
+
+def _arg(index: int) -> int:
+    """Absolute offset of a head argument."""
+    return _ARGS + index * _WORD
+
+
+def _address_array(data: bytes, head_index: int) -> Tuple[str, ...]:
+    """Decode a dynamic address[] argument referenced from the head."""
+    start = _ARGS + _uint(data, _arg(head_index))
+    length = _uint(data, start)
+    return tuple(_address(data, start + _WORD * (i + 1)) for i in range(length))
+
+
+def _route_path(data: bytes, head_index: int) -> Tuple[str, ...]:
+    """Decode an Aerodrome Route[] argument into a token path."""
+    start = _ARGS + _uint(data, _arg(head_index))
+    length = _uint(data, start)
+    if not length:
+        return ()
+    route_size = 4 * _WORD
+    first = start + _WORD
+    path = [_address(data, first)]
+    for i in range(length):
+        path.append(_address(data, first + i * route_size + _WORD))
+    return tuple(path)
+
+
+def _packed_path(data: bytes, struct_start: int, reverse: bool) -> Tuple[str, ...]:
+    """Decode a V3 packed path (token, fee, token, ...) from a params struct."""
+    start = struct_start + _uint(data, struct_start)
+    length = _uint(data, start)
+    packed = data[start + _WORD:start + _WORD + length]
+    tokens = tuple('0x' + packed[i:i + 20].hex() for i in range(0, len(packed) - 19, 23))
+    return tokens[::-1] if reverse else tokens
+
+
+# =============================================================================
+# CALLDATA DECODER
+# =============================================================================
+
+class CalldataDecoder:
+    """
+    Selector-indexed router calldata decoder with per-hash memoization.
+
+    A transaction is decoded the first time any stage asks for it; later
+    stages (and re-broadcasts of the same hash from other providers) get the
+    cached SwapParams.
+    """
+
+    def __init__(self, max_cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initialize the decoder.
+
+        Args:
+            max_cache_size: Maximum number of decoded transactions to memoize
+        """
+        self.logger = logging.getLogger(f"{__name__}.CalldataDecoder")
+        self.max_cache_size = max_cache_size
+        self._cache: 'OrderedDict[str, SwapParams]' = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def decode(self, transaction: CompactTransaction) -> Optional[SwapParams]:
+        """
+        Decode a transaction's calldata into swap parameters.
+
+        Args:
+            transaction: Compact transaction record
+
+        Returns:
+            SwapParams for known router calls, None otherwise
+        """
+        spec = SELECTOR_TABLE.get(transaction.calldata[:4])
+        if spec is None:
+            return None
+
+        tx_hash = transaction.hash
+        cached = self._cache.get(tx_hash) if tx_hash else None
+        if cached is not None:
+            self._cache.move_to_end(tx_hash)
+            self._hits += 1
+            return cached
+
+        self._misses += 1
+        params = self._decode(spec, transaction)
+
+        if tx_hash:
+            self._cache[tx_hash] = params
+            if len(self._cache) > self.max_cache_size:
+                self._cache.popitem(last=False)
+
+        return params
+
+    def forget(self, tx_hash: str) -> None:
+        """Drop a memoized entry (e.g. when the transaction leaves the pool)."""
+        self._cache.pop(tx_hash, None)
+
+    def clear(self) -> None:
+        """Drop all memoized entries."""
+        self._cache.clear()
+
+    def _decode(self, spec: SelectorSpec, transaction: CompactTransaction) -> SwapParams:
+        """Build SwapParams for a known selector, tolerating malformed calldata."""
+        dex_name = spec.dex_name
+        if transaction.to_address:
+            dex_name = ROUTER_DEX_NAMES.get(transaction.to_address.lower(), dex_name)
+
+        params = SwapParams(
+            function_name=spec.function_name,
+            dex_name=dex_name,
+            kind=spec.kind,
+            selector=transaction.calldata[:4]
+        )
+
+        if spec.layout is not None:
+            try:
+                self._decode_layout(spec.layout, transaction, params)
+            except (ValueError, IndexError) as e:
+                self.logger.debug(f"Could not decode {spec.function_name} in {transaction.hash}: {e}")
+
+        return params
+
+    @staticmethod
+    def _decode_layout(layout: str, transaction: CompactTransaction, params: SwapParams) -> None:
+        """Decode calldata fields for the given argument layout."""
+        data = transaction.calldata
+
+        if layout == 'v2_eth_in':
+            # (amountOutMin | amountOut, path, to, deadline), ETH in via msg.value
+            params.amount_in = transaction.value_wei
+            params.amount_out = _uint(data, _arg(0))
+            params.recipient = _address(data, _arg(2))
+            params.path = _address_array(data, 1)
+
+        elif layout == 'v2_exact_in':
+            # (amountIn, amountOutMin, path, to, deadline)
+            params.amount_in = _uint(data, _arg(0))
+            params.amount_out = _uint(data, _arg(1))
+            params.recipient = _address(data, _arg(3))
+            params.path = _address_array(data, 2)
+
+        elif layout == 'v2_exact_out':
+            # (amountOut, amountInMax, path, to, deadline)
+            params.amount_out = _uint(data, _arg(0))
+            params.amount_in = _uint(data, _arg(1))
+            params.recipient = _address(data, _arg(3))
+            params.path = _address_array(data, 2)
+
+        elif layout == 'v2_add_liquidity_eth':
+            # (token, amountTokenDesired, amountTokenMin, amountETHMin, to, deadline)
+            params.path = (_address(data, _arg(0)),)
+            params.amount_in = _uint(data, _arg(1))
+            params.recipient = _address(data, _arg(4))
+
+        elif layout == 'v2_add_liquidity':
+            # (tokenA, tokenB, amountADesired, amountBDesired, ..., to, deadline)
+            params.path = (_address(data, _arg(0)), _address(data, _arg(1)))
+            params.amount_in = _uint(data, _arg(2))
+            params.recipient = _address(data, _arg(6))
+
+        elif layout in ('v3_exact_in_single', 'v3_exact_out_single', 'v3_02_exact_in_single'):
+            # Static struct inlined in the head:
+            # (tokenIn, tokenOut, fee, recipient, [deadline,] amount, limit, sqrtPriceLimitX96)
+            amount_index = 4 if layout == 'v3_02_exact_in_single' else 5
+            params.path = (_address(data, _arg(0)), _address(data, _arg(1)))
+            params.recipient = _address(data, _arg(3))
+            first = _uint(data, _arg(amount_index))
+            second = _uint(data, _arg(amount_index + 1))
+            if layout == 'v3_exact_out_single':
+                params.amount_out, params.amount_in = first, second
+            else:
+                params.amount_in, params.amount_out = first, second
+
+        elif layout in ('v3_exact_in', 'v3_exact_out', 'v3_02_exact_in', 'v3_02_exact_out'):
+            # Dynamic struct: (path, recipient, [deadline,] amount, limit)
+            struct_start = _ARGS + _uint(data, _arg(0))
+            amount_index = 2 if layout.startswith('v3_02') else 3
+            exact_out = layout.endswith('exact_out')
+            params.path = _packed_path(data, struct_start, reverse=exact_out)
+            params.recipient = _address(data, struct_start + _WORD)
+            first = _uint(data, struct_start + amount_index * _WORD)
+            second = _uint(data, struct_start + (amount_index + 1) * _WORD)
+            if exact_out:
+                params.amount_out, params.amount_in = first, second
+            else:
+                params.amount_in, params.amount_out = first, second
+
+        elif layout == 'aero_eth_in':
+            # (amountOutMin, routes, to, deadline), ETH in via msg.value
+            params.amount_in = transaction.value_wei
+            params.amount_out = _uint(data, _arg(0))
+            params.recipient = _address(data, _arg(2))
+            params.path = _route_path(data, 1)
+
+        elif layout == 'aero_exact_in':
+            # (amountIn, amountOutMin, routes, to, deadline)
+            params.amount_in = _uint(data, _arg(0))
+            params.amount_out = _uint(data, _arg(1))
+            params.recipient = _address(data, _arg(3))
+            params.path = _route_path(data, 2)
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get decoder cache statistics."""
+        return {
+            'cached_transactions': len(self._cache),
+            'cache_hits': self._hits,
+            'cache_misses': self._misses,
+        }
+
+
+# Shared decoder so every stage reuses the same per-hash memo
+_shared_decoder: Optional[CalldataDecoder] = None
+
+
+def get_calldata_decoder() -> CalldataDecoder:
+    """
+    Get the process-wide calldata decoder.
+
+    Returns:
+        Shared CalldataDecoder instance
+    """
+    global _shared_decoder
+    if _shared_decoder is None:
+        _shared_decoder = CalldataDecoder()
+    return _shared_decoder
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+__all__ = [
+    'CalldataDecoder',
+    'CalldataKind',
+    'SelectorSpec',
+    'SwapParams',
+    'SELECTOR_TABLE',
+    'ROUTER_DEX_NAMES',
+    'get_calldata_decoder',
+]
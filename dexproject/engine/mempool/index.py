@@ -0,0 +1,475 @@
+"""
+Pending Transaction Index Module
+
+This module provides an indexed store of pending transactions for MEV threat
+detection. Instead of scanning the whole mempool for every target transaction,
+detectors query the index for the small set of relevant candidates.
+
+Key Features:
+- Token pair / pool index with per-pair gas price buckets
+- Sender address index for attacker correlation
+- Liquidity provision and removal indexes for JIT detection
+- Time-ordered DEX transaction sequence for backrun lookups
+- O(1) insert and removal maintained by the mempool monitor
+- Heap-ordered TTL/capacity expiry queue for the pending pool
+
+File: dexproject/engine/mempool/index.py
+Django App: N/A (Pure engine component)
+"""
+
+import bisect
+import heapq
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Any
+
+from .records import CompactTransaction
+
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CONSTANTS
+# =============================================================================
+
+# Gas price bucket width (1 gwei)
+DEFAULT_GAS_BUCKET_SIZE_WEI = 10 ** 9
+
+# Common LP function signatures
+LIQUIDITY_PROVISION_SELECTORS = frozenset({
+    bytes.fromhex('e8e33700'),  # addLiquidity
+    bytes.fromhex('f305d719'),  # addLiquidityETH
+    bytes.fromhex('88316456'),  # mint (V3 NonfungiblePositionManager)
+})
+
+# Common LP withdrawal function signatures
+LIQUIDITY_REMOVAL_SELECTORS = frozenset({
+    bytes.fromhex('baa2abde'),  # removeLiquidity
+    bytes.fromhex('02751cec'),  # removeLiquidityETH
+    bytes.fromhex('0c49ccbe'),  # decreaseLiquidity (V3 NonfungiblePositionManager)
+})
+
+PairKey = Tuple[Optional[str], bytes]
+
+
+# =============================================================================
+# PENDING TRANSACTION INDEX
+# =============================================================================
+
+class PendingTransactionIndex:
+    """
+    Indexed pending transaction store for MEV detection.
+
+    Transactions are indexed by token pair / pool (target contract and function
+    selector, bucketed by gas price), by sender address, and, for DEX
+    interactions, by first-seen time. Detectors only visit the transactions
+    that can actually take part in a given attack pattern.
+    """
+
+    def __init__(self, gas_bucket_size_wei: int = DEFAULT_GAS_BUCKET_SIZE_WEI):
+        """
+        Initialize an empty pending transaction index.
+
+        Args:
+            gas_bucket_size_wei: Width of the gas price buckets in wei
+        """
+        self.gas_bucket_size_wei = gas_bucket_size_wei
+
+        # Primary storage
+        self._by_hash: Dict[str, CompactTransaction] = {}
+
+        # Secondary indexes (hash sets so removal is O(1))
+        self._by_pair: Dict[PairKey, Dict[int, Set[str]]] = defaultdict(lambda: defaultdict(set))
+        self._by_sender: Dict[str, Set[str]] = defaultdict(set)
+        self._liquidity_by_pool: Dict[Optional[str], Set[str]] = defaultdict(set)
+        self._removals_by_pool: Dict[Optional[str], Set[str]] = defaultdict(set)
+
+        # Time-ordered DEX transactions, removed lazily. Each entry carries an
+        # insertion sequence so a re-added hash does not revive its old entry.
+        self._dex_timeline: List[Tuple[float, int, str]] = []
+        self._timeline_seq: Dict[str, int] = {}
+        self._next_seq = 0
+        self._stale_timeline_entries = 0
+
+    # =========================================================================
+    # KEY HELPERS
+    # =========================================================================
+
+    @staticmethod
+    def pair_key(tx: CompactTransaction) -> PairKey:
+        """
+        Get the token pair / pool key for a transaction.
+
+        Mirrors MEVProtectionEngine._involves_same_token_pair: two transactions
+        touch the same pair when they call the same function on the same contract.
+        """
+        return tx.to_address, tx.calldata[:4]
+
+    def gas_bucket(self, gas_price_wei: int) -> int:
+        """Get the gas price bucket for a gas price in wei."""
+        return gas_price_wei // self.gas_bucket_size_wei
+
+    @staticmethod
+    def is_liquidity_provision(tx: CompactTransaction) -> bool:
+        """Check if transaction is liquidity provision."""
+        return tx.calldata[:4] in LIQUIDITY_PROVISION_SELECTORS
+
+    @staticmethod
+    def is_liquidity_removal(tx: CompactTransaction) -> bool:
+        """Check if transaction is liquidity removal."""
+        return tx.calldata[:4] in LIQUIDITY_REMOVAL_SELECTORS
+
+    # =========================================================================
+    # MUTATION
+    # =========================================================================
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Iterable[CompactTransaction],
+        gas_bucket_size_wei: int = DEFAULT_GAS_BUCKET_SIZE_WEI
+    ) -> 'PendingTransactionIndex':
+        """
+        Build an index from an iterable of pending transactions.
+
+        Args:
+            transactions: Transactions to index
+            gas_bucket_size_wei: Width of the gas price buckets in wei
+
+        Returns:
+            Populated PendingTransactionIndex
+        """
+        index = cls(gas_bucket_size_wei)
+        for tx in transactions:
+            index.add(tx)
+        return index
+
+    def add(self, tx: CompactTransaction) -> None:
+        """
+        Add or replace a pending transaction in the index.
+
+        Args:
+            tx: Pending transaction to index
+        """
+        if tx.hash in self._by_hash:
+            self.remove(tx.hash)
+
+        self._by_hash[tx.hash] = tx
+        self._by_pair[self.pair_key(tx)][self.gas_bucket(tx.gas_price_wei)].add(tx.hash)
+        self._by_sender[tx.from_address].add(tx.hash)
+
+        if self.is_liquidity_provision(tx):
+            self._liquidity_by_pool[tx.to_address].add(tx.hash)
+        elif self.is_liquidity_removal(tx):
+            self._removals_by_pool[tx.to_address].add(tx.hash)
+
+        if tx.is_dex_interaction:
+            self._next_seq += 1
+            self._timeline_seq[tx.hash] = self._next_seq
+            entry = (tx.first_seen_mono, self._next_seq, tx.hash)
+            if not self._dex_timeline or entry >= self._dex_timeline[-1]:
+                self._dex_timeline.append(entry)
+            else:
+                bisect.insort(self._dex_timeline, entry)
+
+    def remove(self, tx_hash: str) -> Optional[CompactTransaction]:
+        """
+        Remove a transaction from the index.
+
+        Args:
+            tx_hash: Hash of the transaction to remove
+
+        Returns:
+            The removed transaction, or None if it was not indexed
+        """
+        tx = self._by_hash.pop(tx_hash, None)
+        if tx is None:
+            return None
+
+        pair_key = self.pair_key(tx)
+        buckets = self._by_pair[pair_key]
+        bucket = self.gas_bucket(tx.gas_price_wei)
+        buckets[bucket].discard(tx_hash)
+        if not buckets[bucket]:
+            del buckets[bucket]
+        if not buckets:
+            del self._by_pair[pair_key]
+
+        senders = self._by_sender[tx.from_address]
+        senders.discard(tx_hash)
+        if not senders:
+            del self._by_sender[tx.from_address]
+
+        for by_pool in (self._liquidity_by_pool, self._removals_by_pool):
+            if tx.to_address in by_pool:
+                pool = by_pool[tx.to_address]
+                pool.discard(tx_hash)
+                if not pool:
+                    del by_pool[tx.to_address]
+
+        if self._timeline_seq.pop(tx_hash, None) is not None:
+            self._stale_timeline_entries += 1
+            if self._stale_timeline_entries > len(self._by_hash):
+                self._compact_timeline()
+
+        return tx
+
+    def clear(self) -> None:
+        """Remove all transactions from the index."""
+        self._by_hash.clear()
+        self._by_pair.clear()
+        self._by_sender.clear()
+        self._liquidity_by_pool.clear()
+        self._removals_by_pool.clear()
+        self._dex_timeline.clear()
+        self._timeline_seq.clear()
+        self._stale_timeline_entries = 0
+
+    def _compact_timeline(self) -> None:
+        """Drop timeline entries for transactions that are no longer indexed."""
+        self._dex_timeline = [
+            entry for entry in self._dex_timeline if self._is_live_timeline_entry(entry)
+        ]
+        self._stale_timeline_entries = 0
+
+    def _is_live_timeline_entry(self, entry: Tuple[float, int, str]) -> bool:
+        """Check a timeline entry still refers to the indexed transaction."""
+        _, seq, tx_hash = entry
+        return self._timeline_seq.get(tx_hash) == seq
+
+    # =========================================================================
+    # QUERIES
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def __contains__(self, tx_hash: object) -> bool:
+        return tx_hash in self._by_hash
+
+    def __iter__(self) -> Iterator[CompactTransaction]:
+        return iter(list(self._by_hash.values()))
+
+    def get(self, tx_hash: str) -> Optional[CompactTransaction]:
+        """Get an indexed transaction by hash."""
+        return self._by_hash.get(tx_hash)
+
+    def same_pair(self, tx: CompactTransaction) -> List[CompactTransaction]:
+        """
+        Get all indexed transactions on the same token pair / pool as tx.
+
+        Args:
+            tx: Reference transaction
+
+        Returns:
+            Transactions sharing the pair key (may include tx itself)
+        """
+        buckets = self._by_pair.get(self.pair_key(tx))
+        if not buckets:
+            return []
+        return [self._by_hash[h] for hashes in buckets.values() for h in hashes]
+
+    def same_pair_priced_above(self, tx: CompactTransaction) -> List[CompactTransaction]:
+        """
+        Get transactions on the same pair with a strictly higher gas price.
+
+        Only the gas buckets at or above the reference bucket are visited.
+
+        Args:
+            tx: Reference transaction
+
+        Returns:
+            Same-pair transactions paying more gas than tx
+        """
+        buckets = self._by_pair.get(self.pair_key(tx))
+        if not buckets:
+            return []
+
+        min_bucket = self.gas_bucket(tx.gas_price_wei)
+        candidates = []
+        for bucket, hashes in buckets.items():
+            if bucket < min_bucket:
+                continue
+            for tx_hash in hashes:
+                candidate = self._by_hash[tx_hash]
+                if candidate.gas_price_wei > tx.gas_price_wei:
+                    candidates.append(candidate)
+        return candidates
+
+    def from_sender(self, address: str) -> List[CompactTransaction]:
+        """Get all indexed transactions sent from an address."""
+        return [self._by_hash[h] for h in self._by_sender.get(address, ())]
+
+    def liquidity_provisions(self, pool_address: Optional[str]) -> List[CompactTransaction]:
+        """Get liquidity provision transactions targeting a pool/router address."""
+        return [self._by_hash[h] for h in self._liquidity_by_pool.get(pool_address, ())]
+
+    def liquidity_removals(self, pool_address: Optional[str]) -> List[CompactTransaction]:
+        """Get liquidity removal transactions targeting a pool/router address."""
+        return [self._by_hash[h] for h in self._removals_by_pool.get(pool_address, ())]
+
+    def dex_seen_after(self, timestamp: float) -> Iterator[CompactTransaction]:
+        """
+        Iterate DEX transactions first seen strictly after a timestamp.
+
+        Args:
+            timestamp: Exclusive lower bound (monotonic seconds, first_seen_mono)
+
+        Yields:
+            DEX transactions in first-seen order
+        """
+        # (timestamp, inf) sorts after every real (timestamp, seq, hash) entry
+        start = bisect.bisect_right(self._dex_timeline, (timestamp, float('inf')))
+        for entry in self._dex_timeline[start:]:
+            if self._is_live_timeline_entry(entry):
+                yield self._by_hash[entry[2]]
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get index size statistics.
+
+        Returns:
+            Dictionary containing index statistics
+        """
+        return {
+            "indexed_transactions": len(self._by_hash),
+            "pair_keys": len(self._by_pair),
+            "senders": len(self._by_sender),
+            "liquidity_pools": len(self._liquidity_by_pool),
+            "liquidity_removal_pools": len(self._removals_by_pool),
+            "dex_timeline_entries": len(self._dex_timeline),
+        }
+
+
+# =============================================================================
+# EXPIRY QUEUE
+# =============================================================================
+
+class TransactionExpiryQueue:
+    """
+    Time-ordered expiry structure for the pending transaction pool.
+
+    Keeps two min-heaps: one keyed by last_seen for TTL expiry and one keyed
+    by first_seen for evicting the oldest transactions when the pool is over
+    capacity. Entries are invalidated lazily with per-hash sequence numbers,
+    so insert, refresh and eviction are all amortised O(log n).
+    """
+
+    # Rebuild a heap once it holds this many times more entries than live hashes
+    COMPACTION_FACTOR = 2
+
+    def __init__(self):
+        """Initialize an empty expiry queue."""
+        self._ttl_heap: List[Tuple[float, int, str]] = []
+        self._age_heap: List[Tuple[float, int, str]] = []
+
+        # Live sequence numbers per hash (entry is valid iff its seq matches)
+        self._ttl_seq: Dict[str, int] = {}
+        self._age_seq: Dict[str, int] = {}
+
+        self._next_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._age_seq)
+
+    def __contains__(self, tx_hash: object) -> bool:
+        return tx_hash in self._age_seq
+
+    def _seq(self) -> int:
+        self._next_seq += 1
+        return self._next_seq
+
+    def push(self, tx_hash: str, first_seen: float, last_seen: float) -> None:
+        """
+        Track a newly pooled transaction.
+
+        Args:
+            tx_hash: Transaction hash
+            first_seen: When the transaction was first seen (monotonic seconds)
+            last_seen: When the transaction was last seen (monotonic seconds)
+        """
+        seq = self._seq()
+        self._age_seq[tx_hash] = seq
+        heapq.heappush(self._age_heap, (first_seen, seq, tx_hash))
+        self.touch(tx_hash, last_seen)
+
+    def touch(self, tx_hash: str, last_seen: float) -> None:
+        """
+        Refresh a transaction's last_seen time, postponing its TTL expiry.
+
+        Args:
+            tx_hash: Transaction hash
+            last_seen: New last seen time
+        """
+        if tx_hash not in self._age_seq:
+            return
+        seq = self._seq()
+        self._ttl_seq[tx_hash] = seq
+        heapq.heappush(self._ttl_heap, (last_seen, seq, tx_hash))
+        self._maybe_compact()
+
+    def discard(self, tx_hash: str) -> None:
+        """Stop tracking a transaction (its heap entries become stale)."""
+        self._age_seq.pop(tx_hash, None)
+        self._ttl_seq.pop(tx_hash, None)
+
+    def pop_expired(self, cutoff: float) -> List[str]:
+        """
+        Remove and return transactions last seen before a cutoff.
+
+        Args:
+            cutoff: Transactions with last_seen < cutoff are expired
+
+        Returns:
+            Hashes of expired transactions, oldest first
+        """
+        expired = []
+        heap = self._ttl_heap
+        while heap and heap[0][0] < cutoff:
+            _, seq, tx_hash = heapq.heappop(heap)
+            if self._ttl_seq.get(tx_hash) == seq:
+                self.discard(tx_hash)
+                expired.append(tx_hash)
+        return expired
+
+    def pop_oldest(self, count: int) -> List[str]:
+        """
+        Remove and return the transactions with the oldest first_seen.
+
+        Args:
+            count: Number of transactions to evict
+
+        Returns:
+            Hashes of evicted transactions, oldest first
+        """
+        evicted = []
+        heap = self._age_heap
+        while heap and len(evicted) < count:
+            _, seq, tx_hash = heapq.heappop(heap)
+            if self._age_seq.get(tx_hash) == seq:
+                self.discard(tx_hash)
+                evicted.append(tx_hash)
+        return evicted
+
+    def _maybe_compact(self) -> None:
+        """Drop stale heap entries once they dominate the heaps."""
+        limit = self.COMPACTION_FACTOR * len(self._age_seq) + 64
+        if len(self._ttl_heap) > limit:
+            self._ttl_heap = [e for e in self._ttl_heap if self._ttl_seq.get(e[2]) == e[1]]
+            heapq.heapify(self._ttl_heap)
+        if len(self._age_heap) > limit:
+            self._age_heap = [e for e in self._age_heap if self._age_seq.get(e[2]) == e[1]]
+            heapq.heapify(self._age_heap)
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+__all__ = [
+    'PendingTransactionIndex',
+    'TransactionExpiryQueue',
+    'LIQUIDITY_PROVISION_SELECTORS',
+    'LIQUIDITY_REMOVAL_SELECTORS',
+]
@@ -43,6 +43,11 @@ from .protection import (
     MEVProtectionEngine, PendingTransaction, MEVThreat, 
     ProtectionRecommendation, MEVThreatType
 )
+from .index import PendingTransactionIndex, TransactionExpiryQueue
+from .decoder import SELECTOR_TABLE, CalldataDecoder, SwapParams, get_calldata_decoder
+from .records import (
+    CompactTransaction, to_calldata, to_monotonic, to_wei, monotonic_to_datetime
+)
 from ..execution.gas_optimizer import GasOptimizationEngine, GasMetrics, NetworkCongestion
 from ..communications.django_bridge import DjangoBridge
 from shared.schemas import ChainType, PairSource
@@ -106,58 +111,106 @@ class MempoolConfig:
     max_retries: int = 5
 
 
-@dataclass
-class MempoolTransaction:
-    """Enhanced mempool transaction with analysis data."""
+class MempoolTransaction(CompactTransaction):
+    """
+    Enhanced mempool transaction with analysis data.
+    
+    Built on the compact slotted record shared with the MEV engine: amounts
+    are int wei, calldata is raw bytes and first/last seen are monotonic
+    floats. The Decimal/datetime/hex views (value, gas_price, data,
+    first_seen, last_seen) are computed on access.
+    """
+    
+    __slots__ = (
+        'function_signature',
+        '_mev_threats',
+        'protection_recommendation',
+        'status',
+        'confirmation_block',
+    )
+    
+    def __init__(
+        self,
+        hash: str,
+        from_address: str,
+        to_address: Optional[str],
+        value: Union[Decimal, int],
+        gas_price: Union[Decimal, int],
+        gas_limit: int,
+        nonce: int,
+        data: Union[str, bytes],
+        first_seen: Union[datetime, float],
+        last_seen: Union[datetime, float],
+        is_dex_interaction: bool = False,
+        dex_name: Optional[str] = None,
+        target_token: Optional[str] = None,
+        swap_amount_in: Optional[Decimal] = None,
+        swap_amount_out: Optional[Decimal] = None,
+        function_signature: Optional[str] = None,
+        mev_threats: Optional[List[MEVThreat]] = None,
+        protection_recommendation: Optional[ProtectionRecommendation] = None,
+        status: TransactionStatus = TransactionStatus.PENDING,
+        confirmation_block: Optional[int] = None
+    ):
+        """
+        Create a mempool transaction from rich or compact values.
+        
+        Args:
+            value/gas_price: Amounts in wei (Decimal or int)
+            data: Calldata as a hex string or raw bytes
+            first_seen/last_seen: Datetimes or monotonic floats
+        """
+        super().__init__(
+            hash=hash,
+            from_address=from_address,
+            to_address=to_address,
+            value_wei=to_wei(value),
+            gas_price_wei=to_wei(gas_price),
+            gas_limit=gas_limit,
+            nonce=nonce,
+            calldata=to_calldata(data),
+            first_seen_mono=to_monotonic(first_seen),
+            last_seen_mono=to_monotonic(last_seen),
+            is_dex_interaction=is_dex_interaction,
+            dex_name=dex_name,
+            target_token=target_token,
+            swap_amount_in_wei=None if swap_amount_in is None else to_wei(swap_amount_in),
+            swap_amount_out_wei=None if swap_amount_out is None else to_wei(swap_amount_out)
+        )
+        self.function_signature = function_signature
+        self._mev_threats = mev_threats
+        self.protection_recommendation = protection_recommendation
+        self.status = status
+        self.confirmation_block = confirmation_block
+    
+    @property
+    def first_seen(self) -> datetime:
+        return monotonic_to_datetime(self.first_seen_mono)
     
-    # Basic transaction data
-    hash: str
-    from_address: str
-    to_address: Optional[str]
-    value: Decimal
-    gas_price: Decimal
-    gas_limit: int
-    nonce: int
-    data: str
+    @first_seen.setter
+    def first_seen(self, moment: Union[datetime, float]) -> None:
+        self.first_seen_mono = to_monotonic(moment)
     
-    # Timestamps
-    first_seen: datetime
-    last_seen: datetime
+    @property
+    def last_seen(self) -> datetime:
+        return monotonic_to_datetime(self.last_seen_mono)
     
-    # Analysis results
-    is_dex_interaction: bool = False
-    dex_name: Optional[str] = None
-    target_token: Optional[str] = None
-    swap_amount_in: Optional[Decimal] = None
-    swap_amount_out: Optional[Decimal] = None
-    function_signature: Optional[str] = None
+    @last_seen.setter
+    def last_seen(self, moment: Union[datetime, float]) -> None:
+        self.last_seen_mono = to_monotonic(moment)
     
-    # MEV analysis
-    mev_threats: List[MEVThreat] = field(default_factory=list)
-    protection_recommendation: Optional[ProtectionRecommendation] = None
+    @property
+    def mev_threats(self) -> List[MEVThreat]:
+        # Most transactions never carry threats; avoid a list per record
+        return self._mev_threats if self._mev_threats is not None else []
     
-    # Status tracking
-    status: TransactionStatus = TransactionStatus.PENDING
-    confirmation_block: Optional[int] = None
+    @mev_threats.setter
+    def mev_threats(self, threats: List[MEVThreat]) -> None:
+        self._mev_threats = threats or None
     
     def to_pending_transaction(self) -> PendingTransaction:
-        """Convert to PendingTransaction for MEV analysis."""
-        return PendingTransaction(
-            hash=self.hash,
-            from_address=self.from_address,
-            to_address=self.to_address,
-            value=self.value,
-            gas_price=self.gas_price,
-            gas_limit=self.gas_limit,
-            nonce=self.nonce,
-            data=self.data,
-            timestamp=self.first_seen,
-            is_dex_interaction=self.is_dex_interaction,
-            target_token=self.target_token,
-            swap_amount_in=self.swap_amount_in,
-            swap_amount_out=self.swap_amount_out,
-            dex_name=self.dex_name
-        )
+        """Convert to PendingTransaction for MEV analysis (compact field copy)."""
+        return PendingTransaction.from_record(self)
 
 
 @dataclass
@@ -170,6 +223,10 @@ class MempoolStats:
     mev_threats_detected: int = 0
     current_pending_count: int = 0
     
+    # Pool eviction counters
+    ttl_evictions: int = 0
+    capacity_evictions: int = 0
+    
     # Performance metrics
     avg_processing_latency_ms: float = 0.0
     websocket_reconnects: int = 0
@@ -217,6 +274,16 @@ class MempoolMonitor:
         
         # Transaction storage and analysis
         self._pending_transactions: Dict[int, Dict[str, MempoolTransaction]] = defaultdict(dict)
+        
+        # Shared mempool views (one per chain), updated incrementally on insert/expiry
+        # and read in place by the MEV protection engine
+        self._mempool_indexes: Dict[int, PendingTransactionIndex] = defaultdict(PendingTransactionIndex)
+        
+        # TTL/capacity ordered expiry (heap per chain, keyed by last_seen/first_seen)
+        self._expiry_queues: Dict[int, TransactionExpiryQueue] = defaultdict(TransactionExpiryQueue)
+        
+        # Calldata is decoded once at ingest (shared, memoized by tx hash)
+        self._decoder: CalldataDecoder = get_calldata_decoder()
         self._transaction_queues: Dict[int, asyncio.Queue] = defaultdict(asyncio.Queue)
         
         # Analysis components (will be injected)
@@ -261,6 +328,10 @@ class MempoolMonitor:
         self._gas_optimizer = gas_optimizer
         self._relay_manager = relay_manager
         
+        # Share each chain's mempool view with the MEV engine (no copies)
+        for chain_id in self._chain_configs.keys():
+            self._mev_engine.attach_mempool_view(chain_id, self._mempool_indexes[chain_id])
+        
         # Create HTTP session
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
         self._session = aiohttp.ClientSession(timeout=timeout)
@@ -715,8 +786,8 @@ class MempoolMonitor:
             tx_hash = tx_data.get("hash", "")
             from_addr = tx_data.get("from", "")
             to_addr = tx_data.get("to")
-            value = Decimal(int(tx_data.get("value", "0x0"), 16))
-            gas_price = Decimal(int(tx_data.get("gasPrice", "0x0"), 16))
+            value = int(tx_data.get("value", "0x0"), 16)
+            gas_price = int(tx_data.get("gasPrice", "0x0"), 16)
             gas_limit = int(tx_data.get("gas", "0x0"), 16)
             nonce = int(tx_data.get("nonce", "0x0"), 16)
             data = tx_data.get("input", "0x")
@@ -736,7 +807,7 @@ class MempoolMonitor:
                     return None
             
             # Create mempool transaction
-            now = datetime.utcnow()
+            now = time.monotonic()
             mempool_tx = MempoolTransaction(
                 hash=tx_hash,
                 from_address=from_addr,
@@ -772,61 +843,41 @@ class MempoolMonitor:
         """
         Analyze transaction to identify type and extract DEX interaction data.
         
+        Calldata is decoded once here, at ingest, through the shared
+        selector-indexed decoder; the resulting SwapParams are attached to the
+        record for the MEV engine and analyzers to consume.
+        
         Args:
             transaction: Transaction to analyze
             chain_id: Blockchain network
         """
-        if not transaction.data or transaction.data == "0x":
+        if len(transaction.calldata) < 4:
             return  # Simple ETH transfer
         
-        # Extract function selector
-        if len(transaction.data) >= 10:
-            function_selector = transaction.data[:10]
-            transaction.function_signature = function_selector
-            
-            # Common DEX function selectors
-            dex_functions = {
-                "0x7ff36ab5": ("swapExactETHForTokens", "uniswap_v2"),
-                "0x18cbafe5": ("swapExactTokensForETH", "uniswap_v2"),
-                "0x38ed1739": ("swapExactTokensForTokens", "uniswap_v2"),
-                "0x414bf389": ("exactInputSingle", "uniswap_v3"),
-                "0xc04b8d59": ("exactInput", "uniswap_v3"),
-                "0x5c11d795": ("swapExactTokensForTokensSupportingFeeOnTransferTokens", "uniswap_v2"),
-            }
-            
-            if function_selector in dex_functions:
-                function_name, dex_name = dex_functions[function_selector]
-                transaction.is_dex_interaction = True
-                transaction.dex_name = dex_name
-                
-                # Extract swap parameters (simplified)
-                # In production, this would use proper ABI decoding
-                await self._extract_swap_parameters(transaction, function_name)
+        transaction.function_signature = '0x' + transaction.selector.hex()
+        
+        swap_params = self._decoder.decode(transaction)
+        if swap_params is not None and swap_params.is_swap:
+            transaction.is_dex_interaction = True
+            transaction.dex_name = swap_params.dex_name
+            await self._extract_swap_parameters(transaction, swap_params)
     
     async def _extract_swap_parameters(
         self, 
         transaction: MempoolTransaction, 
-        function_name: str
+        swap_params: SwapParams
     ) -> None:
         """
-        Extract swap parameters from transaction data.
+        Copy decoded swap parameters onto the transaction record.
         
         Args:
             transaction: Transaction with DEX interaction
-            function_name: Name of the DEX function
+            swap_params: Parameters decoded from the router call
         """
-        # Simplified parameter extraction
-        # In production, this would use proper ABI decoding with libraries like web3.py
-        
-        if function_name in ["swapExactETHForTokens", "swapExactTokensForETH"]:
-            # Extract amounts and token addresses
-            # This is a placeholder - actual implementation would decode ABI
-            transaction.swap_amount_in = transaction.value if transaction.value > 0 else None
-        
-        elif function_name == "exactInputSingle":
-            # Uniswap V3 single swap
-            # Would extract tokenIn, tokenOut, amountIn from transaction data
-            pass
+        transaction.swap_params = swap_params
+        transaction.target_token = swap_params.token_out
+        transaction.swap_amount_in_wei = swap_params.amount_in or None
+        transaction.swap_amount_out_wei = swap_params.amount_out
     
     async def _process_transaction_queue(self, chain_id: int) -> None:
         """
@@ -885,16 +936,17 @@ class MempoolMonitor:
         start_time = time.time()
         
         try:
-            # Store transactions in pending pool
-            for tx in transactions:
-                self._pending_transactions[chain_id][tx.hash] = tx
+            # Store transactions in pending pool; re-broadcasts only refresh last_seen
+            new_transactions = [
+                tx for tx in transactions if self._insert_transaction(tx, chain_id)
+            ]
             
             # Clean up old transactions
             await self._cleanup_old_transactions(chain_id)
             
             # Perform MEV analysis if engine is available
             if self._mev_engine:
-                await self._analyze_batch_for_mev(transactions, chain_id)
+                await self._analyze_batch_for_mev(new_transactions, chain_id)
             
             # Update gas price statistics
             await self._update_gas_statistics(transactions, chain_id)
@@ -913,6 +965,45 @@ class MempoolMonitor:
         except Exception as e:
             self.logger.error(f"Error processing transaction batch: {e}")
     
+    def _insert_transaction(self, transaction: MempoolTransaction, chain_id: int) -> bool:
+        """
+        Insert a transaction into the pending pool and the shared mempool view.
+        
+        Args:
+            transaction: Newly received transaction
+            chain_id: Blockchain network
+            
+        Returns:
+            True if the transaction was new, False if it was already pending
+        """
+        pending = self._pending_transactions[chain_id]
+        existing = pending.get(transaction.hash)
+        if existing is not None:
+            existing.last_seen_mono = transaction.last_seen_mono
+            self._expiry_queues[chain_id].touch(transaction.hash, transaction.last_seen_mono)
+            return False
+        
+        # The compact record itself is indexed; no PendingTransaction copy is made
+        pending[transaction.hash] = transaction
+        self._mempool_indexes[chain_id].add(transaction)
+        self._expiry_queues[chain_id].push(
+            transaction.hash, transaction.first_seen_mono, transaction.last_seen_mono
+        )
+        return True
+    
+    def _evict_transaction(self, tx_hash: str, chain_id: int) -> None:
+        """
+        Remove a transaction from the pending pool and the shared mempool view.
+        
+        Args:
+            tx_hash: Hash of the transaction to remove
+            chain_id: Blockchain network
+        """
+        self._pending_transactions[chain_id].pop(tx_hash, None)
+        self._mempool_indexes[chain_id].remove(tx_hash)
+        self._expiry_queues[chain_id].discard(tx_hash)
+        self._decoder.forget(tx_hash)
+    
     async def _analyze_batch_for_mev(
         self, 
         new_transactions: List[MempoolTransaction], 
@@ -928,20 +1019,17 @@ class MempoolMonitor:
         if not self._mev_engine:
             return
         
-        # Get current mempool state for analysis
-        current_mempool = [
-            tx.to_pending_transaction() 
-            for tx in self._pending_transactions[chain_id].values()
-        ]
+        # Current mempool state, indexed for candidate lookups
+        mempool_index = self._mempool_indexes[chain_id]
         
         # Analyze each new transaction
         for tx in new_transactions:
             if tx.is_dex_interaction:
                 try:
-                    pending_tx = tx.to_pending_transaction()
-                    
-                    # Analyze for MEV threats
-                    analysis = await self._mev_engine.analyze_pending_transaction(pending_tx)
+                    # Analyze for MEV threats against the shared view
+                    analysis = await self._mev_engine.analyze_pending_transaction(
+                        tx, mempool_index=mempool_index, chain_id=chain_id
+                    )
                     
                     if analysis:
                         # Store analysis results
@@ -962,8 +1050,8 @@ class MempoolMonitor:
         return {
             'from': transaction.from_address,
             'to': transaction.to_address,
-            'value': int(transaction.value),
-            'gasPrice': int(transaction.gas_price),
+            'value': transaction.value_wei,
+            'gasPrice': transaction.gas_price_wei,
             'gas': transaction.gas_limit,
             'nonce': transaction.nonce,
             'data': transaction.data
@@ -973,34 +1061,33 @@ class MempoolMonitor:
         """
         Remove old transactions from the pending pool.
         
+        Expired and excess transactions are popped from the chain's expiry
+        queue, so cleanup costs O(log n) per evicted transaction rather than
+        a scan of the whole pool.
+        
         Args:
             chain_id: Blockchain network
         """
         chain_config = self._chain_configs[chain_id]
-        cutoff_time = datetime.utcnow() - timedelta(seconds=chain_config.transaction_ttl_seconds)
-        
-        # Find transactions to remove
-        to_remove = [
-            tx_hash for tx_hash, tx in self._pending_transactions[chain_id].items()
-            if tx.last_seen < cutoff_time
-        ]
-        
-        # Remove old transactions
-        for tx_hash in to_remove:
-            del self._pending_transactions[chain_id][tx_hash]
-        
-        # Limit total transactions if needed
-        if len(self._pending_transactions[chain_id]) > chain_config.max_pending_transactions:
-            # Remove oldest transactions
-            sorted_txs = sorted(
-                self._pending_transactions[chain_id].items(),
-                key=lambda x: x[1].first_seen
-            )
-            
-            excess_count = len(sorted_txs) - chain_config.max_pending_transactions
-            for i in range(excess_count):
-                tx_hash = sorted_txs[i][0]
-                del self._pending_transactions[chain_id][tx_hash]
+        expiry_queue = self._expiry_queues[chain_id]
+        cutoff_time = time.monotonic() - chain_config.transaction_ttl_seconds
+        
+        # Remove transactions not seen within the TTL
+        expired = expiry_queue.pop_expired(cutoff_time)
+        for tx_hash in expired:
+            self._evict_transaction(tx_hash, chain_id)
+        
+        # Limit total transactions if needed (oldest first_seen first)
+        excess_count = len(self._pending_transactions[chain_id]) - chain_config.max_pending_transactions
+        evicted = expiry_queue.pop_oldest(excess_count) if excess_count > 0 else []
+        for tx_hash in evicted:
+            self._evict_transaction(tx_hash, chain_id)
+        
+        if chain_id in self._stats:
+            stats = self._stats[chain_id]
+            stats.ttl_evictions += len(expired)
+            stats.capacity_evictions += len(evicted)
+            stats.current_pending_count = len(self._pending_transactions[chain_id])
     
     async def _update_gas_statistics(
         self, 
@@ -1017,7 +1104,7 @@ class MempoolMonitor:
         if not transactions:
             return
         
-        gas_prices = [float(tx.gas_price) for tx in transactions if tx.gas_price > 0]
+        gas_prices = [float(tx.gas_price_wei) for tx in transactions if tx.gas_price_wei > 0]
         
         if gas_prices:
             # Update average gas price
@@ -1111,7 +1198,7 @@ class MempoolMonitor:
         transactions = list(self._pending_transactions[chain_id].values())
         
         # Sort by first seen (most recent first)
-        transactions.sort(key=lambda x: x.first_seen, reverse=True)
+        transactions.sort(key=lambda x: x.first_seen_mono, reverse=True)
         
         if limit:
             transactions = transactions[:limit]
@@ -1137,12 +1224,17 @@ class MempoolMonitor:
                     "dex_transactions_seen": stats.dex_transactions_seen,
                     "mev_threats_detected": stats.mev_threats_detected,
                     "current_pending_count": stats.current_pending_count,
+                    "pool_size": len(self._pending_transactions[chain_id]),
+                    "ttl_evictions": stats.ttl_evictions,
+                    "capacity_evictions": stats.capacity_evictions,
                     "avg_processing_latency_ms": stats.avg_processing_latency_ms,
                     "websocket_reconnects": stats.websocket_reconnects,
                     "avg_gas_price_gwei": float(stats.avg_gas_price or 0) / 1e9,
                     "congestion_level": stats.congestion_level.value,
                     "active_providers": [p.value for p in stats.active_providers],
-                    "failed_providers": [p.value for p in stats.failed_providers]
+                    "failed_providers": [p.value for p in stats.failed_providers],
+                    "mempool_index": self._mempool_indexes[chain_id].get_statistics(),
+                    "calldata_decoder": self._decoder.get_statistics()
                 }
             else:
                 return {"error": f"No statistics available for chain {chain_id}"}
@@ -1223,13 +1315,13 @@ async def _parse_alchemy_transaction(
         is_dex = self._is_dex_transaction(to_addr, input_data, chain_id)
         
         # Create MempoolTransaction
-        now = datetime.utcnow()
+        now = time.monotonic()
         mempool_tx = MempoolTransaction(
             hash=tx_hash,
             from_address=from_addr,
             to_address=to_addr,
-            value=Decimal(str(value_wei)),
-            gas_price=Decimal(str(gas_price_wei)),
+            value=value_wei,
+            gas_price=gas_price_wei,
             gas_limit=gas_limit_int,
             nonce=nonce_int,
             data=input_data,
@@ -1327,24 +1419,12 @@ def _is_dex_transaction(
     if chain_config and to_address.lower() in [addr.lower() for addr in chain_config.target_addresses]:
         return True
         
-    # Check function signatures for DEX operations
+    # Check function selector against the shared router selector table
     if len(input_data) >= 10:  # At least function selector (4 bytes = 8 hex chars + 0x)
-        function_selector = input_data[:10].lower()
-        
-        # Common DEX function signatures
-        dex_signatures = {
-            "0x7ff36ab5",  # swapExactETHForTokens (Uniswap V2)
-            "0x18cbafe5",  # swapExactTokensForETH (Uniswap V2)  
-            "0x38ed1739",  # swapExactTokensForTokens (Uniswap V2)
-            "0x414bf389",  # exactInputSingle (Uniswap V3)
-            "0xac9650d8",  # multicall (Uniswap V3)
-            "0x5ae401dc",  # multicall with deadline (Uniswap V3)
-            "0x24856bc3",  # exactOutput (Uniswap V3)
-            "0x09b81346",  # exactOutputSingle (Uniswap V3)
-        }
-        
-        if function_selector in dex_signatures:
-            return True
+        try:
+            return to_calldata(input_data[:10]) in SELECTOR_TABLE
+        except ValueError:
+            return False  # Not valid hex, so not a router call
             
     return False
 
@@ -39,6 +39,9 @@ from eth_utils import to_checksum_address, to_hex
 # Import engine components
 from ..config import EngineConfig, get_config
 from .relay import PrivateRelayManager, PriorityLevel, RelayType
+from .index import PendingTransactionIndex
+from .records import CompactTransaction, to_calldata, to_monotonic, to_wei
+from .decoder import get_calldata_decoder
 from ..communications.django_bridge import DjangoBridge
 from shared.schemas import (
     BaseMessage, MessageType, RiskLevel, ChainType
@@ -72,6 +75,10 @@ class ProtectionAction(str, Enum):
     NO_ACTION = "no_action"
 
 
+# Detectors accept either an indexed mempool or a plain transaction list
+MempoolView = Union[PendingTransactionIndex, List['PendingTransaction']]
+
+
 class SeverityLevel(str, Enum):
     """MEV threat severity levels."""
     CRITICAL = "critical"
@@ -85,51 +92,78 @@ class SeverityLevel(str, Enum):
 # DATA MODELS
 # =============================================================================
 
-@dataclass
-class PendingTransaction:
-    """Represents a pending transaction in the mempool."""
+class PendingTransaction(CompactTransaction):
+    """
+    Represents a pending transaction in the mempool.
     
-    hash: str
-    from_address: str
-    to_address: Optional[str]
-    value: Decimal
-    gas_price: Decimal
-    gas_limit: int
-    nonce: int
-    data: str
-    timestamp: datetime
+    Stored as a compact slotted record (int wei, raw calldata, monotonic
+    timestamp); value, gas_price, data and timestamp are rich views.
+    """
     
-    # Analysis fields
-    is_dex_interaction: bool = False
-    target_token: Optional[str] = None
-    swap_amount_in: Optional[Decimal] = None
-    swap_amount_out: Optional[Decimal] = None
-    dex_name: Optional[str] = None
+    __slots__ = ()
     
-    def __post_init__(self):
-        """Analyze transaction data after initialization."""
-        if self.to_address and self.data and self.data != "0x":
+    def __init__(
+        self,
+        hash: str,
+        from_address: str,
+        to_address: Optional[str],
+        value: Union[Decimal, int],
+        gas_price: Union[Decimal, int],
+        gas_limit: int,
+        nonce: int,
+        data: Union[str, bytes],
+        timestamp: Union[datetime, float],
+        is_dex_interaction: bool = False,
+        target_token: Optional[str] = None,
+        swap_amount_in: Optional[Decimal] = None,
+        swap_amount_out: Optional[Decimal] = None,
+        dex_name: Optional[str] = None
+    ):
+        """
+        Create a pending transaction from rich or compact values.
+        
+        Args:
+            value/gas_price: Amounts in wei (Decimal or int)
+            data: Calldata as a hex string or raw bytes
+            timestamp: First seen time as a datetime or monotonic float
+        """
+        super().__init__(
+            hash=hash,
+            from_address=from_address,
+            to_address=to_address,
+            value_wei=to_wei(value),
+            gas_price_wei=to_wei(gas_price),
+            gas_limit=gas_limit,
+            nonce=nonce,
+            calldata=to_calldata(data),
+            first_seen_mono=to_monotonic(timestamp),
+            is_dex_interaction=is_dex_interaction,
+            dex_name=dex_name,
+            target_token=target_token,
+            swap_amount_in_wei=None if swap_amount_in is None else to_wei(swap_amount_in),
+            swap_amount_out_wei=None if swap_amount_out is None else to_wei(swap_amount_out)
+        )
+        
+        # Analyze transaction data after initialization
+        if self.to_address and self.calldata:
             self._analyze_transaction_data()
     
+    @classmethod
+    def from_record(cls, record: CompactTransaction) -> 'PendingTransaction':
+        """Create a PendingTransaction sharing another record's compact fields."""
+        pending = cls.__new__(cls)
+        pending._init_from(record)
+        return pending
+    
     def _analyze_transaction_data(self) -> None:
         """Analyze transaction data to identify DEX interactions."""
-        # Simplified DEX interaction detection
-        # In production, this would use comprehensive ABI decoding
-        
-        # Common DEX function selectors
-        dex_selectors = {
-            "0x7ff36ab5": "swapExactETHForTokens",  # Uniswap V2
-            "0x18cbafe5": "swapExactTokensForETH",  # Uniswap V2
-            "0x38ed1739": "swapExactTokensForTokens",  # Uniswap V2
-            "0x414bf389": "exactInputSingle",  # Uniswap V3
-            "0xc04b8d59": "exactInput",  # Uniswap V3
-        }
-        
-        if self.data and len(self.data) >= 10:
-            selector = self.data[:10]
-            if selector in dex_selectors:
-                self.is_dex_interaction = True
-                # Additional parsing would extract swap parameters
+        # Shared decoder: reuses the parameters decoded at ingest for this hash
+        swap_params = get_calldata_decoder().decode(self)
+        if swap_params is not None and swap_params.is_swap:
+            self.is_dex_interaction = True
+            self.swap_params = swap_params
+            self.dex_name = self.dex_name or swap_params.dex_name
+            self.target_token = self.target_token or swap_params.token_out
 
 
 @dataclass
@@ -240,8 +274,11 @@ class MEVProtectionEngine:
         self.config = engine_config
         self.logger = logging.getLogger(f"{__name__}.MEVProtectionEngine")
         
-        # Mempool state tracking
-        self._pending_transactions: Dict[str, PendingTransaction] = {}
+        # Mempool state tracking (indexed by pair, sender and gas bucket).
+        # Shared per-chain views are attached by the MempoolMonitor and read
+        # in place; the local index only backs list-based callers.
+        self._mempool_index = PendingTransactionIndex()
+        self._mempool_views: Dict[int, PendingTransactionIndex] = {}
         self._transaction_history: deque = deque(maxlen=1000)
         
         # MEV threat detection
@@ -296,6 +333,34 @@ class MEVProtectionEngine:
         
         self.logger.info("MEV protection engine shutdown complete")
     
+    def attach_mempool_view(self, chain_id: int, mempool_view: PendingTransactionIndex) -> None:
+        """
+        Attach a shared, incrementally maintained mempool view for a chain.
+        
+        The view is owned and updated by the MempoolMonitor; the engine reads
+        it directly without copying transactions into its own state.
+        
+        Args:
+            chain_id: Blockchain network the view belongs to
+            mempool_view: Shared pending transaction index
+        """
+        self._mempool_views[chain_id] = mempool_view
+        self.logger.debug(f"Attached shared mempool view for chain {chain_id}")
+    
+    def get_mempool_view(self, chain_id: Optional[int] = None) -> PendingTransactionIndex:
+        """
+        Get the mempool view used for analysis.
+        
+        Args:
+            chain_id: Chain whose shared view to use (None for the local index)
+            
+        Returns:
+            Shared view for the chain if attached, otherwise the local index
+        """
+        if chain_id is not None and chain_id in self._mempool_views:
+            return self._mempool_views[chain_id]
+        return self._mempool_index
+    
     def _initialize_threat_patterns(self) -> None:
         """Initialize MEV threat detection patterns."""
         # Sandwich attack patterns
@@ -336,12 +401,20 @@ class MEVProtectionEngine:
         
         self.logger.info(f"Initialized {len(self._threat_patterns)} threat pattern categories")
     
-    async def analyze_pending_transaction(self, transaction: PendingTransaction) -> Optional['ProtectionAnalysis']:
+    async def analyze_pending_transaction(
+        self,
+        transaction: PendingTransaction,
+        mempool_index: Optional[PendingTransactionIndex] = None,
+        chain_id: Optional[int] = None
+    ) -> Optional['ProtectionAnalysis']:
         """
         Analyze a pending transaction for MEV threats and generate protection recommendations.
         
         Args:
             transaction: Transaction to analyze for MEV risks
+            mempool_index: Indexed mempool to analyze against (defaults to the
+                shared view for chain_id, or the engine's own mempool state)
+            chain_id: Chain whose attached mempool view to analyze against
             
         Returns:
             ProtectionAnalysis containing threats and recommendations, or None if analysis fails
@@ -352,7 +425,10 @@ class MEVProtectionEngine:
             self.logger.debug(f"Analyzing transaction {transaction.hash[:10]}... for MEV threats")
             
             # Get current mempool state for context
-            current_mempool = list(self._pending_transactions.values())
+            current_mempool = (
+                mempool_index if mempool_index is not None
+                else self.get_mempool_view(chain_id)
+            )
             
             # Detect MEV threats
             threats = await self._detect_mev_threats(transaction, current_mempool)
@@ -383,7 +459,8 @@ class MEVProtectionEngine:
                 threats=threats,
                 recommendation=recommendation,
                 analysis_time_ms=analysis_time_ms,
-                timestamp=datetime.utcnow()
+                timestamp=datetime.utcnow(),
+                mempool_size_analyzed=len(current_mempool)
             )
             
             return analysis
@@ -411,14 +488,15 @@ class MEVProtectionEngine:
     async def analyze_transaction_for_mev_threats(
         self,
         transaction: TxParams,
-        current_mempool: List[PendingTransaction]
+        current_mempool: MempoolView
     ) -> Tuple[List[MEVThreat], ProtectionRecommendation]:
         """
         Analyze a transaction for MEV threats and generate protection recommendations.
         
         Args:
             transaction: Transaction to analyze
-            current_mempool: Current mempool state
+            current_mempool: Current mempool state, either a shared mempool view
+                (read in place) or a list of pending transactions
             
         Returns:
             Tuple of (detected threats, protection recommendation)
@@ -429,8 +507,10 @@ class MEVProtectionEngine:
             # Convert transaction to internal format for analysis
             pending_tx = self._convert_tx_params_to_pending(transaction)
             
-            # Update mempool state
-            self._update_mempool_state(current_mempool)
+            # Shared views are already up to date; lists are merged into local state
+            if not isinstance(current_mempool, PendingTransactionIndex):
+                self._update_mempool_state(current_mempool)
+                current_mempool = PendingTransactionIndex.from_transactions(current_mempool)
             
             # Detect MEV threats
             threats = await self._detect_mev_threats(pending_tx, current_mempool)
@@ -488,30 +568,31 @@ class MEVProtectionEngine:
     def _update_mempool_state(self, current_mempool: List[PendingTransaction]) -> None:
         """Update internal mempool state with current data."""
         # Clear old transactions
-        current_time = datetime.utcnow()
-        cutoff_time = current_time - timedelta(seconds=30)
+        cutoff_time = time.monotonic() - 30
         
         # Remove old transactions
         old_hashes = [
-            tx_hash for tx_hash, tx in self._pending_transactions.items()
-            if tx.timestamp < cutoff_time
+            tx.hash for tx in self._mempool_index
+            if tx.first_seen_mono < cutoff_time
         ]
         
         for tx_hash in old_hashes:
-            del self._pending_transactions[tx_hash]
+            self._mempool_index.remove(tx_hash)
         
-        # Add new transactions
+        # Add transactions not yet tracked (each is inserted once)
         for tx in current_mempool:
-            self._pending_transactions[tx.hash] = tx
+            if tx.hash in self._mempool_index:
+                continue
+            self._mempool_index.add(tx)
             
             # Track gas price trends
             if tx.is_dex_interaction:
-                self._gas_price_history.append(tx.gas_price)
+                self._gas_price_history.append(tx.gas_price_wei)
 
     async def _detect_mev_threats(
         self, 
         target_tx: PendingTransaction, 
-        mempool: List[PendingTransaction]
+        mempool: MempoolView
     ) -> List[MEVThreat]:
         """
         Detect various MEV threat types against a target transaction.
@@ -524,6 +605,7 @@ class MEVProtectionEngine:
             List of detected MEV threats
         """
         threats = []
+        mempool = self._as_index(mempool)
         
         try:
             # Concurrent threat detection for performance
@@ -562,7 +644,7 @@ class MEVProtectionEngine:
     async def _detect_sandwich_attacks(
         self, 
         target_tx: PendingTransaction, 
-        mempool: List[PendingTransaction]
+        mempool: MempoolView
     ) -> List[MEVThreat]:
         """
         Detect sandwich attack patterns in the mempool.
@@ -580,56 +662,53 @@ class MEVProtectionEngine:
             return threats
             
         try:
-            # Find potential sandwich transactions
+            mempool = self._as_index(mempool)
+            
+            # Find potential sandwich transactions (same token pair only)
             frontrun_candidates = []
-            backrun_candidates = []
+            backrun_candidates: Dict[str, List[PendingTransaction]] = defaultdict(list)
             
-            for tx in mempool:
+            for tx in mempool.same_pair(target_tx):
                 if tx.hash == target_tx.hash or not tx.is_dex_interaction:
                     continue
                     
-                # Check for same token pair interaction
-                if not self._involves_same_token_pair(target_tx, tx):
-                    continue
-                    
                 # Frontrunning candidate: higher gas price, earlier timestamp
-                if (tx.gas_price > target_tx.gas_price and 
-                    tx.timestamp <= target_tx.timestamp):
+                if (tx.gas_price_wei > target_tx.gas_price_wei and 
+                    tx.first_seen_mono <= target_tx.first_seen_mono):
                     frontrun_candidates.append(tx)
                     
                 # Backrunning candidate: lower gas price, later timestamp
-                elif (tx.gas_price < target_tx.gas_price and 
-                      tx.timestamp >= target_tx.timestamp):
-                    backrun_candidates.append(tx)
+                elif (tx.gas_price_wei < target_tx.gas_price_wei and 
+                      tx.first_seen_mono >= target_tx.first_seen_mono):
+                    backrun_candidates[tx.from_address].append(tx)
             
             # Detect sandwich patterns
             for frontrun_tx in frontrun_candidates:
-                for backrun_tx in backrun_candidates:
-                    # Check if same attacker (same from address)
-                    if frontrun_tx.from_address == backrun_tx.from_address:
-                        
-                        # Calculate confidence based on pattern strength
-                        confidence = self._calculate_sandwich_confidence(
-                            frontrun_tx, target_tx, backrun_tx
+                # Only backruns from the same attacker (same from address)
+                for backrun_tx in backrun_candidates.get(frontrun_tx.from_address, ()):
+                    
+                    # Calculate confidence based on pattern strength
+                    confidence = self._calculate_sandwich_confidence(
+                        frontrun_tx, target_tx, backrun_tx
+                    )
+                    
+                    if confidence >= 0.6:  # Minimum confidence threshold
+                        threat = MEVThreat(
+                            threat_type=MEVThreatType.SANDWICH_ATTACK,
+                            target_transaction=target_tx.hash,
+                            attacker_address=frontrun_tx.from_address,
+                            frontrun_transaction=frontrun_tx.hash,
+                            backrun_transaction=backrun_tx.hash,
+                            confidence=confidence,
+                            severity=self._determine_threat_severity(confidence),
+                            estimated_profit=self._estimate_sandwich_profit(
+                                frontrun_tx, target_tx, backrun_tx
+                            ),
+                            detection_time=datetime.utcnow(),
+                            threatening_transactions=[frontrun_tx.hash, backrun_tx.hash]
                         )
                         
-                        if confidence >= 0.6:  # Minimum confidence threshold
-                            threat = MEVThreat(
-                                threat_type=MEVThreatType.SANDWICH_ATTACK,
-                                target_transaction=target_tx.hash,
-                                attacker_address=frontrun_tx.from_address,
-                                frontrun_transaction=frontrun_tx.hash,
-                                backrun_transaction=backrun_tx.hash,
-                                confidence=confidence,
-                                severity=self._determine_threat_severity(confidence),
-                                estimated_profit=self._estimate_sandwich_profit(
-                                    frontrun_tx, target_tx, backrun_tx
-                                ),
-                                detection_time=datetime.utcnow(),
-                                threatening_transactions=[frontrun_tx.hash, backrun_tx.hash]
-                            )
-                            
-                            threats.append(threat)
+                        threats.append(threat)
             
             return threats
             
@@ -640,7 +719,7 @@ class MEVProtectionEngine:
     async def _detect_frontrunning(
         self, 
         target_tx: PendingTransaction, 
-        mempool: List[PendingTransaction]
+        mempool: MempoolView
     ) -> List[MEVThreat]:
         """
         Detect frontrunning patterns in the mempool.
@@ -658,33 +737,31 @@ class MEVProtectionEngine:
             return threats
             
         try:
-            # Look for transactions with similar intent but higher gas prices
-            for tx in mempool:
+            mempool = self._as_index(mempool)
+            
+            # Look for same token interactions with higher gas prices
+            for tx in mempool.same_pair_priced_above(target_tx):
                 if tx.hash == target_tx.hash:
                     continue
+                
+                # Calculate confidence based on similarity and timing
+                confidence = self._calculate_frontrun_confidence(target_tx, tx)
+                
+                if confidence >= 0.7:  # Higher threshold for frontrunning
                     
-                # Must be same token interaction with higher gas price
-                if (self._involves_same_token_pair(target_tx, tx) and
-                    tx.gas_price > target_tx.gas_price):
-                    
-                    # Calculate confidence based on similarity and timing
-                    confidence = self._calculate_frontrun_confidence(target_tx, tx)
+                    threat = MEVThreat(
+                        threat_type=MEVThreatType.FRONTRUNNING,
+                        target_transaction=target_tx.hash,
+                        attacker_address=tx.from_address,
+                        frontrun_transaction=tx.hash,
+                        confidence=confidence,
+                        severity=self._determine_threat_severity(confidence),
+                        gas_price_advantage=float(tx.gas_price_wei - target_tx.gas_price_wei),
+                        detection_time=datetime.utcnow(),
+                        threatening_transactions=[tx.hash]
+                    )
                     
-                    if confidence >= 0.7:  # Higher threshold for frontrunning
-                        
-                        threat = MEVThreat(
-                            threat_type=MEVThreatType.FRONTRUNNING,
-                            target_transaction=target_tx.hash,
-                            attacker_address=tx.from_address,
-                            frontrun_transaction=tx.hash,
-                            confidence=confidence,
-                            severity=self._determine_threat_severity(confidence),
-                            gas_price_advantage=float(tx.gas_price - target_tx.gas_price),
-                            detection_time=datetime.utcnow(),
-                            threatening_transactions=[tx.hash]
-                        )
-                        
-                        threats.append(threat)
+                    threats.append(threat)
             
             return threats
             
@@ -695,7 +772,7 @@ class MEVProtectionEngine:
     async def _detect_backrunning(
         self, 
         target_tx: PendingTransaction, 
-        mempool: List[PendingTransaction]
+        mempool: MempoolView
     ) -> List[MEVThreat]:
         """
         Detect backrunning/arbitrage patterns that might affect the target transaction.
@@ -713,13 +790,15 @@ class MEVProtectionEngine:
             return threats
             
         try:
-            # Look for transactions that could exploit price changes from target tx
-            for tx in mempool:
+            mempool = self._as_index(mempool)
+            
+            # Look for later DEX transactions that could exploit price changes from target tx
+            for tx in mempool.dex_seen_after(target_tx.first_seen_mono):
                 if tx.hash == target_tx.hash:
                     continue
                     
                 # Check for arbitrage opportunities that follow our transaction
-                if (tx.timestamp > target_tx.timestamp and
+                if (tx.first_seen_mono > target_tx.first_seen_mono and
                     self._could_be_arbitrage_followup(target_tx, tx)):
                     
                     confidence = self._calculate_backrun_confidence(target_tx, tx)
@@ -747,7 +826,7 @@ class MEVProtectionEngine:
     async def _detect_jit_liquidity(
         self, 
         target_tx: PendingTransaction, 
-        mempool: List[PendingTransaction]
+        mempool: MempoolView
     ) -> List[MEVThreat]:
         """
         Detect Just-In-Time liquidity provision patterns.
@@ -762,26 +841,24 @@ class MEVProtectionEngine:
         threats = []
         
         try:
-            # Look for liquidity provision followed by removal around target tx
-            liquidity_adds = []
-            liquidity_removes = []
+            mempool = self._as_index(mempool)
             
-            for tx in mempool:
-                if tx.hash == target_tx.hash:
-                    continue
-                    
-                # Identify liquidity provision transactions
-                if self._is_liquidity_provision(tx):
-                    if tx.timestamp <= target_tx.timestamp:
-                        liquidity_adds.append(tx)
-                    else:
-                        liquidity_removes.append(tx)
+            # Look for liquidity provision before the target tx and removal after it
+            # (only the target's pool can be involved in a JIT pattern)
+            liquidity_adds = [
+                tx for tx in mempool.liquidity_provisions(target_tx.to_address)
+                if tx.hash != target_tx.hash and tx.first_seen_mono <= target_tx.first_seen_mono
+            ]
+            liquidity_removes: Dict[str, List[PendingTransaction]] = defaultdict(list)
+            
+            for tx in mempool.liquidity_removals(target_tx.to_address):
+                if tx.hash != target_tx.hash and tx.first_seen_mono > target_tx.first_seen_mono:
+                    liquidity_removes[tx.from_address].append(tx)
             
             # Match adds and removes from same address
             for add_tx in liquidity_adds:
-                for remove_tx in liquidity_removes:
-                    if (add_tx.from_address == remove_tx.from_address and
-                        self._involves_same_pool(add_tx, remove_tx, target_tx)):
+                for remove_tx in liquidity_removes.get(add_tx.from_address, ()):
+                    if self._involves_same_pool(add_tx, remove_tx, target_tx):
                         
                         confidence = self._calculate_jit_confidence(add_tx, target_tx, remove_tx)
                         
@@ -807,12 +884,17 @@ class MEVProtectionEngine:
             return []
     
     # Helper methods for transaction analysis
+    def _as_index(self, mempool: MempoolView) -> PendingTransactionIndex:
+        """Wrap a plain transaction list in an index for candidate lookups."""
+        if isinstance(mempool, PendingTransactionIndex):
+            return mempool
+        return PendingTransactionIndex.from_transactions(mempool)
+
     def _involves_same_token_pair(self, tx1: PendingTransaction, tx2: PendingTransaction) -> bool:
         """Check if two transactions involve the same token pair."""
-        # This is a simplified implementation
+        # This is a simplified implementation (same contract, same function signature)
         # In production, would parse transaction data to extract token addresses
-        return (tx1.to_address == tx2.to_address and 
-                tx1.data[:10] == tx2.data[:10])  # Same function signature
+        return PendingTransactionIndex.pair_key(tx1) == PendingTransactionIndex.pair_key(tx2)
 
     def _calculate_sandwich_confidence(
         self, 
@@ -824,11 +906,11 @@ class MEVProtectionEngine:
         confidence = 0.0
         
         # Gas price ordering (frontrun > target > backrun)
-        if frontrun_tx.gas_price > target_tx.gas_price > backrun_tx.gas_price:
+        if frontrun_tx.gas_price_wei > target_tx.gas_price_wei > backrun_tx.gas_price_wei:
             confidence += 0.4
         
         # Time ordering
-        if frontrun_tx.timestamp <= target_tx.timestamp <= backrun_tx.timestamp:
+        if frontrun_tx.first_seen_mono <= target_tx.first_seen_mono <= backrun_tx.first_seen_mono:
             confidence += 0.3
         
         # Same attacker address
@@ -842,16 +924,16 @@ class MEVProtectionEngine:
         confidence = 0.0
         
         # Higher gas price
-        gas_advantage = float(suspect_tx.gas_price - target_tx.gas_price) / float(target_tx.gas_price)
+        gas_advantage = float(suspect_tx.gas_price_wei - target_tx.gas_price_wei) / float(target_tx.gas_price_wei)
         if gas_advantage > 0.1:  # 10% higher gas
             confidence += 0.4
         
         # Similar transaction data
-        if target_tx.data[:10] == suspect_tx.data[:10]:  # Same function
+        if target_tx.selector == suspect_tx.selector:  # Same function
             confidence += 0.4
         
         # Time proximity
-        time_diff = abs((suspect_tx.timestamp - target_tx.timestamp).total_seconds())
+        time_diff = abs(suspect_tx.first_seen_mono - target_tx.first_seen_mono)
         if time_diff < 60:  # Within 1 minute
             confidence += 0.2
         
@@ -1023,14 +1105,14 @@ class MEVProtectionEngine:
         # Simple heuristic: different DEX interaction after our transaction
         return (suspect_tx.is_dex_interaction and 
                 suspect_tx.to_address != target_tx.to_address and
-                suspect_tx.timestamp > target_tx.timestamp)
+                suspect_tx.first_seen_mono > target_tx.first_seen_mono)
 
     def _calculate_backrun_confidence(self, target_tx: PendingTransaction, suspect_tx: PendingTransaction) -> float:
         """Calculate confidence for backrunning pattern."""
         confidence = 0.0
         
         # Time ordering (suspect after target)
-        if suspect_tx.timestamp > target_tx.timestamp:
+        if suspect_tx.first_seen_mono > target_tx.first_seen_mono:
             confidence += 0.3
         
         # Different DEX (arbitrage pattern)
@@ -1038,39 +1120,26 @@ class MEVProtectionEngine:
             confidence += 0.4
         
         # Value correlation
-        if abs(float(suspect_tx.value - target_tx.value)) / float(target_tx.value) < 0.5:
+        if abs(float(suspect_tx.value_wei - target_tx.value_wei)) / float(target_tx.value_wei) < 0.5:
             confidence += 0.3
         
         return min(confidence, 1.0)
 
     def _is_liquidity_provision(self, tx: PendingTransaction) -> bool:
         """Check if transaction is liquidity provision."""
-        # Common LP function signatures
-        lp_signatures = [
-            '0xe8e33700',  # addLiquidity
-            '0xf305d719',  # addLiquidityETH
-            '0xbaa2abde',  # addLiquidityETH (V3)
-            '0x0c49ccbe',  # mint (V3)
-        ]
-        
-        if len(tx.data) >= 10:
-            function_sig = tx.data[:10].lower()
-            return function_sig in lp_signatures
-        
-        return False
+        return PendingTransactionIndex.is_liquidity_provision(tx)
 
     def _involves_same_pool(self, add_tx: PendingTransaction, remove_tx: PendingTransaction, target_tx: PendingTransaction) -> bool:
         """Check if transactions involve the same liquidity pool."""
-        # Simplified check - in production would parse transaction data
-        return (add_tx.to_address == remove_tx.to_address and
-                self._involves_same_token_pair(add_tx, target_tx))
+        # Simplified check (same pool/router contract) - in production would parse transaction data
+        return add_tx.to_address == remove_tx.to_address == target_tx.to_address
 
     def _calculate_jit_confidence(self, add_tx: PendingTransaction, target_tx: PendingTransaction, remove_tx: PendingTransaction) -> float:
         """Calculate confidence for JIT liquidity pattern."""
         confidence = 0.0
         
         # Time ordering (add before target, remove after)
-        if add_tx.timestamp <= target_tx.timestamp <= remove_tx.timestamp:
+        if add_tx.first_seen_mono <= target_tx.first_seen_mono <= remove_tx.first_seen_mono:
             confidence += 0.4
         
         # Same attacker
@@ -1155,7 +1224,10 @@ class MEVProtectionEngine:
             "active_threats": len(self._active_threats),
             "protection_actions": dict(self._protection_actions_taken),
             "average_analysis_time_ms": avg_analysis_time,
-            "mempool_transactions_tracked": len(self._pending_transactions),
+            "mempool_transactions_tracked": len(self._mempool_index) + sum(
+                len(view) for view in self._mempool_views.values()
+            ),
+            "shared_mempool_views": sorted(self._mempool_views.keys()),
             "gas_price_samples": len(self._gas_price_history),
             "detection_accuracy": sum(self._detection_accuracy) / len(self._detection_accuracy) if self._detection_accuracy else 0.0
         }
@@ -0,0 +1,238 @@
+"""
+Compact Mempool Transaction Records
+
+This module provides the memory-compact transaction record shared by the
+mempool monitor, the pending transaction index and the MEV protection engine.
+Records use __slots__, integer wei amounts, raw bytes calldata and monotonic
+float timestamps; the rich Decimal/datetime/hex-string views are computed
+lazily only when a caller (e.g. threat reporting) asks for them.
+
+Key Features:
+- Slotted record base class for MempoolTransaction and PendingTransaction
+- Integer wei fields instead of Decimal
+- Raw bytes calldata instead of hex strings
+- Monotonic float timestamps with datetime conversion on demand
+
+File: dexproject/engine/mempool/records.py
+Django App: N/A (Pure engine component)
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Optional, Union
+
+
+# =============================================================================
+# CONVERSION HELPERS
+# =============================================================================
+
+# Wall clock / monotonic clock anchor used for datetime <-> monotonic conversion.
+# Naive datetimes are treated as UTC, matching datetime.utcnow() elsewhere.
+_WALL_ANCHOR = datetime.utcnow()
+_MONO_ANCHOR = time.monotonic()
+
+Moment = Union[datetime, float, int]
+Amount = Union[Decimal, int, str, None]
+Calldata = Union[bytes, bytearray, str, None]
+
+
+def to_monotonic(moment: Optional[Moment]) -> float:
+    """
+    Convert a datetime (or an existing monotonic timestamp) to monotonic seconds.
+
+    Args:
+        moment: Naive UTC / aware datetime, monotonic float, or None for now
+
+    Returns:
+        Monotonic timestamp in seconds
+    """
+    if moment is None:
+        return time.monotonic()
+    if isinstance(moment, datetime):
+        if moment.tzinfo is not None:
+            moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+        return _MONO_ANCHOR + (moment - _WALL_ANCHOR).total_seconds()
+    return float(moment)
+
+
+def monotonic_to_datetime(mono: float) -> datetime:
+    """Convert a monotonic timestamp back to a naive UTC datetime."""
+    return _WALL_ANCHOR + timedelta(seconds=mono - _MONO_ANCHOR)
+
+
+def to_wei(amount: Amount) -> int:
+    """Convert a Decimal/int/hex-string amount to integer wei."""
+    if amount is None:
+        return 0
+    if isinstance(amount, str):
+        return int(amount, 16) if amount.startswith('0x') else int(Decimal(amount))
+    return int(amount)
+
+
+def to_calldata(data: Calldata) -> bytes:
+    """
+    Convert hex-string calldata to raw bytes.
+
+    Args:
+        data: '0x'-prefixed hex string, raw bytes or None
+
+    Returns:
+        Raw calldata bytes
+
+    Raises:
+        ValueError: If the hex string is not valid hex
+    """
+    if not data:
+        return b''
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    hex_data = data[2:] if data[:2] in ('0x', '0X') else data
+    if len(hex_data) % 2:
+        hex_data = '0' + hex_data
+    return bytes.fromhex(hex_data)
+
+
+# =============================================================================
+# COMPACT RECORD
+# =============================================================================
+
+class CompactTransaction:
+    """
+    Memory-compact pending transaction record.
+
+    Hot-path consumers (index, expiry, MEV detectors) read the compact fields
+    directly; value, gas_price, data and timestamp are rich views built on
+    access.
+    """
+
+    __slots__ = (
+        'hash',
+        'from_address',
+        'to_address',
+        'value_wei',
+        'gas_price_wei',
+        'gas_limit',
+        'nonce',
+        'calldata',
+        'first_seen_mono',
+        'last_seen_mono',
+        'is_dex_interaction',
+        'dex_name',
+        'target_token',
+        'swap_amount_in_wei',
+        'swap_amount_out_wei',
+        'swap_params',
+    )
+
+    def __init__(
+        self,
+        hash: str,
+        from_address: str,
+        to_address: Optional[str],
+        value_wei: int,
+        gas_price_wei: int,
+        gas_limit: int,
+        nonce: int,
+        calldata: bytes,
+        first_seen_mono: float,
+        last_seen_mono: Optional[float] = None,
+        is_dex_interaction: bool = False,
+        dex_name: Optional[str] = None,
+        target_token: Optional[str] = None,
+        swap_amount_in_wei: Optional[int] = None,
+        swap_amount_out_wei: Optional[int] = None,
+        swap_params: Optional[Any] = None
+    ):
+        self.hash = hash
+        self.from_address = from_address
+        self.to_address = to_address
+        self.value_wei = value_wei
+        self.gas_price_wei = gas_price_wei
+        self.gas_limit = gas_limit
+        self.nonce = nonce
+        self.calldata = calldata
+        self.first_seen_mono = first_seen_mono
+        self.last_seen_mono = first_seen_mono if last_seen_mono is None else last_seen_mono
+        self.is_dex_interaction = is_dex_interaction
+        self.dex_name = dex_name
+        self.target_token = target_token
+        self.swap_amount_in_wei = swap_amount_in_wei
+        self.swap_amount_out_wei = swap_amount_out_wei
+        self.swap_params = swap_params  # Decoded SwapParams, set on ingest
+
+    def _init_from(self, record: 'CompactTransaction') -> None:
+        """Copy the compact fields of another record (no rich conversion)."""
+        for slot in CompactTransaction.__slots__:
+            setattr(self, slot, getattr(record, slot))
+
+    # =========================================================================
+    # COMPACT ACCESSORS
+    # =========================================================================
+
+    @property
+    def selector(self) -> bytes:
+        """4-byte function selector (empty for plain transfers)."""
+        return self.calldata[:4]
+
+    # =========================================================================
+    # RICH (LAZY) VIEWS
+    # =========================================================================
+
+    @property
+    def value(self) -> Decimal:
+        """Value in wei as Decimal."""
+        return Decimal(self.value_wei)
+
+    @property
+    def gas_price(self) -> Decimal:
+        """Gas price in wei as Decimal."""
+        return Decimal(self.gas_price_wei)
+
+    @property
+    def data(self) -> str:
+        """Calldata as a '0x'-prefixed hex string."""
+        return '0x' + self.calldata.hex()
+
+    @property
+    def timestamp(self) -> datetime:
+        """First-seen time as a naive UTC datetime."""
+        return monotonic_to_datetime(self.first_seen_mono)
+
+    @property
+    def swap_amount_in(self) -> Optional[Decimal]:
+        """Decoded swap input amount in wei, if known."""
+        return None if self.swap_amount_in_wei is None else Decimal(self.swap_amount_in_wei)
+
+    @swap_amount_in.setter
+    def swap_amount_in(self, amount: Amount) -> None:
+        self.swap_amount_in_wei = None if amount is None else to_wei(amount)
+
+    @property
+    def swap_amount_out(self) -> Optional[Decimal]:
+        """Decoded swap output amount in wei, if known."""
+        return None if self.swap_amount_out_wei is None else Decimal(self.swap_amount_out_wei)
+
+    @swap_amount_out.setter
+    def swap_amount_out(self, amount: Amount) -> None:
+        self.swap_amount_out_wei = None if amount is None else to_wei(amount)
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(hash={self.hash!r}, from_address={self.from_address!r}, "
+            f"to_address={self.to_address!r}, value_wei={self.value_wei}, "
+            f"gas_price_wei={self.gas_price_wei}, selector=0x{self.selector.hex()})"
+        )
+
+
+# =============================================================================
+# MODULE EXPORTS
+# =============================================================================
+
+__all__ = [
+    'CompactTransaction',
+    'to_monotonic',
+    'monotonic_to_datetime',
+    'to_wei',
+    'to_calldata',
+]
@@ -0,0 +1,292 @@
+"""
+Multicall3 Batch Read Layer for DEX Auto-Trading Bot
+
+This module packs many read-only contract calls - across many tokens and
+pools - into a single Multicall3 aggregate3 eth_call, then decodes the
+results per call. A failing call (revert, empty return data, undecodable
+output) is reported on its own result without failing the rest of the batch.
+
+Works with any executor that awaits `operation(async_w3, *args)` with
+failover, i.e. Web3Client._execute_with_retry,
+ProviderManager.execute_with_retry (both on the async JSON-RPC transport) or
+ProviderManager.execute_batched (JSON-RPC batch window).
+
+File: dexproject/engine/multicall.py
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from eth_abi import decode, encode
+from eth_utils import keccak, to_checksum_address
+from web3 import AsyncWeb3
+
+logger = logging.getLogger(__name__)
+
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = '0xcA11bde05977b3631167028862bE2a173976CA11'
+
+# aggregate3((address target, bool allowFailure, bytes callData)[])
+AGGREGATE3_SELECTOR = keccak(text='aggregate3((address,bool,bytes)[])')[:4]
+
+# Calls per eth_call; keeps request gas and response size within provider limits
+DEFAULT_MAX_BATCH_SIZE = 500
+
+Executor = Callable[..., Awaitable[Any]]
+
+
+@dataclass
+class MulticallRequest:
+    """A single read-only call to include in a multicall batch."""
+    target: str
+    signature: str  # e.g. 'balanceOf(address)'
+    output_types: Tuple[str, ...]
+    args: Tuple[Any, ...] = ()
+    default: Any = None
+    calldata: bytes = field(init=False, repr=False, default=b'')
+
+    def __post_init__(self):
+        """Checksum target and precompute calldata."""
+        self.target = to_checksum_address(self.target)
+        input_types = self.signature[self.signature.index('(') + 1:-1]
+        selector = keccak(text=self.signature)[:4]
+        if input_types:
+            self.calldata = selector + encode(input_types.split(','), list(self.args))
+        else:
+            self.calldata = selector
+
+
+@dataclass
+class MulticallResult:
+    """Decoded outcome of one call in a multicall batch."""
+    success: bool
+    value: Any
+    error: Optional[str] = None
+
+
+# ====================
+# ENCODING / DECODING
+# ====================
+
+def encode_aggregate3(requests: Sequence[MulticallRequest]) -> bytes:
+    """
+    Encode an aggregate3 call for a batch of requests.
+
+    Args:
+        requests: Calls to pack (each allowed to fail independently)
+
+    Returns:
+        Calldata for the Multicall3 contract
+    """
+    calls = [(request.target, True, request.calldata) for request in requests]
+    return AGGREGATE3_SELECTOR + encode(['(address,bool,bytes)[]'], [calls])
+
+
+def decode_call_result(request: MulticallRequest, success: bool, data: bytes) -> MulticallResult:
+    """
+    Decode the return data of one call.
+
+    Args:
+        request: The originating request
+        success: Whether the call succeeded on-chain
+        data: Raw return data
+
+    Returns:
+        MulticallResult with the decoded value, or the request default on failure
+    """
+    if not success:
+        return MulticallResult(False, request.default, 'reverted')
+    if not data:
+        # Calls to addresses without code succeed with empty return data
+        return MulticallResult(False, request.default, 'empty return data')
+
+    try:
+        values = decode(list(request.output_types), data)
+    except Exception as e:
+        # Some older tokens (e.g. MKR) return bytes32 instead of string
+        if request.output_types == ('string',) and len(data) == 32:
+            return MulticallResult(True, data.rstrip(b'\x00').decode('utf-8', 'replace'))
+        return MulticallResult(False, request.default, f'decode error: {e}')
+
+    value = values[0] if len(values) == 1 else values
+    return MulticallResult(True, value)
+
+
+def decode_aggregate3(data: bytes, requests: Sequence[MulticallRequest]) -> List[MulticallResult]:
+    """
+    Decode aggregate3 return data into per-call results.
+
+    Args:
+        data: Raw return data of the aggregate3 call
+        requests: The requests in the order they were encoded
+
+    Returns:
+        One MulticallResult per request
+    """
+    (results,) = decode(['(bool,bytes)[]'], data)
+    if len(results) != len(requests):
+        raise ValueError(f"Multicall returned {len(results)} results for {len(requests)} calls")
+
+    return [
+        decode_call_result(request, success, return_data)
+        for request, (success, return_data) in zip(requests, results)
+    ]
+
+
+# ====================
+# EXECUTION
+# ====================
+
+async def _call_batch(
+    w3: AsyncWeb3,
+    requests: Sequence[MulticallRequest],
+    block_identifier: Union[int, str]
+) -> List[MulticallResult]:
+    """Run one aggregate3 eth_call (falls back to direct calls without Multicall3)."""
+    data = await w3.eth.call(
+        {'to': MULTICALL3_ADDRESS, 'data': encode_aggregate3(requests)},
+        block_identifier
+    )
+    if data:
+        return decode_aggregate3(bytes(data), requests)
+
+    # Empty response: Multicall3 is not deployed on this network
+    logger.warning("Multicall3 unavailable, falling back to individual eth_calls")
+    results = []
+    for request in requests:
+        try:
+            raw = await w3.eth.call({'to': request.target, 'data': request.calldata}, block_identifier)
+            results.append(decode_call_result(request, True, bytes(raw)))
+        except Exception as e:
+            results.append(MulticallResult(False, request.default, str(e)))
+    return results
+
+
+async def execute_multicall(
+    executor: Executor,
+    requests: Sequence[MulticallRequest],
+    block_identifier: Union[int, str] = 'latest',
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE
+) -> List[MulticallResult]:
+    """
+    Execute read-only calls through Multicall3, one eth_call per chunk.
+
+    Args:
+        executor: Failover executor awaiting operation(async_w3, *args)
+        requests: Calls to execute
+        block_identifier: Block to read at
+        max_batch_size: Maximum calls per eth_call
+
+    Returns:
+        One MulticallResult per request, in request order
+    """
+    results: List[MulticallResult] = []
+    for start in range(0, len(requests), max_batch_size):
+        chunk = requests[start:start + max_batch_size]
+        results.extend(await executor(_call_batch, chunk, block_identifier))
+    return results
+
+
+# ====================
+# TOKEN METADATA
+# ====================
+
+ERC20_METADATA_CALLS = (
+    ('symbol', 'symbol()', ('string',), 'UNKNOWN'),
+    ('name', 'name()', ('string',), 'Unknown Token'),
+    ('decimals', 'decimals()', ('uint8',), 18),
+    ('total_supply', 'totalSupply()', ('uint256',), 0),
+)
+
+
+def token_metadata_requests(token_address: str) -> List[MulticallRequest]:
+    """
+    Build the ERC-20 metadata calls for one token.
+
+    Args:
+        token_address: Token contract address
+
+    Returns:
+        Requests for symbol, name, decimals and totalSupply
+    """
+    return [
+        MulticallRequest(token_address, signature, output_types, default=default)
+        for _, signature, output_types, default in ERC20_METADATA_CALLS
+    ]
+
+
+def token_metadata_from_results(
+    token_address: str,
+    results: Sequence[MulticallResult]
+) -> Optional[Dict[str, Any]]:
+    """
+    Assemble token metadata from the results of token_metadata_requests.
+
+    Args:
+        token_address: Token contract address
+        results: Results for the token's metadata requests, in order
+
+    Returns:
+        Metadata dict (with per-field 'failed_calls'), or None if no call
+        succeeded (e.g. no contract code at the address)
+    """
+    if not any(result.success for result in results):
+        return None
+
+    metadata: Dict[str, Any] = {'address': to_checksum_address(token_address)}
+    failed_calls = []
+    for (key, _, _, _), result in zip(ERC20_METADATA_CALLS, results):
+        metadata[key] = result.value
+        if not result.success:
+            failed_calls.append(key)
+    metadata['failed_calls'] = failed_calls
+    return metadata
+
+
+async def fetch_token_metadata(
+    executor: Executor,
+    token_addresses: Sequence[str],
+    extra_requests: Sequence[MulticallRequest] = ()
+) -> Tuple[Dict[str, Optional[Dict[str, Any]]], List[MulticallResult]]:
+    """
+    Fetch ERC-20 metadata for many tokens in a single round trip.
+
+    Args:
+        executor: Failover executor awaiting operation(async_w3, *args)
+        token_addresses: Tokens to look up (duplicates are fetched once)
+        extra_requests: Additional calls to piggyback on the same eth_call
+
+    Returns:
+        Tuple of (address -> metadata or None, results for extra_requests)
+    """
+    unique = list(dict.fromkeys(to_checksum_address(address) for address in token_addresses))
+    per_token = len(ERC20_METADATA_CALLS)
+
+    requests: List[MulticallRequest] = []
+    for address in unique:
+        requests.extend(token_metadata_requests(address))
+    requests.extend(extra_requests)
+
+    results = await execute_multicall(executor, requests)
+
+    metadata = {
+        address: token_metadata_from_results(address, results[i * per_token:(i + 1) * per_token])
+        for i, address in enumerate(unique)
+    }
+    return metadata, results[len(unique) * per_token:]
+
+
+__all__ = [
+    'MULTICALL3_ADDRESS',
+    'MulticallRequest',
+    'MulticallResult',
+    'encode_aggregate3',
+    'decode_aggregate3',
+    'decode_call_result',
+    'execute_multicall',
+    'token_metadata_requests',
+    'token_metadata_from_results',
+    'fetch_token_metadata',
+]
@@ -0,0 +1,312 @@
+"""
+Async JSON-RPC Transport for DEX Auto-Trading Bot
+
+This module provides a non-blocking JSON-RPC transport built on a pooled
+aiohttp session, so RPC calls made from engine coroutines no longer stall the
+event loop that also runs the mempool websocket and the fast lane.
+
+Key Features:
+- One pooled keep-alive aiohttp session per provider
+- Per-provider concurrency limit (bounded in-flight requests)
+- Request pipelining: many calls in flight concurrently on pooled connections
+- JSON-RPC batches: many calls in one HTTP request, responses matched by id
+- Web3 AsyncJSONBaseProvider adapter so AsyncWeb3 (contracts, formatters)
+  runs on the same pooled transport
+
+File: dexproject/engine/rpc_transport.py
+"""
+
+import asyncio
+import itertools
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+from web3.providers.async_base import AsyncJSONBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_KEEPALIVE_SECONDS = 30
+
+RpcCall = Tuple[str, List[Any]]
+RpcDispatch = Callable[[str, Any], Awaitable[Dict[str, Any]]]
+
+
+class JsonRpcError(Exception):
+    """Error object returned by a JSON-RPC endpoint."""
+
+    def __init__(self, code: int, message: str, data: Any = None):
+        super().__init__(f"JSON-RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class AsyncJsonRpcTransport:
+    """
+    Pooled, concurrency-limited JSON-RPC client for a single provider.
+
+    Requests share one aiohttp session with keep-alive connections; the
+    semaphore caps in-flight requests at the provider's concurrency limit so
+    bursts queue locally instead of tripping provider rate limits.
+
+    The session and semaphore belong to the event loop that created them;
+    a transport used from another loop (e.g. a cached ProviderManager
+    reached from several async_to_sync call sites) rebuilds both there.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        name: Optional[str] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        timeout_seconds: float = 10,
+        keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS
+    ):
+        """
+        Initialize the transport.
+
+        Args:
+            url: JSON-RPC HTTP endpoint
+            name: Provider name for logging
+            max_concurrency: Maximum in-flight requests to this provider
+            timeout_seconds: Total timeout per HTTP request
+            keepalive_seconds: Idle keep-alive time for pooled connections
+        """
+        self.url = url
+        self.name = name or url
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.logger = logging.getLogger(f'engine.rpc.{self.name}')
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ids = itertools.count(1)
+
+        # Performance tracking
+        self.total_requests = 0
+        self.total_batches = 0
+        self.failed_requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def _bind_to_running_loop(self) -> None:
+        """Rebuild the session and semaphore when called from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._loop is not None:
+            self.logger.debug("Event loop changed, rebuilding pooled session")
+            session = self._session
+            if session is not None and not session.closed:
+                if self._loop.is_running():
+                    # Close the old pool on the loop that owns it
+                    asyncio.run_coroutine_threadsafe(session.close(), self._loop)
+                elif session.connector is not None:
+                    # Owning loop is gone: drop its sockets now rather than leak them
+                    session.connector._close()
+
+        self._loop = loop
+        self._session = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session lazily (must run inside the event loop)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                keepalive_timeout=self.keepalive_seconds,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+                headers={'Content-Type': 'application/json'}
+            )
+        return self._session
+
+    def next_id(self) -> int:
+        """Allocate a request id."""
+        return next(self._ids)
+
+    async def send(self, payload: Any) -> Any:
+        """
+        POST a raw JSON-RPC payload (single request dict or batch list).
+
+        Args:
+            payload: JSON-serializable request body, or pre-encoded JSON bytes
+
+        Returns:
+            Decoded JSON response body
+
+        Raises:
+            aiohttp.ClientError: On transport failures or non-2xx status
+            asyncio.TimeoutError: When the request exceeds the timeout
+        """
+        self._bind_to_running_loop()
+        async with self._semaphore:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.total_requests += 1
+            try:
+                session = self._get_session()
+                if isinstance(payload, (bytes, str)):
+                    post = session.post(self.url, data=payload)
+                else:
+                    post = session.post(self.url, json=payload)
+                async with post as response:
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+            except Exception:
+                self.failed_requests += 1
+                raise
+            finally:
+                self.in_flight -= 1
+
+    async def request(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Execute a single JSON-RPC call.
+
+        Args:
+            method: JSON-RPC method name (e.g. 'eth_blockNumber')
+            params: Positional parameters
+
+        Returns:
+            The 'result' member of the response
+
+        Raises:
+            JsonRpcError: If the endpoint returned an error object
+        """
+        response = await self.send({
+            'jsonrpc': '2.0',
+            'id': self.next_id(),
+            'method': method,
+            'params': params or [],
+        })
+        if response.get('error'):
+            error = response['error']
+            raise JsonRpcError(error.get('code', -1), error.get('message', ''), error.get('data'))
+        return response.get('result')
+
+    async def request_many(self, calls: Sequence[RpcCall]) -> List[Any]:
+        """
+        Pipeline many calls: all are put in flight at once, bounded by the
+        concurrency limit, over the pooled keep-alive connections.
+
+        Args:
+            calls: (method, params) pairs
+
+        Returns:
+            Results in call order; failed calls are returned as exceptions
+        """
+        return await asyncio.gather(
+            *(self.request(method, params) for method, params in calls),
+            return_exceptions=True
+        )
+
+    async def send_batch(self, requests: Sequence[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Send JSON-RPC request objects as one HTTP array payload.
+
+        Args:
+            requests: Request objects, each with a unique 'id'
+
+        Returns:
+            Response objects in request order; None where the endpoint
+            returned no response for a request
+
+        Raises:
+            JsonRpcError: If the endpoint rejected the batch as a whole
+        """
+        self.total_batches += 1
+        response = await self.send(AsyncJSONBaseProvider.encode_rpc_dict(list(requests)))
+        if not isinstance(response, list):
+            # Batch rejected as a whole (too large, batching disabled, ...)
+            error = (response or {}).get('error') or {}
+            raise JsonRpcError(error.get('code', -1), error.get('message', 'invalid batch response'))
+
+        by_id = {item.get('id'): item for item in response if isinstance(item, dict)}
+        return [by_id.get(request['id']) for request in requests]
+
+    async def close(self) -> None:
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            if self._loop is None or self._loop is asyncio.get_running_loop():
+                await self._session.close()
+            elif self._loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._session.close(), self._loop)
+        self._session = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get transport statistics."""
+        return {
+            'url': self.url,
+            'max_concurrency': self.max_concurrency,
+            'total_requests': self.total_requests,
+            'total_batches': self.total_batches,
+            'failed_requests': self.failed_requests,
+            'in_flight': self.in_flight,
+            'peak_in_flight': self.peak_in_flight,
+        }
+
+
+class AsyncJsonRpcProvider(AsyncJSONBaseProvider):
+    """AsyncWeb3 provider backed by a pooled AsyncJsonRpcTransport."""
+
+    def __init__(self, transport: AsyncJsonRpcTransport, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.transport = transport
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send one request through the shared transport."""
+        return await self.transport.send(self.encode_rpc_request(method, params))
+
+    async def make_batch_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> List[RPCResponse]:
+        """Send a web3 batch as one JSON array payload."""
+        response = await self.transport.send(self.encode_batch_rpc_request(requests))
+        if isinstance(response, list):
+            return sorted(response, key=lambda item: item.get('id', 0))
+        return response
+
+    def __repr__(self) -> str:
+        return f"AsyncJsonRpcProvider({self.transport.name})"
+
+
+class BatchingJsonRpcProvider(AsyncJSONBaseProvider):
+    """
+    AsyncWeb3 provider that hands every request to a dispatcher.
+
+    The dispatcher (ProviderManager's request batcher) coalesces requests
+    made within a short window into one JSON-RPC batch and resolves each
+    request with its own response object.
+    """
+
+    def __init__(self, dispatch: RpcDispatch, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.dispatch = dispatch
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Queue one request for the next batch."""
+        return await self.dispatch(method, params)
+
+    async def make_batch_request(self, requests: List[Tuple[RPCEndpoint, Any]]) -> List[RPCResponse]:
+        """Queue every request of a web3 batch; they flush together."""
+        return list(await asyncio.gather(*(self.dispatch(method, params) for method, params in requests)))
+
+    def __repr__(self) -> str:
+        return "BatchingJsonRpcProvider()"
+
+
+__all__ = [
+    'AsyncJsonRpcTransport',
+    'AsyncJsonRpcProvider',
+    'BatchingJsonRpcProvider',
+    'JsonRpcError',
+]
@@ -75,6 +75,12 @@ class SmartLaneConfig:
     max_acceptable_risk_score: float = 0.7  # 0-1 scale
     min_confidence_threshold: float = 0.5   # 0-1 scale
     
+    # Early exit: a confident score at or above the threshold in a critical
+    # category blocks a BUY, so the remaining categories are cancelled
+    early_exit_enabled: bool = True
+    critical_categories: List[RiskCategory] = None  # Default: honeypot, contract security
+    critical_risk_threshold: float = 0.9    # 0-1 scale
+    
     # Position sizing
     enable_dynamic_sizing: bool = True
     max_position_size_percent: float = 10.0  # % of portfolio
@@ -90,6 +96,12 @@ class SmartLaneConfig:
         
         if self.technical_timeframes is None:
             self.technical_timeframes = ["5m", "30m", "4h"]
+        
+        if self.critical_categories is None:
+            self.critical_categories = [
+                RiskCategory.HONEYPOT_DETECTION,
+                RiskCategory.CONTRACT_SECURITY
+            ]
 
 
 @dataclass
@@ -154,6 +166,10 @@ class SmartLaneAnalysis:
     # Warnings and Alerts
     critical_warnings: List[str]
     informational_notes: List[str]
+    
+    # Early exit (risk_scores holds only the categories completed)
+    is_partial: bool = False
+    early_exit_reason: Optional[str] = None
 
 
 # Version information
@@ -0,0 +1,304 @@
+"""
+Smart Lane Admission Controller
+
+Bounded priority queue in front of the pipeline's analysis slots
+(MAX_CONCURRENT_ANALYSES). When every slot is busy, requests wait in
+priority order - reassessments of positions we hold before manual
+requests, new-pair discovery and cache warming, and within a priority
+higher-liquidity pairs first - instead of polling for a free slot.
+
+Requests that can no longer finish by their deadline (given the recent
+average analysis time) are dropped while waiting, and when the queue is
+full the lowest-priority request is shed.
+
+Path: engine/smart_lane/admission.py
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Maximum number of requests waiting for a slot
+DEFAULT_MAX_QUEUE_SIZE = 100
+
+
+class AnalysisPriority(IntEnum):
+    """Admission priority of an analysis request (lower is served first)."""
+    POSITION_EXIT = 0      # Reassessing a position we hold
+    MANUAL = 1             # User-triggered analysis
+    NEW_PAIR = 2           # Discovery of a newly listed pair
+    BACKGROUND = 3         # Cache warming and other speculative work
+
+
+class AnalysisRejectedError(Exception):
+    """Raised when an analysis request is not admitted."""
+
+    QUEUE_FULL = 'queue_full'
+    DEADLINE = 'deadline'
+
+    def __init__(self, reason: str, message: str):
+        super().__init__(message)
+        self.reason = reason
+
+
+def classify_request(context: Dict[str, Any]) -> AnalysisPriority:
+    """
+    Derive the admission priority of a request from its analysis context.
+
+    Args:
+        context: Analysis context ('priority' - a tier value or name -
+            overrides the flags; unknown values are ignored)
+
+    Returns:
+        Admission priority
+    """
+    priority = context.get('priority')
+    if priority is not None:
+        try:
+            if isinstance(priority, str) and not priority.isdigit():
+                return AnalysisPriority[priority.upper()]
+            return AnalysisPriority(int(priority))
+        except (KeyError, TypeError, ValueError):
+            logger.warning(f"Ignoring unknown analysis priority {priority!r}")
+    if context.get('position_exit') or context.get('position_id'):
+        return AnalysisPriority.POSITION_EXIT
+    if context.get('manual_trigger'):
+        return AnalysisPriority.MANUAL
+    if context.get('cache_warming'):
+        return AnalysisPriority.BACKGROUND
+    return AnalysisPriority.NEW_PAIR
+
+
+@dataclass(order=True)
+class _Ticket:
+    """A waiting request; ordered by priority, then liquidity, then arrival."""
+    priority: int
+    neg_liquidity: float
+    sequence: int
+    deadline: float = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class AdmissionController:
+    """
+    Priority admission to a fixed number of concurrent analysis slots.
+
+    Example usage:
+        admission = AdmissionController(max_concurrent=10)
+
+        await admission.acquire(AnalysisPriority.NEW_PAIR, liquidity_usd, deadline)
+        try:
+            ...  # run the analysis
+        finally:
+            admission.release()
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        expected_duration: Optional[Callable[[], float]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize with every slot free.
+
+        Args:
+            max_concurrent: Number of analysis slots
+            max_queue_size: Maximum waiting requests
+            expected_duration: Returns the expected analysis time in seconds
+                (a waiting request is dropped once it cannot finish in time)
+            clock: Monotonic clock in seconds
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue_size = max_queue_size
+        self._expected_duration = expected_duration or (lambda: 0.0)
+        self._clock = clock
+
+        self.active = 0
+        self._queue: List[_Ticket] = []
+        self._sequence = itertools.count()
+
+        # Metrics
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_full = 0
+        self.dropped_deadline = 0
+        self.max_queue_depth = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._wait_by_priority: Dict[str, List[float]] = {}  # name -> [total, count]
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a slot."""
+        return len(self._queue)
+
+    # =========================================================================
+    # ADMISSION
+    # =========================================================================
+
+    async def acquire(
+        self,
+        priority: AnalysisPriority = AnalysisPriority.NEW_PAIR,
+        liquidity_usd: float = 0.0,
+        deadline: Optional[float] = None
+    ) -> None:
+        """
+        Wait for an analysis slot.
+
+        Args:
+            priority: Admission priority
+            liquidity_usd: Pair liquidity (orders requests of equal priority)
+            deadline: Clock time by which the analysis must finish
+
+        Raises:
+            AnalysisRejectedError: If the queue is full of higher-priority
+                requests or the deadline can no longer be met
+        """
+        if self.active < self.max_concurrent and not self._queue:
+            self.active += 1
+            self._record_admission(priority, 0.0)
+            return
+
+        now = self._clock()
+        ticket = _Ticket(
+            priority=int(priority),
+            neg_liquidity=-float(liquidity_usd or 0.0),
+            sequence=next(self._sequence),
+            deadline=deadline if deadline is not None else float('inf'),
+            enqueued_at=now,
+            future=asyncio.get_running_loop().create_future()
+        )
+
+        if len(self._queue) >= self.max_queue_size:
+            # Shed the lowest-priority request (possibly this one)
+            worst = max(self._queue)
+            if ticket > worst:
+                self.rejected_full += 1
+                raise AnalysisRejectedError(
+                    AnalysisRejectedError.QUEUE_FULL,
+                    f"Admission queue full ({self.max_queue_size} waiting)"
+                )
+            self._queue.remove(worst)
+            heapq.heapify(self._queue)
+            self.rejected_full += 1
+            worst.future.set_exception(AnalysisRejectedError(
+                AnalysisRejectedError.QUEUE_FULL,
+                "Shed from full admission queue by a higher-priority request"
+            ))
+
+        heapq.heappush(self._queue, ticket)
+        self.queued += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+
+        # Stop waiting once the analysis could no longer finish in time
+        timeout = None if deadline is None else deadline - self._expected_duration() - now
+        try:
+            if timeout is not None and timeout <= 0:
+                raise asyncio.TimeoutError
+            await asyncio.wait_for(asyncio.shield(ticket.future), timeout=timeout)
+
+        except asyncio.TimeoutError:
+            if not ticket.future.done():
+                self._drop(ticket)
+                raise AnalysisRejectedError(
+                    AnalysisRejectedError.DEADLINE,
+                    f"Dropped after waiting {self._clock() - now:.2f}s: "
+                    f"analysis could not finish before its deadline"
+                )
+            # Admitted in the same turn the wait timed out
+            ticket.future.result()
+
+        except asyncio.CancelledError:
+            if not ticket.future.done():
+                self._remove(ticket)
+            elif not ticket.future.cancelled() and ticket.future.exception() is None:
+                self.release()  # Admitted just as the caller gave up
+            raise
+
+    def release(self) -> None:
+        """Free a slot and admit the best waiting request that can still finish."""
+        self.active -= 1
+
+        while self._queue and self.active < self.max_concurrent:
+            ticket = heapq.heappop(self._queue)
+            now = self._clock()
+
+            if ticket.deadline - now < self._expected_duration():
+                self.dropped_deadline += 1
+                ticket.future.set_exception(AnalysisRejectedError(
+                    AnalysisRejectedError.DEADLINE,
+                    f"Dropped after waiting {now - ticket.enqueued_at:.2f}s: "
+                    f"analysis could not finish before its deadline"
+                ))
+                continue
+
+            self.active += 1
+            self._record_admission(AnalysisPriority(ticket.priority), now - ticket.enqueued_at)
+            ticket.future.set_result(None)
+
+    def _drop(self, ticket: _Ticket) -> None:
+        """Remove a waiting request that ran out of time."""
+        self._remove(ticket)
+        self.dropped_deadline += 1
+
+    def _remove(self, ticket: _Ticket) -> None:
+        """Remove a waiting request from the queue."""
+        self._queue.remove(ticket)
+        heapq.heapify(self._queue)
+
+    def _record_admission(self, priority: AnalysisPriority, wait_seconds: float) -> None:
+        """Update wait-time metrics for an admitted request."""
+        self.admitted += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        totals = self._wait_by_priority.setdefault(priority.name, [0.0, 0])
+        totals[0] += wait_seconds
+        totals[1] += 1
+
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get queue depth and wait-time statistics.
+
+        Returns:
+            Dictionary of admission counts, queue depth and wait times (ms)
+        """
+        return {
+            'active': self.active,
+            'max_concurrent': self.max_concurrent,
+            'queue_depth': len(self._queue),
+            'max_queue_depth': self.max_queue_depth,
+            'admitted': self.admitted,
+            'queued': self.queued,
+            'rejected_full': self.rejected_full,
+            'dropped_deadline': self.dropped_deadline,
+            'average_wait_ms': self.total_wait_seconds / self.admitted * 1000 if self.admitted else 0.0,
+            'max_wait_ms': self.max_wait_seconds * 1000,
+            'average_wait_ms_by_priority': {
+                name: total / count * 1000
+                for name, (total, count) in self._wait_by_priority.items()
+            }
+        }
+
+
+__all__ = [
+    'DEFAULT_MAX_QUEUE_SIZE',
+    'AnalysisPriority',
+    'AnalysisRejectedError',
+    'AdmissionController',
+    'classify_request',
+]
@@ -9,16 +9,117 @@ Path: engine/smart_lane/analyzers/__init__.py
 """
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 from .. import RiskScore, RiskCategory
+from ..token_context import TOKEN_CONTEXT_KEY, TokenContextLoader
 
 logger = logging.getLogger(__name__)
 
 
+class AnalysisCache:
+    """
+    Bounded LRU cache with a per-entry TTL for analyzer results.
+    
+    Keyed by token address. Reads refresh recency; writes past max_entries
+    evict the least recently used entry. Expired entries are dropped on read.
+    """
+    
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            ttl_seconds: How long an entry is served after it is stored
+            max_entries: Maximum number of entries kept
+            clock: Monotonic clock in seconds
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a fresh entry.
+        
+        Args:
+            key: Cache key (token address)
+            
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store an entry, evicting the least recently used ones over the bound.
+        
+        Args:
+            key: Cache key (token address)
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache size and hit statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'expirations': self.expirations,
+                'evictions': self.evictions
+            }
+
+
 class BaseAnalyzer(ABC):
     """
     Base class for all Smart Lane risk analyzers.
@@ -52,6 +153,9 @@ class BaseAnalyzer(ABC):
         self.version = "1.0.0"
         self.supported_chains = [1, 56, 137, 42161, 10, 8453]  # ETH, BSC, MATIC, ARB, OP, BASE
         
+        # Result caches, by attribute name (see _create_analysis_cache)
+        self.analysis_caches: Dict[str, AnalysisCache] = {}
+        
         logger.debug(f"{self.analyzer_name} initialized for chain {chain_id}")
     
     @abstractmethod
@@ -95,6 +199,10 @@ class BaseAnalyzer(ABC):
         if total_cache_requests > 0:
             cache_hit_rate = (self.performance_stats['cache_hits'] / total_cache_requests) * 100
         
+        cache_stats = {name: cache.get_stats() for name, cache in self.analysis_caches.items()}
+        cache_hits = sum(stats['hits'] for stats in cache_stats.values())
+        cache_lookups = cache_hits + sum(stats['misses'] for stats in cache_stats.values())
+        
         return {
             'analyzer_name': self.analyzer_name,
             'version': self.version,
@@ -102,10 +210,58 @@ class BaseAnalyzer(ABC):
             'success_rate_percent': success_rate,
             'average_analysis_time_ms': self.performance_stats['average_analysis_time_ms'],
             'cache_hit_rate_percent': cache_hit_rate,
+            'analysis_cache_hit_ratio': cache_hits / cache_lookups if cache_lookups else 0.0,
+            'analysis_caches': cache_stats,
             'supported_chains': self.supported_chains,
             'chain_id': self.chain_id
         }
     
+    async def _load_token_fact(
+        self,
+        token_address: str,
+        context: Optional[Dict[str, Any]],
+        fact: str
+    ) -> Any:
+        """
+        Get a token fact shared with the other analyzers of this analysis.
+        
+        Uses the analysis's TokenContextLoader (see token_context.py), or a
+        one-off loader when the analyzer is called outside the pipeline.
+        
+        Args:
+            token_address: Token being analyzed
+            context: Analysis context
+            fact: Fact name (FACT_* in token_context.py)
+            
+        Returns:
+            Fact data (shared; copy before mutating)
+        """
+        loader = context.get(TOKEN_CONTEXT_KEY) if context else None
+        if loader is None or loader.token_address != token_address:
+            loader = TokenContextLoader(token_address, self.chain_id)
+        return await loader.load(fact, context)
+    
+    def _create_analysis_cache(
+        self,
+        name: str,
+        ttl_seconds: float,
+        max_entries: int
+    ) -> AnalysisCache:
+        """
+        Create a result cache reported in get_performance_metrics.
+        
+        Args:
+            name: Attribute name the analyzer stores the cache under
+            ttl_seconds: Entry lifetime
+            max_entries: LRU bound
+            
+        Returns:
+            New AnalysisCache
+        """
+        cache = AnalysisCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+        self.analysis_caches[name] = cache
+        return cache
+    
     def _update_performance_stats(self, analysis_time_ms: float, success: bool) -> None:
         """Update performance tracking statistics."""
         self.performance_stats['total_analyses'] += 1
@@ -245,6 +401,56 @@ def create_analyzer(category: RiskCategory, chain_id: int, config: Optional[Dict
         raise ValueError(f"Analyzer not available for {category.value}")
 
 
+# Long-lived analyzers, built once per (chain, category)
+_analyzer_pool: Dict[Tuple[int, RiskCategory], BaseAnalyzer] = {}
+_analyzer_pool_lock = threading.Lock()
+
+
+def get_analyzer(category: RiskCategory, chain_id: int) -> BaseAnalyzer:
+    """
+    Get the shared analyzer for a risk category on a chain.
+    
+    The analyzer is created on first use and reused afterwards, so its
+    result caches and setup (pattern tables, thresholds) persist across
+    analyses.
+    
+    Args:
+        category: Risk category to analyze
+        chain_id: Blockchain chain identifier
+        
+    Returns:
+        Shared analyzer instance
+        
+    Raises:
+        ValueError: If category is not supported
+    """
+    key = (chain_id, category)
+    analyzer = _analyzer_pool.get(key)
+    if analyzer is None:
+        with _analyzer_pool_lock:
+            analyzer = _analyzer_pool.get(key)
+            if analyzer is None:
+                analyzer = create_analyzer(category, chain_id)
+                _analyzer_pool[key] = analyzer
+    return analyzer
+
+
+def get_pooled_analyzers(chain_id: int) -> Dict[RiskCategory, BaseAnalyzer]:
+    """Get the shared analyzers created so far for a chain."""
+    with _analyzer_pool_lock:
+        return {
+            category: analyzer
+            for (pool_chain_id, category), analyzer in _analyzer_pool.items()
+            if pool_chain_id == chain_id
+        }
+
+
+def clear_analyzer_pool() -> None:
+    """Drop all shared analyzers (they are rebuilt on next use)."""
+    with _analyzer_pool_lock:
+        _analyzer_pool.clear()
+
+
 # Analyzer registry for dynamic loading
 ANALYZER_REGISTRY = {
     RiskCategory.HONEYPOT_DETECTION: "honeypot_analyzer.HoneypotAnalyzer",
@@ -318,8 +524,12 @@ def get_analyzer_info(category: RiskCategory) -> Dict[str, str]:
 
 # Export key classes and functions
 __all__ = [
+    'AnalysisCache',
     'BaseAnalyzer',
     'create_analyzer',
+    'get_analyzer',
+    'get_pooled_analyzers',
+    'clear_analyzer_pool',
     'get_available_analyzers',
     'get_analyzer_info',
     'ANALYZER_REGISTRY'
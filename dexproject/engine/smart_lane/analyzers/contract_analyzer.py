@@ -19,6 +19,7 @@ import hashlib
 
 from . import BaseAnalyzer
 from .. import RiskScore, RiskCategory
+from ..token_context import FACT_CONTRACT_DATA
 
 logger = logging.getLogger(__name__)
 
@@ -119,8 +120,10 @@ class ContractAnalyzer(BaseAnalyzer):
         self.malicious_patterns = self._load_malicious_patterns()
         
         # Analysis cache
-        self.contract_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
         self.cache_ttl_hours = 24  # Contract code doesn't change often
+        self.contract_cache = self._create_analysis_cache(
+            'contract_cache', ttl_seconds=self.cache_ttl_hours * 3600, max_entries=100
+        )
         
         logger.info(f"Contract analyzer initialized for chain {chain_id}")
     
@@ -291,27 +294,10 @@ class ContractAnalyzer(BaseAnalyzer):
         """
         Fetch contract bytecode, source code, and metadata.
         
-        In production, this would use blockchain APIs like Etherscan,
-        Web3 providers, and verification services.
+        Shared with the other analyzers of this analysis (the honeypot
+        analyzer reads the same contract code).
         """
-        await asyncio.sleep(0.1)  # Simulate API call
-        
-        # Mock contract data - in production would fetch real data
-        contract_data = {
-            'address': token_address,
-            'bytecode': context.get('bytecode', '0x608060405234801561001057600080fd5b50...'),  # Mock bytecode
-            'source_code': context.get('source_code'),  # May be None if not verified
-            'verification_status': 'VERIFIED' if context.get('source_code') else 'UNVERIFIED',
-            'compiler_version': '0.8.19+commit.7dd6d404',
-            'optimization_enabled': True,
-            'creation_block': 18567890,
-            'creator_address': '0x742d35Cc6481C4c29f4F1f8CA0dAa5c2E8a2C0A5',
-            'transaction_count': 15234,
-            'contract_size_bytes': 12458,
-            'audit_reports': [],  # Would contain audit information if available
-            'proxy_type': None,  # 'TRANSPARENT', 'UUPS', 'BEACON', or None
-            'implementation_address': None
-        }
+        contract_data = dict(await self._load_token_fact(token_address, context, FACT_CONTRACT_DATA))
         
         # Add mock source code if available
         if not contract_data['source_code'] and context.get('include_mock_source'):
@@ -1108,29 +1094,11 @@ class ContractAnalyzer(BaseAnalyzer):
     
     def _get_cached_analysis(self, token_address: str) -> Optional[Dict[str, Any]]:
         """Get cached contract analysis if available and fresh."""
-        if token_address in self.contract_cache:
-            result, timestamp = self.contract_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_hours * 3600):
-                return result
-            else:
-                del self.contract_cache[token_address]
-        
-        return None
+        return self.contract_cache.get(token_address)
     
     def _cache_analysis_result(self, token_address: str, result: Dict[str, Any]) -> None:
         """Cache contract analysis result."""
-        self.contract_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries
-        if len(self.contract_cache) > 100:
-            sorted_entries = sorted(
-                self.contract_cache.items(),
-                key=lambda x: x[1][1]
-            )
-            for token, _ in sorted_entries[:20]:
-                del self.contract_cache[token]
+        self.contract_cache.set(token_address, result)
     
     def _create_risk_score_from_cache(self, cached_result: Dict[str, Any]) -> RiskScore:
         """Create risk score from cached analysis."""
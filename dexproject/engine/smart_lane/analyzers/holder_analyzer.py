@@ -18,6 +18,7 @@ from decimal import Decimal
 
 from . import BaseAnalyzer
 from .. import RiskScore, RiskCategory
+from ..token_context import FACT_HOLDER_BALANCES
 
 logger = logging.getLogger(__name__)
 
@@ -109,8 +110,10 @@ class HolderAnalyzer(BaseAnalyzer):
         self.known_addresses = self._load_known_addresses()
         
         # Holder analysis cache
-        self.holder_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
         self.cache_ttl_minutes = 45  # Holder data changes relatively slowly
+        self.holder_cache = self._create_analysis_cache(
+            'holder_cache', ttl_seconds=self.cache_ttl_minutes * 60, max_entries=50
+        )
         
         logger.info(f"Holder distribution analyzer initialized for chain {chain_id}")
     
@@ -152,8 +155,8 @@ class HolderAnalyzer(BaseAnalyzer):
             
             # Parallel holder analysis tasks
             analysis_tasks = [
-                self._analyze_holder_distribution(token_address),
-                self._identify_whale_holders(token_address),
+                self._analyze_holder_distribution(token_address, context),
+                self._identify_whale_holders(token_address, context),
                 self._analyze_team_allocations(token_address),
                 self._analyze_exchange_holdings(token_address),
                 self._calculate_distribution_metrics(token_address),
@@ -229,14 +232,18 @@ class HolderAnalyzer(BaseAnalyzer):
             logger.error(f"Error in holder distribution analysis: {e}", exc_info=True)
             return self._create_error_risk_score(f"Holder analysis failed: {str(e)}")
     
-    async def _analyze_holder_distribution(self, token_address: str) -> Dict[str, Any]:
+    async def _analyze_holder_distribution(
+        self,
+        token_address: str,
+        context: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """Analyze overall token holder distribution by tiers."""
         try:
-            await asyncio.sleep(0.25)  # Simulate blockchain queries for holder data
+            holder_balances = await self._load_token_fact(token_address, context, FACT_HOLDER_BALANCES)
             
             # Mock holder distribution based on token characteristics
             address_hash = hash(token_address)
-            total_supply = 1000000000  # 1B tokens typical
+            total_supply = holder_balances['total_supply']
             
             # Generate realistic holder counts for each tier
             holder_tiers = []
@@ -289,10 +296,15 @@ class HolderAnalyzer(BaseAnalyzer):
             logger.error(f"Error analyzing holder distribution: {e}")
             return {'error': str(e)}
     
-    async def _identify_whale_holders(self, token_address: str) -> List[WhaleHolder]:
+    async def _identify_whale_holders(
+        self,
+        token_address: str,
+        context: Dict[str, Any]
+    ) -> List[WhaleHolder]:
         """Identify and analyze whale holders (>2% of supply)."""
         try:
-            await asyncio.sleep(0.2)  # Simulate whale identification queries
+            # Whales come from the same balances as the distribution
+            await self._load_token_fact(token_address, context, FACT_HOLDER_BALANCES)
             
             whale_holders = []
             address_hash = hash(token_address)
@@ -1033,28 +1045,11 @@ class HolderAnalyzer(BaseAnalyzer):
     
     def _get_cached_analysis(self, token_address: str) -> Optional[Dict[str, Any]]:
         """Get cached holder analysis if available and fresh."""
-        if token_address in self.holder_cache:
-            result, timestamp = self.holder_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_minutes * 60):
-                return result
-            else:
-                del self.holder_cache[token_address]
-        
-        return None
+        return self.holder_cache.get(token_address)
     
     def _cache_analysis_result(self, token_address: str, result: Dict[str, Any]) -> None:
         """Cache holder analysis result."""
-        self.holder_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries
-        if len(self.holder_cache) > 50:
-            oldest_token = min(
-                self.holder_cache.keys(),
-                key=lambda k: self.holder_cache[k][1]
-            )
-            del self.holder_cache[oldest_token]
+        self.holder_cache.set(token_address, result)
     
     def _create_risk_score_from_cache(self, cached_result: Dict[str, Any]) -> RiskScore:
         """Create RiskScore from cached result."""
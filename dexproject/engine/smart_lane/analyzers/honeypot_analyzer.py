@@ -17,6 +17,7 @@ from datetime import datetime, timezone, timedelta
 
 from . import BaseAnalyzer
 from .. import RiskScore, RiskCategory
+from ..token_context import FACT_CONTRACT_DATA, FACT_HOLDER_BALANCES, FACT_POOL_RESERVES
 
 logger = logging.getLogger(__name__)
 
@@ -88,8 +89,10 @@ class HoneypotAnalyzer(BaseAnalyzer):
         self.known_patterns = self._load_known_patterns()
         
         # Simulation cache for performance
-        self.simulation_cache: Dict[str, Tuple[SimulationResult, datetime]] = {}
         self.cache_ttl_minutes = 30
+        self.simulation_cache = self._create_analysis_cache(
+            'simulation_cache', ttl_seconds=self.cache_ttl_minutes * 60, max_entries=100
+        )
         
         logger.info(f"Honeypot analyzer initialized for chain {chain_id}")
     
@@ -202,13 +205,13 @@ class HoneypotAnalyzer(BaseAnalyzer):
         
         # Create analysis tasks that can run in parallel
         tasks = [
-            self._analyze_contract_code(token_address),
+            self._analyze_contract_code(token_address, context),
             self._simulate_transactions(token_address, context),
-            self._analyze_holder_patterns(token_address),
-            self._check_liquidity_locks(token_address),
+            self._analyze_holder_patterns(token_address, context),
+            self._check_liquidity_locks(token_address, context),
             self._analyze_trading_history(token_address),
             self._check_known_patterns(token_address),
-            self._analyze_contract_ownership(token_address),
+            self._analyze_contract_ownership(token_address, context),
             self._check_external_databases(token_address)
         ]
         
@@ -244,7 +247,11 @@ class HoneypotAnalyzer(BaseAnalyzer):
         logger.debug(f"Collected {len(indicators)} honeypot indicators")
         return indicators
     
-    async def _analyze_contract_code(self, token_address: str) -> List[HoneypotIndicator]:
+    async def _analyze_contract_code(
+        self,
+        token_address: str,
+        context: Dict[str, Any]
+    ) -> List[HoneypotIndicator]:
         """
         Analyze token contract code for honeypot patterns.
         
@@ -253,8 +260,8 @@ class HoneypotAnalyzer(BaseAnalyzer):
         """
         indicators = []
         
-        # Simulated contract analysis - in production would use Web3
-        await asyncio.sleep(0.1)  # Simulate API call
+        # Contract code shared with the contract analyzer
+        await self._load_token_fact(token_address, context, FACT_CONTRACT_DATA)
         
         # Check for common honeypot patterns in contract code
         suspicious_patterns = [
@@ -421,12 +428,16 @@ class HoneypotAnalyzer(BaseAnalyzer):
         
         return indicators
     
-    async def _analyze_holder_patterns(self, token_address: str) -> List[HoneypotIndicator]:
+    async def _analyze_holder_patterns(
+        self,
+        token_address: str,
+        context: Dict[str, Any]
+    ) -> List[HoneypotIndicator]:
         """Analyze token holder distribution patterns for honeypot indicators."""
         indicators = []
         
-        # Simulated holder analysis
-        await asyncio.sleep(0.1)  # Simulate API call
+        # Holder balances shared with the holder analyzer
+        await self._load_token_fact(token_address, context, FACT_HOLDER_BALANCES)
         
         # Mock holder data - in production would query blockchain
         holder_data = {
@@ -491,12 +502,16 @@ class HoneypotAnalyzer(BaseAnalyzer):
         
         return indicators
     
-    async def _check_liquidity_locks(self, token_address: str) -> List[HoneypotIndicator]:
+    async def _check_liquidity_locks(
+        self,
+        token_address: str,
+        context: Dict[str, Any]
+    ) -> List[HoneypotIndicator]:
         """Check liquidity lock status and legitimacy."""
         indicators = []
         
-        # Simulated liquidity analysis
-        await asyncio.sleep(0.1)  # Simulate API call
+        # Pool reserves shared with the liquidity analyzer
+        await self._load_token_fact(token_address, context, FACT_POOL_RESERVES)
         
         # Mock liquidity data
         liquidity_data = {
@@ -710,12 +725,16 @@ class HoneypotAnalyzer(BaseAnalyzer):
         
         return indicators
     
-    async def _analyze_contract_ownership(self, token_address: str) -> List[HoneypotIndicator]:
+    async def _analyze_contract_ownership(
+        self,
+        token_address: str,
+        context: Dict[str, Any]
+    ) -> List[HoneypotIndicator]:
         """Analyze contract ownership and admin functions."""
         indicators = []
         
-        # Simulated ownership analysis
-        await asyncio.sleep(0.05)
+        # Ownership comes from the shared contract data
+        await self._load_token_fact(token_address, context, FACT_CONTRACT_DATA)
         
         # Mock ownership data
         ownership_data = {
@@ -1002,33 +1021,16 @@ class HoneypotAnalyzer(BaseAnalyzer):
     
     def _get_cached_simulation(self, token_address: str) -> Optional[SimulationResult]:
         """Get cached simulation result if available and fresh."""
-        if token_address in self.simulation_cache:
-            result, timestamp = self.simulation_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_minutes * 60):
-                self.performance_stats['cache_hits'] += 1
-                return result
-            else:
-                # Remove expired cache entry
-                del self.simulation_cache[token_address]
-        
-        self.performance_stats['cache_misses'] += 1
-        return None
+        result = self.simulation_cache.get(token_address)
+        if result is not None:
+            self.performance_stats['cache_hits'] += 1
+        else:
+            self.performance_stats['cache_misses'] += 1
+        return result
     
     def _cache_simulation_result(self, token_address: str, result: SimulationResult) -> None:
         """Cache simulation result for future use."""
-        self.simulation_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries if cache gets too large
-        if len(self.simulation_cache) > 100:
-            # Remove oldest entries
-            sorted_entries = sorted(
-                self.simulation_cache.items(),
-                key=lambda x: x[1][1]
-            )
-            for token, _ in sorted_entries[:20]:  # Remove oldest 20
-                del self.simulation_cache[token]
+        self.simulation_cache.set(token_address, result)
     
     def _load_known_patterns(self) -> List[Dict[str, Any]]:
         """Load known honeypot patterns for pattern matching."""
@@ -18,6 +18,7 @@ from decimal import Decimal
 
 from . import BaseAnalyzer
 from .. import RiskScore, RiskCategory
+from ..token_context import FACT_POOL_RESERVES
 
 logger = logging.getLogger(__name__)
 
@@ -85,8 +86,10 @@ class LiquidityAnalyzer(BaseAnalyzer):
         self.analysis_trade_sizes = [100, 500, 1000, 5000, 10000, 50000]
         
         # Liquidity analysis cache
-        self.liquidity_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
         self.cache_ttl_minutes = 15  # Shorter TTL for liquidity (changes frequently)
+        self.liquidity_cache = self._create_analysis_cache(
+            'liquidity_cache', ttl_seconds=self.cache_ttl_minutes * 60, max_entries=50
+        )
         
         # Network-specific DEX configurations
         self.dex_configs = self._load_dex_configs()
@@ -138,7 +141,7 @@ class LiquidityAnalyzer(BaseAnalyzer):
             
             # Collect liquidity metrics in parallel
             metrics_tasks = [
-                self._analyze_total_liquidity(token_address, pair_address),
+                self._analyze_total_liquidity(token_address, pair_address, context),
                 self._analyze_slippage_curves(token_address, pair_address),
                 self._analyze_lp_distribution(pair_address),
                 self._analyze_liquidity_stability(pair_address),
@@ -210,12 +213,13 @@ class LiquidityAnalyzer(BaseAnalyzer):
     async def _analyze_total_liquidity(
         self, 
         token_address: str, 
-        pair_address: str
+        pair_address: str,
+        context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Analyze total liquidity depth and composition."""
         try:
-            # Simulate Web3 calls for liquidity data
-            await asyncio.sleep(0.2)  # Simulate network latency
+            # Pool reserves shared with the honeypot analyzer
+            await self._load_token_fact(token_address, context, FACT_POOL_RESERVES)
             
             # Mock liquidity data based on realistic scenarios
             base_liquidity = 25000 + (hash(token_address) % 200000)  # $25K-$225K range
@@ -601,28 +605,11 @@ class LiquidityAnalyzer(BaseAnalyzer):
     
     def _get_cached_analysis(self, token_address: str) -> Optional[Dict[str, Any]]:
         """Get cached analysis result if available and fresh."""
-        if token_address in self.liquidity_cache:
-            result, timestamp = self.liquidity_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_minutes * 60):
-                return result
-            else:
-                del self.liquidity_cache[token_address]
-        
-        return None
+        return self.liquidity_cache.get(token_address)
     
     def _cache_analysis_result(self, token_address: str, result: Dict[str, Any]) -> None:
         """Cache analysis result for future use."""
-        self.liquidity_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries
-        if len(self.liquidity_cache) > 50:
-            oldest_token = min(
-                self.liquidity_cache.keys(),
-                key=lambda k: self.liquidity_cache[k][1]
-            )
-            del self.liquidity_cache[oldest_token]
+        self.liquidity_cache.set(token_address, result)
     
     def _create_risk_score_from_cache(self, cached_result: Dict[str, Any]) -> RiskScore:
         """Create RiskScore from cached result."""
@@ -120,8 +120,10 @@ class MarketAnalyzer(BaseAnalyzer):
         self.manipulation_patterns = self._load_manipulation_patterns()
         
         # Analysis cache
-        self.market_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
         self.cache_ttl_minutes = 10  # Short cache for market data
+        self.market_cache = self._create_analysis_cache(
+            'market_cache', ttl_seconds=self.cache_ttl_minutes * 60, max_entries=50
+        )
         
         logger.info(f"Market analyzer initialized for chain {chain_id}")
     
@@ -1220,29 +1222,11 @@ class MarketAnalyzer(BaseAnalyzer):
     
     def _get_cached_analysis(self, token_address: str) -> Optional[Dict[str, Any]]:
         """Get cached market analysis if available and fresh."""
-        if token_address in self.market_cache:
-            result, timestamp = self.market_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_minutes * 60):
-                return result
-            else:
-                del self.market_cache[token_address]
-        
-        return None
+        return self.market_cache.get(token_address)
     
     def _cache_analysis_result(self, token_address: str, result: Dict[str, Any]) -> None:
         """Cache market analysis result."""
-        self.market_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries
-        if len(self.market_cache) > 50:
-            sorted_entries = sorted(
-                self.market_cache.items(),
-                key=lambda x: x[1][1]
-            )
-            for token, _ in sorted_entries[:10]:
-                del self.market_cache[token]
+        self.market_cache.set(token_address, result)
     
     def _create_risk_score_from_cache(self, cached_result: Dict[str, Any]) -> RiskScore:
         """Create risk score from cached analysis."""
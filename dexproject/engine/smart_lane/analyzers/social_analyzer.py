@@ -111,8 +111,10 @@ class SocialAnalyzer(BaseAnalyzer):
         self.sentiment_patterns = self._load_sentiment_patterns()
         
         # Analysis cache
-        self.sentiment_cache: Dict[str, Tuple[SentimentAnalysis, datetime]] = {}
         self.cache_ttl_minutes = 15  # Shorter cache for social data
+        self.sentiment_cache = self._create_analysis_cache(
+            'sentiment_cache', ttl_seconds=self.cache_ttl_minutes * 60, max_entries=50
+        )
         
         logger.info(f"Social analyzer initialized for chain {chain_id}")
     
@@ -788,29 +790,11 @@ class SocialAnalyzer(BaseAnalyzer):
     
     def _get_cached_sentiment(self, token_address: str) -> Optional[SentimentAnalysis]:
         """Get cached sentiment analysis if available and fresh."""
-        if token_address in self.sentiment_cache:
-            result, timestamp = self.sentiment_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_minutes * 60):
-                return result
-            else:
-                del self.sentiment_cache[token_address]
-        
-        return None
+        return self.sentiment_cache.get(token_address)
     
     def _cache_sentiment_result(self, token_address: str, result: SentimentAnalysis) -> None:
         """Cache sentiment analysis result."""
-        self.sentiment_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries
-        if len(self.sentiment_cache) > 50:
-            sorted_entries = sorted(
-                self.sentiment_cache.items(),
-                key=lambda x: x[1][1]
-            )
-            for token, _ in sorted_entries[:10]:
-                del self.sentiment_cache[token]
+        self.sentiment_cache.set(token_address, result)
     
     def _create_risk_score_from_cache(self, cached_result: SentimentAnalysis) -> RiskScore:
         """Create risk score from cached sentiment analysis."""
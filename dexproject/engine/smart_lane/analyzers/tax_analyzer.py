@@ -90,8 +90,10 @@ class TaxAnalyzer(BaseAnalyzer):
         self.simulation_amounts = [100, 1000, 10000, 100000]  # Different test sizes
         
         # Tax analysis cache
-        self.tax_cache: Dict[str, Tuple[Dict[str, Any], datetime]] = {}
         self.cache_ttl_minutes = 30  # Tax structures can change
+        self.tax_cache = self._create_analysis_cache(
+            'tax_cache', ttl_seconds=self.cache_ttl_minutes * 60, max_entries=100
+        )
         
         logger.info(f"Tax analyzer initialized for chain {chain_id}")
     
@@ -877,28 +879,11 @@ class TaxAnalyzer(BaseAnalyzer):
     
     def _get_cached_analysis(self, token_address: str) -> Optional[Dict[str, Any]]:
         """Get cached tax analysis if available and fresh."""
-        if token_address in self.tax_cache:
-            result, timestamp = self.tax_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_minutes * 60):
-                return result
-            else:
-                del self.tax_cache[token_address]
-        
-        return None
+        return self.tax_cache.get(token_address)
     
     def _cache_analysis_result(self, token_address: str, result: Dict[str, Any]) -> None:
         """Cache tax analysis result."""
-        self.tax_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries
-        if len(self.tax_cache) > 100:
-            oldest_token = min(
-                self.tax_cache.keys(),
-                key=lambda k: self.tax_cache[k][1]
-            )
-            del self.tax_cache[oldest_token]
+        self.tax_cache.set(token_address, result)
     
     def _create_risk_score_from_cache(self, cached_result: Dict[str, Any]) -> RiskScore:
         """Create RiskScore from cached result."""
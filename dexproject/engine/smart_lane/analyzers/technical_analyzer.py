@@ -19,6 +19,7 @@ import statistics
 
 from . import BaseAnalyzer
 from .. import RiskScore, RiskCategory, TechnicalSignal
+from ..token_context import FACT_PRICE_HISTORY
 
 logger = logging.getLogger(__name__)
 
@@ -121,8 +122,10 @@ class TechnicalAnalyzer(BaseAnalyzer):
             self.thresholds.update(config.get('thresholds', {}))
         
         # Technical analysis cache
-        self.analysis_cache: Dict[str, Tuple[TechnicalAnalysisResult, datetime]] = {}
         self.cache_ttl_minutes = 5  # Short cache for technical data
+        self.analysis_cache = self._create_analysis_cache(
+            'analysis_cache', ttl_seconds=self.cache_ttl_minutes * 60, max_entries=20
+        )
         
         logger.info(f"Technical analyzer initialized for chain {chain_id} with timeframes: {self.timeframes}")
     
@@ -177,10 +180,13 @@ class TechnicalAnalyzer(BaseAnalyzer):
             
             # Get price and volume data
             raw_price_data = await self._fetch_price_data(token_address, context)
-        price_data = self._normalize_price_data(raw_price_data)
-            if not price_data or (isinstance(price_data, dict) and len(price_data.get('prices', [])) < 24) or (isinstance(price_data, list) and len(price_data) < 24):
+            prices = self._normalize_price_data(raw_price_data)
+            if len(prices) < 24:
                 return self._create_error_risk_score("Insufficient price data for technical analysis")
             
+            # The helpers below read price_data['prices']
+            price_data = {**raw_price_data, 'prices': prices} if isinstance(raw_price_data, dict) else {'prices': prices}
+            
             # Perform multi-timeframe analysis
             analysis_tasks = [
                 self._calculate_technical_indicators(price_data),
@@ -278,45 +284,9 @@ class TechnicalAnalyzer(BaseAnalyzer):
         """
         Fetch historical price and volume data.
         
-        In production, this would fetch data from DEX APIs, price feeds,
-        or blockchain data providers like The Graph.
+        Shared with the other analyzers of this analysis.
         """
-        await asyncio.sleep(0.1)  # Simulate API call
-        
-        # Mock price data generation
-        current_time = datetime.now(timezone.utc)
-        base_price = context.get('current_price', 1.0)
-        
-        # Generate 7 days of hourly price data
-        prices = []
-        volumes = []
-        
-        for i in range(168):  # 7 days * 24 hours
-            timestamp = current_time - timedelta(hours=168-i)
-            
-            # Simulate price movement with trend and volatility
-            trend_factor = 1.0 + (i / 1000)  # Slight uptrend
-            volatility = 0.02 + (0.01 * math.sin(i / 10))  # Variable volatility
-            random_factor = 1.0 + (volatility * math.sin(i * 0.7) * math.cos(i * 0.3))
-            
-            price = base_price * trend_factor * random_factor
-            volume = 10000 + (5000 * math.sin(i / 5)) + (2000 * random_factor)
-            
-            prices.append({
-                'timestamp': timestamp.isoformat(),
-                'open': price * 0.999,
-                'high': price * 1.002,
-                'low': price * 0.998,
-                'close': price,
-                'volume': max(volume, 100)
-            })
-        
-        return {
-            'prices': prices,
-            'current_price': base_price,
-            'data_quality': 'GOOD',
-            'source': 'mock_api'
-        }
+        return await self._load_token_fact(token_address, context, FACT_PRICE_HISTORY)
     
     async def _calculate_technical_indicators(self, price_data: Dict[str, Any]) -> List[TechnicalIndicator]:
         """Calculate various technical indicators across timeframes."""
@@ -1030,29 +1000,11 @@ class TechnicalAnalyzer(BaseAnalyzer):
     
     def _get_cached_analysis(self, token_address: str) -> Optional[TechnicalAnalysisResult]:
         """Get cached technical analysis if available and fresh."""
-        if token_address in self.analysis_cache:
-            result, timestamp = self.analysis_cache[token_address]
-            age = datetime.now(timezone.utc) - timestamp
-            
-            if age.total_seconds() < (self.cache_ttl_minutes * 60):
-                return result
-            else:
-                del self.analysis_cache[token_address]
-        
-        return None
+        return self.analysis_cache.get(token_address)
     
     def _cache_analysis_result(self, token_address: str, result: TechnicalAnalysisResult) -> None:
         """Cache technical analysis result."""
-        self.analysis_cache[token_address] = (result, datetime.now(timezone.utc))
-        
-        # Clean up old cache entries
-        if len(self.analysis_cache) > 20:
-            sorted_entries = sorted(
-                self.analysis_cache.items(),
-                key=lambda x: x[1][1]
-            )
-            for token, _ in sorted_entries[:5]:
-                del self.analysis_cache[token]
+        self.analysis_cache.set(token_address, result)
     
     def _create_risk_score_from_cache(self, cached_result: TechnicalAnalysisResult) -> RiskScore:
         """Create risk score from cached technical analysis."""
@@ -1102,7 +1054,7 @@ class TechnicalAnalyzer(BaseAnalyzer):
         """
         try:
             # Get price data for timeframe
-            price_data = await self._fetch_price_data(timeframe, context)
+            price_data = await self._fetch_timeframe_price_data(timeframe, context)
             
             if not price_data:
                 return None
@@ -1130,7 +1082,7 @@ class TechnicalAnalyzer(BaseAnalyzer):
             logger.warning(f"Error analyzing timeframe {timeframe}: {e}")
             return None
     
-    async def _fetch_price_data(
+    async def _fetch_timeframe_price_data(
         self,
         timeframe: str,
         context: Dict[str, Any]
@@ -5,6 +5,10 @@ Dedicated caching layer for Smart Lane analysis results. Provides intelligent
 caching with data freshness tracking, cache invalidation, and performance
 optimization for comprehensive analysis results.
 
+Analyses are stored in the compact binary format of cache_codec; callers
+that only need the recommendation can use get_analysis_summary, which
+skips rebuilding the risk scores and technical signals.
+
 Path: engine/smart_lane/cache.py
 """
 
@@ -13,13 +17,16 @@ import json
 import logging
 import time
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, Any, List, Set
+from typing import Dict, Optional, Any, List, Set, Union
 from dataclasses import asdict
 from enum import Enum
 
 import redis.asyncio as redis
 
 from . import SmartLaneAnalysis, RiskCategory, RiskScore
+from .cache_codec import (
+    CacheCodecError, CachedAnalysis, UnsupportedEntryError, decode_summary, encode_analysis
+)
 
 logger = logging.getLogger(__name__)
 
@@ -84,7 +91,9 @@ class SmartLaneCache:
             'misses': 0,
             'stores': 0,
             'invalidations': 0,
-            'evictions': 0
+            'evictions': 0,
+            'decode_errors': 0,
+            'stored_bytes': 0
         }
         
         # Key prefixes for organization
@@ -95,10 +104,10 @@ class SmartLaneCache:
     async def initialize(self) -> None:
         """Initialize Redis connection and cache structures."""
         try:
+            # Binary client: analysis entries are not UTF-8 text
             self.redis_client = redis.from_url(
                 self.redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                decode_responses=False,
                 socket_connect_timeout=5,
                 socket_timeout=5
             )
@@ -132,22 +141,56 @@ class SmartLaneCache:
         Returns:
             Cached analysis if available and fresh, None otherwise
         """
+        entry = await self.get_analysis_summary(token_address, max_age_minutes)
+        if entry is None:
+            return None
+        
+        try:
+            return entry.to_analysis()
+        except CacheCodecError as e:
+            # The summary lookup counted a hit; the entry turned out unusable
+            self.cache_stats['hits'] -= 1
+            self.cache_stats['misses'] += 1
+            if isinstance(e, UnsupportedEntryError):
+                logger.debug(f"Skipping cached analysis for {token_address[:10]}...: {e}")
+                return None
+            logger.warning(f"Undecodable cached analysis for {token_address[:10]}...: {e}")
+            self.cache_stats['decode_errors'] += 1
+            await self._invalidate_analysis(token_address)
+            return None
+    
+    async def get_analysis_summary(
+        self,
+        token_address: str,
+        max_age_minutes: Optional[int] = None
+    ) -> Optional[CachedAnalysis]:
+        """
+        Retrieve the recommendation and overall scores of a cached analysis.
+        
+        Only the entry's summary is decoded; call to_analysis() on the
+        result for the full analysis.
+        
+        Args:
+            token_address: Token contract address
+            max_age_minutes: Maximum acceptable age in minutes (overrides strategy)
+            
+        Returns:
+            Lazily decoded entry if available and fresh, None otherwise
+            (entries in the legacy JSON format are wrapped already decoded)
+        """
         if not self.redis_client:
             return None
         
         cache_key = self._get_analysis_key(token_address)
         
         try:
-            # Get cached data with metadata
-            cached_data = await self.redis_client.hgetall(cache_key)
-            
-            if not cached_data:
-                self.cache_stats['misses'] += 1
-                return None
+            # One read for the timestamp and the entry
+            cached_timestamp, analysis_bytes, legacy_json = await self.redis_client.hmget(
+                cache_key, 'timestamp', 'analysis', 'analysis_data'
+            )
             
             # Check data freshness
-            cached_timestamp = cached_data.get('timestamp')
-            if not cached_timestamp:
+            if not cached_timestamp or not (analysis_bytes or legacy_json):
                 self.cache_stats['misses'] += 1
                 return None
             
@@ -160,22 +203,32 @@ class SmartLaneCache:
                 self.cache_stats['misses'] += 1
                 return None
             
-            # Deserialize analysis data
-            analysis_json = cached_data.get('analysis_data')
-            if not analysis_json:
-                self.cache_stats['misses'] += 1
-                return None
-            
-            analysis_dict = json.loads(analysis_json)
-            analysis = self._deserialize_analysis(analysis_dict)
+            if analysis_bytes:
+                entry = decode_summary(analysis_bytes)
+            else:
+                # Entry written before the binary format
+                entry = CachedAnalysis.from_analysis(self._deserialize_analysis(json.loads(legacy_json)))
             
             # Update freshness score based on age
-            analysis.data_freshness_score = self._calculate_freshness_score(cache_age_minutes)
+            entry.data_freshness_score = self._calculate_freshness_score(cache_age_minutes)
             
             self.cache_stats['hits'] += 1
             logger.debug(f"Cache hit for {token_address[:10]}... (age: {cache_age_minutes:.1f}m)")
             
-            return analysis
+            return entry
+            
+        except UnsupportedEntryError as e:
+            # Written by a newer worker; leave it for the workers that can read it
+            logger.debug(f"Skipping cached analysis for {token_address[:10]}...: {e}")
+            self.cache_stats['misses'] += 1
+            return None
+            
+        except CacheCodecError as e:
+            logger.warning(f"Undecodable cached analysis for {token_address[:10]}...: {e}")
+            self.cache_stats['decode_errors'] += 1
+            self.cache_stats['misses'] += 1
+            await self._invalidate_analysis(token_address)
+            return None
             
         except Exception as e:
             logger.error(f"Error retrieving cached analysis for {token_address}: {e}")
@@ -209,16 +262,17 @@ class SmartLaneCache:
                 return False
             
             cache_key = self._get_analysis_key(token_address)
+            tracking_key = f"{self.key_prefix}:tracking"
             
             # Calculate TTL based on analysis quality
             ttl_minutes = custom_ttl_minutes or self._calculate_intelligent_ttl(analysis)
             
             # Serialize analysis data
-            analysis_data = self._serialize_analysis(analysis)
+            analysis_bytes = encode_analysis(analysis)
             
             # Prepare cache entry
             cache_entry = {
-                'analysis_data': json.dumps(analysis_data),
+                'analysis': analysis_bytes,
                 'timestamp': datetime.now(timezone.utc).isoformat(),
                 'confidence': str(analysis.overall_confidence),
                 'risk_score': str(analysis.overall_risk_score),
@@ -226,20 +280,27 @@ class SmartLaneCache:
                 'cache_strategy': self.cache_strategy.value
             }
             
-            # Store in Redis with expiration
+            # Store in Redis with expiration and size tracking (one round trip)
             pipe = self.redis_client.pipeline()
             pipe.hset(cache_key, mapping=cache_entry)
+            pipe.hdel(cache_key, 'analysis_data')  # Legacy JSON copy
             pipe.expire(cache_key, ttl_minutes * 60)  # Convert to seconds
+            pipe.sadd(tracking_key, token_address.lower())
+            pipe.scard(tracking_key)
             
-            await pipe.execute()
+            results = await pipe.execute()
             
-            # Update cache size tracking
-            await self._update_cache_size_tracking(token_address)
+            # Enforce the size limit
+            current_size = results[-1]
+            if current_size > self.max_cache_size:
+                await self._evict_oldest_entries(current_size - self.max_cache_size)
             
             self.cache_stats['stores'] += 1
+            self.cache_stats['stored_bytes'] += len(analysis_bytes)
             logger.debug(
                 f"Cached analysis for {token_address[:10]}... "
-                f"(TTL: {ttl_minutes}m, confidence: {analysis.overall_confidence:.3f})"
+                f"(TTL: {ttl_minutes}m, {len(analysis_bytes)} bytes, "
+                f"confidence: {analysis.overall_confidence:.3f})"
             )
             
             return True
@@ -382,6 +443,11 @@ class SmartLaneCache:
             'stores': self.cache_stats['stores'],
             'invalidations': self.cache_stats['invalidations'],
             'evictions': self.cache_stats['evictions'],
+            'decode_errors': self.cache_stats['decode_errors'],
+            'average_entry_bytes': (
+                self.cache_stats['stored_bytes'] / self.cache_stats['stores']
+                if self.cache_stats['stores'] else 0.0
+            ),
             'redis_connected': self.redis_client is not None,
             'default_ttl_minutes': self.cache_config['default_ttl_minutes'],
             'max_cache_size': self.max_cache_size
@@ -463,9 +529,11 @@ class SmartLaneCache:
         """Generate Redis key for token analysis."""
         return f"{self.key_prefix}:analysis:{token_address.lower()}"
     
-    def _calculate_cache_age_minutes(self, timestamp_str: str) -> float:
+    def _calculate_cache_age_minutes(self, timestamp_str: Union[str, bytes]) -> float:
         """Calculate cache age in minutes from timestamp string."""
         try:
+            if isinstance(timestamp_str, bytes):
+                timestamp_str = timestamp_str.decode()
             cached_time = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
             current_time = datetime.now(timezone.utc)
             age_delta = current_time - cached_time
@@ -607,27 +675,6 @@ class SmartLaneCache:
             logger.error(f"Error invalidating analysis for {token_address}: {e}")
             return False
     
-    async def _update_cache_size_tracking(self, token_address: str) -> None:
-        """Update cache size tracking and enforce limits."""
-        if not self.redis_client:
-            return
-        
-        try:
-            # Add to tracking set
-            tracking_key = f"{self.key_prefix}:tracking"
-            await self.redis_client.sadd(tracking_key, token_address.lower())
-            
-            # Check if we need to evict entries
-            current_size = await self.redis_client.scard(tracking_key)
-            
-            if current_size > self.max_cache_size:
-                # Get oldest entries and evict them
-                excess = current_size - self.max_cache_size
-                await self._evict_oldest_entries(excess)
-                
-        except Exception as e:
-            logger.error(f"Error updating cache size tracking: {e}")
-    
     async def _evict_oldest_entries(self, count: int) -> None:
         """Evict the oldest cache entries to maintain size limits."""
         if not self.redis_client:
@@ -0,0 +1,358 @@
+"""
+Smart Lane Cache Codec
+
+Compact, schema-versioned binary encoding of SmartLaneAnalysis for the
+Smart Lane cache. An entry is a fixed header, a small summary section
+(recommendation, overall scores, identification) and a detail section
+(risk scores, technical signals, warnings) that is compressed when large.
+
+Callers that only need the recommendation decode the summary; the detail
+section is decoded on first access (CachedAnalysis.to_analysis), and
+RiskScore / TechnicalSignal objects are rebuilt only then.
+
+Bodies are msgpack (pinned in requirements.txt), or JSON where msgpack is
+missing; compression is always zlib so that every worker can read every
+entry. Entries this process cannot read but another worker may (newer
+schema or body format) raise UnsupportedEntryError and are left in place.
+
+Path: engine/smart_lane/cache_codec.py
+"""
+
+import json
+import logging
+import struct
+import zlib
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from . import (
+    DecisionConfidence, RiskCategory, RiskScore, SmartLaneAction,
+    SmartLaneAnalysis, TechnicalSignal
+)
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Bump when the summary/detail layout changes; older entries become misses,
+# newer ones are left for the workers that can read them
+SCHEMA_VERSION = 1
+
+# magic, schema version, body format, compression, summary length
+_HEADER = struct.Struct('>3sBBBI')
+_MAGIC = b'SLC'
+
+FORMAT_MSGPACK = 1
+FORMAT_JSON = 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+
+# Detail sections smaller than this are stored uncompressed
+DEFAULT_COMPRESS_THRESHOLD_BYTES = 512
+
+# Fields decoded without touching the detail section
+SUMMARY_FIELDS = (
+    'token_address',
+    'chain_id',
+    'analysis_id',
+    'timestamp',
+    'recommended_action',
+    'confidence_level',
+    'overall_risk_score',
+    'overall_confidence',
+    'position_size_percent',
+    'is_partial',
+    'early_exit_reason',
+)
+
+
+class CacheCodecError(ValueError):
+    """Raised when a cache entry cannot be decoded (corrupt, foreign or outdated)."""
+
+
+class UnsupportedEntryError(CacheCodecError):
+    """Raised for a valid entry this process cannot read (newer schema or missing codec)."""
+
+
+# =============================================================================
+# BODY FORMATS
+# =============================================================================
+
+def _to_plain(value: Any) -> Any:
+    """Convert values msgpack/JSON cannot encode (enums, datetimes, decimals, sets)."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _shallow_dict(value: Any) -> Any:
+    """Dataclass fields as a dict, without asdict's deep copy of nested values."""
+    if is_dataclass(value):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    return value
+
+
+def _pack(value: Any, body_format: int) -> bytes:
+    if body_format == FORMAT_MSGPACK:
+        return msgpack.packb(value, default=_to_plain, use_bin_type=True)
+    return json.dumps(value, default=_to_plain, separators=(',', ':')).encode()
+
+
+def _unpack(data: bytes, body_format: int) -> Any:
+    if body_format == FORMAT_MSGPACK:
+        if not MSGPACK_AVAILABLE:
+            raise UnsupportedEntryError("Entry is msgpack-encoded but msgpack is not installed")
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+    if body_format == FORMAT_JSON:
+        return json.loads(data)
+    raise UnsupportedEntryError(f"Unknown body format {body_format}")
+
+
+def _decompress(data: bytes, compression: int) -> bytes:
+    if compression == COMPRESSION_NONE:
+        return data
+    if compression == COMPRESSION_ZLIB:
+        return zlib.decompress(data)
+    raise UnsupportedEntryError(f"Unknown compression {compression}")
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def encode_analysis(
+    analysis: SmartLaneAnalysis,
+    compress_threshold_bytes: int = DEFAULT_COMPRESS_THRESHOLD_BYTES
+) -> bytes:
+    """
+    Encode an analysis as a cache entry.
+
+    Args:
+        analysis: Analysis to encode
+        compress_threshold_bytes: Compress detail sections at least this large
+
+    Returns:
+        Encoded entry
+    """
+    body_format = FORMAT_MSGPACK if MSGPACK_AVAILABLE else FORMAT_JSON
+
+    summary = {name: getattr(analysis, name) for name in SUMMARY_FIELDS}
+    detail = {
+        field.name: getattr(analysis, field.name)
+        for field in fields(SmartLaneAnalysis)
+        if field.name not in SUMMARY_FIELDS
+    }
+    # Category enums are not valid map keys in either body format
+    detail['risk_scores'] = {
+        (category.value if isinstance(category, Enum) else str(category)): _shallow_dict(score)
+        for category, score in analysis.risk_scores.items()
+    }
+    detail['technical_signals'] = [_shallow_dict(signal) for signal in analysis.technical_signals]
+
+    summary_bytes = _pack(summary, body_format)
+    detail_bytes = _pack(detail, body_format)
+
+    compression = COMPRESSION_NONE
+    if len(detail_bytes) >= compress_threshold_bytes:
+        compression = COMPRESSION_ZLIB
+        detail_bytes = zlib.compress(detail_bytes, 6)
+
+    header = _HEADER.pack(_MAGIC, SCHEMA_VERSION, body_format, compression, len(summary_bytes))
+    return header + summary_bytes + detail_bytes
+
+
+# =============================================================================
+# DECODING
+# =============================================================================
+
+class CachedAnalysis:
+    """
+    Lazily decoded cache entry.
+
+    The summary fields are available as attributes right away; the full
+    SmartLaneAnalysis is rebuilt on the first to_analysis() call.
+
+    Example usage:
+        entry = decode_summary(data)
+        if entry.recommended_action == SmartLaneAction.AVOID:
+            return
+        analysis = entry.to_analysis()
+    """
+
+    def __init__(self, data: bytes):
+        """
+        Parse the header and summary of an entry.
+
+        Args:
+            data: Encoded entry
+
+        Raises:
+            UnsupportedEntryError: If the entry needs a newer schema or a
+                codec this process lacks
+            CacheCodecError: If the entry is corrupt, foreign or outdated
+        """
+        data = bytes(data)
+        if len(data) < _HEADER.size:
+            raise CacheCodecError("Entry shorter than its header")
+
+        magic, version, self._format, self._compression, summary_length = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise CacheCodecError("Not a Smart Lane cache entry")
+        if version > SCHEMA_VERSION:
+            raise UnsupportedEntryError(f"Schema version {version} (expected {SCHEMA_VERSION})")
+        if version != SCHEMA_VERSION:
+            raise CacheCodecError(f"Schema version {version} (expected {SCHEMA_VERSION})")
+
+        summary_end = _HEADER.size + summary_length
+        if summary_end > len(data):
+            raise CacheCodecError("Truncated summary section")
+
+        try:
+            summary = _unpack(data[_HEADER.size:summary_end], self._format)
+            self._set_summary(summary)
+        except CacheCodecError:
+            raise
+        except Exception as e:
+            raise CacheCodecError(f"Invalid summary section: {e}") from e
+
+        self._detail_bytes = data[summary_end:]
+        self._analysis: Optional[SmartLaneAnalysis] = None
+
+    @classmethod
+    def from_analysis(cls, analysis: SmartLaneAnalysis) -> 'CachedAnalysis':
+        """
+        Wrap an already decoded analysis (e.g. from a legacy JSON entry).
+
+        Args:
+            analysis: Decoded analysis
+
+        Returns:
+            Entry whose to_analysis() returns the given analysis
+        """
+        entry = cls.__new__(cls)
+        entry._format = entry._compression = None
+        entry._set_summary({name: getattr(analysis, name) for name in SUMMARY_FIELDS})
+        entry._detail_bytes = b''
+        entry._analysis = analysis
+        return entry
+
+    def _set_summary(self, summary: Dict[str, Any]) -> None:
+        """Expose the summary fields as attributes."""
+        self.recommended_action = SmartLaneAction(summary['recommended_action'])
+        self.confidence_level = DecisionConfidence(summary['confidence_level'])
+
+        self._summary = summary
+        self.token_address: str = summary['token_address']
+        self.chain_id: int = summary['chain_id']
+        self.analysis_id: str = summary['analysis_id']
+        self.timestamp: str = summary['timestamp']
+        self.overall_risk_score: float = summary['overall_risk_score']
+        self.overall_confidence: float = summary['overall_confidence']
+        self.position_size_percent: float = summary['position_size_percent']
+        self.is_partial: bool = summary['is_partial']
+        self.early_exit_reason: Optional[str] = summary['early_exit_reason']
+        self.data_freshness_score: Optional[float] = None
+
+    @property
+    def is_decoded(self) -> bool:
+        """Whether the detail section has been decoded."""
+        return self._analysis is not None
+
+    def to_analysis(self) -> SmartLaneAnalysis:
+        """
+        Rebuild the full analysis (decoded once, then reused).
+
+        Returns:
+            Analysis with RiskScore and TechnicalSignal objects restored
+
+        Raises:
+            CacheCodecError: If the detail section cannot be decoded
+        """
+        if self._analysis is None:
+            try:
+                detail = _unpack(_decompress(self._detail_bytes, self._compression), self._format)
+                self._analysis = _build_analysis(self._summary, detail)
+            except CacheCodecError:
+                raise
+            except Exception as e:
+                raise CacheCodecError(f"Invalid detail section: {e}") from e
+            self._detail_bytes = b''
+
+        if self.data_freshness_score is not None:
+            self._analysis.data_freshness_score = self.data_freshness_score
+        return self._analysis
+
+
+def _build_analysis(summary: Dict[str, Any], detail: Dict[str, Any]) -> SmartLaneAnalysis:
+    """Assemble a SmartLaneAnalysis from decoded summary and detail sections."""
+    values = {**detail, **summary}
+    values['recommended_action'] = SmartLaneAction(values['recommended_action'])
+    values['confidence_level'] = DecisionConfidence(values['confidence_level'])
+    values['risk_scores'] = {
+        RiskCategory(category): RiskScore(**{**score, 'category': RiskCategory(score['category'])})
+        for category, score in detail['risk_scores'].items()
+    }
+    values['technical_signals'] = [TechnicalSignal(**signal) for signal in detail['technical_signals']]
+
+    # Entries outlive code changes within a schema version; ignore unknown fields
+    known = {field.name for field in fields(SmartLaneAnalysis)}
+    return SmartLaneAnalysis(**{name: value for name, value in values.items() if name in known})
+
+
+def decode_summary(data: bytes) -> CachedAnalysis:
+    """
+    Decode only the summary of an entry.
+
+    Args:
+        data: Encoded entry
+
+    Returns:
+        Lazily decoded entry
+
+    Raises:
+        CacheCodecError: If the entry cannot be decoded
+    """
+    return CachedAnalysis(data)
+
+
+def decode_analysis(data: bytes) -> SmartLaneAnalysis:
+    """
+    Decode a full analysis.
+
+    Args:
+        data: Encoded entry
+
+    Returns:
+        Decoded analysis
+
+    Raises:
+        CacheCodecError: If the entry cannot be decoded
+    """
+    return CachedAnalysis(data).to_analysis()
+
+
+__all__ = [
+    'SCHEMA_VERSION',
+    'MSGPACK_AVAILABLE',
+    'CacheCodecError',
+    'UnsupportedEntryError',
+    'CachedAnalysis',
+    'encode_analysis',
+    'decode_analysis',
+    'decode_summary',
+]
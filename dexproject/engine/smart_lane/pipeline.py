@@ -22,6 +22,9 @@ from . import (
     AnalysisDepth, RiskCategory, SmartLaneAction, DecisionConfidence,
     DEFAULT_CONFIG, MAX_CONCURRENT_ANALYSES
 )
+from .admission import AdmissionController, AnalysisPriority, AnalysisRejectedError, classify_request
+from .analyzers import get_analyzer, get_pooled_analyzers
+from .token_context import TOKEN_CONTEXT_KEY, TokenContextLoader
 from .cache import SmartLaneCache
 from .thought_log import ThoughtLogGenerator
 from .strategy.position_sizing import PositionSizer
@@ -52,7 +55,8 @@ class SmartLanePipeline:
         self,
         config: SmartLaneConfig = None,
         chain_id: int = 1,
-        enable_caching: bool = True
+        enable_caching: bool = True,
+        read_executor: Optional[Any] = None
     ):
         """
         Initialize the Smart Lane pipeline.
@@ -61,10 +65,13 @@ class SmartLanePipeline:
             config: Pipeline configuration settings
             chain_id: Blockchain chain identifier
             enable_caching: Whether to enable analysis result caching
+            read_executor: Failover executor for batched on-chain reads
+                (e.g. Web3Client._execute_with_retry)
         """
         self.config = config or DEFAULT_CONFIG
         self.chain_id = chain_id
         self.enable_caching = enable_caching
+        self.read_executor = read_executor
         
         # Pipeline state management
         self.status = PipelineStatus.INITIALIZING
@@ -84,9 +91,18 @@ class SmartLanePipeline:
             'failed_analyses': 0,
             'timeout_analyses': 0,
             'average_analysis_time_ms': 0.0,
-            'cache_hit_ratio': 0.0
+            'cache_hit_ratio': 0.0,
+            'data_round_trips': 0,
+            'data_loaded_analyses': 0,
+            'early_exits': 0
         }
         
+        # Priority admission to the MAX_CONCURRENT_ANALYSES analysis slots
+        self.admission = AdmissionController(
+            max_concurrent=MAX_CONCURRENT_ANALYSES,
+            expected_duration=lambda: self.performance_metrics['average_analysis_time_ms'] / 1000
+        )
+        
         # Thread pool for concurrent analysis
         self.thread_pool = ThreadPoolExecutor(
             max_workers=MAX_CONCURRENT_ANALYSES,
@@ -99,7 +115,9 @@ class SmartLanePipeline:
         self,
         token_address: str,
         context: Optional[Dict[str, Any]] = None,
-        force_refresh: bool = False
+        force_refresh: bool = False,
+        priority: Optional[AnalysisPriority] = None,
+        deadline_seconds: Optional[float] = None
     ) -> SmartLaneAnalysis:
         """
         Perform comprehensive token analysis.
@@ -108,6 +126,10 @@ class SmartLanePipeline:
             token_address: Token contract address to analyze
             context: Additional context for analysis (price, volume, etc.)
             force_refresh: Force fresh analysis, bypassing cache
+            priority: Admission priority when the pipeline is at capacity
+                (default: derived from the context, see classify_request)
+            deadline_seconds: Time from now by which the analysis must
+                finish (default: max_analysis_time_seconds)
             
         Returns:
             Complete Smart Lane analysis with recommendation
@@ -115,9 +137,13 @@ class SmartLanePipeline:
         Raises:
             TimeoutError: If analysis exceeds configured time limit
             ValueError: If token_address is invalid
+            AnalysisRejectedError: If the request was shed from a full
+                admission queue or could no longer meet its deadline
         """
         analysis_start = time.time()
         analysis_id = str(uuid.uuid4())
+        context = context or {}
+        admitted = False
         
         try:
             logger.info(f"Starting Smart Lane analysis: {token_address[:10]}... (ID: {analysis_id})")
@@ -126,12 +152,6 @@ class SmartLanePipeline:
             if not token_address or len(token_address) != 42:
                 raise ValueError(f"Invalid token address: {token_address}")
             
-            # Check if we're at capacity
-            if len(self.active_analyses) >= MAX_CONCURRENT_ANALYSES:
-                logger.warning("Pipeline at maximum capacity, queuing analysis")
-                await self._wait_for_capacity()
-            
-            self.active_analyses.add(analysis_id)
             self.performance_metrics['total_analyses'] += 1
             
             # Check cache first (if enabled and not forcing refresh)
@@ -140,24 +160,40 @@ class SmartLanePipeline:
                 cached_result = await self.cache.get_analysis(token_address)
                 if cached_result:
                     logger.debug(f"Using cached analysis for {token_address[:10]}...")
-                    self.active_analyses.remove(analysis_id)
                     return cached_result
             
+            # Wait for an analysis slot, in priority order
+            if deadline_seconds is None:
+                deadline_seconds = self.config.max_analysis_time_seconds
+            deadline = time.monotonic() + deadline_seconds
+            if self.admission.active >= self.admission.max_concurrent:
+                logger.debug(
+                    f"Pipeline at maximum capacity, queuing analysis "
+                    f"({self.admission.queue_depth} waiting)"
+                )
+            await self.admission.acquire(
+                priority=priority if priority is not None else classify_request(context),
+                liquidity_usd=context.get('liquidity_usd') or 0.0,
+                deadline=deadline
+            )
+            admitted = True
+            self.active_analyses.add(analysis_id)
+            
             # Perform comprehensive analysis with timeout protection
             analysis_task = asyncio.create_task(
                 self._perform_comprehensive_analysis(
                     token_address=token_address,
                     analysis_id=analysis_id,
-                    context=context or {}
+                    context=context
                 )
             )
             
+            # Time spent queueing counts against the deadline
+            timeout = max(0.0, deadline - time.monotonic())
+            
             try:
                 # Wait for analysis with timeout
-                analysis_result = await asyncio.wait_for(
-                    analysis_task,
-                    timeout=self.config.max_analysis_time_seconds
-                )
+                analysis_result = await asyncio.wait_for(analysis_task, timeout=timeout)
                 
                 # Cache successful result
                 if self.cache:
@@ -177,9 +213,13 @@ class SmartLanePipeline:
             except asyncio.TimeoutError:
                 analysis_task.cancel()
                 self.performance_metrics['timeout_analyses'] += 1
-                logger.error(f"Analysis timeout for {token_address[:10]}... after {self.config.max_analysis_time_seconds}s")
-                raise TimeoutError(f"Analysis exceeded {self.config.max_analysis_time_seconds}s timeout")
+                logger.error(f"Analysis timeout for {token_address[:10]}... after {timeout:.2f}s")
+                raise TimeoutError(f"Analysis exceeded its {deadline_seconds}s deadline")
                 
+        except AnalysisRejectedError as e:
+            logger.warning(f"Analysis not admitted for {token_address[:10]}...: {e}")
+            raise
+            
         except Exception as e:
             self.performance_metrics['failed_analyses'] += 1
             logger.error(f"Analysis failed for {token_address[:10]}...: {e}", exc_info=True)
@@ -188,6 +228,8 @@ class SmartLanePipeline:
         finally:
             # Cleanup
             self.active_analyses.discard(analysis_id)
+            if admitted:
+                self.admission.release()
     
     async def _perform_comprehensive_analysis(
         self,
@@ -229,12 +271,16 @@ class SmartLanePipeline:
             informational_notes=[]
         )
         
+        # One loader per analysis: analyzers share each fetched token fact
+        loader = TokenContextLoader(token_address, self.chain_id, self.read_executor)
+        context = {**context, TOKEN_CONTEXT_KEY: loader}
+        
         try:
             # Phase 1: Parallel Risk Analysis (target: <3s)
             logger.debug("Phase 1: Executing parallel risk analysis...")
             risk_analysis_start = time.time()
             
-            risk_scores = await self._execute_parallel_risk_analysis(
+            risk_scores, early_exit_reason = await self._execute_parallel_risk_analysis(
                 token_address=token_address,
                 context=context
             )
@@ -246,6 +292,10 @@ class SmartLanePipeline:
             risk_analysis_time = (time.time() - risk_analysis_start) * 1000
             logger.debug(f"Risk analysis completed in {risk_analysis_time:.1f}ms")
             
+            # Early exit: a critical verdict cut the risk analysis short
+            if early_exit_reason:
+                return self._finalize_early_exit(analysis_result, early_exit_reason, analysis_start_time)
+            
             # Phase 2: Technical Analysis (target: <1s)
             logger.debug("Phase 2: Executing technical analysis...")
             technical_start = time.time()
@@ -338,24 +388,79 @@ class SmartLanePipeline:
             analysis_result.confidence_level = DecisionConfidence.LOW
             
             return analysis_result
+        
+        finally:
+            # Nothing fetched for this analysis is needed once it ends
+            # (normally, by early exit, or cancelled on timeout)
+            loader.cancel_pending()
+            data_stats = loader.get_stats()
+            self.performance_metrics['data_round_trips'] += data_stats['round_trips']
+            self.performance_metrics['data_loaded_analyses'] += 1
+            logger.debug(f"Token data loaded in {data_stats['round_trips']} round trips: {data_stats}")
+    
+    def _finalize_early_exit(
+        self,
+        analysis_result: SmartLaneAnalysis,
+        reason: str,
+        analysis_start_time: float
+    ) -> SmartLaneAnalysis:
+        """
+        Complete an analysis whose risk phase a blocking verdict cut short.
+        
+        Technical analysis, strategy and the thought log are skipped; the
+        result is a partial AVOID recommendation.
+        
+        Args:
+            analysis_result: Result with the completed risk scores
+            reason: Blocking verdict from _get_blocking_verdict
+            analysis_start_time: Start of the analysis (time.time())
+            
+        Returns:
+            Finalized analysis result
+        """
+        analysis_result.is_partial = True
+        analysis_result.early_exit_reason = reason
+        analysis_result.recommended_action = SmartLaneAction.AVOID
+        analysis_result.confidence_level = DecisionConfidence.HIGH
+        analysis_result.critical_warnings.append(f"Early exit: {reason}")
+        analysis_result.total_analysis_time_ms = (time.time() - analysis_start_time) * 1000
+        
+        self.performance_metrics['early_exits'] += 1
+        self.analysis_history[analysis_result.analysis_id] = analysis_result
+        
+        logger.info(
+            f"Analysis of {analysis_result.token_address[:10]}... exited early "
+            f"in {analysis_result.total_analysis_time_ms:.1f}ms - {reason}"
+        )
+        
+        return analysis_result
     
     async def _execute_parallel_risk_analysis(
         self,
         token_address: str,
         context: Dict[str, Any]
-    ) -> Dict[RiskCategory, RiskScore]:
+    ) -> Tuple[Dict[RiskCategory, RiskScore], Optional[str]]:
         """
         Execute all risk analysis categories in parallel for performance.
         
         This method coordinates the parallel execution of all 8 risk categories
         to meet the <3s performance target for comprehensive analysis.
+        
+        Results are consumed as they complete. When early exit is enabled
+        and a critical category returns a blocking verdict while others are
+        still running, those are cancelled and only the completed ones are
+        returned (see _get_blocking_verdict).
+        
+        Returns:
+            Completed category scores, and the blocking verdict if pending
+            categories were cancelled (None when every category completed)
         """
-        risk_tasks = []
         enabled_categories = self.config.enabled_categories
         
         logger.debug(f"Starting parallel risk analysis for {len(enabled_categories)} categories")
         
         # Create analysis tasks for each enabled category
+        pending: Dict[asyncio.Task, RiskCategory] = {}
         for category in enabled_categories:
             task = asyncio.create_task(
                 self._analyze_risk_category(
@@ -365,38 +470,85 @@ class SmartLanePipeline:
                 ),
                 name=f"risk_{category.value.lower()}"
             )
-            risk_tasks.append((category, task))
+            pending[task] = category
         
         # Execute all risk analyses concurrently
         risk_scores = {}
+        early_exit_reason = None
         
         try:
-            # Wait for all tasks to complete
-            for category, task in risk_tasks:
-                try:
-                    risk_score = await task
-                    risk_scores[category] = risk_score
-                    logger.debug(f"Risk category {category.value} completed: score={risk_score.score:.3f}")
-                    
-                except Exception as e:
-                    logger.warning(f"Risk category {category.value} failed: {e}")
-                    # Create a failed risk score
-                    risk_scores[category] = RiskScore(
-                        category=category,
-                        score=1.0,  # Maximum risk for failed analysis
-                        confidence=0.0,  # Zero confidence
-                        details={'error': str(e)},
-                        analysis_time_ms=0.0,
-                        warnings=[f"Analysis failed: {str(e)}"],
-                        data_quality="POOR"
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                
+                for task in done:
+                    category = pending.pop(task)
+                    try:
+                        risk_score = task.result()
+                        risk_scores[category] = risk_score
+                        logger.debug(f"Risk category {category.value} completed: score={risk_score.score:.3f}")
+                        
+                    except Exception as e:
+                        logger.warning(f"Risk category {category.value} failed: {e}")
+                        # Create a failed risk score
+                        risk_scores[category] = RiskScore(
+                            category=category,
+                            score=1.0,  # Maximum risk for failed analysis
+                            confidence=0.0,  # Zero confidence
+                            details={'error': str(e)},
+                            analysis_time_ms=0.0,
+                            warnings=[f"Analysis failed: {str(e)}"],
+                            data_quality="POOR"
+                        )
+                
+                early_exit_reason = self._get_blocking_verdict(risk_scores) if pending else None
+                if early_exit_reason:
+                    logger.debug(
+                        f"Critical risk verdict for {token_address[:10]}..., "
+                        f"cancelling {len(pending)} remaining categories"
                     )
+                    break
             
             logger.debug(f"Parallel risk analysis completed: {len(risk_scores)} categories processed")
-            return risk_scores
+            return risk_scores, early_exit_reason
             
         except Exception as e:
             logger.error(f"Critical error in parallel risk analysis: {e}", exc_info=True)
             raise
+        
+        finally:
+            # Early exit, error, or our own cancellation: stop the rest
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+    
+    def _get_blocking_verdict(self, risk_scores: Dict[RiskCategory, RiskScore]) -> Optional[str]:
+        """
+        Find a critical category verdict that rules out buying the token.
+        
+        Failed analyses (zero confidence) never block; they only raise risk.
+        
+        Args:
+            risk_scores: Category scores completed so far
+            
+        Returns:
+            Reason for the early exit, or None if no verdict blocks
+        """
+        if not self.config.early_exit_enabled:
+            return None
+        
+        for category in self.config.critical_categories:
+            risk_score = risk_scores.get(category)
+            if (
+                risk_score is not None
+                and risk_score.score >= self.config.critical_risk_threshold
+                and risk_score.confidence >= self.config.min_confidence_threshold
+            ):
+                return (
+                    f"{category.value} risk {risk_score.score:.2f} is at or above the "
+                    f"critical threshold {self.config.critical_risk_threshold:.2f}"
+                )
+        return None
     
     async def _analyze_risk_category(
         self,
@@ -407,47 +559,13 @@ class SmartLanePipeline:
         """
         Analyze a specific risk category.
         
-        This method will import and execute the appropriate analyzer
-        based on the risk category.
+        Uses the chain's long-lived analyzer for the category, so its
+        result caches carry over between analyses.
         """
         category_start = time.time()
         
         try:
-            # Import the appropriate analyzer (dynamic import for performance)
-            if category == RiskCategory.HONEYPOT_DETECTION:
-                from .analyzers.honeypot_analyzer import HoneypotAnalyzer
-                analyzer = HoneypotAnalyzer(chain_id=self.chain_id)
-                
-            elif category == RiskCategory.LIQUIDITY_ANALYSIS:
-                from .analyzers.liquidity_analyzer import LiquidityAnalyzer
-                analyzer = LiquidityAnalyzer(chain_id=self.chain_id)
-                
-            elif category == RiskCategory.SOCIAL_SENTIMENT:
-                from .analyzers.social_analyzer import SocialAnalyzer
-                analyzer = SocialAnalyzer(chain_id=self.chain_id)
-                
-            elif category == RiskCategory.TECHNICAL_ANALYSIS:
-                from .analyzers.technical_analyzer import TechnicalAnalyzer
-                analyzer = TechnicalAnalyzer(chain_id=self.chain_id)
-                
-            elif category == RiskCategory.TOKEN_TAX_ANALYSIS:
-                from .analyzers.tax_analyzer import TaxAnalyzer
-                analyzer = TaxAnalyzer(chain_id=self.chain_id)
-                
-            elif category == RiskCategory.CONTRACT_SECURITY:
-                from .analyzers.contract_analyzer import ContractAnalyzer
-                analyzer = ContractAnalyzer(chain_id=self.chain_id)
-                
-            elif category == RiskCategory.HOLDER_DISTRIBUTION:
-                from .analyzers.holder_analyzer import HolderAnalyzer
-                analyzer = HolderAnalyzer(chain_id=self.chain_id)
-                
-            elif category == RiskCategory.MARKET_STRUCTURE:
-                from .analyzers.market_analyzer import MarketAnalyzer
-                analyzer = MarketAnalyzer(chain_id=self.chain_id)
-                
-            else:
-                raise ValueError(f"Unknown risk category: {category}")
+            analyzer = get_analyzer(category, self.chain_id)
             
             # Execute the analysis
             risk_score = await analyzer.analyze(token_address, context)
@@ -484,9 +602,7 @@ class SmartLanePipeline:
         Returns technical signals for configured timeframes.
         """
         try:
-            from .analyzers.technical_analyzer import TechnicalAnalyzer
-            
-            technical_analyzer = TechnicalAnalyzer(chain_id=self.chain_id)
+            technical_analyzer = get_analyzer(RiskCategory.TECHNICAL_ANALYSIS, self.chain_id)
             
             # Get technical signals for all configured timeframes
             signals = []
@@ -646,11 +762,6 @@ class SmartLanePipeline:
             }
         }
     
-    async def _wait_for_capacity(self) -> None:
-        """Wait for pipeline capacity to become available."""
-        while len(self.active_analyses) >= MAX_CONCURRENT_ANALYSES:
-            await asyncio.sleep(0.1)
-    
     def _update_performance_metrics(self, analysis_time_ms: float, success: bool) -> None:
         """Update performance tracking metrics."""
         if success:
@@ -674,6 +785,18 @@ class SmartLanePipeline:
                 self.performance_metrics['total_analyses']
             ) * 100
         
+        # Result caches of this chain's shared analyzers
+        analyzer_metrics = {
+            category.value: analyzer.get_performance_metrics()
+            for category, analyzer in get_pooled_analyzers(self.chain_id).items()
+        }
+        cache_hits = cache_lookups = 0
+        data_loaded_analyses = self.performance_metrics['data_loaded_analyses']
+        for metrics in analyzer_metrics.values():
+            for stats in metrics['analysis_caches'].values():
+                cache_hits += stats['hits']
+                cache_lookups += stats['hits'] + stats['misses']
+        
         return {
             'status': self.status,
             'active_analyses': len(self.active_analyses),
@@ -681,6 +804,14 @@ class SmartLanePipeline:
             'success_rate_percent': success_rate,
             'average_analysis_time_ms': self.performance_metrics['average_analysis_time_ms'],
             'cache_enabled': self.cache is not None,
+            'analyzer_cache_hit_ratio': cache_hits / cache_lookups if cache_lookups else 0.0,
+            'analyzers': analyzer_metrics,
+            'early_exits': self.performance_metrics['early_exits'],
+            'admission': self.admission.get_stats(),
+            'average_data_round_trips': (
+                self.performance_metrics['data_round_trips'] / data_loaded_analyses
+                if data_loaded_analyses else 0.0
+            ),
             'config_analysis_depth': self.config.analysis_depth.value,
             'max_analysis_time_s': self.config.max_analysis_time_seconds
         }
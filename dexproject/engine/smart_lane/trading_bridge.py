@@ -537,6 +537,38 @@ class SmartLaneTradingBridge:
             'cooldown_until': self.cooldown_tracker.get(token_address, {})
         }
     
+    async def reassess_position(
+        self,
+        token_address: str,
+        position_id: str,
+        pair_address: Optional[str] = None
+    ) -> SmartLaneAnalysis:
+        """
+        Re-run Smart Lane analysis for a token we hold before deciding on an exit.
+        
+        The request carries the position, so a busy pipeline admits it
+        ahead of new-pair discovery and cache warming; the cache is bypassed.
+        
+        Args:
+            token_address: Token of the open position
+            position_id: Open position being reassessed
+            pair_address: Trading pair for the token
+            
+        Returns:
+            Fresh analysis of the token
+        """
+        self.logger.info(f"🔁 Reassessing position {position_id} in {token_address[:10]}...")
+        
+        return await self.pipeline.analyze_token(
+            token_address=token_address,
+            context={
+                'position_id': position_id,
+                'position_exit': True,
+                'pair_address': pair_address
+            },
+            force_refresh=True
+        )
+    
     async def manual_trigger_analysis(
         self,
         token_address: str,
@@ -0,0 +1,92 @@
+"""
+Test Suite for the Smart Lane Analyzer Pool
+
+Validates that analyzer result caches are bounded LRUs with a TTL and
+report hit ratios, that get_analyzer builds one analyzer per chain and
+category, and that SmartLanePipeline reuses those analyzers so repeat
+analyses of a token are served from the analyzers' caches.
+
+File: dexproject/engine/tests/test_analyzer_pool.py
+"""
+
+import asyncio
+import os
+import unittest
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.smart_lane import DEFAULT_CONFIG, RiskCategory
+from engine.smart_lane.analyzers import AnalysisCache, clear_analyzer_pool, get_analyzer
+from engine.smart_lane.pipeline import SmartLanePipeline
+
+
+TOKEN = '0x' + '1' * 40
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Bounded LRU with per-entry TTL."""
+
+    def setUp(self):
+        self.now = [0.0]
+        self.cache = AnalysisCache(ttl_seconds=10, max_entries=2, clock=lambda: self.now[0])
+
+    def test_lru_eviction_and_hit_ratio(self):
+        self.cache.set('a', 1)
+        self.cache.set('b', 2)
+        self.assertEqual(self.cache.get('a'), 1)   # 'b' is now least recently used
+        self.cache.set('c', 3)
+
+        self.assertIsNone(self.cache.get('b'))
+        self.assertEqual(self.cache.get('c'), 3)
+
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['entries'], stats['evictions']), (2, 1))
+        self.assertAlmostEqual(stats['hit_ratio'], 2 / 3)
+
+    def test_entries_expire(self):
+        self.cache.set('a', 1)
+        self.now[0] = 9.9
+        self.assertEqual(self.cache.get('a'), 1)
+        self.now[0] = 10.0
+        self.assertIsNone(self.cache.get('a'))
+        self.assertEqual((len(self.cache), self.cache.expirations), (0, 1))
+
+
+class TestAnalyzerPool(unittest.TestCase):
+    """Shared analyzers per chain, reused by the pipeline."""
+
+    def setUp(self):
+        clear_analyzer_pool()
+        self.addCleanup(clear_analyzer_pool)
+
+    def test_one_analyzer_per_chain_and_category(self):
+        analyzer = get_analyzer(RiskCategory.LIQUIDITY_ANALYSIS, 1)
+
+        self.assertIs(get_analyzer(RiskCategory.LIQUIDITY_ANALYSIS, 1), analyzer)
+        self.assertIsNot(get_analyzer(RiskCategory.LIQUIDITY_ANALYSIS, 8453), analyzer)
+        self.assertIsNot(get_analyzer(RiskCategory.TOKEN_TAX_ANALYSIS, 1), analyzer)
+
+    def test_pipeline_reuses_analyzer_caches(self):
+        pipeline = SmartLanePipeline(config=DEFAULT_CONFIG, chain_id=1, enable_caching=False)
+        self.addCleanup(pipeline.thread_pool.shutdown)
+
+        async def analyze_twice():
+            first = await pipeline._analyze_risk_category(RiskCategory.LIQUIDITY_ANALYSIS, TOKEN, {})
+            second = await pipeline._analyze_risk_category(RiskCategory.LIQUIDITY_ANALYSIS, TOKEN, {})
+            return first, second
+
+        first, second = asyncio.run(analyze_twice())
+
+        self.assertEqual(second.score, first.score)
+        self.assertEqual(second.data_quality, 'CACHED')
+
+        metrics = pipeline.get_performance_metrics()
+        liquidity = metrics['analyzers'][RiskCategory.LIQUIDITY_ANALYSIS.value]
+        self.assertEqual(liquidity['analysis_caches']['liquidity_cache']['hits'], 1)
+        self.assertAlmostEqual(metrics['analyzer_cache_hit_ratio'], 0.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
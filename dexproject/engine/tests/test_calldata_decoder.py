@@ -0,0 +1,166 @@
+"""
+Test Suite for the Selector-Indexed Calldata Decoder
+
+Validates swap parameter decoding for the Uniswap V2/V3, SushiSwap and
+Aerodrome router layouts, per-hash memoization, and that the mempool monitor
+attaches decoded parameters to transactions at ingest.
+
+File: dexproject/engine/tests/test_calldata_decoder.py
+"""
+
+import asyncio
+import os
+import unittest
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from eth_abi import encode
+
+from engine.mempool.decoder import CalldataDecoder, CalldataKind
+from engine.mempool.monitor import MempoolMonitor, MempoolTransaction, _is_dex_transaction
+from engine.mempool.protection import PendingTransaction
+
+
+WETH = '0x' + 'aa' * 20
+USDC = '0x' + 'bb' * 20
+PEPE = '0x' + 'cc' * 20
+RECIPIENT = '0x' + 'dd' * 20
+FACTORY = '0x' + 'ee' * 20
+SUSHI_ROUTER = '0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F'
+
+
+def calldata(selector, types, args):
+    """ABI-encode a router call."""
+    return bytes.fromhex(selector) + encode(types, args)
+
+
+def make_tx(tx_hash, data, to_address='0xRouter', value=0):
+    """Create a pending transaction carrying the given calldata."""
+    return PendingTransaction(
+        hash=tx_hash,
+        from_address='0xSender',
+        to_address=to_address,
+        value=value,
+        gas_price=25 * 10 ** 9,
+        gas_limit=200000,
+        nonce=0,
+        data=data,
+        timestamp=0.0,
+    )
+
+
+class MockEngineConfig:
+    """Mock engine configuration for testing."""
+    chain_configs = {1: {'name': 'Ethereum', 'chain_id': 1}}
+
+
+class TestCalldataDecoder(unittest.TestCase):
+    """Router layout decoding and memoization."""
+
+    def setUp(self):
+        self.decoder = CalldataDecoder()
+
+    def test_uniswap_v2_exact_tokens_for_tokens(self):
+        data = calldata(
+            '38ed1739',
+            ['uint256', 'uint256', 'address[]', 'address', 'uint256'],
+            [10 ** 18, 5 * 10 ** 17, [WETH, USDC, PEPE], RECIPIENT, 1700000000],
+        )
+        params = self.decoder.decode(make_tx('0x1', data))
+
+        self.assertEqual(params.function_name, 'swapExactTokensForTokens')
+        self.assertEqual(params.dex_name, 'uniswap_v2')
+        self.assertEqual(params.path, (WETH, USDC, PEPE))
+        self.assertEqual((params.amount_in, params.amount_out), (10 ** 18, 5 * 10 ** 17))
+        self.assertEqual(params.recipient, RECIPIENT)
+
+    def test_sushiswap_router_and_eth_value(self):
+        data = calldata(
+            '7ff36ab5',
+            ['uint256', 'address[]', 'address', 'uint256'],
+            [123, [WETH, PEPE], RECIPIENT, 1700000000],
+        )
+        params = self.decoder.decode(make_tx('0x2', data, to_address=SUSHI_ROUTER, value=3 * 10 ** 18))
+
+        self.assertEqual(params.dex_name, 'sushiswap')
+        self.assertEqual(params.amount_in, 3 * 10 ** 18)
+        self.assertEqual(params.token_out, PEPE)
+
+    def test_uniswap_v3_exact_input_packed_path(self):
+        path = bytes.fromhex(WETH[2:]) + (3000).to_bytes(3, 'big') + bytes.fromhex(PEPE[2:])
+        data = calldata(
+            'c04b8d59',
+            ['(bytes,address,uint256,uint256,uint256)'],
+            [(path, RECIPIENT, 1700000000, 10 ** 18, 42)],
+        )
+        params = self.decoder.decode(make_tx('0x3', data))
+
+        self.assertEqual(params.path, (WETH, PEPE))
+        self.assertEqual((params.amount_in, params.amount_out), (10 ** 18, 42))
+        self.assertEqual(params.recipient, RECIPIENT)
+
+    def test_aerodrome_routes(self):
+        data = calldata(
+            'cac88ea9',
+            ['uint256', 'uint256', '(address,address,bool,address)[]', 'address', 'uint256'],
+            [10 ** 6, 10 ** 15, [(USDC, WETH, False, FACTORY), (WETH, PEPE, True, FACTORY)], RECIPIENT, 1],
+        )
+        params = self.decoder.decode(make_tx('0x4', data))
+
+        self.assertEqual(params.dex_name, 'aerodrome')
+        self.assertEqual(params.path, (USDC, WETH, PEPE))
+        self.assertEqual(params.amount_in, 10 ** 6)
+
+    def test_truncated_calldata_is_classified_without_amounts(self):
+        params = self.decoder.decode(make_tx('0x5', '0x38ed1739' + '00' * 8))
+
+        self.assertEqual(params.kind, CalldataKind.SWAP)
+        self.assertIsNone(params.amount_in)
+        self.assertEqual(params.path, ())
+
+    def test_unknown_selector_and_memoization(self):
+        self.assertIsNone(self.decoder.decode(make_tx('0x6', '0xdeadbeef')))
+
+        data = calldata('18cbafe5', ['uint256', 'uint256', 'address[]', 'address', 'uint256'],
+                        [1, 1, [PEPE, WETH], RECIPIENT, 1])
+        first = self.decoder.decode(make_tx('0x7', data))
+        second = self.decoder.decode(make_tx('0x7', data))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.decoder.get_statistics()['cache_hits'], 1)
+
+
+class TestIngestDecoding(unittest.TestCase):
+    """The monitor decodes calldata once at ingest."""
+
+    def test_monitor_attaches_swap_params(self):
+        monitor = MempoolMonitor(MockEngineConfig())
+        monitor._decoder = CalldataDecoder()
+        data = calldata('38ed1739', ['uint256', 'uint256', 'address[]', 'address', 'uint256'],
+                        [10 ** 18, 1, [WETH, PEPE], RECIPIENT, 1])
+        tx = MempoolTransaction(
+            hash='0x8', from_address='0xSender', to_address='0xRouter',
+            value=0, gas_price=25 * 10 ** 9, gas_limit=200000, nonce=0,
+            data=data, first_seen=0.0, last_seen=0.0,
+        )
+        asyncio.run(monitor._analyze_transaction_type(tx, 1))
+
+        self.assertTrue(tx.is_dex_interaction)
+        self.assertEqual(tx.target_token, PEPE)
+        self.assertEqual(tx.swap_amount_in_wei, 10 ** 18)
+        self.assertIs(monitor._decoder.decode(tx), tx.swap_params)
+
+        # The MEV engine's record for the same hash reuses the same parameters
+        self.assertIs(PendingTransaction.from_record(tx).swap_params, tx.swap_params)
+
+    def test_malformed_input_is_not_dex(self):
+        monitor = MempoolMonitor(MockEngineConfig())
+
+        self.assertFalse(_is_dex_transaction(monitor, '0xRouter', '0xzz38ed1739', 1))
+        self.assertTrue(_is_dex_transaction(monitor, '0xRouter', '0x38ed1739', 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,266 @@
+"""
+Test Suite for the Pending Transaction Index
+
+Validates that PendingTransactionIndex keeps its pair, sender, gas bucket and
+timeline indexes consistent under insert/remove, that MEV detection on the
+index finds the same threats as detection on a plain mempool list, and that the
+monitor shares its per-chain view with the MEV engine without copying and
+expires it through the heap-ordered expiry queue.
+
+File: dexproject/engine/tests/test_mempool_index.py
+"""
+
+import asyncio
+import os
+import unittest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.mempool.index import PendingTransactionIndex, TransactionExpiryQueue
+from engine.mempool.records import to_monotonic
+from engine.mempool.protection import MEVProtectionEngine, PendingTransaction, MEVThreatType
+from engine.mempool.monitor import MempoolMonitor, MempoolTransaction
+
+
+ROUTER = '0xUniswapRouter'
+OTHER_ROUTER = '0xSushiRouter'
+
+
+def make_tx(tx_hash, sender, gas_gwei, offset_seconds, to_address=ROUTER, data='0x414bf389', value=10 ** 18):
+    """Create a pending DEX transaction relative to a fixed base time."""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    return PendingTransaction(
+        hash=tx_hash,
+        from_address=sender,
+        to_address=to_address,
+        value=Decimal(value),
+        gas_price=Decimal(gas_gwei * 10 ** 9),
+        gas_limit=200000,
+        nonce=0,
+        data=data,
+        timestamp=base + timedelta(seconds=offset_seconds),
+        is_dex_interaction=True,
+    )
+
+
+class MockEngineConfig:
+    """Mock engine configuration for testing."""
+    chain_configs = {1: {'name': 'Ethereum', 'chain_id': 1}}
+
+
+class TestPendingTransactionIndex(unittest.TestCase):
+    """Index maintenance tests."""
+
+    def setUp(self):
+        self.target = make_tx('0xtarget', '0xVictim', 25, 0)
+        self.front = make_tx('0xfront', '0xAttacker', 30, -1)
+        self.back = make_tx('0xback', '0xAttacker', 20, 1)
+        self.other = make_tx('0xother', '0xSomeone', 40, 2, to_address=OTHER_ROUTER)
+        self.index = PendingTransactionIndex.from_transactions(
+            [self.front, self.target, self.back, self.other]
+        )
+
+    def test_pair_and_gas_bucket_lookup(self):
+        same_pair = {tx.hash for tx in self.index.same_pair(self.target)}
+        self.assertEqual(same_pair, {'0xtarget', '0xfront', '0xback'})
+
+        priced_above = [tx.hash for tx in self.index.same_pair_priced_above(self.target)]
+        self.assertEqual(priced_above, ['0xfront'])
+
+    def test_sender_and_timeline_lookup(self):
+        self.assertEqual(
+            {tx.hash for tx in self.index.from_sender('0xAttacker')},
+            {'0xfront', '0xback'}
+        )
+        self.assertEqual(
+            [tx.hash for tx in self.index.dex_seen_after(self.target.first_seen_mono)],
+            ['0xback', '0xother']
+        )
+
+    def test_remove_cleans_all_indexes(self):
+        self.index.remove('0xback')
+        self.index.remove('0xother')
+
+        self.assertNotIn('0xback', self.index)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual([tx.hash for tx in self.index.from_sender('0xAttacker')], ['0xfront'])
+        self.assertEqual(list(self.index.dex_seen_after(self.target.first_seen_mono)), [])
+        self.assertEqual(self.index.get_statistics()['pair_keys'], 1)
+
+    def test_readd_replaces_existing_entry(self):
+        bumped = make_tx('0xback', '0xAttacker', 50, 1)
+        self.index.add(bumped)
+
+        self.assertEqual(len(self.index), 4)
+        self.assertEqual(
+            [tx.hash for tx in self.index.dex_seen_after(self.target.first_seen_mono)],
+            ['0xback', '0xother']
+        )
+        self.assertIn('0xback', {tx.hash for tx in self.index.same_pair_priced_above(self.target)})
+
+    def test_liquidity_removal_is_not_provision(self):
+        add = make_tx('0xadd', '0xLP', 25, 0, data='0xf305d719' + '00' * 32)
+        remove = make_tx('0xremove', '0xLP', 25, 0, data='0xbaa2abde' + '00' * 32)
+
+        self.assertTrue(PendingTransactionIndex.is_liquidity_provision(add))
+        self.assertFalse(PendingTransactionIndex.is_liquidity_provision(remove))
+        self.assertTrue(PendingTransactionIndex.is_liquidity_removal(remove))
+
+        index = PendingTransactionIndex.from_transactions([add, remove])
+        self.assertEqual([tx.hash for tx in index.liquidity_provisions(ROUTER)], ['0xadd'])
+        self.assertEqual([tx.hash for tx in index.liquidity_removals(ROUTER)], ['0xremove'])
+
+        index.remove('0xremove')
+        self.assertEqual(index.liquidity_removals(ROUTER), [])
+
+
+class TestIndexedMEVDetection(unittest.TestCase):
+    """Detection on the index matches detection on a plain list."""
+
+    def setUp(self):
+        self.engine = MEVProtectionEngine(MockEngineConfig())
+
+    def test_index_and_list_detection_agree(self):
+        target = make_tx('0xtarget', '0xVictim', 25, 0)
+        mempool = [
+            make_tx('0xfront', '0xAttacker', 30, -1),
+            target,
+            make_tx('0xback', '0xAttacker', 20, 1),
+            make_tx('0xcopy', '0xCopier', 40, 0),
+            make_tx('0xarb', '0xArb', 22, 3, to_address=OTHER_ROUTER),
+            make_tx('0xunrelated', '0xAttacker', 10, 2, data='0x38ed1739'),
+        ]
+        index = PendingTransactionIndex.from_transactions(mempool)
+
+        from_list = asyncio.run(self.engine._detect_mev_threats(target, mempool))
+        from_index = asyncio.run(self.engine._detect_mev_threats(target, index))
+
+        def summarize(threats):
+            return sorted((t.threat_type.value, tuple(t.threatening_transactions)) for t in threats)
+
+        self.assertEqual(summarize(from_list), summarize(from_index))
+        threat_types = {t.threat_type for t in from_index}
+        self.assertIn(MEVThreatType.SANDWICH_ATTACK, threat_types)
+        self.assertIn(MEVThreatType.FRONTRUNNING, threat_types)
+        self.assertIn(MEVThreatType.BACKRUNNING, threat_types)
+
+    def test_jit_liquidity_add_and_remove_around_target(self):
+        target = make_tx('0xtarget', '0xVictim', 25, 0)
+        mempool = PendingTransactionIndex.from_transactions([
+            make_tx('0xadd', '0xLP', 30, -1, data='0xe8e33700' + '00' * 32),
+            target,
+            make_tx('0xremove', '0xLP', 20, 1, data='0xbaa2abde' + '00' * 32),
+            # A second add is not a removal, and another sender's removal does not pair
+            make_tx('0xadd2', '0xLP', 20, 2, data='0xf305d719' + '00' * 32),
+            make_tx('0xother', '0xOther', 20, 1, data='0x02751cec' + '00' * 32),
+        ])
+
+        threats = asyncio.run(self.engine._detect_jit_liquidity(target, mempool))
+
+        self.assertEqual(
+            [(t.frontrun_transaction, t.backrun_transaction) for t in threats],
+            [('0xadd', '0xremove')]
+        )
+        self.assertEqual(threats[0].threat_type, MEVThreatType.JIT_LIQUIDITY)
+
+
+class TestSharedMempoolView(unittest.TestCase):
+    """The monitor and the MEV engine read the same incrementally updated view."""
+
+    def setUp(self):
+        self.engine = MEVProtectionEngine(MockEngineConfig())
+        self.monitor = MempoolMonitor(MockEngineConfig())
+        self.monitor._mev_engine = self.engine
+        self.engine.attach_mempool_view(1, self.monitor._mempool_indexes[1])
+
+    def _mempool_tx(self, tx_hash, seen):
+        return MempoolTransaction(
+            hash=tx_hash,
+            from_address='0xSender',
+            to_address=ROUTER,
+            value=Decimal(10 ** 18),
+            gas_price=Decimal(25 * 10 ** 9),
+            gas_limit=200000,
+            nonce=0,
+            data='0x414bf389',
+            first_seen=seen,
+            last_seen=seen,
+            is_dex_interaction=True,
+        )
+
+    def test_batches_update_shared_view_in_place(self):
+        now = datetime.utcnow()
+        asyncio.run(self.monitor._process_transaction_batch(
+            [self._mempool_tx('0xa', now), self._mempool_tx('0xb', now)], 1
+        ))
+        view = self.engine.get_mempool_view(1)
+        self.assertIs(view, self.monitor._mempool_indexes[1])
+        self.assertEqual(len(view), 2)
+
+        # A re-broadcast refreshes last_seen without a second insert
+        later = now + timedelta(seconds=5)
+        asyncio.run(self.monitor._process_transaction_batch([self._mempool_tx('0xa', later)], 1))
+        self.assertEqual(len(view), 2)
+        self.assertEqual(self.monitor._pending_transactions[1]['0xa'].last_seen_mono, to_monotonic(later))
+        self.assertEqual(self.engine.get_protection_statistics()['mempool_transactions_tracked'], 2)
+
+    def test_cleanup_evicts_expired_and_excess_transactions(self):
+        from engine.mempool.monitor import MempoolStats
+
+        self.monitor._stats[1] = MempoolStats(chain_id=1)
+        config = self.monitor._chain_configs[1]
+        config.max_pending_transactions = 2
+
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=config.transaction_ttl_seconds + 10)
+        for tx in [
+            self._mempool_tx('0xstale', stale),
+            self._mempool_tx('0xold', now - timedelta(seconds=3)),
+            self._mempool_tx('0xmid', now - timedelta(seconds=2)),
+            self._mempool_tx('0xnew', now - timedelta(seconds=1)),
+        ]:
+            self.monitor._insert_transaction(tx, 1)
+
+        asyncio.run(self.monitor._cleanup_old_transactions(1))
+
+        self.assertEqual(set(self.monitor._pending_transactions[1]), {'0xmid', '0xnew'})
+        self.assertEqual(len(self.monitor._mempool_indexes[1]), 2)
+        stats = self.monitor.get_statistics(1)
+        self.assertEqual(stats['pool_size'], 2)
+        self.assertEqual(stats['ttl_evictions'], 1)
+        self.assertEqual(stats['capacity_evictions'], 1)
+
+
+class TestTransactionExpiryQueue(unittest.TestCase):
+    """Heap-ordered expiry with lazy invalidation."""
+
+    def test_touch_postpones_ttl_expiry(self):
+        base = 1000.0
+        queue = TransactionExpiryQueue()
+        queue.push('0xa', base, base)
+        queue.push('0xb', base + 1, base + 1)
+        queue.touch('0xa', base + 10)
+
+        self.assertEqual(queue.pop_expired(base + 5), ['0xb'])
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.pop_expired(base + 11), ['0xa'])
+
+    def test_pop_oldest_skips_discarded_and_readded(self):
+        base = 1000.0
+        queue = TransactionExpiryQueue()
+        for i, tx_hash in enumerate(['0xa', '0xb', '0xc']):
+            queue.push(tx_hash, base + i, base + i)
+        queue.discard('0xa')
+        queue.push('0xa', base + 5, base + 5)
+
+        self.assertEqual(queue.pop_oldest(2), ['0xb', '0xc'])
+        self.assertEqual(queue.pop_oldest(5), ['0xa'])
+        self.assertEqual(len(queue), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Test Suite for the Multicall3 Batch Read Layer
+
+Validates that many token/pool reads are packed into a single aggregate3
+eth_call, that results are decoded per call with per-call failure reporting,
+and that Web3Client token and pool lookups are served from one batch.
+
+File: dexproject/engine/tests/test_multicall.py
+"""
+
+import asyncio
+import logging
+import os
+import unittest
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from eth_abi import decode, encode
+from eth_utils import keccak, to_checksum_address
+
+from engine.multicall import (
+    MULTICALL3_ADDRESS, MulticallRequest, execute_multicall, fetch_token_metadata
+)
+from engine.web3_client import Web3Client
+
+
+TOKEN_A = to_checksum_address('0x' + 'a1' * 20)
+TOKEN_B = to_checksum_address('0x' + 'b2' * 20)
+EMPTY = to_checksum_address('0x' + 'c3' * 20)
+PAIR = to_checksum_address('0x' + 'd4' * 20)
+
+
+def selector(signature):
+    return keccak(text=signature)[:4]
+
+
+class FakeEth:
+    """Minimal eth namespace serving aggregate3 from a table of contract responses."""
+
+    def __init__(self, contracts):
+        self.contracts = contracts
+        self.calls = 0
+
+    async def call(self, transaction, block_identifier='latest'):
+        self.calls += 1
+        assert transaction['to'] == MULTICALL3_ADDRESS
+        (calls,) = decode(['(address,bool,bytes)[]'], transaction['data'][4:])
+        results = []
+        for target, _, calldata in calls:
+            response = self.contracts.get(to_checksum_address(target), {}).get(bytes(calldata[:4]))
+            results.append((False, b'') if response == 'revert' else (True, response or b''))
+        return encode(['(bool,bytes)[]'], [results])
+
+
+class FakeWeb3:
+    def __init__(self, contracts):
+        self.eth = FakeEth(contracts)
+
+
+def token_contract(symbol, decimals):
+    return {
+        selector('symbol()'): encode(['string'], [symbol]),
+        selector('name()'): encode(['string'], [f'{symbol} Token']),
+        selector('decimals()'): encode(['uint8'], [decimals]),
+        selector('totalSupply()'): 'revert',
+    }
+
+
+CONTRACTS = {
+    TOKEN_A: token_contract('AAA', 18),
+    TOKEN_B: token_contract('BBB', 6),
+    PAIR: {
+        selector('token0()'): encode(['address'], [TOKEN_A]),
+        selector('token1()'): encode(['address'], [TOKEN_B]),
+        selector('getReserves()'): encode(['uint112', 'uint112', 'uint32'], [1000, 2000, 1]),
+    },
+}
+
+
+class TestMulticall(unittest.TestCase):
+    """Batch encoding, execution and per-call decoding."""
+
+    def setUp(self):
+        self.w3 = FakeWeb3(CONTRACTS)
+
+        async def executor(operation, *args):
+            return await operation(self.w3, *args)
+
+        self.executor = executor
+
+    def test_token_metadata_single_round_trip(self):
+        metadata, _ = asyncio.run(fetch_token_metadata(self.executor, [TOKEN_A, TOKEN_B, EMPTY, TOKEN_A]))
+
+        self.assertEqual(self.w3.eth.calls, 1)
+        self.assertEqual(metadata[TOKEN_A]['symbol'], 'AAA')
+        self.assertEqual(metadata[TOKEN_B]['decimals'], 6)
+        # Reverted call is reported per call and falls back to its default
+        self.assertEqual(metadata[TOKEN_B]['failed_calls'], ['total_supply'])
+        self.assertEqual(metadata[TOKEN_B]['total_supply'], 0)
+        # No code at address: every call returns empty data
+        self.assertIsNone(metadata[EMPTY])
+
+    def test_chunking_and_argument_encoding(self):
+        requests = [
+            MulticallRequest(TOKEN_A, 'balanceOf(address)', ('uint256',), args=(TOKEN_B,), default=-1)
+            for _ in range(5)
+        ]
+        self.assertEqual(requests[0].calldata[4:], encode(['address'], [TOKEN_B]))
+
+        results = asyncio.run(execute_multicall(self.executor, requests, max_batch_size=2))
+
+        self.assertEqual(self.w3.eth.calls, 3)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(not r.success and r.value == -1 for r in results))
+
+    def test_web3_client_pair_info_batches_reads(self):
+        client = Web3Client.__new__(Web3Client)
+        client.logger = logging.getLogger('test.web3_client')
+        client.chain_config = type('ChainConfig', (), {'weth_address': TOKEN_A, 'usdc_address': TOKEN_B})()
+
+        async def execute_with_retry(operation, *args):
+            return await operation(self.w3, *args)
+
+        client._execute_with_retry = execute_with_retry
+
+        pair_infos = asyncio.run(client.get_uniswap_v2_pair_infos([PAIR, EMPTY]))
+
+        # One multicall for pair state, one for all distinct tokens
+        self.assertEqual(self.w3.eth.calls, 2)
+        self.assertIsNone(pair_infos[EMPTY])
+        pair = pair_infos[PAIR]
+        self.assertEqual((pair.token0.symbol, pair.token1.symbol), ('AAA', 'BBB'))
+        self.assertEqual(pair.liquidity, 3000)
+
+
+if __name__ == '__main__':
+    unittest.main()
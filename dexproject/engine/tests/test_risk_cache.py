@@ -0,0 +1,240 @@
+"""
+Test Suite for the Fast Risk Cache Memory Tier
+
+Validates that the memory tier behaves as a size-bounded LRU (hits refresh
+recency, the least recently used entry is evicted first) and that hit/miss
+counts and the per-lookup latency histogram are exposed through
+get_cache_statistics, that concurrent misses and risk computations for one
+token are coalesced into a single fetch, that early refresh triggers
+only as entries approach expiry, and that the fast lane engine fills the
+cache from Smart Lane risk analysis.
+
+File: dexproject/engine/tests/test_risk_cache.py
+"""
+
+import asyncio
+import json
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.cache.risk_cache import FastRiskCache, RiskCacheEntry
+from engine.execution.fast_engine import FastLaneExecutionEngine
+from engine.smart_lane import DEFAULT_CONFIG, RiskCategory, RiskScore
+from shared.schemas import RiskLevel
+
+
+def token(i):
+    return '0x' + f'{i:040x}'
+
+
+def risk_data(score):
+    return {'overall_risk_score': score, 'risk_level': 'low'}
+
+
+class TestFastRiskCacheMemoryTier(unittest.TestCase):
+    """O(1) LRU memory tier and lookup statistics."""
+
+    def setUp(self):
+        self.cache = FastRiskCache(chain_id=1)
+        self.cache.max_memory_entries = 3
+
+    def test_lru_eviction_order(self):
+        async def run():
+            for i in range(3):
+                await self.cache.store_risk_data(token(i), risk_data(10 + i))
+            # Touch token 0 so token 1 becomes least recently used
+            self.assertIsNotNone(await self.cache.get_token_risk(token(0)))
+            await self.cache.store_risk_data(token(3), risk_data(13))
+
+            self.assertIsNone(await self.cache.get_token_risk(token(1)))
+            for i in (0, 2, 3):
+                self.assertIsNotNone(await self.cache.get_token_risk(token(i)))
+
+        asyncio.run(run())
+
+        self.assertEqual(len(self.cache.memory_cache), 3)
+        self.assertEqual(self.cache.statistics.cache_evictions, 1)
+
+    def test_restore_existing_key_does_not_evict(self):
+        async def run():
+            for i in range(3):
+                await self.cache.store_risk_data(token(i), risk_data(10))
+            await self.cache.store_risk_data(token(0), risk_data(90))
+            return await self.cache.get_token_risk(token(0))
+
+        data = asyncio.run(run())
+
+        self.assertEqual(data['overall_risk_score'], 90.0)
+        self.assertEqual(self.cache.statistics.cache_evictions, 0)
+
+    def test_hit_miss_counts_and_latency_histogram(self):
+        async def run():
+            await self.cache.store_risk_data(token(1), risk_data(20))
+            await self.cache.get_token_risk(token(1))
+            await self.cache.get_token_risk(token(1))
+            await self.cache.get_token_risk(token(2))
+            return await self.cache.get_cache_statistics()
+
+        performance = asyncio.run(run())['performance']
+
+        self.assertEqual((performance['cache_hits'], performance['cache_misses']), (2, 1))
+        self.assertEqual((performance['memory_hits'], performance['memory_misses']), (2, 1))
+        self.assertEqual(sum(performance['lookup_latency_histogram_ms'].values()), 3)
+
+
+class CountingRedis:
+    """Minimal async Redis stand-in that counts and delays GETs."""
+
+    def __init__(self, data):
+        self.data = data
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        await asyncio.sleep(0.01)
+        return self.data.get(key)
+
+
+class TestFastRiskCacheSingleFlight(unittest.TestCase):
+    """Request coalescing and probabilistic early refresh."""
+
+    def setUp(self):
+        self.cache = FastRiskCache(chain_id=1)
+
+    def make_entry(self, expires_in):
+        now = datetime.now(timezone.utc)
+        return RiskCacheEntry(
+            token_address=token(1),
+            chain_id=1,
+            overall_risk_score=20,
+            risk_level=RiskLevel.LOW,
+            risk_categories={},
+            expires_at=now + expires_in
+        )
+
+    def test_concurrent_misses_share_one_redis_fetch(self):
+        entry = self.make_entry(timedelta(hours=1))
+        self.cache.redis_client = CountingRedis({entry.get_cache_key(): json.dumps(entry.to_dict())})
+
+        async def run():
+            return await asyncio.gather(*(self.cache.get_token_risk(token(1)) for _ in range(10)))
+
+        results = asyncio.run(run())
+
+        self.assertEqual(self.cache.redis_client.gets, 1)
+        self.assertTrue(all(result['overall_risk_score'] == 20.0 for result in results))
+        self.assertEqual(self.cache.statistics.coalesced_requests, 9)
+        self.assertIn(entry.get_cache_key(), self.cache.memory_cache)
+
+    def test_concurrent_computations_run_once(self):
+        calls = []
+
+        async def fetcher(address):
+            calls.append(address)
+            await asyncio.sleep(0.01)
+            return risk_data(30)
+
+        self.cache.risk_fetcher = fetcher
+
+        async def run():
+            results = await asyncio.gather(
+                *(self.cache._compute_risk(token(1), source='warming') for _ in range(5))
+            )
+            return results, await self.cache.get_token_risk(token(1))
+
+        results, data = asyncio.run(run())
+
+        self.assertEqual(calls, [token(1)])
+        self.assertEqual(results, [True] * 5)
+        self.assertEqual(data['source'], 'warming')
+
+    def test_token_is_queued_for_warming_once(self):
+        async def run():
+            for _ in range(6):
+                await self.cache.get_token_risk(token(1))
+
+        asyncio.run(run())
+
+        self.assertEqual(self.cache.warming_queue.qsize(), 1)
+
+    def test_early_refresh_depends_on_time_to_expiry(self):
+        fresh = self.make_entry(timedelta(days=7))
+        expired = self.make_entry(timedelta(seconds=-1))
+
+        self.assertFalse(any(self.cache._should_refresh_early(fresh) for _ in range(1000)))
+        self.assertTrue(self.cache._should_refresh_early(expired))
+
+        # Close to expiry, some but not all hits trigger a refresh
+        closing = self.make_entry(timedelta(seconds=60))
+        refreshes = sum(self.cache._should_refresh_early(closing) for _ in range(2000))
+        self.assertGreater(refreshes, 0)
+        self.assertLess(refreshes, 2000)
+
+    def test_hits_queue_one_refresh_per_token(self):
+        async def run():
+            await self.cache.store_risk_data(token(1), risk_data(20))
+            entry = next(iter(self.cache.memory_cache.values()))
+            entry.expires_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+            for _ in range(5):
+                await self.cache.get_token_risk(token(1))
+
+        asyncio.run(run())
+
+        self.assertEqual(self.cache.refresh_queue.qsize(), 1)
+        self.assertEqual(self.cache.statistics.early_refreshes, 1)
+
+
+
+class StubRiskPipeline:
+    """Smart Lane pipeline stand-in returning fixed risk scores."""
+
+    config = DEFAULT_CONFIG
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.contexts = []
+
+    async def analyze_token(self, token_address, context=None):
+        self.contexts.append(context)
+        return SimpleNamespace(
+            risk_scores={
+                category: RiskScore(category, score, 0.9, {}, 1.0, [])
+                for category, score in self.scores.items()
+            },
+            overall_risk_score=max(self.scores.values()),
+            overall_confidence=0.9
+        )
+
+
+class TestFastLaneRiskFetcher(unittest.TestCase):
+    """The fast lane engine computes cache entries with Smart Lane."""
+
+    def test_engine_fills_cache_from_smart_lane(self):
+        engine = FastLaneExecutionEngine(chain_id=1)
+        engine.risk_pipeline = StubRiskPipeline({
+            RiskCategory.HONEYPOT_DETECTION: 0.95,
+            RiskCategory.LIQUIDITY_ANALYSIS: 0.2,
+        })
+        cache = FastRiskCache(chain_id=1, risk_fetcher=engine._fetch_token_risk)
+
+        async def run():
+            stored = await cache._compute_risk(token(1), source='warming')
+            return stored, await cache.get_token_risk(token(1))
+
+        stored, data = asyncio.run(run())
+
+        self.assertTrue(stored)
+        self.assertTrue(data['is_honeypot'])
+        self.assertEqual(data['risk_level'], 'critical')
+        self.assertEqual(data['overall_risk_score'], 95.0)
+        self.assertEqual(engine.risk_pipeline.contexts, [{'cache_warming': True}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,388 @@
+"""
+Test Suite for the Async JSON-RPC Transport
+
+Validates that RPC calls run on a pooled aiohttp session without blocking
+the event loop, that the per-provider concurrency limit is respected while
+requests are pipelined, that AsyncWeb3 works on top of the transport, that
+ProviderManager batches requests into one HTTP call with per-request retry
+and failover, and that hedged reads race a second provider once the primary
+exceeds its latency budget.
+
+File: dexproject/engine/tests/test_rpc_transport.py
+"""
+
+import asyncio
+import gc
+import os
+import threading
+import unittest
+import warnings
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from aiohttp import web
+from web3 import AsyncWeb3
+
+from engine.rpc_transport import AsyncJsonRpcProvider, AsyncJsonRpcTransport, JsonRpcError
+from engine.utils import ChainConfig, ProviderConfig, ProviderManager
+
+
+RESPONSE_DELAY = 0.02
+
+
+async def start_stub_server():
+    """Start a local JSON-RPC stub answering eth_blockNumber and eth_chainId."""
+
+    async def handle(request):
+        body = await request.json()
+        await asyncio.sleep(RESPONSE_DELAY)
+
+        def answer(call):
+            if call['method'] == 'eth_blockNumber':
+                return {'jsonrpc': '2.0', 'id': call['id'], 'result': hex(1234)}
+            if call['method'] == 'eth_chainId':
+                return {'jsonrpc': '2.0', 'id': call['id'], 'result': hex(1)}
+            return {'jsonrpc': '2.0', 'id': call['id'], 'error': {'code': -32601, 'message': 'method not found'}}
+
+        if isinstance(body, list):
+            return web.json_response([answer(call) for call in body])
+        return web.json_response(answer(body))
+
+    app = web.Application()
+    app.router.add_post('/', handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f'http://127.0.0.1:{port}/'
+
+
+class ThreadedStubServer:
+    """
+    JSON-RPC stub on its own thread, so ProviderManager's synchronous
+    connection test can reach it. Counts HTTP requests and can fail the
+    first N of them, delay every answer, and the first call of each method
+    in flaky_methods is answered with a retryable error.
+    """
+
+    def __init__(self, fail_http=0):
+        self.http_requests = 0
+        self.fail_http = fail_http
+        self.delay = 0.0
+        self.flaky_methods = set()
+        self.ready = threading.Event()
+        threading.Thread(target=lambda: asyncio.run(self._serve()), daemon=True).start()
+        self.ready.wait()
+
+    def answer(self, call):
+        method = call['method']
+        if method in self.flaky_methods:
+            self.flaky_methods.discard(method)
+            return {'jsonrpc': '2.0', 'id': call['id'], 'error': {'code': -32005, 'message': 'limit exceeded'}}
+        if method == 'eth_blockNumber':
+            return {'jsonrpc': '2.0', 'id': call['id'], 'result': hex(1234)}
+        if method == 'web3_clientVersion':
+            return {'jsonrpc': '2.0', 'id': call['id'], 'result': 'stub/v1'}
+        if method == 'eth_getBalance':
+            return {'jsonrpc': '2.0', 'id': call['id'], 'result': hex(int(call['params'][0][-2:], 16))}
+        return {'jsonrpc': '2.0', 'id': call['id'], 'error': {'code': 3, 'message': 'execution reverted'}}
+
+    async def handle(self, request):
+        body = await request.json()
+        self.http_requests += 1
+        await asyncio.sleep(self.delay)
+        if self.http_requests <= self.fail_http:
+            return web.Response(status=503)
+        if isinstance(body, list):
+            # Answer out of order; responses are matched by id
+            return web.json_response([self.answer(call) for call in reversed(body)])
+        return web.json_response(self.answer(body))
+
+    async def _serve(self):
+        app = web.Application()
+        app.router.add_post('/', self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        self.ready.set()
+        await asyncio.Event().wait()
+
+
+def make_provider_manager(*servers):
+    """Create a ProviderManager over the given stub servers, in priority order."""
+    chain_config = ChainConfig(
+        chain_id=1,
+        name='Stub',
+        rpc_providers=[
+            ProviderConfig(name=f'stub{i}', url=server.url, priority=i)
+            for i, server in enumerate(servers)
+        ]
+    )
+    manager = ProviderManager(chain_config)
+    manager.current_provider = 'stub0'
+    # Exclude the synchronous connection tests from the request counts
+    for server in servers:
+        server.http_requests = 0
+    return manager
+
+
+class TestAsyncJsonRpcTransport(unittest.TestCase):
+    """Pooled, concurrency-limited transport."""
+
+    def test_request_and_error(self):
+        async def run():
+            runner, url = await start_stub_server()
+            transport = AsyncJsonRpcTransport(url, name='stub')
+            try:
+                self.assertEqual(await transport.request('eth_blockNumber'), hex(1234))
+                with self.assertRaises(JsonRpcError):
+                    await transport.request('eth_unknown')
+            finally:
+                await transport.close()
+                await runner.cleanup()
+
+        asyncio.run(run())
+
+    def test_pipelined_requests_respect_concurrency_limit(self):
+        async def run():
+            runner, url = await start_stub_server()
+            transport = AsyncJsonRpcTransport(url, name='stub', max_concurrency=4)
+            try:
+                loop = asyncio.get_running_loop()
+                started = loop.time()
+                results = await transport.request_many([('eth_blockNumber', [])] * 16)
+                elapsed = loop.time() - started
+            finally:
+                await transport.close()
+                await runner.cleanup()
+
+            self.assertEqual(results, [hex(1234)] * 16)
+            self.assertEqual(transport.get_stats()['peak_in_flight'], 4)
+            # 16 calls at 4 in flight is 4 rounds, far below 16 sequential round trips
+            self.assertLess(elapsed, 16 * RESPONSE_DELAY)
+
+        asyncio.run(run())
+
+    def test_transport_reused_across_event_loops(self):
+        server = ThreadedStubServer()
+        transport = AsyncJsonRpcTransport(server.url, name='stub', max_concurrency=1)
+
+        async def burst():
+            # More calls than slots, so the semaphore is contended on this loop
+            return await transport.request_many([('eth_blockNumber', [])] * 3)
+
+        self.assertEqual(asyncio.run(burst()), [hex(1234)] * 3)
+        self.assertEqual(asyncio.run(burst()), [hex(1234)] * 3)
+        self.assertEqual(transport.get_stats()['failed_requests'], 0)
+
+    def test_rebind_closes_session_of_finished_loop(self):
+        server = ThreadedStubServer()
+        transport = AsyncJsonRpcTransport(server.url, name='stub')
+
+        async def call():
+            return await transport.request('eth_blockNumber'), transport._session
+
+        _, first_session = asyncio.run(call())
+        self.assertFalse(first_session.closed)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always', ResourceWarning)
+            _, second_session = asyncio.run(call())
+            # The first loop is closed, so its pool is closed synchronously
+            self.assertTrue(first_session.closed)
+            self.assertIsNot(second_session, first_session)
+            del first_session
+            gc.collect()
+
+        self.assertEqual(
+            [w for w in caught if 'Unclosed' in str(w.message)], []
+        )
+
+    def test_async_web3_over_transport(self):
+        async def run():
+            runner, url = await start_stub_server()
+            transport = AsyncJsonRpcTransport(url, name='stub')
+            try:
+                w3 = AsyncWeb3(AsyncJsonRpcProvider(transport))
+                block_number = await w3.eth.block_number
+                chain_id = await w3.eth.chain_id
+            finally:
+                await transport.close()
+                await runner.cleanup()
+
+            self.assertEqual((block_number, chain_id), (1234, 1))
+
+        asyncio.run(run())
+
+
+class TestProviderManagerBatching(unittest.TestCase):
+    """JSON-RPC batches with per-request retry and failover."""
+
+    def test_explicit_batch_is_one_http_request(self):
+        server = ThreadedStubServer()
+        manager = make_provider_manager(server)
+        addresses = ['0x' + f'{i:040x}' for i in range(1, 6)]
+
+        async def run():
+            try:
+                return await manager.batch_rpc(
+                    [('eth_getBalance', [address, 'latest']) for address in addresses]
+                    + [('eth_call', [{'to': addresses[0], 'data': '0x'}, 'latest'])]
+                )
+            finally:
+                await manager.close()
+
+        results = asyncio.run(run())
+
+        self.assertEqual(server.http_requests, 1)
+        self.assertEqual(results[:5], [hex(i) for i in range(1, 6)])
+        # Non-retryable per-call error is returned, not raised
+        self.assertIsInstance(results[5], JsonRpcError)
+        self.assertEqual(results[5].code, 3)
+
+    def test_windowed_requests_share_a_batch(self):
+        server = ThreadedStubServer()
+        manager = make_provider_manager(server)
+
+        async def run():
+            try:
+                w3 = manager.get_batched_web3()
+                return await asyncio.gather(
+                    w3.eth.block_number,
+                    *(manager.rpc_batched('eth_getBalance', ['0x' + f'{i:040x}', 'latest']) for i in range(1, 4))
+                )
+            finally:
+                await manager.close()
+
+        results = asyncio.run(run())
+
+        self.assertEqual(server.http_requests, 1)
+        self.assertEqual(results, [1234, '0x1', '0x2', '0x3'])
+        self.assertEqual(manager.get_health_summary()['batching']['batched_requests'], 4)
+
+    def test_batch_windows_are_per_event_loop(self):
+        server = ThreadedStubServer()
+        manager = make_provider_manager(server)
+        manager.batch_window_ms = 200
+        barrier = threading.Barrier(2)
+        results = {}
+
+        async def run(index):
+            barrier.wait()
+            return await asyncio.gather(*(
+                manager.rpc_batched('eth_getBalance', ['0x' + f'{i:040x}', 'latest'])
+                for i in (index, index + 2)
+            ))
+
+        def worker(index):
+            try:
+                results[index] = asyncio.run(asyncio.wait_for(run(index), timeout=5))
+            except Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in (1, 2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Both loops open a window at once; each resolves on its own loop
+        self.assertEqual(results, {1: ['0x1', '0x3'], 2: ['0x2', '0x4']})
+        self.assertEqual(server.http_requests, 2)
+        self.assertEqual(manager._batch_queues, {})
+
+    def test_retryable_errors_retry_only_the_failed_requests(self):
+        server = ThreadedStubServer()
+        manager = make_provider_manager(server)
+        server.flaky_methods.add('eth_blockNumber')
+
+        async def run():
+            try:
+                return await manager.batch_rpc([
+                    ('eth_blockNumber', []),
+                    ('eth_getBalance', ['0x' + '00' * 19 + '07', 'latest']),
+                ])
+            finally:
+                await manager.close()
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [hex(1234), '0x7'])
+        self.assertEqual(server.http_requests, 2)
+        self.assertEqual(manager.batched_requests, 3)
+
+    def test_failover_to_healthy_provider(self):
+        failing = ThreadedStubServer()
+        healthy = ThreadedStubServer()
+        manager = make_provider_manager(failing, healthy)
+        # stub0 passed its connection test and is selected, then starts failing
+        failing.fail_http = 100
+        manager.provider_health['stub0'].consecutive_failures = 2
+
+        async def run():
+            try:
+                return await manager.rpc_batched('eth_blockNumber')
+            finally:
+                await manager.close()
+
+        self.assertEqual(asyncio.run(run()), hex(1234))
+        self.assertEqual(manager.current_provider, 'stub1')
+        self.assertEqual(healthy.http_requests, 1)
+
+
+class TestHedgedRequests(unittest.TestCase):
+    """Opt-in hedging on a p95 latency budget."""
+
+    def setUp(self):
+        self.primary = ThreadedStubServer()
+        self.secondary = ThreadedStubServer()
+        self.manager = make_provider_manager(self.primary, self.secondary)
+        # Primary normally answers in ~50ms, so its hedge budget is its p95
+        for _ in range(50):
+            self.manager.provider_health['stub0'].record_latency(50.0)
+
+    def run_hedged(self):
+        async def run():
+            try:
+                return await self.manager.rpc_hedged('eth_blockNumber')
+            finally:
+                await self.manager.close()
+
+        return asyncio.run(run())
+
+    def test_budget_from_p95(self):
+        self.assertEqual(self.manager.get_hedge_budget_ms('stub0'), 50.0)
+        # Too few samples: default budget
+        self.assertEqual(self.manager.get_hedge_budget_ms('stub1'), 250.0)
+
+    def test_fast_primary_is_not_hedged(self):
+        self.assertEqual(self.run_hedged(), hex(1234))
+        self.assertEqual(self.manager.hedged_requests, 0)
+        self.assertEqual(self.secondary.http_requests, 0)
+
+    def test_slow_primary_is_hedged_and_secondary_wins(self):
+        self.primary.delay = 0.5
+
+        self.assertEqual(self.run_hedged(), hex(1234))
+
+        health = self.manager.provider_health
+        self.assertEqual(self.manager.hedged_requests, 1)
+        self.assertEqual(health['stub0'].hedges_triggered, 1)
+        self.assertEqual((health['stub1'].hedges_served, health['stub1'].hedge_wins), (1, 1))
+        # The cancelled primary still contributes its elapsed time to the window
+        self.assertGreater(health['stub0'].get_latency_percentile(100), 50.0)
+
+    def test_failed_primary_falls_through_to_hedge(self):
+        self.primary.fail_http = 100
+
+        self.assertEqual(self.run_hedged(), hex(1234))
+        self.assertEqual(self.manager.provider_health['stub1'].hedge_wins, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Test Suite for the Smart Lane Admission Controller
+
+Validates that requests waiting for an analysis slot are admitted in
+priority and liquidity order, that a full queue sheds its lowest-priority
+request, that requests which can no longer meet their deadline are
+dropped, and that SmartLanePipeline releases its slots and bounds an
+analysis by what is left of its deadline, and that position
+reassessments reach the pipeline tagged for the exit tier.
+
+File: dexproject/engine/tests/test_smart_lane_admission.py
+"""
+
+import asyncio
+import os
+import time
+import unittest
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.smart_lane import DEFAULT_CONFIG
+from engine.smart_lane.admission import (
+    AdmissionController, AnalysisPriority, AnalysisRejectedError, classify_request
+)
+from engine.smart_lane.analyzers import clear_analyzer_pool
+from engine.smart_lane.pipeline import SmartLanePipeline
+from engine.smart_lane.trading_bridge import SmartLaneTradingBridge
+
+
+class TestAdmissionController(unittest.TestCase):
+    """Priority order, load shedding and deadlines."""
+
+    def test_waiting_requests_admitted_by_priority_then_liquidity(self):
+        admission = AdmissionController(max_concurrent=1)
+        order = []
+
+        async def request(name, priority, liquidity_usd=0.0):
+            await admission.acquire(priority, liquidity_usd)
+            order.append(name)
+            await asyncio.sleep(0)
+            admission.release()
+
+        async def run():
+            await admission.acquire()  # Occupy the only slot
+            waiters = [
+                asyncio.create_task(request('dust pair', AnalysisPriority.NEW_PAIR, 500)),
+                asyncio.create_task(request('warming', AnalysisPriority.BACKGROUND)),
+                asyncio.create_task(request('deep pair', AnalysisPriority.NEW_PAIR, 2000000)),
+                asyncio.create_task(request('held token', AnalysisPriority.POSITION_EXIT)),
+            ]
+            await asyncio.sleep(0)
+            self.assertEqual(admission.queue_depth, 4)
+            admission.release()
+            await asyncio.gather(*waiters)
+
+        asyncio.run(run())
+
+        self.assertEqual(order, ['held token', 'deep pair', 'dust pair', 'warming'])
+        stats = admission.get_stats()
+        self.assertEqual((stats['admitted'], stats['queued'], stats['max_queue_depth']), (5, 4, 4))
+        self.assertEqual(stats['active'], 0)
+
+    def test_full_queue_sheds_lowest_priority(self):
+        admission = AdmissionController(max_concurrent=1, max_queue_size=1)
+
+        async def run():
+            await admission.acquire()
+            background = asyncio.create_task(admission.acquire(AnalysisPriority.BACKGROUND))
+            await asyncio.sleep(0)
+
+            # A higher-priority request takes the place of the queued one...
+            urgent = asyncio.create_task(admission.acquire(AnalysisPriority.POSITION_EXIT))
+            await asyncio.sleep(0)
+            with self.assertRaises(AnalysisRejectedError) as shed:
+                await background
+            self.assertEqual(shed.exception.reason, AnalysisRejectedError.QUEUE_FULL)
+
+            # ...while a lower-priority one is refused outright
+            with self.assertRaises(AnalysisRejectedError):
+                await admission.acquire(AnalysisPriority.BACKGROUND)
+
+            admission.release()
+            await urgent
+
+        asyncio.run(run())
+        self.assertEqual(admission.get_stats()['rejected_full'], 2)
+
+    def test_request_dropped_when_deadline_cannot_be_met(self):
+        admission = AdmissionController(max_concurrent=1, expected_duration=lambda: 1.0)
+
+        async def run():
+            await admission.acquire()
+            start = time.monotonic()
+            with self.assertRaises(AnalysisRejectedError) as dropped:
+                await admission.acquire(deadline=start + 1.05)
+            return time.monotonic() - start, dropped.exception
+
+        waited, error = asyncio.run(run())
+
+        self.assertLess(waited, 0.5)
+        self.assertEqual(error.reason, AnalysisRejectedError.DEADLINE)
+        self.assertEqual((admission.queue_depth, admission.dropped_deadline), (0, 1))
+
+    def test_classify_request(self):
+        self.assertEqual(classify_request({'position_id': 7}), AnalysisPriority.POSITION_EXIT)
+        self.assertEqual(classify_request({'manual_trigger': True}), AnalysisPriority.MANUAL)
+        self.assertEqual(classify_request({'cache_warming': True}), AnalysisPriority.BACKGROUND)
+        self.assertEqual(classify_request({}), AnalysisPriority.NEW_PAIR)
+        self.assertEqual(classify_request({'priority': 0, 'cache_warming': True}), AnalysisPriority.POSITION_EXIT)
+
+    def test_classify_request_tolerates_unknown_priorities(self):
+        self.assertEqual(classify_request({'priority': 'position_exit'}), AnalysisPriority.POSITION_EXIT)
+        self.assertEqual(classify_request({'priority': '1'}), AnalysisPriority.MANUAL)
+        self.assertEqual(classify_request({'priority': 9}), AnalysisPriority.NEW_PAIR)
+        self.assertEqual(classify_request({'priority': 'urgent'}), AnalysisPriority.NEW_PAIR)
+        self.assertEqual(
+            classify_request({'priority': [0], 'position_id': 7}), AnalysisPriority.POSITION_EXIT
+        )
+
+
+class TestPipelineAdmission(unittest.TestCase):
+    """SmartLanePipeline.analyze_token goes through admission."""
+
+    def setUp(self):
+        clear_analyzer_pool()
+        self.addCleanup(clear_analyzer_pool)
+
+    def test_analyses_queue_for_a_slot_and_release_it(self):
+        pipeline = SmartLanePipeline(config=DEFAULT_CONFIG, chain_id=1, enable_caching=False)
+        self.addCleanup(pipeline.thread_pool.shutdown)
+        pipeline.admission.max_concurrent = 1
+
+        async def run():
+            return await asyncio.gather(
+                pipeline.analyze_token('0x' + '1' * 40),
+                pipeline.analyze_token('0x' + '2' * 40, context={'position_id': 1})
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(len(results), 2)
+        admission = pipeline.get_performance_metrics()['admission']
+        self.assertEqual((admission['admitted'], admission['queued'], admission['active']), (2, 1, 0))
+        self.assertIn(AnalysisPriority.POSITION_EXIT.name, admission['average_wait_ms_by_priority'])
+
+    def test_position_reassessment_is_admitted_as_exit(self):
+        calls = []
+
+        class RecordingPipeline:
+            async def analyze_token(self, token_address, context=None, force_refresh=False, **kwargs):
+                calls.append((classify_request(context), force_refresh))
+
+        bridge = SmartLaneTradingBridge(RecordingPipeline())
+        asyncio.run(bridge.reassess_position('0x' + '1' * 40, 'position-1'))
+
+        self.assertEqual(calls, [(AnalysisPriority.POSITION_EXIT, True)])
+
+    def test_queue_wait_counts_against_deadline(self):
+        pipeline = SmartLanePipeline(config=DEFAULT_CONFIG, chain_id=1, enable_caching=False)
+        self.addCleanup(pipeline.thread_pool.shutdown)
+        pipeline.admission.max_concurrent = 1
+
+        async def slow_analysis(**kwargs):
+            await asyncio.sleep(10)
+
+        pipeline._perform_comprehensive_analysis = slow_analysis
+
+        async def run():
+            await pipeline.admission.acquire()  # Occupy the only slot
+            asyncio.get_running_loop().call_later(0.2, pipeline.admission.release)
+            start = time.monotonic()
+            with self.assertRaises(TimeoutError):
+                await pipeline.analyze_token('0x' + '1' * 40, deadline_seconds=0.4)
+            return time.monotonic() - start
+
+        waited = asyncio.run(run())
+
+        # The analysis gets what is left of the deadline, not a fresh timeout
+        self.assertLess(waited, 0.6)
+        self.assertEqual(pipeline.performance_metrics['timeout_analyses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
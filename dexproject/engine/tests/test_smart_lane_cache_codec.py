@@ -0,0 +1,279 @@
+"""
+Test Suite for the Smart Lane Cache Codec
+
+Validates that analyses round-trip through the binary, schema-versioned
+cache format with their RiskScore and TechnicalSignal objects restored,
+that summary decoding leaves the detail section untouched, that foreign
+or outdated entries are rejected, and that SmartLaneCache stores and
+reads entries in one round trip each and keeps entries only other
+workers can read.
+
+File: dexproject/engine/tests/test_smart_lane_cache_codec.py
+"""
+
+import asyncio
+import json
+import os
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.smart_lane import (
+    DecisionConfidence, RiskCategory, RiskScore, SmartLaneAction,
+    SmartLaneAnalysis, TechnicalSignal
+)
+from engine.smart_lane import cache_codec
+from engine.smart_lane.cache import SmartLaneCache
+from engine.smart_lane.cache_codec import (
+    CacheCodecError, CachedAnalysis, UnsupportedEntryError, decode_analysis, decode_summary, encode_analysis
+)
+
+
+TOKEN = '0x' + '1' * 40
+
+
+def make_analysis(**overrides):
+    values = dict(
+        token_address=TOKEN,
+        chain_id=1,
+        analysis_id='analysis-1',
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        risk_scores={
+            category: RiskScore(
+                category=category,
+                score=0.3,
+                confidence=0.8,
+                details={'holders': 1250, 'observed_at': datetime(2026, 1, 1), 'tax': Decimal('0.05')},
+                analysis_time_ms=12.5,
+                warnings=['concentrated holders'] * 3
+            )
+            for category in RiskCategory
+        },
+        overall_risk_score=0.3,
+        overall_confidence=0.8,
+        technical_signals=[
+            TechnicalSignal('5m', 'BUY', 0.7, {'rsi': 41.0}, {'support': 0.95}, 0.6)
+        ],
+        technical_summary={'overall_signal': 'BUY', 'signal_count': 1},
+        recommended_action=SmartLaneAction.PARTIAL_BUY,
+        position_size_percent=2.5,
+        confidence_level=DecisionConfidence.MEDIUM,
+        stop_loss_percent=8.0,
+        take_profit_targets=[10.0, 25.0],
+        max_hold_time_hours=24,
+        total_analysis_time_ms=310.0,
+        cache_hit_ratio=0.0,
+        data_freshness_score=1.0,
+        critical_warnings=[],
+        informational_notes=['AI Thought Log: ...']
+    )
+    values.update(overrides)
+    return SmartLaneAnalysis(**values)
+
+
+class TestCacheCodec(unittest.TestCase):
+    """Binary encoding with lazy detail decoding."""
+
+    def test_round_trip_restores_objects(self):
+        analysis = make_analysis()
+
+        decoded = decode_analysis(encode_analysis(analysis))
+
+        self.assertEqual(decoded.recommended_action, SmartLaneAction.PARTIAL_BUY)
+        self.assertEqual(decoded.confidence_level, DecisionConfidence.MEDIUM)
+        honeypot = decoded.risk_scores[RiskCategory.HONEYPOT_DETECTION]
+        self.assertIsInstance(honeypot, RiskScore)
+        self.assertEqual(honeypot.category, RiskCategory.HONEYPOT_DETECTION)
+        self.assertEqual(honeypot.details['tax'], '0.05')
+        self.assertEqual(decoded.technical_signals, analysis.technical_signals)
+        self.assertEqual(decoded.take_profit_targets, [10.0, 25.0])
+
+    def test_summary_decode_skips_detail(self):
+        entry = decode_summary(encode_analysis(make_analysis()))
+
+        self.assertEqual(entry.recommended_action, SmartLaneAction.PARTIAL_BUY)
+        self.assertEqual(entry.overall_risk_score, 0.3)
+        self.assertFalse(entry.is_decoded)
+
+        self.assertIs(entry.to_analysis(), entry.to_analysis())
+        self.assertTrue(entry.is_decoded)
+
+    def test_large_detail_is_compressed(self):
+        analysis = make_analysis()
+        encoded = encode_analysis(analysis)
+        uncompressed = encode_analysis(analysis, compress_threshold_bytes=10 ** 9)
+
+        self.assertLess(len(encoded), len(uncompressed))
+        self.assertEqual(decode_analysis(encoded), decode_analysis(uncompressed))
+
+    def test_foreign_and_outdated_entries_rejected(self):
+        encoded = bytearray(encode_analysis(make_analysis()))
+
+        with self.assertRaises(CacheCodecError):
+            decode_summary(b'{"analysis": 1}')
+
+        encoded[3] = cache_codec.SCHEMA_VERSION - 1
+        with self.assertRaises(CacheCodecError):
+            decode_summary(bytes(encoded))
+
+    def test_entries_from_newer_workers_unsupported(self):
+        encoded = bytearray(encode_analysis(make_analysis()))
+
+        newer_schema = bytearray(encoded)
+        newer_schema[3] = cache_codec.SCHEMA_VERSION + 1
+        with self.assertRaises(UnsupportedEntryError):
+            decode_summary(bytes(newer_schema))
+
+        # Compression is only checked when the detail section is decoded
+        newer_compression = bytearray(encoded)
+        newer_compression[5] = 9
+        entry = decode_summary(bytes(newer_compression))
+        with self.assertRaises(UnsupportedEntryError):
+            entry.to_analysis()
+
+
+class FakePipeline:
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    async def execute(self):
+        self.redis_client.round_trips += 1
+        results = []
+        for name, args, kwargs in self.commands:
+            results.append(await getattr(self.redis_client, name)(*args, **kwargs))
+        self.redis_client.round_trips -= len(self.commands)
+        return results
+
+
+class FakeRedis:
+    """Byte-valued hashes and sets, counting round trips."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.sets = {}
+        self.round_trips = 0
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    async def hset(self, key, mapping):
+        self.round_trips += 1
+        self.hashes.setdefault(key, {}).update({
+            field: value if isinstance(value, bytes) else str(value).encode()
+            for field, value in mapping.items()
+        })
+
+    async def hdel(self, key, *fields):
+        self.round_trips += 1
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    async def hmget(self, key, *fields):
+        self.round_trips += 1
+        return [self.hashes.get(key, {}).get(field) for field in fields]
+
+    async def expire(self, key, seconds):
+        self.round_trips += 1
+
+    async def sadd(self, key, member):
+        self.round_trips += 1
+        self.sets.setdefault(key, set()).add(member)
+
+    async def scard(self, key):
+        self.round_trips += 1
+        return len(self.sets.get(key, ()))
+
+    async def delete(self, key):
+        self.round_trips += 1
+        return int(self.hashes.pop(key, None) is not None)
+
+
+class TestSmartLaneCacheEntries(unittest.TestCase):
+    """SmartLaneCache reads and writes binary entries."""
+
+    def setUp(self):
+        self.cache = SmartLaneCache(chain_id=1)
+        self.cache.redis_client = FakeRedis()
+
+    def test_store_and_read_one_round_trip_each(self):
+        redis_client = self.cache.redis_client
+
+        self.assertTrue(asyncio.run(self.cache.store_analysis(TOKEN, make_analysis())))
+        self.assertEqual(redis_client.round_trips, 1)
+
+        entry = asyncio.run(self.cache.get_analysis_summary(TOKEN))
+        self.assertEqual(redis_client.round_trips, 2)
+        self.assertEqual(entry.recommended_action, SmartLaneAction.PARTIAL_BUY)
+        self.assertEqual(entry.data_freshness_score, 1.0)
+
+        analysis = asyncio.run(self.cache.get_analysis(TOKEN))
+        self.assertIsInstance(analysis.risk_scores[RiskCategory.LIQUIDITY_ANALYSIS], RiskScore)
+        self.assertEqual(self.cache.get_cache_statistics()['cache_hits'], 2)
+
+    def test_undecodable_entry_is_a_miss_and_dropped(self):
+        key = self.cache._get_analysis_key(TOKEN)
+        self.cache.redis_client.hashes[key] = {
+            'timestamp': datetime.now(timezone.utc).isoformat().encode(),
+            'analysis': b'SLC\x00garbage'
+        }
+
+        self.assertIsNone(asyncio.run(self.cache.get_analysis(TOKEN)))
+        self.assertNotIn(key, self.cache.redis_client.hashes)
+        self.assertEqual(self.cache.get_cache_statistics()['decode_errors'], 1)
+
+    def test_undecodable_detail_is_a_miss(self):
+        encoded = encode_analysis(make_analysis())
+        key = self.cache._get_analysis_key(TOKEN)
+        self.cache.redis_client.hashes[key] = {
+            'timestamp': datetime.now(timezone.utc).isoformat().encode(),
+            'analysis': encoded[:-10]  # Summary intact, detail truncated
+        }
+
+        self.assertIsNone(asyncio.run(self.cache.get_analysis(TOKEN)))
+        self.assertNotIn(key, self.cache.redis_client.hashes)
+        stats = self.cache.get_cache_statistics()
+        self.assertEqual((stats['cache_hits'], stats['cache_misses'], stats['decode_errors']), (0, 1, 1))
+
+    def test_legacy_json_entry_is_wrapped(self):
+        analysis = make_analysis(risk_scores={}, technical_signals=[])
+        key = self.cache._get_analysis_key(TOKEN)
+        self.cache.redis_client.hashes[key] = {
+            'timestamp': datetime.now(timezone.utc).isoformat().encode(),
+            'analysis_data': json.dumps(
+                self.cache._serialize_analysis(analysis), default=lambda value: value.value
+            ).encode()
+        }
+
+        entry = asyncio.run(self.cache.get_analysis_summary(TOKEN))
+
+        self.assertIsInstance(entry, CachedAnalysis)
+        self.assertTrue(entry.is_decoded)
+        self.assertEqual(entry.recommended_action, SmartLaneAction.PARTIAL_BUY)
+        self.assertEqual(entry.to_analysis().analysis_id, 'analysis-1')
+        self.assertEqual(entry.to_analysis().data_freshness_score, entry.data_freshness_score)
+
+    def test_unsupported_entry_is_a_miss_and_kept(self):
+        encoded = bytearray(encode_analysis(make_analysis()))
+        encoded[3] = cache_codec.SCHEMA_VERSION + 1
+        key = self.cache._get_analysis_key(TOKEN)
+        self.cache.redis_client.hashes[key] = {
+            'timestamp': datetime.now(timezone.utc).isoformat().encode(),
+            'analysis': bytes(encoded)
+        }
+
+        self.assertIsNone(asyncio.run(self.cache.get_analysis(TOKEN)))
+        self.assertIn(key, self.cache.redis_client.hashes)
+        stats = self.cache.get_cache_statistics()
+        self.assertEqual((stats['cache_misses'], stats['decode_errors']), (1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
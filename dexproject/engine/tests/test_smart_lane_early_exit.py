@@ -0,0 +1,138 @@
+"""
+Test Suite for Smart Lane Early Exit
+
+Validates that the pipeline consumes risk category results as they
+complete and, once a critical category returns a blocking verdict,
+cancels the remaining categories and returns a partial AVOID result (but
+runs the full analysis when nothing was left to cancel), and that fact
+fetches still in flight are cancelled when an analysis ends.
+
+File: dexproject/engine/tests/test_smart_lane_early_exit.py
+"""
+
+import asyncio
+import os
+import time
+import unittest
+from dataclasses import replace
+from unittest.mock import patch
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.smart_lane import DEFAULT_CONFIG, RiskCategory, RiskScore, SmartLaneAction
+from engine.smart_lane import token_context
+from engine.smart_lane.pipeline import SmartLanePipeline
+from engine.smart_lane.token_context import FACT_CONTRACT_DATA, TOKEN_CONTEXT_KEY
+
+
+TOKEN = '0x' + '1' * 40
+
+
+class TestEarlyExit(unittest.TestCase):
+    """Critical verdicts short-circuit the risk analysis."""
+
+    def make_pipeline(self, honeypot_score, honeypot_confidence=0.9, honeypot_delay=0, others_delay=1, **config):
+        """Pipeline whose honeypot category answers after honeypot_delay and the rest after others_delay."""
+        pipeline = SmartLanePipeline(
+            config=replace(DEFAULT_CONFIG, **config), chain_id=1, enable_caching=False
+        )
+        self.addCleanup(pipeline.thread_pool.shutdown)
+        self.cancelled = []
+
+        async def analyze_category(category, token_address, context):
+            if category == RiskCategory.HONEYPOT_DETECTION:
+                await asyncio.sleep(honeypot_delay)
+                return RiskScore(category, honeypot_score, honeypot_confidence, {}, 1.0, [])
+            try:
+                await asyncio.sleep(others_delay)
+            except asyncio.CancelledError:
+                self.cancelled.append(category)
+                raise
+            return RiskScore(category, 0.2, 0.9, {}, 1000.0, [])
+
+        pipeline._analyze_risk_category = analyze_category
+        return pipeline
+
+    def test_blocking_verdict_cancels_remaining_categories(self):
+        pipeline = self.make_pipeline(honeypot_score=0.95)
+
+        start = time.perf_counter()
+        result = asyncio.run(pipeline._perform_comprehensive_analysis(TOKEN, 'test', {}))
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertTrue(result.is_partial)
+        self.assertIn(RiskCategory.HONEYPOT_DETECTION.value, result.early_exit_reason)
+        self.assertEqual(result.recommended_action, SmartLaneAction.AVOID)
+        self.assertEqual(list(result.risk_scores), [RiskCategory.HONEYPOT_DETECTION])
+        self.assertEqual(len(self.cancelled), len(DEFAULT_CONFIG.enabled_categories) - 1)
+        self.assertEqual(pipeline.get_performance_metrics()['early_exits'], 1)
+
+    def test_verdict_after_all_categories_runs_full_analysis(self):
+        pipeline = self.make_pipeline(honeypot_score=0.95, honeypot_delay=0.05, others_delay=0)
+
+        result = asyncio.run(pipeline._perform_comprehensive_analysis(TOKEN, 'test', {}))
+
+        self.assertEqual(len(result.risk_scores), len(DEFAULT_CONFIG.enabled_categories))
+        self.assertFalse(result.is_partial)
+        self.assertIsNone(result.early_exit_reason)
+        self.assertTrue(result.technical_summary)
+        self.assertEqual(pipeline.get_performance_metrics()['early_exits'], 0)
+
+    def test_low_confidence_verdict_does_not_block(self):
+        pipeline = self.make_pipeline(honeypot_score=1.0, honeypot_confidence=0.0)
+
+        scores, reason = asyncio.run(pipeline._execute_parallel_risk_analysis(TOKEN, {}))
+
+        self.assertEqual(len(scores), len(DEFAULT_CONFIG.enabled_categories))
+        self.assertIsNone(reason)
+        self.assertEqual(self.cancelled, [])
+
+    def test_early_exit_can_be_disabled(self):
+        pipeline = self.make_pipeline(honeypot_score=0.95, early_exit_enabled=False)
+
+        scores, reason = asyncio.run(pipeline._execute_parallel_risk_analysis(TOKEN, {}))
+
+        self.assertEqual(len(scores), len(DEFAULT_CONFIG.enabled_categories))
+        self.assertIsNone(reason)
+        self.assertIsNone(pipeline._get_blocking_verdict(scores))
+
+
+class TestAnalysisTimeout(unittest.TestCase):
+    """A timed-out analysis stops its shared fetches."""
+
+    def test_timeout_cancels_fact_fetches(self):
+        pipeline = SmartLanePipeline(
+            config=replace(DEFAULT_CONFIG, max_analysis_time_seconds=0.1),
+            chain_id=1,
+            enable_caching=False
+        )
+        self.addCleanup(pipeline.thread_pool.shutdown)
+        cancelled = []
+
+        async def slow_fetcher(loader, context):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(FACT_CONTRACT_DATA)
+                raise
+
+        async def analyze_category(category, token_address, context):
+            return await context[TOKEN_CONTEXT_KEY].load(FACT_CONTRACT_DATA, context)
+
+        pipeline._analyze_risk_category = analyze_category
+
+        async def run():
+            with self.assertRaises(TimeoutError):
+                await pipeline.analyze_token(TOKEN)
+            await asyncio.sleep(0)
+            return list(cancelled)  # Before asyncio.run cancels leftover tasks
+
+        with patch.dict(token_context.FACT_FETCHERS, {FACT_CONTRACT_DATA: slow_fetcher}):
+            cancelled_in_time = asyncio.run(run())
+
+        self.assertEqual(cancelled_in_time, [FACT_CONTRACT_DATA])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Test Suite for the Smart Lane Token Context Loader
+
+Validates that analyzers of one analysis share each fetched token fact,
+that on-chain reads made in the same event-loop turn go out as one
+deduplicated multicall that cancel_pending() stops, and that a full pipeline analysis fetches every
+shared fact exactly once.
+
+File: dexproject/engine/tests/test_token_context.py
+"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+import django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from eth_abi import decode, encode
+
+from engine.multicall import MulticallRequest
+from engine.smart_lane import DEFAULT_CONFIG
+from engine.smart_lane import token_context
+from engine.smart_lane.analyzers import clear_analyzer_pool
+from engine.smart_lane.pipeline import SmartLanePipeline
+from engine.smart_lane.token_context import (
+    FACT_CONTRACT_DATA, FACT_HOLDER_BALANCES, FACT_POOL_RESERVES, FACT_PRICE_HISTORY,
+    FACT_TOKEN_METADATA, TokenContextLoader
+)
+
+
+TOKEN = '0x' + '1' * 40
+
+
+class FakeEth:
+    """Minimal eth namespace answering every call of an aggregate3 with 18."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    async def call(self, transaction, block_identifier='latest'):
+        (calls,) = decode(['(address,bool,bytes)[]'], transaction['data'][4:])
+        self.batch_sizes.append(len(calls))
+        return encode(['(bool,bytes)[]'], [[(True, encode(['uint256'], [18])) for _ in calls]])
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.eth = FakeEth()
+
+
+class TestTokenContextLoader(unittest.TestCase):
+    """Memoized facts and batched reads."""
+
+    def test_concurrent_loads_share_one_fetch(self):
+        fetches = []
+
+        async def fetcher(loader, context):
+            fetches.append(context)
+            await asyncio.sleep(0)
+            return {'value': 1}
+
+        async def load_three():
+            loader = TokenContextLoader(TOKEN, 1)
+            results = await asyncio.gather(*[loader.load(FACT_CONTRACT_DATA) for _ in range(3)])
+            return loader, results
+
+        with patch.dict(token_context.FACT_FETCHERS, {FACT_CONTRACT_DATA: fetcher}):
+            loader, results = asyncio.run(load_three())
+
+        self.assertEqual(len(fetches), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        stats = loader.get_stats()
+        self.assertEqual((stats['facts_fetched'], stats['fact_hits'], stats['round_trips']), (1, 2, 1))
+
+    def test_fetch_errors_reach_every_caller(self):
+        async def fetcher(loader, context):
+            raise RuntimeError('node down')
+
+        async def load_twice():
+            loader = TokenContextLoader(TOKEN, 1)
+            return await asyncio.gather(
+                loader.load(FACT_CONTRACT_DATA), loader.load(FACT_CONTRACT_DATA),
+                return_exceptions=True
+            )
+
+        with patch.dict(token_context.FACT_FETCHERS, {FACT_CONTRACT_DATA: fetcher}):
+            results = asyncio.run(load_twice())
+
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    def test_unknown_fact_is_rejected(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(TokenContextLoader(TOKEN, 1).load('nonexistent'))
+
+    def test_reads_in_one_turn_are_one_deduplicated_multicall(self):
+        w3 = FakeWeb3()
+
+        async def executor(operation, *args):
+            return await operation(w3, *args)
+
+        decimals = MulticallRequest(TOKEN, 'decimals()', ['uint8'])
+        supply = MulticallRequest(TOKEN, 'totalSupply()', ['uint256'])
+
+        async def read():
+            loader = TokenContextLoader(TOKEN, 1, executor)
+            results = await asyncio.gather(loader.call(decimals), loader.call(supply), loader.call(decimals))
+            return loader, results
+
+        loader, results = asyncio.run(read())
+
+        self.assertEqual(w3.eth.batch_sizes, [2])
+        self.assertEqual([result.value for result in results], [18, 18, 18])
+        stats = loader.get_stats()
+        self.assertEqual((stats['calls'], stats['call_hits'], stats['multicall_batches']), (2, 1, 1))
+
+    def test_cancel_pending_stops_multicall_in_flight(self):
+        cancelled = []
+
+        async def executor(operation, *args):
+            try:
+                await asyncio.sleep(5)  # Slow node
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def read_then_cancel():
+            loader = TokenContextLoader(TOKEN, 1, executor)
+            read = asyncio.ensure_future(loader.call(MulticallRequest(TOKEN, 'decimals()', ['uint8'])))
+            await asyncio.sleep(0.01)  # Multicall sent
+            count = loader.cancel_pending()
+            await asyncio.sleep(0)
+            return count, read
+
+        count, read = asyncio.run(read_then_cancel())
+
+        self.assertEqual(count, 2)  # The read and its multicall
+        self.assertEqual(cancelled, [True])
+        self.assertTrue(read.cancelled())
+
+    def test_reads_without_executor_fail_softly(self):
+        async def load_metadata():
+            loader = TokenContextLoader(TOKEN, 1)
+            return loader, await loader.load(FACT_TOKEN_METADATA)
+
+        loader, metadata = asyncio.run(load_metadata())
+
+        self.assertIsNone(metadata)
+        self.assertEqual(loader.get_stats()['round_trips'], 0)
+
+
+class TestPipelineTokenContext(unittest.TestCase):
+    """Analyzers of one pipeline analysis share their token facts."""
+
+    def setUp(self):
+        clear_analyzer_pool()
+        self.addCleanup(clear_analyzer_pool)
+
+    def test_each_fact_is_fetched_once_per_analysis(self):
+        pipeline = SmartLanePipeline(config=DEFAULT_CONFIG, chain_id=1, enable_caching=False)
+        self.addCleanup(pipeline.thread_pool.shutdown)
+
+        fetched = []
+
+        def counting(fact, fetcher):
+            async def fetch(loader, context):
+                fetched.append(fact)
+                return await fetcher(loader, context)
+            return fetch
+
+        counting_fetchers = {fact: counting(fact, fetcher) for fact, fetcher in token_context.FACT_FETCHERS.items()}
+        with patch.dict(token_context.FACT_FETCHERS, counting_fetchers):
+            asyncio.run(pipeline._perform_comprehensive_analysis(TOKEN, 'test', {}))
+
+        self.assertEqual(len(fetched), len(set(fetched)))
+        self.assertTrue({FACT_CONTRACT_DATA, FACT_HOLDER_BALANCES, FACT_POOL_RESERVES, FACT_PRICE_HISTORY} <= set(fetched))
+        self.assertGreater(pipeline.get_performance_metrics()['average_data_round_trips'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,7 +13,8 @@ import asyncio
 import logging
 import time
 import json
-from typing import Dict, Any, List, Optional, Union, Callable, TYPE_CHECKING
+from collections import deque
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union, Callable, TYPE_CHECKING
 from decimal import Decimal
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
@@ -22,13 +23,18 @@ from enum import Enum
 
 # Conditional imports to avoid missing dependency errors
 try:
-    from web3 import Web3
+    from web3 import AsyncWeb3, Web3
     from web3.exceptions import Web3Exception
+    from .rpc_transport import (
+        AsyncJsonRpcProvider, AsyncJsonRpcTransport, BatchingJsonRpcProvider, JsonRpcError
+    )
     WEB3_AVAILABLE = True
 except ImportError:
     WEB3_AVAILABLE = False
     Web3 = None
+    AsyncWeb3 = None
     Web3Exception = Exception
+    JsonRpcError = Exception
 
 if TYPE_CHECKING:
     from .config import ChainConfig
@@ -46,6 +52,7 @@ class ProviderConfig:
     timeout_seconds: int = 30
     priority: int = 1
     api_key: Optional[str] = None
+    max_concurrent_requests: int = 8
 
 
 @dataclass 
@@ -60,6 +67,15 @@ class ChainConfig:
     max_gas_price_gwei: Optional[Decimal] = None
 
 
+# Latency samples kept per provider for percentile estimates
+LATENCY_WINDOW_SIZE = 200
+
+# Hedged requests: budget used until a provider has enough latency samples
+HEDGE_MIN_SAMPLES = 20
+HEDGE_DEFAULT_BUDGET_MS = 250.0
+HEDGE_MIN_BUDGET_MS = 10.0
+
+
 @dataclass
 class ProviderHealth:
     """Health metrics for a single provider."""
@@ -75,6 +91,12 @@ class ProviderHealth:
     consecutive_successes: int = 0
     last_latency_ms: float = 0.0
     uptime_percentage: float = 100.0
+    latency_samples: deque = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW_SIZE))
+    
+    # Hedged request accounting
+    hedges_triggered: int = 0  # Requests on this provider that exceeded its budget
+    hedges_served: int = 0     # Hedge requests sent to this provider
+    hedge_wins: int = 0        # Hedge requests on this provider that answered first
     
     def get_success_rate(self) -> float:
         """Calculate success rate percentage."""
@@ -101,6 +123,26 @@ class ProviderHealth:
         
         return latency_score + success_penalty
     
+    def record_latency(self, latency_ms: float) -> None:
+        """Add a latency sample to the percentile window."""
+        self.latency_samples.append(latency_ms)
+    
+    def get_latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Latency percentile over the recent sample window.
+        
+        Args:
+            percentile: Percentile to compute (0-100)
+            
+        Returns:
+            Latency in milliseconds, or None without samples
+        """
+        if not self.latency_samples:
+            return None
+        ordered = sorted(self.latency_samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percentile / 100))
+        return ordered[index]
+    
     def update_success(self, latency_ms: float) -> None:
         """Update metrics after a successful request."""
         self.total_requests += 1
@@ -110,6 +152,7 @@ class ProviderHealth:
         self.last_success = datetime.now(timezone.utc)
         self.last_latency_ms = latency_ms
         self.is_available = True
+        self.record_latency(latency_ms)
        
         # Update rolling average latency
         if self.average_latency_ms == 0:
@@ -408,6 +451,20 @@ class circuit_breaker_context:
         return False  # Don't suppress exceptions
 
 
+# JSON-RPC error codes worth retrying on another attempt or provider
+# (limit exceeded, internal error, rate limited)
+RETRYABLE_RPC_ERROR_CODES = frozenset({-32005, -32603, 429})
+
+
+@dataclass
+class BatchEntry:
+    """A single request queued for a JSON-RPC batch."""
+    method: str
+    params: Any
+    future: Optional[asyncio.Future] = None
+    response: Optional[Dict[str, Any]] = None
+
+
 class ProviderManager:
     """
     Manages multiple RPC providers with automatic failover and health monitoring.
@@ -417,14 +474,25 @@ class ProviderManager:
     - Health monitoring and recovery
     - Rate limiting per provider
     - Load balancing based on latency and success rate
+    - JSON-RPC batching: requests made within a short window are sent as
+      one HTTP request, with per-request retry and failover
+    - Opt-in hedged reads: a second provider is raced once the primary
+      exceeds its p95 latency budget
     """
     
-    def __init__(self, chain_config: ChainConfig):
+    def __init__(
+        self,
+        chain_config: ChainConfig,
+        batch_window_ms: float = 5.0,
+        max_batch_size: int = 100
+    ):
         """
         Initialize provider manager.
         
         Args:
             chain_config: Configuration for the blockchain network
+            batch_window_ms: How long queued requests wait for companions
+            max_batch_size: Maximum requests per JSON-RPC batch
         """
         self.chain_config = chain_config
         self.logger = logging.getLogger(f'engine.providers.{chain_config.name.lower()}')
@@ -438,6 +506,24 @@ class ProviderManager:
         self.web3_instances: Dict[str, Web3] = {}
         self.failover_count = 0
         
+        # Async transport: pooled aiohttp JSON-RPC client per provider
+        self.transports: Dict[str, AsyncJsonRpcTransport] = {}
+        self.async_web3_instances: Dict[str, AsyncWeb3] = {}
+        
+        # JSON-RPC batching
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        # Batch windows are per event loop: futures and timers belong to one loop
+        self._batch_queues: Dict[asyncio.AbstractEventLoop, List[BatchEntry]] = {}
+        self._batch_flush_handles: Dict[asyncio.AbstractEventLoop, asyncio.TimerHandle] = {}
+        self._batch_tasks: set = set()
+        self._batched_web3: Optional[AsyncWeb3] = None
+        self.batches_sent = 0
+        self.batched_requests = 0
+        
+        # Hedged requests
+        self.hedged_requests = 0
+        
         # Initialize providers
         self._initialize_providers()
     
@@ -568,12 +654,424 @@ class ProviderManager:
         
         return self.web3_instances.get(self.current_provider)
     
+    def _get_provider_config(self, provider_name: str) -> Optional[ProviderConfig]:
+        """Look up a provider's configuration by name."""
+        return next(
+            (p for p in self.chain_config.rpc_providers if p.name == provider_name),
+            None
+        )
+    
+    def get_transport(self, provider_name: Optional[str] = None) -> Optional[AsyncJsonRpcTransport]:
+        """
+        Get the pooled async JSON-RPC transport for a provider.
+        
+        Args:
+            provider_name: Provider to use, or None for the current provider
+            
+        Returns:
+            Shared transport instance, or None if no provider is available
+        """
+        if not WEB3_AVAILABLE:
+            return None
+        
+        if provider_name is None:
+            if not self.current_provider:
+                self._select_best_provider()
+            provider_name = self.current_provider
+        if not provider_name:
+            return None
+        
+        if provider_name not in self.transports:
+            provider_config = self._get_provider_config(provider_name)
+            if not provider_config:
+                return None
+            self.transports[provider_name] = AsyncJsonRpcTransport(
+                provider_config.url,
+                name=provider_name,
+                max_concurrency=getattr(provider_config, 'max_concurrent_requests', 8),
+                timeout_seconds=provider_config.timeout_seconds
+            )
+        
+        return self.transports[provider_name]
+    
+    async def get_async_web3(self, provider_name: Optional[str] = None) -> Optional[AsyncWeb3]:
+        """
+        Get an AsyncWeb3 instance for a provider.
+        
+        The instance runs on the provider's pooled async transport, so calls
+        awaited on it never block the event loop.
+        
+        Args:
+            provider_name: Provider to use, or None for the current provider
+        """
+        transport = self.get_transport(provider_name)
+        if transport is None:
+            return None
+        
+        provider_name = transport.name
+        if provider_name not in self.async_web3_instances:
+            self.async_web3_instances[provider_name] = AsyncWeb3(AsyncJsonRpcProvider(transport))
+        return self.async_web3_instances[provider_name]
+    
+    async def rpc(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Execute a raw JSON-RPC call on the async transport with retry and failover.
+        
+        Args:
+            method: JSON-RPC method name
+            params: Positional parameters
+            
+        Returns:
+            The call's result member
+        """
+        async def _rpc(w3: AsyncWeb3) -> Any:
+            return await w3.provider.transport.request(method, params)
+        
+        return await self.execute_with_retry(_rpc)
+    
+    # =========================================================================
+    # JSON-RPC BATCHING
+    # =========================================================================
+    
+    async def batch_rpc(self, calls: Sequence[Tuple[str, List[Any]]]) -> List[Any]:
+        """
+        Execute many independent JSON-RPC calls as batch payloads.
+        
+        Calls are split into chunks of max_batch_size; each chunk is one HTTP
+        request to the healthiest provider. Failed calls are retried (with
+        failover) individually, not as a whole batch.
+        
+        Args:
+            calls: (method, params) pairs
+            
+        Returns:
+            Results in call order; calls that failed are returned as
+            JsonRpcError instances
+        """
+        entries = [BatchEntry(method, params) for method, params in calls]
+        chunks = [
+            entries[start:start + self.max_batch_size]
+            for start in range(0, len(entries), self.max_batch_size)
+        ]
+        await asyncio.gather(*(self._execute_batch(chunk) for chunk in chunks))
+        return [self._unwrap_response(entry.response) for entry in entries]
+    
+    async def rpc_batched(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Execute one JSON-RPC call, coalesced with other calls made within
+        the batch window into a single HTTP request.
+        
+        Args:
+            method: JSON-RPC method name
+            params: Positional parameters
+            
+        Returns:
+            The call's result member
+            
+        Raises:
+            JsonRpcError: If the call failed on every attempt
+        """
+        result = self._unwrap_response(await self._dispatch_batched(method, params))
+        if isinstance(result, JsonRpcError):
+            raise result
+        return result
+    
+    def get_batched_web3(self) -> Optional[AsyncWeb3]:
+        """
+        Get an AsyncWeb3 whose requests go through the batch window.
+        
+        Concurrent coroutines using this instance share HTTP requests;
+        retry and failover are handled per request by the batcher.
+        """
+        if not WEB3_AVAILABLE:
+            return None
+        if self._batched_web3 is None:
+            self._batched_web3 = AsyncWeb3(BatchingJsonRpcProvider(self._dispatch_batched))
+        return self._batched_web3
+    
+    async def execute_batched(self, operation: Callable, *args, **kwargs) -> Any:
+        """
+        Run an async operation against the batched AsyncWeb3.
+        
+        Drop-in executor for execute_with_retry when callers issue bursts of
+        independent reads (e.g. multicall executors).
+        """
+        return await operation(self.get_batched_web3(), *args, **kwargs)
+    
+    async def _dispatch_batched(self, method: str, params: Any) -> Dict[str, Any]:
+        """Queue a request for the current batch window and await its response."""
+        loop = asyncio.get_running_loop()
+        entry = BatchEntry(method, params, future=loop.create_future())
+        queue = self._batch_queues.setdefault(loop, [])
+        queue.append(entry)
+        
+        if len(queue) >= self.max_batch_size:
+            self._flush_batch_queue(loop)
+        elif loop not in self._batch_flush_handles:
+            self._batch_flush_handles[loop] = loop.call_later(
+                self.batch_window_ms / 1000, self._flush_batch_queue, loop
+            )
+        
+        return await entry.future
+    
+    def _flush_batch_queue(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Send everything queued in loop's current window as one batch."""
+        handle = self._batch_flush_handles.pop(loop, None)
+        if handle is not None:
+            handle.cancel()
+        
+        entries = self._batch_queues.pop(loop, [])
+        if entries:
+            task = loop.create_task(self._resolve_batch(entries))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _resolve_batch(self, entries: List[BatchEntry]) -> None:
+        """Execute a windowed batch and resolve each waiting request."""
+        try:
+            await self._execute_batch(entries)
+        except Exception as e:
+            for entry in entries:
+                if not entry.future.done():
+                    entry.future.set_exception(e)
+            return
+        
+        for entry in entries:
+            if not entry.future.done():
+                entry.future.set_result(entry.response)
+    
+    async def _execute_batch(self, entries: List[BatchEntry]) -> None:
+        """
+        Send entries as JSON-RPC batches with per-request retry and failover.
+        
+        Each attempt sends the still-pending entries to the healthiest
+        provider. A transport failure counts against that provider and the
+        whole remainder is retried; within a successful batch only entries
+        with a missing or retryable error response are retried.
+        """
+        max_retries = 3
+        pending = list(entries)
+        
+        for attempt in range(max_retries):
+            transport = self.get_transport()
+            if transport is None:
+                await asyncio.sleep(1)
+                continue
+            provider_name = transport.name
+            
+            try:
+                if provider_name in self.rate_limiters:
+                    await self.rate_limiters[provider_name].wait_if_needed()
+                
+                requests = [
+                    {'jsonrpc': '2.0', 'id': transport.next_id(), 'method': entry.method, 'params': entry.params or []}
+                    for entry in pending
+                ]
+                start_time = time.time()
+                responses = await transport.send_batch(requests)
+                latency_ms = (time.time() - start_time) * 1000
+                
+                self.batches_sent += 1
+                self.batched_requests += len(requests)
+                if provider_name in self.provider_health:
+                    self.provider_health[provider_name].update_success(latency_ms)
+                
+            except Exception as e:
+                if provider_name in self.provider_health:
+                    self.provider_health[provider_name].update_failure(str(e))
+                self.logger.warning(
+                    f"Batch of {len(pending)} requests failed on {provider_name}: {e}"
+                )
+                self._select_best_provider()
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(0.1 * (attempt + 1))
+                continue
+            
+            retry = []
+            for entry, response in zip(pending, responses):
+                if response is not None:
+                    entry.response = response
+                if response is None or self._is_retryable_response(response):
+                    retry.append(entry)
+            
+            pending = retry
+            if not pending:
+                return
+            
+            self.logger.debug(f"Retrying {len(pending)} of batch on next attempt")
+            self._select_best_provider()
+        
+        for entry in pending:
+            if entry.response is None:
+                entry.response = {
+                    'jsonrpc': '2.0',
+                    'error': {'code': -32603, 'message': 'All providers failed after retries'}
+                }
+    
+    @staticmethod
+    def _is_retryable_response(response: Dict[str, Any]) -> bool:
+        """Check whether a per-request error response is worth retrying."""
+        error = response.get('error')
+        return bool(error) and error.get('code') in RETRYABLE_RPC_ERROR_CODES
+    
+    @staticmethod
+    def _unwrap_response(response: Optional[Dict[str, Any]]) -> Any:
+        """Return a response's result, or its error as a JsonRpcError."""
+        error = (response or {}).get('error')
+        if response is None or error:
+            error = error or {'code': -32603, 'message': 'No response'}
+            return JsonRpcError(error.get('code', -1), error.get('message', ''), error.get('data'))
+        return response.get('result')
+    
+    # =========================================================================
+    # HEDGED REQUESTS
+    # =========================================================================
+    
+    def get_hedge_budget_ms(self, provider_name: str) -> float:
+        """
+        Latency budget after which a request on this provider is hedged.
+        
+        Uses the provider's p95 latency once enough samples exist.
+        """
+        health = self.provider_health.get(provider_name)
+        if health is None or len(health.latency_samples) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_BUDGET_MS
+        return max(HEDGE_MIN_BUDGET_MS, health.get_latency_percentile(95))
+    
+    def _select_hedge_provider(self, exclude: str) -> Optional[str]:
+        """Pick the healthiest provider other than `exclude`."""
+        candidates = [
+            (name, health) for name, health in self.provider_health.items()
+            if name != exclude and health.is_healthy()
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda x: x[1].get_priority_score())[0]
+    
+    async def _execute_on_provider(
+        self,
+        provider_name: str,
+        operation: Callable,
+        *args,
+        **kwargs
+    ) -> Any:
+        """Run an async operation on one specific provider, recording its health."""
+        w3 = await self.get_async_web3(provider_name)
+        if w3 is None:
+            raise Exception(f"Provider {provider_name} unavailable")
+        
+        if provider_name in self.rate_limiters:
+            await self.rate_limiters[provider_name].wait_if_needed()
+        
+        health = self.provider_health.get(provider_name)
+        start_time = time.time()
+        try:
+            result = await operation(w3, *args, **kwargs)
+        except asyncio.CancelledError:
+            # Lost the race: keep the elapsed time so p95 is not biased low
+            if health:
+                health.record_latency((time.time() - start_time) * 1000)
+            raise
+        except Exception as e:
+            if health:
+                health.update_failure(str(e))
+            raise
+        
+        if health:
+            health.update_success((time.time() - start_time) * 1000)
+        return result
+    
+    async def execute_hedged(self, operation: Callable, *args, **kwargs) -> Any:
+        """
+        Execute an idempotent read with a hedge on a second provider.
+        
+        The operation runs on the current provider; if it has not answered
+        within that provider's p95 latency budget (or fails), the same
+        operation is fired at the next healthiest provider and the first
+        successful answer wins. Only use for reads (nonce, gas, eth_call).
+        
+        Args:
+            operation: Coroutine function taking an AsyncWeb3
+            
+        Returns:
+            The first successful result
+        """
+        if not self.current_provider:
+            self._select_best_provider()
+        primary = self.current_provider
+        secondary = self._select_hedge_provider(primary) if primary else None
+        if not secondary or not asyncio.iscoroutinefunction(operation):
+            return await self.execute_with_retry(operation, *args, **kwargs)
+        
+        budget_ms = self.get_hedge_budget_ms(primary)
+        primary_task = asyncio.ensure_future(
+            self._execute_on_provider(primary, operation, *args, **kwargs)
+        )
+        tasks = [primary_task]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=budget_ms / 1000)
+            if done and primary_task.exception() is None:
+                return primary_task.result()
+            
+            # Over budget or failed: race the same read on the second provider
+            self.hedged_requests += 1
+            self.provider_health[primary].hedges_triggered += 1
+            self.provider_health[secondary].hedges_served += 1
+            self.logger.debug(
+                f"Hedging request from {primary} to {secondary} (budget {budget_ms:.0f}ms)"
+            )
+            hedge_task = asyncio.ensure_future(
+                self._execute_on_provider(secondary, operation, *args, **kwargs)
+            )
+            tasks.append(hedge_task)
+            
+            last_error: Optional[BaseException] = primary_task.exception() if done else None
+            pending = {task for task in tasks if not task.done()}
+            while pending:
+                finished, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in finished:
+                    if task.exception() is None:
+                        if task is hedge_task:
+                            self.provider_health[secondary].hedge_wins += 1
+                        return task.result()
+                    last_error = task.exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        self._select_best_provider()
+        raise last_error
+    
+    async def rpc_hedged(self, method: str, params: Optional[List[Any]] = None) -> Any:
+        """
+        Execute a raw read-only JSON-RPC call with hedging.
+        
+        Args:
+            method: JSON-RPC method name
+            params: Positional parameters
+            
+        Returns:
+            The call's result member
+        """
+        async def _rpc(w3: AsyncWeb3) -> Any:
+            return await w3.provider.transport.request(method, params)
+        
+        return await self.execute_hedged(_rpc)
+    
     async def execute_with_retry(self, operation: Callable, *args, **kwargs) -> Any:
-        """Execute operation with automatic retry and failover."""
+        """
+        Execute operation with automatic retry and failover.
+        
+        Coroutine operations receive an AsyncWeb3 bound to the pooled async
+        transport and must await their calls; synchronous operations receive
+        a blocking Web3 and run in the thread pool.
+        """
         max_retries = 3
+        is_async = asyncio.iscoroutinefunction(operation)
         
         for attempt in range(max_retries):
-            w3 = await self.get_web3()
+            w3 = await (self.get_async_web3() if is_async else self.get_web3())
             if not w3:
                 await asyncio.sleep(1)
                 continue
@@ -586,7 +1084,7 @@ class ProviderManager:
                 start_time = time.time()
                 
                 # Execute operation
-                if asyncio.iscoroutinefunction(operation):
+                if is_async:
                     result = await operation(w3, *args, **kwargs)
                 else:
                     # Run synchronous operation in thread pool
@@ -635,7 +1133,11 @@ class ProviderManager:
                 'total_requests': health.total_requests,
                 'consecutive_failures': health.consecutive_failures,
                 'is_paid': any(p.is_paid for p in self.chain_config.rpc_providers if p.name == name),
-                'last_error': health.last_error
+                'last_error': health.last_error,
+                'p95_latency_ms': health.get_latency_percentile(95),
+                'hedges_triggered': health.hedges_triggered,
+                'hedges_served': health.hedges_served,
+                'hedge_wins': health.hedge_wins
             }
         
         return {
@@ -645,11 +1147,25 @@ class ProviderManager:
             'success_rate': overall_success_rate,
             'total_providers': len(self.provider_health),
             'healthy_providers': sum(1 for h in self.provider_health.values() if h.is_healthy()),
-            'providers': provider_details
+            'providers': provider_details,
+            'transports': {name: t.get_stats() for name, t in self.transports.items()},
+            'hedged_requests': self.hedged_requests,
+            'batching': {
+                'batches_sent': self.batches_sent,
+                'batched_requests': self.batched_requests,
+                'avg_batch_size': self.batched_requests / self.batches_sent if self.batches_sent else 0.0
+            }
         }
     
     async def close(self):
         """Close all connections and clean up resources."""
+        loop = asyncio.get_running_loop()
+        if self._batch_queues.get(loop):
+            self._flush_batch_queue(loop)
+        pending = [task for task in self._batch_tasks if task.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        
         for w3 in self.web3_instances.values():
             try:
                 # Close any open connections
@@ -659,6 +1175,16 @@ class ProviderManager:
                 self.logger.debug(f"Error closing provider connection: {e}")
         
         self.web3_instances.clear()
+        
+        for transport in self.transports.values():
+            try:
+                await transport.close()
+            except Exception as e:
+                self.logger.debug(f"Error closing transport {transport.name}: {e}")
+        
+        self.transports.clear()
+        self.async_web3_instances.clear()
+        self._batched_web3 = None
         self.logger.info(f"Closed all connections for {self.chain_config.name}")
 
 
@@ -874,7 +1400,7 @@ async def get_token_info(provider_manager: ProviderManager, token_address: str)
         Token information dict or None if failed
     """
     try:
-        def _get_token_info_sync(w3: Web3) -> Dict[str, Any]:
+        async def _get_token_info(w3: AsyncWeb3) -> Dict[str, Any]:
             # Basic ERC-20 ABI for token info
             erc20_abi = [
                 {
@@ -911,13 +1437,13 @@ async def get_token_info(provider_manager: ProviderManager, token_address: str)
             
             return {
                 'address': token_address,
-                'symbol': contract.functions.symbol().call(),
-                'name': contract.functions.name().call(),
-                'decimals': contract.functions.decimals().call(),
-                'total_supply': contract.functions.totalSupply().call()
+                'symbol': await contract.functions.symbol().call(),
+                'name': await contract.functions.name().call(),
+                'decimals': await contract.functions.decimals().call(),
+                'total_supply': await contract.functions.totalSupply().call()
             }
         
-        return await provider_manager.execute_with_retry(_get_token_info_sync)
+        return await provider_manager.execute_with_retry(_get_token_info)
         
     except Exception as e:
         logger.error(f"Failed to get token info for {token_address}: {e}")
@@ -935,10 +1461,10 @@ async def get_latest_block(provider_manager: ProviderManager) -> Optional[int]:
         Latest block number or None if failed
     """
     try:
-        def _get_block_sync(w3: Web3) -> int:
-            return w3.eth.block_number
+        async def _get_block(w3: AsyncWeb3) -> int:
+            return await w3.eth.block_number
         
-        return await provider_manager.execute_with_retry(_get_block_sync)
+        return await provider_manager.execute_with_retry(_get_block)
         
     except Exception as e:
         logger.error(f"Failed to get latest block: {e}")
@@ -956,10 +1482,10 @@ async def get_gas_price(provider_manager: ProviderManager) -> Optional[int]:
         Gas price in Wei or None if failed
     """
     try:
-        def _get_gas_price_sync(w3: Web3) -> int:
-            return w3.eth.gas_price
+        async def _get_gas_price(w3: AsyncWeb3) -> int:
+            return await w3.eth.gas_price
         
-        return await provider_manager.execute_with_retry(_get_gas_price_sync)
+        return await provider_manager.execute_with_retry(_get_gas_price)
         
     except Exception as e:
         logger.error(f"Failed to get gas price: {e}")
@@ -978,10 +1504,10 @@ async def get_eth_balance(provider_manager: ProviderManager, address: str) -> Op
         ETH balance as Decimal or None if failed
     """
     try:
-        def _get_balance_sync(w3: Web3) -> int:
-            return w3.eth.get_balance(address)
+        async def _get_balance(w3: AsyncWeb3) -> int:
+            return await w3.eth.get_balance(address)
         
-        balance_wei = await provider_manager.execute_with_retry(_get_balance_sync)
+        balance_wei = await provider_manager.execute_with_retry(_get_balance)
         return wei_to_ether(balance_wei) if balance_wei is not None else None
         
     except Exception as e:
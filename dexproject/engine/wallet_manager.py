@@ -293,11 +293,11 @@ class WalletManager:
             web3 = self.web3_client.web3
             
             # Get ETH balance
-            eth_balance_wei = web3.eth.get_balance(checksum_address)
+            eth_balance_wei = await web3.eth.get_balance(checksum_address)
             eth_balance = Decimal(eth_balance_wei) / Decimal('1e18')
             
             # Get nonce for pending transactions
-            nonce = web3.eth.get_transaction_count(checksum_address, 'pending')
+            nonce = await web3.eth.get_transaction_count(checksum_address, 'pending')
             
             return {
                 'address': checksum_address,
@@ -327,10 +327,8 @@ class WalletManager:
             if not self.web3_client or not self.web3_client.is_connected:
                 raise ValueError("Web3 client not connected")
             
-            web3 = self.web3_client.web3
-            
             # Get base gas price
-            base_gas_price = web3.eth.gas_price
+            base_gas_price = await self.web3_client.get_gas_price(hedge=True)
             base_gwei = Decimal(base_gas_price) / Decimal('1e9')
             
             # Calculate different priority levels
@@ -379,12 +377,11 @@ class WalletManager:
             if not self.web3_client or not self.web3_client.is_connected:
                 raise ValueError("Web3 client not connected")
             
-            web3 = self.web3_client.web3
             from_address = to_checksum_address(from_address)
             to_address = to_checksum_address(to_address)
             
-            # Get nonce
-            nonce = web3.eth.get_transaction_count(from_address, 'pending')
+            # Get nonce (hedged: transaction preparation is on the fast lane)
+            nonce = await self.web3_client.get_transaction_count(from_address, 'pending', hedge=True)
             
             # Estimate gas price if not provided
             if gas_price_gwei is None:
@@ -410,7 +407,13 @@ class WalletManager:
             # Estimate gas limit if not provided
             if gas_limit is None:
                 try:
-                    estimated_gas = web3.eth.estimate_gas(tx_params)
+                    estimated_gas = await self.web3_client.estimate_gas(
+                        to_address,
+                        Web3.to_hex(data) if data else None,
+                        value,
+                        from_address,
+                        hedge=True
+                    )
                     # Add 20% buffer to estimated gas
                     gas_limit = int(estimated_gas * 1.2)
                 except Exception as e:
@@ -538,7 +541,7 @@ class WalletManager:
             web3 = self.web3_client.web3
             
             # Broadcast transaction
-            tx_hash = web3.eth.send_raw_transaction(signed_transaction.signed_transaction)
+            tx_hash = await web3.eth.send_raw_transaction(signed_transaction.signed_transaction)
             
             self.logger.info(f"📡 Transaction broadcasted: {tx_hash.hex()}")
             return tx_hash.hex()
@@ -571,7 +574,7 @@ class WalletManager:
             self.logger.info(f"⏳ Waiting for confirmation: {tx_hash}")
             
             # Wait for receipt
-            receipt = web3.eth.wait_for_transaction_receipt(
+            receipt = await web3.eth.wait_for_transaction_receipt(
                 tx_hash, 
                 timeout=timeout_seconds
             )
@@ -650,4 +653,4 @@ class WalletManager:
             'chain': self.chain_config.name,
             'chain_id': self.chain_config.chain_id,
             'web3_connected': self.web3_client.is_connected if self.web3_client else False
-        }
\ No newline at end of file
+        }
\ No newline at end of file
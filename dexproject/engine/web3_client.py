@@ -16,7 +16,7 @@ from decimal import Decimal
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from web3.exceptions import Web3Exception, BlockNotFound, TransactionNotFound
 from web3.types import BlockData, TxData, LogReceipt, FilterParams
 from web3.contract import Contract
@@ -27,6 +27,9 @@ import json
 
 from .config import ChainConfig, config
 from .utils import ProviderManager
+from .multicall import (
+    MulticallRequest, MulticallResult, execute_multicall, fetch_token_metadata
+)
 
 logger = logging.getLogger(__name__)
 
@@ -96,7 +99,8 @@ class Web3Client:
         self.logger = logging.getLogger(f'engine.web3.{chain_config.name.lower()}')
         
         # Connection state
-        self._current_web3: Optional[Web3] = None
+        # AsyncWeb3 on the provider's pooled aiohttp transport (non-blocking)
+        self._current_web3: Optional[AsyncWeb3] = None
         self._is_connected = False
         self._connection_lock = asyncio.Lock()
         
@@ -269,10 +273,10 @@ class Web3Client:
         """
         async with self._connection_lock:
             try:
-                # Get Web3 instance from provider manager
-                self._current_web3 = await self.provider_manager.get_web3()
+                # Get AsyncWeb3 instance from provider manager
+                self._current_web3 = await self.provider_manager.get_async_web3()
                 
-                if self._current_web3 and self._current_web3.is_connected():
+                if self._current_web3 and await self._current_web3.is_connected():
                     self._is_connected = True
                     
                     # Test connection with a simple call
@@ -318,11 +322,11 @@ class Web3Client:
         return self._is_connected and self._current_web3 is not None
 
     @property
-    def web3(self) -> Optional[Web3]:
-        """Get current Web3 instance."""
+    def web3(self) -> Optional[AsyncWeb3]:
+        """Get current AsyncWeb3 instance (calls must be awaited)."""
         return self._current_web3
 
-    async def _ensure_connection(self) -> Web3:
+    async def _ensure_connection(self) -> AsyncWeb3:
         """Ensure connection is active, reconnect if necessary."""
         if not self.is_connected:
             success = await self.connect()
@@ -365,35 +369,55 @@ class Web3Client:
         # All retries failed
         raise Web3Exception(f"All retry attempts failed. Last error: {last_exception}")
 
+    async def _execute(self, operation: Callable, *args, hedge: bool = False) -> Any:
+        """
+        Execute a read, optionally hedged across providers.
+
+        Hedged reads go through ProviderManager.execute_hedged, which races a
+        second provider once the current one exceeds its p95 latency budget.
+        Use for latency-critical fast-lane reads only.
+        """
+        if not hedge:
+            return await self._execute_with_retry(operation, *args)
+
+        await self._ensure_connection()
+        self._total_requests += 1
+        self._last_request_time = time.time()
+        try:
+            return await self.provider_manager.execute_hedged(operation, *args)
+        except Exception:
+            self._failed_requests += 1
+            raise
+
     # ====================
     # BLOCKCHAIN DATA RETRIEVAL
     # ====================
 
     async def get_latest_block_number(self) -> int:
         """Get the latest block number."""
-        async def _get_block_number(w3: Web3) -> int:
-            return w3.eth.block_number
+        async def _get_block_number(w3: AsyncWeb3) -> int:
+            return await w3.eth.block_number
         
         return await self._execute_with_retry(_get_block_number)
 
     async def get_block(self, block_identifier: Union[int, str, HexStr]) -> BlockData:
         """Get block data by number or hash."""
-        async def _get_block(w3: Web3, block_id: Union[int, str, HexStr]) -> BlockData:
-            return w3.eth.get_block(block_id, full_transactions=False)
+        async def _get_block(w3: AsyncWeb3, block_id: Union[int, str, HexStr]) -> BlockData:
+            return await w3.eth.get_block(block_id, full_transactions=False)
         
         return await self._execute_with_retry(_get_block, block_identifier)
 
     async def get_transaction(self, tx_hash: HexStr) -> TxData:
         """Get transaction data by hash."""
-        async def _get_transaction(w3: Web3, hash: HexStr) -> TxData:
-            return w3.eth.get_transaction(hash)
+        async def _get_transaction(w3: AsyncWeb3, hash: HexStr) -> TxData:
+            return await w3.eth.get_transaction(hash)
         
         return await self._execute_with_retry(_get_transaction, tx_hash)
 
     async def get_logs(self, filter_params: FilterParams) -> List[LogReceipt]:
         """Get logs matching the filter parameters."""
-        async def _get_logs(w3: Web3, params: FilterParams) -> List[LogReceipt]:
-            return w3.eth.get_logs(params)
+        async def _get_logs(w3: AsyncWeb3, params: FilterParams) -> List[LogReceipt]:
+            return await w3.eth.get_logs(params)
         
         return await self._execute_with_retry(_get_logs, filter_params)
 
@@ -402,11 +426,12 @@ class Web3Client:
         contract_address: ChecksumAddress, 
         function_abi: Dict[str, Any], 
         function_inputs: List[Any] = None,
-        block_identifier: Union[int, str] = 'latest'
+        block_identifier: Union[int, str] = 'latest',
+        hedge: bool = False
     ) -> Any:
-        """Call a read-only contract function."""
+        """Call a read-only contract function (hedged across providers if `hedge`)."""
         async def _call_function(
-            w3: Web3, 
+            w3: AsyncWeb3, 
             addr: ChecksumAddress, 
             abi: Dict[str, Any], 
             inputs: List[Any], 
@@ -417,18 +442,36 @@ class Web3Client:
             contract_function = getattr(contract.functions, function_name)
             
             if inputs:
-                return contract_function(*inputs).call(block_identifier=block)
+                return await contract_function(*inputs).call(block_identifier=block)
             else:
-                return contract_function().call(block_identifier=block)
+                return await contract_function().call(block_identifier=block)
         
-        return await self._execute_with_retry(
+        return await self._execute(
             _call_function, 
             contract_address, 
             function_abi, 
             function_inputs or [], 
-            block_identifier
+            block_identifier,
+            hedge=hedge
         )
 
+    async def multicall(
+        self,
+        requests: List[MulticallRequest],
+        block_identifier: Union[int, str] = 'latest'
+    ) -> List[MulticallResult]:
+        """
+        Execute many read-only calls in a single Multicall3 eth_call.
+        
+        Args:
+            requests: Calls to batch (targets may be any number of contracts)
+            block_identifier: Block to read at
+            
+        Returns:
+            Per-call results in request order; failures are reported per call
+        """
+        return await execute_multicall(self._execute_with_retry, requests, block_identifier)
+
     # ====================
     # TOKEN OPERATIONS
     # ====================
@@ -443,58 +486,71 @@ class Web3Client:
         Returns:
             TokenInfo object or None if token is invalid
         """
-        try:
-            # Validate and checksum address
-            if not is_address(token_address):
-                self.logger.warning(f"Invalid token address: {token_address}")
-                return None
+        token_infos = await self.get_token_infos([token_address])
+        return token_infos.get(token_address)
+
+    async def get_token_infos(self, token_addresses: List[str]) -> Dict[str, Optional[TokenInfo]]:
+        """
+        Get token information for many tokens in one round trip.
+        
+        Symbol, name, decimals and totalSupply for every token are packed
+        into a single multicall. Addresses without contract code return
+        empty data for every call and map to None.
+        
+        Args:
+            token_addresses: Token contract addresses
             
+        Returns:
+            Mapping of each requested address to TokenInfo or None
+        """
+        token_infos: Dict[str, Optional[TokenInfo]] = {}
+        valid_addresses = []
+        for token_address in token_addresses:
+            if is_address(token_address):
+                valid_addresses.append(token_address)
+            else:
+                self.logger.warning(f"Invalid token address: {token_address}")
+                token_infos[token_address] = None
+        
+        if not valid_addresses:
+            return token_infos
+        
+        try:
+            metadata, _ = await fetch_token_metadata(self._execute_with_retry, valid_addresses)
+        except Exception as e:
+            self.logger.error(f"Failed to get token info for {len(valid_addresses)} tokens: {e}")
+            token_infos.update({address: None for address in valid_addresses})
+            return token_infos
+        
+        for token_address in valid_addresses:
             address = to_checksum_address(token_address)
+            token_metadata = metadata.get(address)
             
-            # Check if contract exists
-            w3 = await self._ensure_connection()
-            code = w3.eth.get_code(address)
-            if not code or code == b'':
+            if token_metadata is None:
                 self.logger.warning(f"No contract code at address: {address}")
-                return None
-            
-            # Get token information using contract calls
-            contract = w3.eth.contract(address=address, abi=self.erc20_abi)
-            
-            # Execute multiple calls concurrently
-            tasks = [
-                self._safe_contract_call(contract.functions.symbol().call, "UNKNOWN"),
-                self._safe_contract_call(contract.functions.name().call, "Unknown Token"),
-                self._safe_contract_call(contract.functions.decimals().call, 18),
-                self._safe_contract_call(contract.functions.totalSupply().call, 0)
-            ]
-            
-            symbol, name, decimals, total_supply = await asyncio.gather(*tasks)
+                token_infos[token_address] = None
+                continue
             
-            # Create TokenInfo object
-            token_info = TokenInfo(
-                address=address,
-                symbol=symbol,
-                name=name,
-                decimals=decimals,
-                total_supply=total_supply,
-                is_verified=await self._check_token_verification(address)
-            )
-            
-            self.logger.debug(f"Retrieved token info for {symbol}: {name}")
-            return token_info
+            if token_metadata['failed_calls']:
+                self.logger.debug(
+                    f"Token {address} calls failed, using defaults: {token_metadata['failed_calls']}"
+                )
             
-        except Exception as e:
-            self.logger.error(f"Failed to get token info for {token_address}: {e}")
-            return None
-
-    async def _safe_contract_call(self, call_func: Callable, default_value: Any) -> Any:
-        """Execute contract call with error handling and default value."""
-        try:
-            return call_func()
-        except Exception as e:
-            self.logger.debug(f"Contract call failed, using default: {e}")
-            return default_value
+            try:
+                token_infos[token_address] = TokenInfo(
+                    address=address,
+                    symbol=token_metadata['symbol'],
+                    name=token_metadata['name'],
+                    decimals=token_metadata['decimals'],
+                    total_supply=token_metadata['total_supply'],
+                    is_verified=await self._check_token_verification(address)
+                )
+                self.logger.debug(f"Retrieved token info for {token_metadata['symbol']}: {token_metadata['name']}")
+            except ValueError as e:
+                self.logger.error(f"Failed to get token info for {token_address}: {e}")
+                token_infos[token_address] = None
+        
+        return token_infos
 
     async def _check_token_verification(self, token_address: ChecksumAddress) -> bool:
         """Check if token is verified (simplified implementation)."""
@@ -539,37 +595,53 @@ class Web3Client:
 
     async def get_uniswap_v3_pool_info(self, pool_address: str) -> Optional[PairInfo]:
         """Get Uniswap V3 pool information."""
-        try:
-            pool_addr = to_checksum_address(pool_address)
-            w3 = await self._ensure_connection()
-            pool_contract = w3.eth.contract(address=pool_addr, abi=self.uniswap_v3_pool_abi)
-            
-            # Get pool data concurrently
-            tasks = [
-                self._safe_contract_call(pool_contract.functions.token0().call, None),
-                self._safe_contract_call(pool_contract.functions.token1().call, None),
-                self._safe_contract_call(pool_contract.functions.fee().call, 0),
-                self._safe_contract_call(pool_contract.functions.liquidity().call, 0),
-                self._safe_contract_call(pool_contract.functions.slot0().call, (0, 0, 0, 0, 0, 0, False))
-            ]
-            
-            token0_addr, token1_addr, fee, liquidity, slot0 = await asyncio.gather(*tasks)
+        pool_infos = await self.get_uniswap_v3_pool_infos([pool_address])
+        return pool_infos.get(pool_address)
+
+    async def get_uniswap_v3_pool_infos(self, pool_addresses: List[str]) -> Dict[str, Optional[PairInfo]]:
+        """
+        Get Uniswap V3 pool information for many pools.
+        
+        Costs two round trips regardless of the number of pools: one
+        multicall for every pool's state, one for every distinct token.
+        
+        Args:
+            pool_addresses: Pool contract addresses
             
-            if not token0_addr or not token1_addr:
-                return None
+        Returns:
+            Mapping of each requested address to PairInfo or None
+        """
+        pool_calls = [
+            ('token0()', ('address',), None),
+            ('token1()', ('address',), None),
+            ('fee()', ('uint24',), 0),
+            ('liquidity()', ('uint128',), 0),
+            ('slot0()', ('uint160', 'int24', 'uint16', 'uint16', 'uint16', 'uint8', 'bool'),
+             (0, 0, 0, 0, 0, 0, False)),
+        ]
+        
+        pool_states = await self._read_pool_states(pool_addresses, pool_calls)
+        token_infos = await self._get_pool_token_infos(pool_states)
+        
+        pool_infos: Dict[str, Optional[PairInfo]] = {}
+        for pool_address, state in pool_states.items():
+            if state is None:
+                pool_infos[pool_address] = None
+                continue
             
-            # Get token information
-            token0_info = await self.get_token_info(token0_addr)
-            token1_info = await self.get_token_info(token1_addr)
+            token0_addr, token1_addr, fee, liquidity, slot0 = state
+            token0_info = token_infos.get(token0_addr)
+            token1_info = token_infos.get(token1_addr)
             
             if not token0_info or not token1_info:
-                return None
+                pool_infos[pool_address] = None
+                continue
             
             # Extract slot0 data
             sqrt_price_x96, tick = slot0[0], slot0[1]
             
-            return PairInfo(
-                pair_address=pool_addr,
+            pool_infos[pool_address] = PairInfo(
+                pair_address=to_checksum_address(pool_address),
                 token0=token0_info,
                 token1=token1_info,
                 fee_tier=fee,
@@ -578,41 +650,54 @@ class Web3Client:
                 tick=tick,
                 protocol='uniswap_v3'
             )
-            
-        except Exception as e:
-            self.logger.error(f"Failed to get Uniswap V3 pool info: {e}")
-            return None
+        
+        return pool_infos
 
     async def get_uniswap_v2_pair_info(self, pair_address: str) -> Optional[PairInfo]:
         """Get Uniswap V2 pair information."""
-        try:
-            pair_addr = to_checksum_address(pair_address)
-            w3 = await self._ensure_connection()
-            pair_contract = w3.eth.contract(address=pair_addr, abi=self.uniswap_v2_pair_abi)
-            
-            # Get pair data
-            tasks = [
-                self._safe_contract_call(pair_contract.functions.token0().call, None),
-                self._safe_contract_call(pair_contract.functions.token1().call, None),
-                self._safe_contract_call(pair_contract.functions.getReserves().call, (0, 0, 0))
-            ]
-            
-            token0_addr, token1_addr, reserves = await asyncio.gather(*tasks)
+        pair_infos = await self.get_uniswap_v2_pair_infos([pair_address])
+        return pair_infos.get(pair_address)
+
+    async def get_uniswap_v2_pair_infos(self, pair_addresses: List[str]) -> Dict[str, Optional[PairInfo]]:
+        """
+        Get Uniswap V2 pair information for many pairs.
+        
+        Costs two round trips regardless of the number of pairs: one
+        multicall for every pair's state, one for every distinct token.
+        
+        Args:
+            pair_addresses: Pair contract addresses
             
-            if not token0_addr or not token1_addr:
-                return None
+        Returns:
+            Mapping of each requested address to PairInfo or None
+        """
+        pair_calls = [
+            ('token0()', ('address',), None),
+            ('token1()', ('address',), None),
+            ('getReserves()', ('uint112', 'uint112', 'uint32'), (0, 0, 0)),
+        ]
+        
+        pair_states = await self._read_pool_states(pair_addresses, pair_calls)
+        token_infos = await self._get_pool_token_infos(pair_states)
+        
+        pair_infos: Dict[str, Optional[PairInfo]] = {}
+        for pair_address, state in pair_states.items():
+            if state is None:
+                pair_infos[pair_address] = None
+                continue
             
-            # Get token information
-            token0_info = await self.get_token_info(token0_addr)
-            token1_info = await self.get_token_info(token1_addr)
+            token0_addr, token1_addr, reserves = state
+            token0_info = token_infos.get(token0_addr)
+            token1_info = token_infos.get(token1_addr)
             
             if not token0_info or not token1_info:
-                return None
+                pair_infos[pair_address] = None
+                continue
             
             reserve0, reserve1 = reserves[0], reserves[1]
             
-            return PairInfo(
-                pair_address=pair_addr,
+            pair_infos[pair_address] = PairInfo(
+                pair_address=to_checksum_address(pair_address),
                 token0=token0_info,
                 token1=token1_info,
                 fee_tier=3000,  # V2 has fixed 0.3% fee
@@ -621,10 +706,75 @@ class Web3Client:
                 tick=0,  # V2 doesn't use ticks
                 protocol='uniswap_v2'
             )
+        
+        return pair_infos
+
+    async def _read_pool_states(
+        self,
+        pool_addresses: List[str],
+        pool_calls: List[Tuple[str, Tuple[str, ...], Any]]
+    ) -> Dict[str, Optional[List[Any]]]:
+        """
+        Read the same set of view functions from many pools in one multicall.
+        
+        Args:
+            pool_addresses: Pool contract addresses
+            pool_calls: (signature, output types, default) per view function
             
+        Returns:
+            Mapping of pool address to decoded values, or None when the pool's
+            token0/token1 could not be read
+        """
+        pool_states: Dict[str, Optional[List[Any]]] = {}
+        requests: List[MulticallRequest] = []
+        valid_pools = []
+        
+        for pool_address in pool_addresses:
+            if not is_address(pool_address):
+                self.logger.warning(f"Invalid pool address: {pool_address}")
+                pool_states[pool_address] = None
+                continue
+            valid_pools.append(pool_address)
+            requests.extend(
+                MulticallRequest(pool_address, signature, output_types, default=default)
+                for signature, output_types, default in pool_calls
+            )
+        
+        if not requests:
+            return pool_states
+        
+        try:
+            results = await self.multicall(requests)
         except Exception as e:
-            self.logger.error(f"Failed to get Uniswap V2 pair info: {e}")
-            return None
+            self.logger.error(f"Failed to read state for {len(valid_pools)} pools: {e}")
+            pool_states.update({pool_address: None for pool_address in valid_pools})
+            return pool_states
+        
+        per_pool = len(pool_calls)
+        for i, pool_address in enumerate(valid_pools):
+            pool_results = results[i * per_pool:(i + 1) * per_pool]
+            # token0/token1 are required; other fields fall back to defaults
+            if not pool_results[0].success or not pool_results[1].success:
+                self.logger.debug(f"Could not read tokens for pool {pool_address}")
+                pool_states[pool_address] = None
+            else:
+                pool_states[pool_address] = [result.value for result in pool_results]
+        
+        return pool_states
+
+    async def _get_pool_token_infos(
+        self,
+        pool_states: Dict[str, Optional[List[Any]]]
+    ) -> Dict[str, Optional[TokenInfo]]:
+        """Fetch TokenInfo for every distinct token0/token1 in one multicall."""
+        token_addresses = list(dict.fromkeys(
+            token_address
+            for state in pool_states.values() if state is not None
+            for token_address in state[:2]
+        ))
+        if not token_addresses:
+            return {}
+        return await self.get_token_infos(token_addresses)
 
     # ====================
     # EVENT SUBSCRIPTIONS
@@ -723,10 +873,11 @@ class Web3Client:
         to_address: str, 
         data: str = None, 
         value: int = 0,
-        from_address: str = None
+        from_address: str = None,
+        hedge: bool = False
     ) -> int:
-        """Estimate gas for a transaction."""
-        async def _estimate_gas(w3: Web3, to: str, data_hex: str, val: int, from_addr: str) -> int:
+        """Estimate gas for a transaction (hedged across providers if `hedge`)."""
+        async def _estimate_gas(w3: AsyncWeb3, to: str, data_hex: str, val: int, from_addr: str) -> int:
             tx_params = {
                 'to': to_checksum_address(to),
                 'value': val
@@ -737,16 +888,28 @@ class Web3Client:
             if from_addr:
                 tx_params['from'] = to_checksum_address(from_addr)
             
-            return w3.eth.estimate_gas(tx_params)
+            return await w3.eth.estimate_gas(tx_params)
         
-        return await self._execute_with_retry(_estimate_gas, to_address, data, value, from_address)
+        return await self._execute(_estimate_gas, to_address, data, value, from_address, hedge=hedge)
 
-    async def get_gas_price(self) -> int:
-        """Get current gas price."""
-        async def _get_gas_price(w3: Web3) -> int:
-            return w3.eth.gas_price
+    async def get_gas_price(self, hedge: bool = False) -> int:
+        """Get current gas price (hedged across providers if `hedge`)."""
+        async def _get_gas_price(w3: AsyncWeb3) -> int:
+            return await w3.eth.gas_price
+        
+        return await self._execute(_get_gas_price, hedge=hedge)
+
+    async def get_transaction_count(
+        self,
+        address: str,
+        block_identifier: Union[int, str] = 'pending',
+        hedge: bool = False
+    ) -> int:
+        """Get an account nonce (hedged across providers if `hedge`)."""
+        async def _get_transaction_count(w3: AsyncWeb3, addr: str, block: Union[int, str]) -> int:
+            return await w3.eth.get_transaction_count(to_checksum_address(addr), block)
         
-        return await self._execute_with_retry(_get_gas_price)
+        return await self._execute(_get_transaction_count, address, block_identifier, hedge=hedge)
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get client performance statistics."""
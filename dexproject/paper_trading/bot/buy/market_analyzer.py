@@ -23,10 +23,14 @@ DELEGATED RESPONSIBILITIES (see other modules):
 File: dexproject/paper_trading/bot/market_analyzer.py
 """
 
+import asyncio
 import logging
+import time
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional, Any
 
+from asgiref.sync import sync_to_async
 from django.utils import timezone
 
 from paper_trading.models import (
@@ -70,9 +74,16 @@ from paper_trading.bot.buy.market_helpers import MarketHelpers
 
 # Import professional settings (Unibot/Maestro standards)
 from paper_trading.bot.shared.professional_settings import PositionLimits
+from paper_trading.bot.shared.thought_log_writer import ThoughtLogWriter
+from paper_trading.bot.shared.tick_context import TICK_QUERY_BUDGET, TickContext
 
 logger = logging.getLogger(__name__)
 
+# Async ticks start prefetching the next tick's prices this many times the
+# last observed fetch duration before the tick is due
+PRICE_PREFETCH_LEAD_FACTOR = 1.5
+DEFAULT_PRICE_FETCH_SECONDS = 1.0
+
 
 # =============================================================================
 # MARKET ANALYZER CLASS - Core Orchestration
@@ -114,6 +125,14 @@ class MarketAnalyzer:
             position_manager=position_manager,
             trade_executor=trade_executor
         )
+
+        # Or, on a long-lived event loop
+        await analyzer.tick_async(
+            price_manager=price_manager,
+            position_manager=position_manager,
+            trade_executor=trade_executor,
+            next_tick_at=loop.time() + analyzer.tick_interval
+        )
     """
 
     def __init__(
@@ -144,9 +163,23 @@ class MarketAnalyzer:
         self.use_tx_manager = use_tx_manager
         
         self.tick_count = 0
+        self.tick_interval = 15  # Overridden by the bot
         self.last_decisions: Dict[str, TradingDecision] = {}
         self.pending_transactions: List[Any] = []
         
+        # Per-phase timings (ms) of the current and last completed tick
+        self.tick_timings: Dict[str, float] = {}
+        self.last_tick_timings: Dict[str, float] = {}
+        self._tick_started = 0.0
+        
+        # Per-tick snapshot/unit of work and the last tick's query count
+        self.tick_context: Optional[TickContext] = None
+        self.last_tick_queries = 0
+        
+        # Async mode: background fetch of the next tick's prices
+        self._price_prefetch: Optional[asyncio.Task] = None
+        self._price_fetch_seconds = DEFAULT_PRICE_FETCH_SECONDS
+        
         # Initialize arbitrage detection components
         self.arbitrage_detector: Optional[ArbitrageEngine] = None
         self.dex_comparator: Optional[DEXPriceComparator] = None
@@ -217,10 +250,14 @@ class MarketAnalyzer:
             arbitrage_enabled=self.check_arbitrage  # ✅ CORRECT
         )
         
+        # Thought logs are batched off the tick path (the bot starts/stops the worker)
+        self.thought_writer = ThoughtLogWriter()
+        
         self.helpers = MarketHelpers(
             account=account,
             session=session,
-            use_tx_manager=use_tx_manager
+            use_tx_manager=use_tx_manager,
+            thought_writer=self.thought_writer
         )
         
         logger.info(
@@ -262,230 +299,537 @@ class MarketAnalyzer:
         - SELL cooldown: 0 min (exit fast)
         - MEV protection: >$1000 trades
 
+        Account, strategy config and open positions are loaded once
+        into a TickContext shared by all phases; deferred writes are flushed
+        in one transaction at the end of the tick. Per-phase timings and the
+        tick's query count are logged at the end of the tick and kept in
+        last_tick_timings and last_tick_queries.
+
         Args:
             price_manager: RealPriceManager instance
             position_manager: PositionManager instance
             trade_executor: TradeExecutor instance
         """
-        try:
-            self.tick_count += 1
-            logger.info(
-                f"\n{'='*80}\n"
-                f"[TICK {self.tick_count}] Starting Professional Trading Cycle\n"
-                f"{'='*80}"
-            )
+        self._begin_tick()
+        with self.tick_context.count_queries():
+            try:
+                # PHASE 1: UPDATE MARKET DATA
+                with self._phase_timer('prices'):
+                    self._update_market_prices(price_manager)
+                with self._phase_timer('positions'):
+                    self._refresh_positions(price_manager, position_manager)
+                with self._phase_timer('pending_tx'):
+                    self._update_pending_transactions()
+                logger.info(f"[TICK {self.tick_count}] ✅ Phase 1 complete - Market data updated")
+
+                # PHASE 2: CIRCUIT BREAKER CHECK
+                if not self._trading_allowed():
+                    return
 
-            # ================================================================
-            # PHASE 1: UPDATE MARKET DATA
-            # ================================================================
-            logger.info(f"[TICK {self.tick_count}] PHASE 1: Updating market data...")
-            
-            # Update all token prices
-            self._update_market_prices(price_manager)
-            
-            # Update position values with latest prices
-            tokens = price_manager.get_all_tokens()
-            position_manager.update_position_prices(tokens)
-            
-            # Check pending transactions if using TX Manager
-            if self.use_tx_manager and TRANSACTION_MANAGER_AVAILABLE:
-                self.pending_transactions = self.helpers.check_pending_transactions(
-                    self.pending_transactions
+                # PHASE 3: SELL PATH
+                with self._phase_timer('sell'):
+                    self._run_sell_path(price_manager, position_manager, trade_executor)
+
+                # PHASE 4: BUY PATH
+                with self._phase_timer('buy'):
+                    position_count = self._run_buy_path(price_manager, position_manager, trade_executor)
+                if position_count is None:
+                    return
+
+                # PHASE 5: STATISTICS & STATUS UPDATES
+                with self._phase_timer('status'):
+                    self._run_status_phase(price_manager, position_manager, trade_executor, position_count)
+
+            except Exception as e:
+                logger.error(
+                    f"[TICK {self.tick_count}] ❌ TICK FAILED: {e}",
+                    exc_info=True
                 )
-            
-            logger.info(f"[TICK {self.tick_count}] ✅ Phase 1 complete - Market data updated")
-            
-            logger.info(f"[TICK {self.tick_count}] ✅ Phase 1 complete - Market data updated")
+            finally:
+                self._flush_tick_context()
+                self._finish_tick()
 
-            # ADD THIS LINE:
-            logger.info(f"[TICK {self.tick_count}] DEBUG: About to check circuit breaker")
+    async def tick_async(
+        self,
+        price_manager: Any,
+        position_manager: Any,
+        trade_executor: Any,
+        next_tick_at: Optional[float] = None
+    ) -> None:
+        """
+        Execute one market tick on the bot's long-lived event loop.
 
+        Runs the same phases as tick(). The price fetch and the pending
+        transaction check run concurrently. ORM-bound phases run in Django's
+        sync thread via sync_to_async, so the intelligence engine and DEX
+        comparator coroutines they reach through async_to_sync execute back
+        on this loop instead of on a fresh loop per call; their queries are
+        counted in that thread. Once this tick's prices are applied, the
+        next tick's prices are prefetched in the background, timed to land
+        just before next_tick_at.
+
+        Args:
+            price_manager: RealPriceManager instance
+            position_manager: PositionManager instance
+            trade_executor: TradeExecutor instance
+            next_tick_at: Loop time (loop.time()) of the next scheduled tick;
+                enables price prefetching when given
+        """
+        self._begin_tick()
+        try:
+            # PHASE 1: UPDATE MARKET DATA (prices and pending TX overlap)
+            await asyncio.gather(
+                self._timed_phase('prices', self._update_market_prices_async(price_manager)),
+                self._timed_phase('pending_tx', self._orm_phase(self._update_pending_transactions))
+            )
+            if next_tick_at is not None:
+                self._schedule_price_prefetch(price_manager, next_tick_at)
+            with self._phase_timer('positions'):
+                await self._orm_phase(self._refresh_positions, price_manager, position_manager)
+            logger.info(f"[TICK {self.tick_count}] ✅ Phase 1 complete - Market data updated")
 
-            # ================================================================
             # PHASE 2: CIRCUIT BREAKER CHECK
-            # ================================================================
-            if self.circuit_breaker_manager:
-                if not self.circuit_breaker_manager.can_trade():
-                    logger.warning(
-                        f"[TICK {self.tick_count}] ⛔ Circuit breaker OPEN - "
-                        "Skipping all trading operations"
-                    )
-                    return
+            if not await self._orm_phase(self._trading_allowed):
+                return
 
-            # ================================================================
-            # PHASE 3: SELL PATH - PROCESS POSITIONS WE OWN (Priority 1)
-            # ================================================================
-            logger.info(
-                f"\n[TICK {self.tick_count}] PHASE 3: SELL PATH - "
-                "Evaluating existing positions..."
-            )
-            
-            # Get current position count for logging
-            # Get current position count for logging
-            # CRITICAL: Load ALL open positions for account, not filtered by session
-            # This ensures we can close positions from previous sessions
-            current_positions = PaperPosition.objects.filter(
-                account=self.account,
-                is_open=True
-            ).select_related('account')
-            position_count = current_positions.count()
-            
-            if position_count > 0:
-                logger.info(
-                    f"[TICK {self.tick_count}] Evaluating {position_count} open positions"
-                )
-                
-                # 3a. INTELLIGENT SELLS (AI-driven exits)
-                # This analyzes market conditions and decides if we should exit
-                logger.info(
-                    f"[TICK {self.tick_count}] 3a. Checking intelligent sell signals..."
-                )
-                self.position_evaluator.check_position_sells(
-                    price_manager=price_manager,
-                    position_manager=position_manager,
-                    trade_executor=trade_executor,
-                    thought_logger=self.helpers.log_thought
+            # PHASE 3: SELL PATH
+            with self._phase_timer('sell'):
+                await self._orm_phase(
+                    self._run_sell_path, price_manager, position_manager, trade_executor
                 )
-                
-                # 3b. SAFETY NET (forced exits on hard thresholds)
-                # This is the last line of defense: stop-loss, take-profit, max hold time
-                logger.info(
-                    f"[TICK {self.tick_count}] 3b. Checking safety net triggers..."
-                )
-                self.position_evaluator.check_auto_close_positions(
-                    price_manager=price_manager,
-                    position_manager=position_manager,
-                    trade_executor=trade_executor,
-                    thought_logger=self.helpers.log_thought
-                )
-                
-                logger.info(
-                    f"[TICK {self.tick_count}] ✅ Phase 3 complete - "
-                    "Position evaluation finished"
+
+            # PHASE 4: BUY PATH
+            with self._phase_timer('buy'):
+                position_count = await self._orm_phase(
+                    self._run_buy_path, price_manager, position_manager, trade_executor
                 )
-            else:
-                logger.info(
-                    f"[TICK {self.tick_count}] No open positions - Skipping SELL path"
+            if position_count is None:
+                return
+
+            # PHASE 5: STATISTICS & STATUS UPDATES
+            with self._phase_timer('status'):
+                await self._orm_phase(
+                    self._run_status_phase, price_manager, position_manager, trade_executor, position_count
                 )
 
-            # ================================================================
-            # PHASE 4: BUY PATH - PROCESS TOKENS WE DON'T OWN (Priority 2)
-            # ================================================================
-            logger.info(
-                f"\n[TICK {self.tick_count}] PHASE 4: BUY PATH - "
-                "Analyzing new opportunities..."
+        except Exception as e:
+            logger.error(
+                f"[TICK {self.tick_count}] ❌ TICK FAILED: {e}",
+                exc_info=True
             )
-            
-            # Reload positions in case any were closed in Phase 3
-            position_manager.load_positions()
-            current_positions = PaperPosition.objects.filter(
-                account=self.account,
-                is_open=True
-            ).select_related('account')
-            position_count = current_positions.count()
-            
-            # PROFESSIONAL BOT RULE: Use industry-standard position limits
-            MAX_OPEN_POSITIONS = PositionLimits.MAX_OPEN_POSITIONS
-            
-            if position_count >= MAX_OPEN_POSITIONS:
-                logger.info(
-                    f"[TICK {self.tick_count}] ⚠️  Already at max positions "
-                    f"({position_count}/{MAX_OPEN_POSITIONS}) - Skipping BUY path"
-                )
-                return          
+        finally:
+            await self._orm_phase(self._flush_tick_context)
+            self._finish_tick()
 
-            else:
-                available_slots = MAX_OPEN_POSITIONS - position_count
-                logger.info(
-                    f"[TICK {self.tick_count}] {available_slots} position slots available "
-                    f"({position_count}/{MAX_OPEN_POSITIONS} filled)"
-                )
-                
-                # Get all available tokens
-                tokens = price_manager.get_all_tokens()
-                logger.info(
-                    f"[TICK {self.tick_count}] Analyzing {len(tokens)} tokens for BUY"
-                )
-                
-                # Token analyzer will:
-                # 1. Filter OUT tokens we already own
-                # 2. Check BUY cooldowns (15 min same token, 3 min any token)
-                # 3. Analyze remaining tokens with intelligence engine
-                # 4. Execute BUY if confidence is high enough
-                self.token_analyzer.analyze_tokens_for_buy(
-                    tokens=tokens,
-                    price_manager=price_manager,
-                    position_manager=position_manager,
-                    trade_executor=trade_executor,
-                    thought_logger=self.helpers.log_thought
-                )
-                
-                logger.info(
-                    f"[TICK {self.tick_count}] ✅ Phase 4 complete - "
-                    "BUY analysis finished"
-                )
+    # =========================================================================
+    # TICK PHASES
+    # =========================================================================
 
-            # Reload position count after BUY analysis for accurate final summary
-            current_positions = PaperPosition.objects.filter(
-                account=self.account,
-                is_open=True
+    def _refresh_positions(self, price_manager: Any, position_manager: Any) -> None:
+        """
+        Load the tick snapshot and update position values with the latest prices.
+
+        The position writes are deferred to the end-of-tick flush.
+
+        Args:
+            price_manager: RealPriceManager instance
+            position_manager: PositionManager instance
+        """
+        self.tick_context.refresh()
+        position_manager.set_positions(self.tick_context.positions.values())
+
+        tokens = price_manager.get_all_tokens()
+        position_manager.update_position_prices(tokens, tick_context=self.tick_context)
+
+    def _update_pending_transactions(self) -> None:
+        """Check pending transactions if using TX Manager."""
+        if self.use_tx_manager and TRANSACTION_MANAGER_AVAILABLE:
+            self.pending_transactions = self.helpers.check_pending_transactions(
+                self.pending_transactions
             )
-            position_count = current_positions.count()
-            logger.debug(
-                f"[TICK {self.tick_count}] Position count after BUY analysis: "
-                f"{position_count}/{MAX_OPEN_POSITIONS}"
+
+    def _trading_allowed(self) -> bool:
+        """
+        Check the circuit breaker before any trading operations.
+
+        Returns:
+            False if the circuit breaker is open, True otherwise
+        """
+        if self.circuit_breaker_manager:
+            if not self.circuit_breaker_manager.can_trade():
+                logger.warning(
+                    f"[TICK {self.tick_count}] ⛔ Circuit breaker OPEN - "
+                    "Skipping all trading operations"
+                )
+                return False
+        return True
+
+    def _run_sell_path(
+        self,
+        price_manager: Any,
+        position_manager: Any,
+        trade_executor: Any
+    ) -> None:
+        """
+        SELL PATH - process positions we own (priority 1).
+
+        Args:
+            price_manager: RealPriceManager instance
+            position_manager: PositionManager instance
+            trade_executor: TradeExecutor instance
+        """
+        logger.info(
+            f"\n[TICK {self.tick_count}] PHASE 3: SELL PATH - "
+            "Evaluating existing positions..."
+        )
+
+        # CRITICAL: The tick snapshot holds ALL open positions for the account,
+        # not filtered by session, so positions from previous sessions can close
+        position_count = position_manager.get_position_count()
+
+        if position_count > 0:
+            logger.info(
+                f"[TICK {self.tick_count}] Evaluating {position_count} open positions"
             )
 
-            # ================================================================
-            # PHASE 5: STATISTICS & STATUS UPDATES
-            # ================================================================
+            # 3a. INTELLIGENT SELLS (AI-driven exits)
+            # This analyzes market conditions and decides if we should exit
             logger.info(
-                f"\n[TICK {self.tick_count}] PHASE 5: Updating metrics and status..."
+                f"[TICK {self.tick_count}] 3a. Checking intelligent sell signals..."
             )
-            
-            # Update arbitrage stats from delegated components
-            self.arbitrage_opportunities_found = (
-                self.position_evaluator.arbitrage_opportunities_found
+            self.position_evaluator.check_position_sells(
+                price_manager=price_manager,
+                position_manager=position_manager,
+                trade_executor=trade_executor,
+                thought_logger=self.helpers.log_thought
             )
-            self.arbitrage_trades_executed = (
-                self.position_evaluator.arbitrage_trades_executed
+
+            # 3b. SAFETY NET (forced exits on hard thresholds)
+            # This is the last line of defense: stop-loss, take-profit, max hold time
+            logger.info(
+                f"[TICK {self.tick_count}] 3b. Checking safety net triggers..."
             )
-            
-            # Update performance metrics every 20 ticks
-            if self.tick_count % 20 == 0:
-                self._update_metrics(position_manager)
-                logger.info(
-                    f"[TICK {self.tick_count}] Performance metrics updated "
-                    "(20-tick interval)"
-                )
-            
-            # Send WebSocket status update
-            self._send_bot_status_update(
-                status='RUNNING',
+            self.position_evaluator.check_auto_close_positions(
                 price_manager=price_manager,
                 position_manager=position_manager,
-                trade_executor=trade_executor
+                trade_executor=trade_executor,
+                thought_logger=self.helpers.log_thought
             )
-            
+
             logger.info(
-                f"[TICK {self.tick_count}] ✅ Phase 5 complete - Status updated"
+                f"[TICK {self.tick_count}] ✅ Phase 3 complete - "
+                "Position evaluation finished"
             )
-            
-            # Final summary
+        else:
             logger.info(
-                f"\n{'='*80}\n"
-                f"[TICK {self.tick_count}] ✅ TICK COMPLETE\n"
-                f"Summary: {position_count}/{MAX_OPEN_POSITIONS} positions open, "
-                f"{self.arbitrage_opportunities_found} arb opps found, "
-                f"{self.arbitrage_trades_executed} arb trades executed\n"
-                f"{'='*80}\n"
+                f"[TICK {self.tick_count}] No open positions - Skipping SELL path"
             )
 
+    def _run_buy_path(
+        self,
+        price_manager: Any,
+        position_manager: Any,
+        trade_executor: Any
+    ) -> Optional[int]:
+        """
+        BUY PATH - process tokens we don't own (priority 2).
+
+        Args:
+            price_manager: RealPriceManager instance
+            position_manager: PositionManager instance
+            trade_executor: TradeExecutor instance
+
+        Returns:
+            Open position count after BUY analysis, or None if already at
+            max positions (the rest of the tick is skipped)
+        """
+        logger.info(
+            f"\n[TICK {self.tick_count}] PHASE 4: BUY PATH - "
+            "Analyzing new opportunities..."
+        )
+
+        # Positions closed in Phase 3 were already removed from the manager
+        position_count = position_manager.get_position_count()
+
+        # PROFESSIONAL BOT RULE: Use industry-standard position limits
+        MAX_OPEN_POSITIONS = PositionLimits.MAX_OPEN_POSITIONS
+
+        if position_count >= MAX_OPEN_POSITIONS:
+            logger.info(
+                f"[TICK {self.tick_count}] ⚠️  Already at max positions "
+                f"({position_count}/{MAX_OPEN_POSITIONS}) - Skipping BUY path"
+            )
+            return None
+
+        available_slots = MAX_OPEN_POSITIONS - position_count
+        logger.info(
+            f"[TICK {self.tick_count}] {available_slots} position slots available "
+            f"({position_count}/{MAX_OPEN_POSITIONS} filled)"
+        )
+
+        # Get all available tokens
+        tokens = price_manager.get_all_tokens()
+        logger.info(
+            f"[TICK {self.tick_count}] Analyzing {len(tokens)} tokens for BUY"
+        )
+
+        # Token analyzer will:
+        # 1. Filter OUT tokens we already own
+        # 2. Check BUY cooldowns (15 min same token, 3 min any token)
+        # 3. Analyze remaining tokens with intelligence engine
+        # 4. Execute BUY if confidence is high enough
+        self.token_analyzer.analyze_tokens_for_buy(
+            tokens=tokens,
+            price_manager=price_manager,
+            position_manager=position_manager,
+            trade_executor=trade_executor,
+            thought_logger=self.helpers.log_thought
+        )
+
+        logger.info(
+            f"[TICK {self.tick_count}] ✅ Phase 4 complete - "
+            "BUY analysis finished"
+        )
+
+        # Position count after BUY analysis (opened positions are tracked in memory)
+        position_count = position_manager.get_position_count()
+        logger.debug(
+            f"[TICK {self.tick_count}] Position count after BUY analysis: "
+            f"{position_count}/{MAX_OPEN_POSITIONS}"
+        )
+        return position_count
+
+    def _run_status_phase(
+        self,
+        price_manager: Any,
+        position_manager: Any,
+        trade_executor: Any,
+        position_count: int
+    ) -> None:
+        """
+        Update metrics and send the bot status over WebSocket.
+
+        Args:
+            price_manager: RealPriceManager instance
+            position_manager: PositionManager instance
+            trade_executor: TradeExecutor instance
+            position_count: Open position count after BUY analysis
+        """
+        logger.info(
+            f"\n[TICK {self.tick_count}] PHASE 5: Updating metrics and status..."
+        )
+
+        # Update arbitrage stats from delegated components
+        self.arbitrage_opportunities_found = (
+            self.position_evaluator.arbitrage_opportunities_found
+        )
+        self.arbitrage_trades_executed = (
+            self.position_evaluator.arbitrage_trades_executed
+        )
+
+        # Update performance metrics every 20 ticks
+        if self.tick_count % 20 == 0:
+            self._update_metrics(position_manager)
+            logger.info(
+                f"[TICK {self.tick_count}] Performance metrics updated "
+                "(20-tick interval)"
+            )
+
+        # Send WebSocket status update
+        self._send_bot_status_update(
+            status='RUNNING',
+            price_manager=price_manager,
+            position_manager=position_manager,
+            trade_executor=trade_executor
+        )
+
+        logger.info(
+            f"[TICK {self.tick_count}] ✅ Phase 5 complete - Status updated"
+        )
+
+        # Final summary
+        logger.info(
+            f"\n{'='*80}\n"
+            f"[TICK {self.tick_count}] ✅ TICK COMPLETE\n"
+            f"Summary: {position_count}/{PositionLimits.MAX_OPEN_POSITIONS} positions open, "
+            f"{self.arbitrage_opportunities_found} arb opps found, "
+            f"{self.arbitrage_trades_executed} arb trades executed\n"
+            f"{'='*80}\n"
+        )
+
+    # =========================================================================
+    # TICK TIMING & PRICE PREFETCH
+    # =========================================================================
+
+    def _begin_tick(self) -> None:
+        """Start a new tick, reset its phase timings and create its TickContext."""
+        self.tick_count += 1
+        self.tick_timings = {}
+        self.tick_context = TickContext(self.tick_count, self.account, self.strategy_config)
+        self._tick_started = time.perf_counter()
+        logger.info(
+            f"\n{'='*80}\n"
+            f"[TICK {self.tick_count}] Starting Professional Trading Cycle\n"
+            f"{'='*80}"
+        )
+
+    def _finish_tick(self) -> None:
+        """Record the total tick duration and query count, and log them."""
+        self.tick_timings['total'] = (time.perf_counter() - self._tick_started) * 1000
+        self.last_tick_timings = {
+            phase: round(elapsed_ms, 1) for phase, elapsed_ms in self.tick_timings.items()
+        }
+        self.last_tick_queries = self.tick_context.query_count
+        logger.info(
+            f"[TICK {self.tick_count}] Phase timings (ms): "
+            + ", ".join(f"{phase}={elapsed_ms}" for phase, elapsed_ms in self.last_tick_timings.items())
+            + f" | queries={self.last_tick_queries}"
+        )
+        if self.tick_context.is_over_budget():
+            logger.warning(
+                f"[TICK {self.tick_count}] Issued {self.last_tick_queries} queries "
+                f"(budget {TICK_QUERY_BUDGET})"
+            )
+
+    def _flush_tick_context(self) -> None:
+        """Flush the tick's deferred writes."""
+        try:
+            self.tick_context.flush()
         except Exception as e:
             logger.error(
-                f"[TICK {self.tick_count}] ❌ TICK FAILED: {e}",
+                f"[TICK {self.tick_count}] Failed to flush tick writes: {e}",
+                exc_info=True
+            )
+
+    async def _orm_phase(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run an ORM-bound tick phase in Django's sync thread, counting its queries.
+
+        Args:
+            func: Phase method
+            *args: Positional arguments for the phase
+
+        Returns:
+            The phase's return value
+        """
+        def run() -> Any:
+            with self.tick_context.count_queries():
+                return func(*args)
+
+        return await sync_to_async(run)()
+
+    @contextmanager
+    def _phase_timer(self, phase: str) -> Iterator[None]:
+        """Time a tick phase (sync or awaited) into tick_timings."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.tick_timings[phase] = (time.perf_counter() - started) * 1000
+
+    async def _timed_phase(self, phase: str, awaitable: Awaitable[Any]) -> Any:
+        """Await a tick phase that runs concurrently with others, timing it."""
+        with self._phase_timer(phase):
+            return await awaitable
+
+    async def _update_market_prices_async(self, price_manager: Any) -> None:
+        """
+        Update market prices on the event loop, using prefetched prices if any.
+
+        Args:
+            price_manager: RealPriceManager instance
+        """
+        try:
+            prefetch, self._price_prefetch = self._price_prefetch, None
+            prefetched_prices = await self._await_price_prefetch(prefetch)
+
+            if hasattr(price_manager, 'update_all_prices'):
+                started = time.perf_counter()
+                await price_manager.update_all_prices(prefetched_prices=prefetched_prices)
+                if not prefetched_prices:
+                    self._price_fetch_seconds = time.perf_counter() - started
+            else:
+                await sync_to_async(price_manager.update_prices)()
+
+            self._update_gas_price(price_manager)
+
+        except Exception as e:
+            logger.error(
+                f"[MARKET ANALYZER] Failed to update market prices: {e}",
                 exc_info=True
-            )            
+            )
+
+    async def _await_price_prefetch(
+        self,
+        prefetch: Optional[asyncio.Task]
+    ) -> Optional[Dict[str, Optional[Decimal]]]:
+        """
+        Collect prefetched prices, or None so the tick fetches fresh ones.
+
+        Args:
+            prefetch: Prefetch task scheduled by the previous tick, if any
+
+        Returns:
+            Prefetched prices, or None if there was no prefetch or it
+            failed or was cancelled
+        """
+        if prefetch is None:
+            return None
+        try:
+            return await prefetch
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if current is not None and current.cancelling():
+                raise  # The tick itself is being cancelled
+            logger.warning("[MARKET ANALYZER] Price prefetch was cancelled, fetching fresh prices")
+        except Exception as e:
+            logger.warning(f"[MARKET ANALYZER] Price prefetch failed, fetching fresh prices: {e}")
+        return None
+
+    def _schedule_price_prefetch(self, price_manager: Any, next_tick_at: float) -> None:
+        """
+        Start fetching the next tick's prices in the background.
+
+        Args:
+            price_manager: RealPriceManager instance
+            next_tick_at: Loop time of the next scheduled tick
+        """
+        if not getattr(price_manager, 'use_real_prices', False):
+            return
+        if not hasattr(price_manager, 'fetch_bulk_prices'):
+            return
+        self._price_prefetch = asyncio.create_task(
+            self._prefetch_prices(price_manager, next_tick_at)
+        )
+
+    async def _prefetch_prices(
+        self,
+        price_manager: Any,
+        next_tick_at: float
+    ) -> Dict[str, Optional[Decimal]]:
+        """
+        Fetch prices so they arrive just before the next tick.
+
+        The fetch starts PRICE_PREFETCH_LEAD_FACTOR times the last observed
+        fetch duration ahead of next_tick_at, or immediately if this tick
+        has already run past that point, so the prices are fresh when used.
+
+        Args:
+            price_manager: RealPriceManager instance
+            next_tick_at: Loop time of the next scheduled tick
+
+        Returns:
+            Prices keyed by token symbol (errors propagate to the next
+            tick, which then fetches fresh prices)
+        """
+        loop = asyncio.get_running_loop()
+        lead = self._price_fetch_seconds * PRICE_PREFETCH_LEAD_FACTOR
+        await asyncio.sleep(max(0.0, next_tick_at - lead - loop.time()))
+
+        started = time.perf_counter()
+        prices = await price_manager.fetch_bulk_prices()
+        self._price_fetch_seconds = time.perf_counter() - started
+        return prices
 
     # =========================================================================
     # TRANSACTION MANAGER INTEGRATION
@@ -555,23 +899,7 @@ class MarketAnalyzer:
             price_manager.update_prices()
             logger.debug("[PRICES] Market prices updated successfully")
 
-            # Update gas price for arbitrage calculations
-            if self.arbitrage_detector:
-                try:
-                    # Try to get gas price from price manager
-                    if hasattr(price_manager, 'get_gas_price'):
-                        gas_price_gwei = price_manager.get_gas_price()
-                        if gas_price_gwei:
-                            # Update arbitrage detector directly
-                            self.arbitrage_detector.update_gas_price(
-                                Decimal(str(gas_price_gwei))
-                            )
-                    else:
-                        # Use conservative default if not available
-                        # On Base, gas is typically very low (< 1 gwei)
-                        self.arbitrage_detector.update_gas_price(Decimal('0.5'))
-                except Exception as gas_error:
-                    logger.debug(f"[PRICES] Could not update gas price: {gas_error}")
+            self._update_gas_price(price_manager)
 
         except Exception as e:
             logger.error(
@@ -579,6 +907,32 @@ class MarketAnalyzer:
                 exc_info=True
             )
 
+    def _update_gas_price(self, price_manager: Any) -> None:
+        """
+        Update gas price for arbitrage calculations.
+
+        Args:
+            price_manager: RealPriceManager instance
+        """
+        if not self.arbitrage_detector:
+            return
+
+        try:
+            # Try to get gas price from price manager
+            if hasattr(price_manager, 'get_gas_price'):
+                gas_price_gwei = price_manager.get_gas_price()
+                if gas_price_gwei:
+                    # Update arbitrage detector directly
+                    self.arbitrage_detector.update_gas_price(
+                        Decimal(str(gas_price_gwei))
+                    )
+            else:
+                # Use conservative default if not available
+                # On Base, gas is typically very low (< 1 gwei)
+                self.arbitrage_detector.update_gas_price(Decimal('0.5'))
+        except Exception as gas_error:
+            logger.debug(f"[PRICES] Could not update gas price: {gas_error}")
+
     def _update_metrics(self, position_manager: Any) -> None:
         """
         Update performance metrics for the current session.
@@ -726,8 +1080,8 @@ class MarketAnalyzer:
                 # Get win rate from account trade statistics
                 win_rate = 0.0
                 try:
-                    # Refresh account from database to get latest trade counts
-                    self.account.refresh_from_db()
+                    # Trade counts are current: the account was loaded by the tick
+                    # snapshot and trades update this same instance
                     total_trades = self.account.total_trades or 0
                     winning_trades = self.account.winning_trades or 0
                     if total_trades > 0:
@@ -748,6 +1102,9 @@ class MarketAnalyzer:
                     'account_balance': account_cash,
                     'open_positions': positions_data,
                     'tick_count': self.tick_count,
+                    'tick_timings_ms': self.last_tick_timings,
+                    'tick_queries': self.last_tick_queries,
+                    'thought_log': self.thought_writer.get_stats(),
                     'total_gas_savings': 0,  # Placeholder
                     'pending_transactions': len(self.pending_transactions),
                     'consecutive_failures': 0,  # Placeholder
@@ -804,6 +1161,11 @@ class MarketAnalyzer:
         try:
             logger.info("[MARKET ANALYZER] Starting cleanup...")
 
+            # Drop any in-flight price prefetch
+            if self._price_prefetch and not self._price_prefetch.done():
+                self._price_prefetch.cancel()
+            self._price_prefetch = None
+
             # Clean up DEX comparator
             if self.dex_comparator:
                 await self.dex_comparator.cleanup()
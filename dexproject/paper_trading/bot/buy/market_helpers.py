@@ -16,7 +16,7 @@ File: dexproject/paper_trading/bot/market_helpers.py
 
 import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
 
 from django.utils import timezone
 
@@ -26,6 +26,9 @@ from paper_trading.models import (
     PaperAIThoughtLog
 )
 
+if TYPE_CHECKING:
+    from paper_trading.bot.shared.thought_log_writer import ThoughtLogWriter
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,7 +63,8 @@ class MarketHelpers:
         self,
         account: PaperTradingAccount,
         session: PaperTradingSession,
-        use_tx_manager: bool = False
+        use_tx_manager: bool = False,
+        thought_writer: Optional['ThoughtLogWriter'] = None
     ) -> None:
         """
         Initialize the Market Helpers.
@@ -69,10 +73,12 @@ class MarketHelpers:
             account: Paper trading account
             session: Current trading session
             use_tx_manager: Whether Transaction Manager is enabled
+            thought_writer: Optional buffered writer for thought logs
         """
         self.account = account
         self.session = session
         self.use_tx_manager = use_tx_manager
+        self.thought_writer = thought_writer
 
         logger.info("[MARKET HELPERS] Initialized market helpers")
 
@@ -93,6 +99,8 @@ class MarketHelpers:
 
         This creates a PaperAIThoughtLog record that can be viewed in the
         AI Thought Logs dashboard to understand why the bot made decisions.
+        With a thought writer the record is queued and written in a later
+        batch (it may also be sampled out), otherwise it is saved directly.
 
         Args:
             action: Decision action (BUY, SELL, HOLD, SKIP)
@@ -102,7 +110,8 @@ class MarketHelpers:
             metadata: Additional metadata dict
 
         Returns:
-            PaperAIThoughtLog object if successful, None otherwise
+            PaperAIThoughtLog object (unsaved until flushed when buffered)
+            if successful, None otherwise
         """
         try:
             if not metadata:
@@ -127,7 +136,7 @@ class MarketHelpers:
                 confidence_level = 'VERY_LOW'
 
             # Create thought log
-            thought = PaperAIThoughtLog.objects.create(
+            thought = PaperAIThoughtLog(
                 account=self.account,
                 decision_type=action,
                 token_symbol=token_symbol,
@@ -146,6 +155,11 @@ class MarketHelpers:
                 created_at=timezone.now()
             )
 
+            if self.thought_writer is not None:
+                self.thought_writer.submit(thought)
+            else:
+                thought.save()
+
             logger.debug(
                 f"[THOUGHT LOG] Logged {action} decision for {token_symbol} "
                 f"(Confidence: {confidence:.1f}%)"
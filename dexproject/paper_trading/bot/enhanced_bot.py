@@ -25,7 +25,7 @@ import sys
 import io
 import asyncio
 from contextlib import suppress
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Tuple
 
 from paper_trading.bot.shared.validation import ValidationLimits
 # Force UTF-8 encoding for Windows console to support emoji logging
@@ -91,6 +91,7 @@ from paper_trading.bot.positions import PositionManager
 from paper_trading.bot.execution import TradeExecutor
 from paper_trading.bot.shared import create_price_manager
 from paper_trading.bot.sell import PositionEvaluator
+from paper_trading.services.websocket_service import websocket_service
 
 # ============================================================================
 # INTELLIGENCE SYSTEM IMPORTS
@@ -144,6 +145,33 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# TICK SCHEDULING
+# =============================================================================
+
+def next_tick_deadline(due_at: float, now: float, interval: float) -> Tuple[float, int]:
+    """
+    Deadline of the next tick on a fixed-rate schedule.
+
+    Ticks are due every interval seconds from the start, regardless of how
+    long each tick takes. A tick that finishes late is followed immediately
+    by the next one, and slots that passed entirely during an overrun are
+    skipped rather than run back to back.
+
+    Args:
+        due_at: When the next tick was scheduled (loop time)
+        now: Current loop time
+        interval: Seconds between ticks
+
+    Returns:
+        Tuple of (next deadline, number of skipped ticks)
+    """
+    if now <= due_at:
+        return due_at, 0
+    missed = int((now - due_at) // interval)
+    return due_at + missed * interval, missed
+
+
 # =============================================================================
 # ENHANCED PAPER TRADING BOT CLASS
 # =============================================================================
@@ -169,7 +197,7 @@ class EnhancedPaperTradingBot:
         )
 
         if bot.initialize():
-            bot.run()
+            bot.run()  # or bot.run_async() for the asyncio-native loop
     """
 
     def __init__(
@@ -928,6 +956,7 @@ class EnhancedPaperTradingBot:
                 use_tx_manager=self.use_tx_manager
             )
             self.market_analyzer.tick_interval = self.tick_interval
+            self.market_analyzer.thought_writer.start()
             logger.info("[MARKET] Market analyzer initialized")
         except Exception as e:
             logger.error(f"[MARKET] Failed to initialize market analyzer: {e}", exc_info=True)
@@ -1060,6 +1089,64 @@ class EnhancedPaperTradingBot:
         finally:
             self.shutdown()
 
+    def run_async(self) -> None:
+        """
+        Asyncio-native run loop on a single long-lived event loop.
+
+        Unlike run(), the price feed, DEX comparator and intelligence engine
+        share one event loop for the whole session instead of a fresh loop
+        per call, and independent tick phases overlap (see
+        MarketAnalyzer.tick_async). Ticks run at a fixed rate: each one is
+        due tick_interval after the previous one was due, not after it
+        finished, so the cadence does not drift by the tick duration.
+        """
+        assert self.market_analyzer is not None, "Market analyzer must be initialized before run"
+        assert self.price_manager is not None, "Price manager must be initialized before run"
+        assert self.position_manager is not None, "Position manager must be initialized before run"
+        assert self.trade_executor is not None, "Trade executor must be initialized before run"
+
+        self.running = True
+        logger.info("[BOT] Starting asyncio run loop...")
+
+        try:
+            asyncio.run(self._run_ticks_async())
+        except KeyboardInterrupt:
+            logger.info("[BOT] Received interrupt signal, shutting down...")
+        finally:
+            self.shutdown()
+
+    async def _run_ticks_async(self) -> None:
+        """Fixed-rate tick scheduler for run_async()."""
+        assert self.market_analyzer is not None
+        assert self.price_manager is not None
+
+        loop = asyncio.get_running_loop()
+        due_at = loop.time()
+
+        try:
+            while self.running:
+                due_at += self.tick_interval
+                await self.market_analyzer.tick_async(
+                    price_manager=self.price_manager,
+                    position_manager=self.position_manager,
+                    trade_executor=self.trade_executor,
+                    next_tick_at=due_at
+                )
+
+                due_at, missed = next_tick_deadline(due_at, loop.time(), self.tick_interval)
+                if missed:
+                    logger.warning(
+                        f"[BOT] Tick overran its {self.tick_interval}s interval, "
+                        f"skipping {missed} tick(s)"
+                    )
+
+                # Sleep until the next tick is due
+                await asyncio.sleep(max(0.0, due_at - loop.time()))
+        finally:
+            # Close loop-bound clients while their loop is still running
+            await self.market_analyzer.cleanup()
+            await self.price_manager.close()
+
     def shutdown(self) -> None:
         """
         Gracefully shut down the bot, cancel background tasks, and close resources.
@@ -1166,6 +1253,11 @@ class EnhancedPaperTradingBot:
 
         # --- DB/session & final stats -------------------------------------------
         try:
+            # Write any thought logs still buffered, then deliver batched updates
+            if self.market_analyzer:
+                self.market_analyzer.thought_writer.stop()
+            websocket_service.flush()
+
             if self.session:
                 self.session.status = 'COMPLETED'
                 self.session.stopped_at = timezone.now()
@@ -1231,6 +1323,11 @@ if __name__ == '__main__':
         action='store_true',
         help='Disable circuit breaker protection'
     )
+    parser.add_argument(
+        '--async-loop',
+        action='store_true',
+        help='Run ticks on a single asyncio event loop with overlapped phases'
+    )
 
     args = parser.parse_args()
 
@@ -1321,7 +1418,10 @@ if __name__ == '__main__':
         print("=" * 60)
         print("\n🚀 Bot is running! Press Ctrl+C to stop.\n")
 
-        bot.run()
+        if args.async_loop:
+            bot.run_async()
+        else:
+            bot.run()
     else:
         print("\n❌ Bot initialization failed. Check logs for details.\n")
         sys.exit(1)
\ No newline at end of file
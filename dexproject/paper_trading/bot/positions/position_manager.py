@@ -17,8 +17,10 @@ File: dexproject/paper_trading/bot/positions/position_manager.py
 
 import logging
 from decimal import Decimal
-from typing import Dict, List, Tuple, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Optional, Any
 
+from django.db import transaction
+from django.db.models import Sum
 from django.utils import timezone
 
 from paper_trading.models import (
@@ -30,8 +32,19 @@ from paper_trading.models import (
 # ✅ CRITICAL FIX: Import the validation function
 from paper_trading.models.base import validate_decimal_field
 
+if TYPE_CHECKING:
+    from paper_trading.bot.shared.tick_context import TickContext
+
 logger = logging.getLogger(__name__)
 
+# Fields written by the per-tick price update
+POSITION_PRICE_FIELDS = [
+    'current_price_usd',
+    'current_value_usd',
+    'unrealized_pnl_usd',
+    'last_updated'
+]
+
 
 # =============================================================================
 # POSITION MANAGER CLASS
@@ -172,11 +185,7 @@ class PositionManager:
                 is_open=True
             ).order_by('-opened_at')
             
-            self.positions = {}
-            
-            for position in queryset:
-                # Store by token symbol
-                self.positions[position.token_symbol] = position
+            self.set_positions(queryset)
             
             logger.info(f"[POSITION MANAGER] Loaded {len(self.positions)} open positions via Django ORM")
             return len(self.positions)
@@ -186,6 +195,21 @@ class PositionManager:
             self.positions = {}
             return 0
 
+    def set_positions(self, positions: Iterable[PaperPosition]) -> None:
+        """
+        Replace the tracked open positions with already loaded ones.
+
+        Used by the market tick to share the positions of its TickContext
+        snapshot instead of querying them again.
+
+        Args:
+            positions: Open positions, most recently opened first
+        """
+        self.positions = {}
+        for position in positions:
+            # Store by token symbol
+            self.positions[position.token_symbol] = position
+
 
 
 
@@ -193,15 +217,24 @@ class PositionManager:
     # PRICE UPDATES
     # =========================================================================
 
-    def update_position_prices(self, token_list: List[Dict[str, Any]]) -> int:
+    def update_position_prices(
+        self,
+        token_list: List[Dict[str, Any]],
+        tick_context: Optional['TickContext'] = None
+    ) -> int:
         """
         Update all open position prices with current market prices.
 
         This method should be called on every tick to keep position
-        values current in the database for dashboard display.
+        values current in the database for dashboard display. Values are
+        computed for all positions in one pass and persisted with a single
+        bulk_update, together with the account P&L, in one transaction.
+        With a tick context, both writes are deferred to its flush at the
+        end of the tick.
 
         Args:
             token_list: List of tokens with current prices
+            tick_context: Optional TickContext of the running tick
 
         Returns:
             Number of positions updated
@@ -210,106 +243,37 @@ class PositionManager:
             if not self.positions:
                 return 0
 
-            updated_count = 0
-
-            for token_symbol, position in self.positions.items():
-                # Get current price from token list
-                current_token = next(
-                    (t for t in token_list if t['symbol'] == token_symbol),
-                    None
-                )
-
-                if not current_token:
-                    continue
-
-                # Update position with current price
-                old_price = position.current_price_usd
-                new_price = current_token['price']
-
-                # ✅ VALIDATE: Skip if price is invalid
-                if not new_price or new_price <= 0:
-                    logger.warning(
-                        f"[PRICE UPDATE] Invalid price for {token_symbol}: {new_price}"
-                    )
-                    continue
-
-                # ✅ VALIDATE: Convert to Decimal safely
-                try:
-                    new_price = Decimal(str(new_price))
-                except (ValueError, TypeError, ArithmeticError):
-                    logger.warning(
-                        f"[PRICE UPDATE] Cannot convert price to Decimal for {token_symbol}: {new_price}"
-                    )
-                    continue
-
-                # ✅ CRITICAL FIX: Validate and quantize price before calculations
-                new_price = validate_decimal_field(
-                    new_price,
-                    'current_price_usd',
-                    min_value=Decimal('0.00000001'),
-                    max_value=Decimal('1000000'),
-                    default_value=Decimal('0.01'),
-                    decimal_places=8
-                )
-
-                # Calculate new values
-                position.current_price_usd = new_price
-                new_value = position.quantity * new_price
-                new_pnl = new_value - position.total_invested_usd
-
-                # ✅ CRITICAL FIX: Validate and quantize calculated values
-                new_value = validate_decimal_field(
-                    new_value,
-                    'current_value_usd',
-                    min_value=Decimal('0'),
-                    max_value=Decimal('1000000'),
-                    default_value=Decimal('0'),
-                    decimal_places=2
-                )
+            prices = {token['symbol']: token['price'] for token in token_list}
+            now = timezone.now()
 
-                new_pnl = validate_decimal_field(
-                    new_pnl,
-                    'unrealized_pnl_usd',
-                    min_value=Decimal('-1000000'),
-                    max_value=Decimal('1000000'),
-                    default_value=Decimal('0'),
-                    decimal_places=2
-                )
+            updated_positions = [
+                position
+                for token_symbol, position in self.positions.items()
+                if token_symbol in prices
+                and self._apply_position_price(position, prices[token_symbol], now)
+            ]
 
-                position.current_value_usd = new_value
-                position.unrealized_pnl_usd = new_pnl
-                position.last_updated = timezone.now()
+            if not updated_positions:
+                return 0
 
-                position.save(update_fields=[
-                    'current_price_usd',
-                    'current_value_usd',
-                    'unrealized_pnl_usd',
-                    'last_updated'
-                ])
-
-                updated_count += 1
-
-                # Log significant price changes
-                if old_price and old_price > 0:
-                    price_change_pct = ((new_price - old_price) / old_price) * 100
-                    if abs(price_change_pct) > 1:  # Log if >1% change
-                        logger.debug(
-                            f"[PRICE UPDATE] {token_symbol}: "
-                            f"${old_price:.2f} → ${new_price:.2f} "
-                            f"({price_change_pct:+.2f}%), "
-                            f"Position value: ${position.current_value_usd:.2f}, "
-                            f"P&L: ${position.unrealized_pnl_usd:+.2f}"
-                        )
+            if tick_context is not None:
+                tick_context.defer_position_update(updated_positions, POSITION_PRICE_FIELDS)
+                tick_context.on_flush(self.update_account_pnl)
+                return len(updated_positions)
 
-            if updated_count > 0:
-                logger.debug(
-                    f"[POSITION MANAGER] Updated prices for {updated_count} positions"
+            with transaction.atomic():
+                PaperPosition.objects.bulk_update(
+                    updated_positions,
+                    fields=POSITION_PRICE_FIELDS
                 )
 
                 # Update account's total P&L after price updates
                 self.update_account_pnl()
 
-            return updated_count
+            logger.debug(
+                f"[POSITION MANAGER] Updated prices for {len(updated_positions)} positions"
+            )
+            return len(updated_positions)
 
         except Exception as e:
             logger.error(
@@ -318,6 +282,90 @@ class PositionManager:
             )
             return 0
 
+    def _apply_position_price(
+        self,
+        position: PaperPosition,
+        new_price: Any,
+        updated_at: Any
+    ) -> bool:
+        """
+        Set a position's price, value and unrealized P&L in memory.
+
+        Args:
+            position: Open position to update
+            new_price: Current market price for the position's token
+            updated_at: Timestamp to record as last_updated
+
+        Returns:
+            True if the position was updated, False if the price is invalid
+        """
+        token_symbol = position.token_symbol
+        old_price = position.current_price_usd
+
+        # ✅ VALIDATE: Skip if price is invalid
+        if not new_price or new_price <= 0:
+            logger.warning(
+                f"[PRICE UPDATE] Invalid price for {token_symbol}: {new_price}"
+            )
+            return False
+
+        # ✅ VALIDATE: Convert to Decimal safely
+        try:
+            new_price = Decimal(str(new_price))
+        except (ValueError, TypeError, ArithmeticError):
+            logger.warning(
+                f"[PRICE UPDATE] Cannot convert price to Decimal for {token_symbol}: {new_price}"
+            )
+            return False
+
+        # ✅ CRITICAL FIX: Validate and quantize price before calculations
+        new_price = validate_decimal_field(
+            new_price,
+            'current_price_usd',
+            min_value=Decimal('0.00000001'),
+            max_value=Decimal('1000000'),
+            default_value=Decimal('0.01'),
+            decimal_places=8
+        )
+
+        # Calculate new values
+        position.current_price_usd = new_price
+        new_value = position.quantity * new_price
+        new_pnl = new_value - position.total_invested_usd
+
+        # ✅ CRITICAL FIX: Validate and quantize calculated values
+        position.current_value_usd = validate_decimal_field(
+            new_value,
+            'current_value_usd',
+            min_value=Decimal('0'),
+            max_value=Decimal('1000000'),
+            default_value=Decimal('0'),
+            decimal_places=2
+        )
+        position.unrealized_pnl_usd = validate_decimal_field(
+            new_pnl,
+            'unrealized_pnl_usd',
+            min_value=Decimal('-1000000'),
+            max_value=Decimal('1000000'),
+            default_value=Decimal('0'),
+            decimal_places=2
+        )
+        position.last_updated = updated_at
+
+        # Log significant price changes
+        if old_price and old_price > 0:
+            price_change_pct = ((new_price - old_price) / old_price) * 100
+            if abs(price_change_pct) > 1:  # Log if >1% change
+                logger.debug(
+                    f"[PRICE UPDATE] {token_symbol}: "
+                    f"${old_price:.2f} → ${new_price:.2f} "
+                    f"({price_change_pct:+.2f}%), "
+                    f"Position value: ${position.current_value_usd:.2f}, "
+                    f"P&L: ${position.unrealized_pnl_usd:+.2f}"
+                )
+
+        return True
+
     # =========================================================================
     # AUTO-CLOSE LOGIC
     # =========================================================================
@@ -1097,15 +1145,11 @@ class PositionManager:
                 for pos in self.positions.values()
             )
 
-            # Calculate total realized P&L from closed positions
-            closed_positions = PaperPosition.objects.filter(
+            # Calculate total realized P&L from closed positions (one aggregate query)
+            total_realized_pnl = PaperPosition.objects.filter(
                 account=self.account,
                 is_open=False
-            )
-            total_realized_pnl = sum(
-                pos.realized_pnl_usd
-                for pos in closed_positions
-            )
+            ).aggregate(total=Sum('realized_pnl_usd'))['total'] or Decimal('0')
 
             # Update account's total P&L
             self.account.total_profit_loss_usd = total_unrealized_pnl + total_realized_pnl
@@ -39,6 +39,7 @@ from paper_trading.services.websocket_service import websocket_service
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from paper_trading.intelligence.core.intel_slider import IntelSliderEngine
+    from paper_trading.bot.shared.thought_log_writer import ThoughtLogWriter
     from paper_trading.bot.price_service_integration import RealPriceManager
     from paper_trading.bot.position_manager import PositionManager
     from paper_trading.bot.trade_executor import TradeExecutor
@@ -95,7 +96,8 @@ class MetricsLogger:
         pending_transactions: Optional[list] = None,
         arbitrage_enabled: bool = False,
         arbitrage_opportunities_found: int = 0,
-        arbitrage_trades_executed: int = 0
+        arbitrage_trades_executed: int = 0,
+        thought_writer: Optional['ThoughtLogWriter'] = None
     ) -> None:
         """
         Initialize the Metrics Logger.
@@ -111,6 +113,7 @@ class MetricsLogger:
             arbitrage_enabled: Whether arbitrage detection is enabled
             arbitrage_opportunities_found: Number of arbitrage opportunities found
             arbitrage_trades_executed: Number of arbitrage trades executed
+            thought_writer: Optional buffered writer for thought logs
         """
         self.account = account
         self.session = session
@@ -122,6 +125,7 @@ class MetricsLogger:
         self.arbitrage_enabled = arbitrage_enabled
         self.arbitrage_opportunities_found = arbitrage_opportunities_found
         self.arbitrage_trades_executed = arbitrage_trades_executed
+        self.thought_writer = thought_writer
 
         logger.info("[METRICS LOGGER] Initialized metrics logger")
 
@@ -188,6 +192,7 @@ class MetricsLogger:
 
         This creates a transparent record of why the bot made a particular
         decision, enabling users to understand and trust the AI's reasoning.
+        With a thought writer the record is queued for a batched write.
 
         Args:
             action: Decision action (BUY, SELL, HOLD, SKIP)
@@ -206,7 +211,7 @@ class MetricsLogger:
             confidence_level = self._calculate_confidence_level(confidence)
 
             # Create thought log
-            PaperAIThoughtLog.objects.create(
+            thought = PaperAIThoughtLog(
                 account=self.account,
                 decision_type=action,
                 token_address=token_address,
@@ -225,6 +230,11 @@ class MetricsLogger:
                 analysis_time_ms=0
             )
 
+            if self.thought_writer is not None:
+                self.thought_writer.submit(thought)
+            else:
+                thought.save()
+
             logger.debug(
                 f"[THOUGHT LOG] Logged {action} decision for {token_symbol}: "
                 f"{confidence:.1f}% confidence"
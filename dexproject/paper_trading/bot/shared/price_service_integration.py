@@ -268,20 +268,29 @@ class RealPriceManager:
     # OPTIMIZED: BULK PRICE UPDATE METHOD
     # =========================================================================
     
-    async def update_all_prices(self) -> Dict[str, bool]:
+    async def update_all_prices(
+        self,
+        prefetched_prices: Optional[Dict[str, Optional[Decimal]]] = None
+    ) -> Dict[str, bool]:
         """
         Update prices for all tokens using BULK API call.
         
         OPTIMIZATION: Makes 1 API call for all tokens instead of N separate calls.
         This reduces API usage by 90% and completes updates instantly (no spacing needed).
         
+        Args:
+            prefetched_prices: Prices from an earlier fetch_bulk_prices() call;
+                applied instead of fetching when non-empty (real mode only)
+        
         Returns:
             Dictionary mapping token symbols to update success status
         """
         results = {}
         
         try:
-            if self.use_real_prices:
+            if self.use_real_prices and prefetched_prices:
+                results = self.apply_bulk_prices(prefetched_prices)
+            elif self.use_real_prices:
                 # Use BULK fetching (1 API call for all tokens)
                 results = await self._update_all_prices_bulk()
             else:
@@ -372,12 +381,27 @@ class RealPriceManager:
         Returns:
             Dictionary mapping token symbols to update success status
         """
-        results = {}
+        if not self._price_service:
+            logger.warning("[PRICE MANAGER] Price service not initialized")
+            return {token['symbol']: False for token in self.token_list}
+        
+        bulk_prices = await self.fetch_bulk_prices()
+        return self.apply_bulk_prices(bulk_prices)
+    
+    async def fetch_bulk_prices(self) -> Dict[str, Optional[Decimal]]:
+        """
+        Fetch prices for all tokens in one bulk call without applying them.
         
+        Used to prefetch the next tick's prices while the current tick is
+        still reading the token list; apply_bulk_prices() installs them.
+        
+        Returns:
+            Dictionary mapping token symbols to fetched prices (None if missing),
+            or an empty dictionary if the fetch failed
+        """
         try:
             if not self._price_service:
-                logger.warning("[PRICE MANAGER] Price service not initialized")
-                return {token['symbol']: False for token in self.token_list}
+                return {}
             
             # Prepare token list for bulk fetching
             tokens_to_fetch = [
@@ -397,6 +421,28 @@ class RealPriceManager:
             self.total_api_calls += 1
             self.bulk_api_calls += 1
             
+            return bulk_prices
+            
+        except Exception as e:
+            logger.error(
+                f"[PRICE MANAGER] Bulk fetch error: {e}",
+                exc_info=True
+            )
+            return {}
+    
+    def apply_bulk_prices(self, bulk_prices: Dict[str, Optional[Decimal]]) -> Dict[str, bool]:
+        """
+        Install prices returned by fetch_bulk_prices() into the token list.
+        
+        Args:
+            bulk_prices: Dictionary mapping token symbols to prices
+            
+        Returns:
+            Dictionary mapping token symbols to update success status
+        """
+        results = {}
+        
+        try:
             # Update each token with fetched prices
             for token in self.token_list:
                 symbol = token['symbol']
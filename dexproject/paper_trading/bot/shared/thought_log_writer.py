@@ -0,0 +1,282 @@
+"""
+Thought Log Writer - Buffered AI Thought Log Persistence
+
+Queues PaperAIThoughtLog records in memory and writes them with bulk_create
+from a background worker thread, instead of one INSERT per decision on the
+tick's hot path. A batch is flushed when it reaches max_batch_size, every
+flush_interval_seconds, and on stop().
+
+Because bulk_create does not send post_save, the writer sends it for every
+written record so the dashboard's live thought feed keeps working.
+
+Backpressure: when the queue is full, low-value thoughts (HOLD/SKIP) are
+dropped and other thoughts are written synchronously by the caller.
+Low-value thoughts can also be sampled with low_value_sample_rate.
+
+File: dexproject/paper_trading/bot/shared/thought_log_writer.py
+"""
+
+import logging
+import random
+import threading
+from typing import Any, Dict, List, Optional
+
+from django.db import close_old_connections, connection
+from django.db.models.signals import post_save
+
+from paper_trading.constants import DecisionType
+from paper_trading.models import PaperAIThoughtLog
+
+logger = logging.getLogger(__name__)
+
+
+# Defaults (tuned for a 15s tick logging every analyzed token)
+DEFAULT_MAX_BATCH_SIZE = 50
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_MAX_QUEUE_SIZE = 1000
+
+# Decisions that may be sampled or dropped under backpressure
+LOW_VALUE_ACTIONS = frozenset({DecisionType.HOLD, DecisionType.SKIP})
+
+
+# =============================================================================
+# THOUGHT LOG WRITER CLASS
+# =============================================================================
+
+class ThoughtLogWriter:
+    """
+    Buffered, batched sink for AI thought logs.
+
+    Example usage:
+        writer = ThoughtLogWriter(low_value_sample_rate=0.25)
+        writer.start()
+
+        writer.submit(PaperAIThoughtLog(account=account, ...))
+
+        # On shutdown: stop the worker and flush what is left
+        writer.stop()
+
+    Without start(), full batches are written by the submitting thread.
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        low_value_sample_rate: float = 1.0
+    ) -> None:
+        """
+        Initialize the writer.
+
+        Args:
+            max_batch_size: Queue length that triggers a flush
+            flush_interval_seconds: Maximum time a record waits for a flush
+            max_queue_size: Queue length at which backpressure applies
+            low_value_sample_rate: Fraction of HOLD/SKIP thoughts kept (0-1)
+        """
+        self.max_batch_size = max_batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_queue_size = max_queue_size
+        self.low_value_sample_rate = low_value_sample_rate
+
+        self._queue: List[PaperAIThoughtLog] = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._random = random.Random()
+
+        # Metrics
+        self.submitted = 0
+        self.flushed = 0
+        self.flushes = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self.failed = 0
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the background flush worker."""
+        if self.is_running():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='thought-log-writer',
+            daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            f"[THOUGHT WRITER] Started (batch={self.max_batch_size}, "
+            f"interval={self.flush_interval_seconds}s, queue={self.max_queue_size})"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Stop the worker and flush any queued records.
+
+        Args:
+            timeout: Seconds to wait for the worker's final flush
+        """
+        if self._thread is not None:
+            self._stopping.set()
+            self._wake.set()
+            self._thread.join(timeout)
+            self._thread = None
+        # Covers a writer that was never started or a worker that timed out
+        self.flush()
+        logger.info(f"[THOUGHT WRITER] Stopped: {self.get_stats()}")
+
+    def is_running(self) -> bool:
+        """Check whether the background worker is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self) -> None:
+        """Worker loop: flush on size (wake) or time thresholds."""
+        try:
+            while not self._stopping.is_set():
+                self._wake.wait(self.flush_interval_seconds)
+                self._wake.clear()
+                self.flush()
+            self.flush()
+        finally:
+            # The worker thread owns its own DB connection
+            connection.close()
+
+    # =========================================================================
+    # SUBMISSION
+    # =========================================================================
+
+    def submit(self, thought: PaperAIThoughtLog) -> bool:
+        """
+        Queue an unsaved thought log for writing.
+
+        Args:
+            thought: Unsaved PaperAIThoughtLog instance
+
+        Returns:
+            True if queued, False if sampled out or dropped
+        """
+        low_value = thought.decision_type in LOW_VALUE_ACTIONS
+
+        if low_value and self._random.random() >= self.low_value_sample_rate:
+            with self._lock:
+                self.sampled_out += 1
+            return False
+
+        queued = batch_ready = False
+        with self._lock:
+            if len(self._queue) < self.max_queue_size:
+                self._queue.append(thought)
+                self.submitted += 1
+                queued = True
+                batch_ready = len(self._queue) >= self.max_batch_size
+            elif low_value:
+                self.dropped += 1
+
+        if not queued:
+            if low_value:
+                return False
+            # Backpressure: the producer writes the backlog before queueing more
+            logger.warning(
+                f"[THOUGHT WRITER] Queue full ({self.max_queue_size}), flushing inline"
+            )
+            self.flush()
+            with self._lock:
+                self._queue.append(thought)
+                self.submitted += 1
+            return True
+
+        if batch_ready:
+            if self.is_running():
+                self._wake.set()
+            else:
+                self.flush()
+        return True
+
+    # =========================================================================
+    # FLUSHING
+    # =========================================================================
+
+    def flush(self) -> int:
+        """
+        Write all queued records with bulk_create.
+
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            batch, self._queue = self._queue, []
+        if not batch:
+            return 0
+
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            with self._lock:
+                self.failed += len(batch)
+            logger.error(
+                f"[THOUGHT WRITER] Failed to write {len(batch)} thought logs: {e}",
+                exc_info=True
+            )
+            close_old_connections()
+            return 0
+
+        with self._lock:
+            self.flushed += len(batch)
+            self.flushes += 1
+        logger.debug(f"[THOUGHT WRITER] Flushed {len(batch)} thought logs")
+        return len(batch)
+
+    def _write_batch(self, batch: List[PaperAIThoughtLog]) -> None:
+        """
+        Insert a batch and send post_save for each record.
+
+        Args:
+            batch: Unsaved thought logs
+        """
+        PaperAIThoughtLog.objects.bulk_create(batch, batch_size=self.max_batch_size)
+
+        for thought in batch:
+            post_save.send(
+                sender=PaperAIThoughtLog,
+                instance=thought,
+                created=True,
+                update_fields=None,
+                raw=False,
+                using=thought._state.db
+            )
+
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get writer metrics.
+
+        Returns:
+            Dictionary with queue length and submitted/flushed/dropped counts
+        """
+        with self._lock:
+            stats = {
+                'pending': len(self._queue),
+                'submitted': self.submitted,
+                'flushed': self.flushed,
+                'flushes': self.flushes,
+                'dropped': self.dropped,
+                'sampled_out': self.sampled_out,
+                'failed': self.failed,
+            }
+        stats['running'] = self.is_running()
+        return stats
+
+
+__all__ = [
+    'LOW_VALUE_ACTIONS',
+    'ThoughtLogWriter',
+]
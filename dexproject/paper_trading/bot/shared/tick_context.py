@@ -0,0 +1,185 @@
+"""
+Tick Context - Per-Tick Unit of Work for the Paper Trading Bot
+
+Loads the state that every tick phase reads (account, open positions
+and strategy configuration) once at the start of a market tick, and
+collects writes that can wait until the tick is over so they are flushed
+together in one transaction. It also counts the ORM queries issued
+during the tick so the per-tick query budget can be monitored.
+
+File: dexproject/paper_trading/bot/shared/tick_context.py
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import connection, transaction
+
+from paper_trading.models import (
+    PaperPosition,
+    PaperStrategyConfiguration,
+    PaperTradingAccount
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Queries a tick without trades may issue before a warning is logged
+TICK_QUERY_BUDGET = 20
+
+
+# =============================================================================
+# TICK CONTEXT CLASS
+# =============================================================================
+
+class TickContext:
+    """
+    Snapshot and unit of work for a single market tick.
+
+    The account and strategy configuration are refreshed in place, so the
+    trade executor and helpers that share those instances see the same
+    data. Phases read open positions from the snapshot instead of querying
+    them again, and register deferred writes that flush() persists with one
+    bulk_update per field set.
+
+    Example usage:
+        context = TickContext(tick_number, account, strategy_config)
+        with context.count_queries():
+            context.refresh()
+            position_manager.set_positions(context.positions.values())
+
+        # ... tick phases read context, defer writes ...
+
+        context.flush()
+    """
+
+    def __init__(
+        self,
+        tick_number: int,
+        account: PaperTradingAccount,
+        strategy_config: Optional[PaperStrategyConfiguration] = None
+    ) -> None:
+        """
+        Initialize an empty tick context.
+
+        Args:
+            tick_number: Tick sequence number
+            account: Paper trading account (refreshed in place)
+            strategy_config: Optional strategy configuration (refreshed in place)
+        """
+        self.tick_number = tick_number
+        self.account = account
+        self.strategy_config = strategy_config
+
+        self.positions: Dict[str, PaperPosition] = {}
+
+        self.query_count = 0
+
+        # Deferred writes: field set -> positions keyed by primary key
+        self._dirty_positions: Dict[Tuple[str, ...], Dict[Any, PaperPosition]] = {}
+        self._flush_callbacks: List[Callable[[], None]] = []
+
+    def refresh(self) -> None:
+        """Load account, strategy config and open positions."""
+        self.account.refresh_from_db()
+        if self.strategy_config is not None:
+            self.strategy_config.refresh_from_db()
+
+        # Same ordering as PositionManager.load_positions()
+        self.positions = {}
+        for position in PaperPosition.objects.filter(
+            account=self.account,
+            is_open=True
+        ).order_by('-opened_at'):
+            self.positions[position.token_symbol] = position
+
+    # =========================================================================
+    # QUERY COUNTING
+    # =========================================================================
+
+    @contextmanager
+    def count_queries(self) -> Iterator[None]:
+        """
+        Count queries on this thread's connection into query_count.
+
+        Connections are per thread, so enter this in the thread that runs
+        the ORM work (e.g. inside a sync_to_async call).
+        """
+        def counter(execute: Callable, sql: str, params: Any, many: bool, context: Dict) -> Any:
+            self.query_count += 1
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(counter):
+            yield
+
+    def is_over_budget(self) -> bool:
+        """Check whether this tick exceeded TICK_QUERY_BUDGET."""
+        return self.query_count > TICK_QUERY_BUDGET
+
+    # =========================================================================
+    # DEFERRED WRITES
+    # =========================================================================
+
+    def defer_position_update(
+        self,
+        positions: Iterable[PaperPosition],
+        fields: Iterable[str]
+    ) -> None:
+        """
+        Record positions whose fields should be written at flush time.
+
+        Args:
+            positions: Positions already updated in memory
+            fields: Model fields to write
+        """
+        bucket = self._dirty_positions.setdefault(tuple(fields), {})
+        for position in positions:
+            bucket[position.pk] = position
+
+    def on_flush(self, callback: Callable[[], None]) -> None:
+        """
+        Run a callback inside the flush transaction (once per tick).
+
+        Args:
+            callback: Zero-argument callable, e.g. an account P&L update
+        """
+        if callback not in self._flush_callbacks:
+            self._flush_callbacks.append(callback)
+
+    def flush(self) -> int:
+        """
+        Persist deferred writes in a single transaction.
+
+        Positions closed during the tick are skipped; closing them already
+        saved their final values. Run it inside count_queries() so the
+        writes count towards the tick's budget.
+
+        Returns:
+            Number of position rows written
+        """
+        if not self._dirty_positions and not self._flush_callbacks:
+            return 0
+
+        written = 0
+        with transaction.atomic():
+            for fields, positions in self._dirty_positions.items():
+                still_open = [position for position in positions.values() if position.is_open]
+                if still_open:
+                    PaperPosition.objects.bulk_update(still_open, fields=list(fields))
+                    written += len(still_open)
+
+            for callback in self._flush_callbacks:
+                callback()
+
+        self._dirty_positions.clear()
+        self._flush_callbacks.clear()
+
+        logger.debug(f"[TICK {self.tick_number}] Flushed {written} deferred position updates")
+        return written
+
+
+__all__ = [
+    'TICK_QUERY_BUDGET',
+    'TickContext',
+]
@@ -15,6 +15,7 @@ from typing import Dict, Any, Optional
 from decimal import Decimal
 from datetime import datetime
 
+from channels.consumer import get_handler_name
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 from django.contrib.auth.models import User
@@ -29,10 +30,19 @@ from .models import (
     PaperStrategyConfiguration,
     PaperPerformanceMetrics
 )
+from .services.delta_stream import STREAM_UPDATE_TYPE, DeltaStream
 
 logger = logging.getLogger(__name__)
 
 
+# Delta-encoded streams per connection, with their row-keyed list fields
+STREAM_ROW_KEYS = {
+    'portfolio': {'open_positions': 'token_symbol'},
+    'account': {},
+    'positions': {'positions': 'position_id'},
+}
+
+
 class PaperTradingConsumer(AsyncWebsocketConsumer):
     """
     WebSocket consumer for real-time paper trading updates.
@@ -43,8 +53,20 @@ class PaperTradingConsumer(AsyncWebsocketConsumer):
     - Performance metrics streaming
     - AI thought process streaming
     - Bot status updates
+
+    Portfolio, account and open-position data are sent as delta streams
+    (see services.delta_stream): a snapshot first, then only what changed,
+    with a sequence number the client uses to detect gaps and resync.
     """
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the consumer and its per-connection streams."""
+        super().__init__(*args, **kwargs)
+        self.streams: Dict[str, DeltaStream] = {
+            name: DeltaStream(name, row_keys)
+            for name, row_keys in STREAM_ROW_KEYS.items()
+        }
+
     async def connect(self) -> None:
         """
         Handle WebSocket connection.
@@ -156,6 +178,9 @@ class PaperTradingConsumer(AsyncWebsocketConsumer):
             elif message_type == 'request_performance_metrics':
                 await self.send_performance_metrics()
             
+            elif message_type == 'resync':
+                await self.send_stream_snapshot(data.get('stream'))
+            
             else:
                 logger.warning(f"Unknown WebSocket message type: {message_type}")
                 await self.send_error(f"Unknown message type: {message_type}")
@@ -196,6 +221,58 @@ class PaperTradingConsumer(AsyncWebsocketConsumer):
             'timestamp': timezone.now().isoformat()
         }))
     
+    async def push_stream(
+        self,
+        name: str,
+        snapshot: Dict[str, Any],
+        reply: bool = False
+    ) -> None:
+        """
+        Send a stream's new state as a snapshot or delta frame.
+        
+        Args:
+            name: Stream name
+            snapshot: Full current state of the stream
+            reply: Answer a client request, sending an 'unchanged' frame
+                   when nothing changed instead of nothing
+        """
+        stream = self.streams[name]
+        frame = stream.encode(snapshot)
+        
+        if frame is None and reply:
+            frame = {
+                'type': STREAM_UPDATE_TYPE,
+                'stream': name,
+                'kind': 'unchanged',
+                'seq': stream.seq,
+            }
+        
+        if frame is not None:
+            await self.send(text_data=json.dumps(frame))
+    
+    async def send_stream_snapshot(self, name: Optional[str]) -> None:
+        """
+        Resend a stream's full state after the client detected a gap.
+        
+        The stored state is what the client is missing, so no query is
+        needed; a stream that has not sent anything yet is loaded first.
+        
+        Args:
+            name: Stream name
+        """
+        stream = self.streams.get(name)
+        if stream is None:
+            await self.send_error(f"Unknown stream: {name}")
+            return
+        
+        if stream.has_state():
+            await self.send(text_data=json.dumps(stream.snapshot_frame()))
+        elif name == 'account':
+            await self.send_portfolio_update()
+        elif name == 'positions':
+            await self.send_open_positions()
+        # The portfolio stream starts with the bot's next broadcast
+    
     async def send_initial_snapshot(self) -> None:
         """Send initial data snapshot after connection."""
         try:
@@ -368,6 +445,34 @@ class PaperTradingConsumer(AsyncWebsocketConsumer):
         except Exception as e:
             logger.error(f"Error sending metrics_updated: {e}", exc_info=True)
     
+    async def batch_update(self, event: Dict[str, Any]) -> None:
+        """
+        Handle a batched frame from the WebSocket fan-out.
+        
+        Dispatches each message to its own handler in order, so clients
+        receive the same messages as when they were sent one by one.
+        Messages without a handler are skipped.
+        
+        Args:
+            event: Event with 'messages', a list of channel layer messages
+        """
+        for message in event.get('messages', []):
+            try:
+                handler = getattr(self, get_handler_name(message), None)
+            except ValueError:
+                handler = None
+            if handler is None or handler == self.batch_update:
+                logger.warning(f"No handler for batched message type {message.get('type')}")
+                continue
+            
+            try:
+                await handler(message)
+            except Exception as e:
+                logger.error(
+                    f"Error handling batched {message.get('type')}: {e}",
+                    exc_info=True
+                )
+    
     # =========================================================================
     # DATA REQUEST HANDLERS - Client Requested Updates
     # =========================================================================
@@ -377,11 +482,7 @@ class PaperTradingConsumer(AsyncWebsocketConsumer):
         try:
             account_data = await self.get_account_data()
             
-            await self.send(text_data=json.dumps({
-                'type': 'portfolio_update',
-                'data': account_data,
-                'timestamp': timezone.now().isoformat()
-            }, default=str))
+            await self.push_stream('account', account_data, reply=True)
             
         except Exception as e:
             logger.error(f"Error sending portfolio update: {e}", exc_info=True)
@@ -412,11 +513,7 @@ class PaperTradingConsumer(AsyncWebsocketConsumer):
         try:
             positions = await self.get_open_positions()
             
-            await self.send(text_data=json.dumps({
-                'type': 'open_positions',
-                'data': positions,
-                'timestamp': timezone.now().isoformat()
-            }, default=str))
+            await self.push_stream('positions', {'positions': positions}, reply=True)
             
         except Exception as e:
             logger.error(f"Error sending open positions: {e}", exc_info=True)
@@ -729,7 +826,11 @@ class PaperTradingConsumer(AsyncWebsocketConsumer):
         Args:
             event: Dictionary containing portfolio data
         """
-        await self.send(text_data=json.dumps(event))
+        try:
+            await self.push_stream('portfolio', event.get('data', {}))
+            
+        except Exception as e:
+            logger.error(f"Error sending portfolio update: {e}", exc_info=True)
 
 
     async def order_update(self, event):
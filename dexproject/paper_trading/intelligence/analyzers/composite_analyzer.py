@@ -16,7 +16,7 @@ File: dexproject/paper_trading/intelligence/analyzers/composite_analyzer.py
 import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union
 
 # Import base analyzer
 from paper_trading.intelligence.analyzers.base import BaseAnalyzer
@@ -27,6 +27,7 @@ from paper_trading.intelligence.analyzers.liquidity_analyzer import RealLiquidit
 from paper_trading.intelligence.analyzers.volatility_analyzer import RealVolatilityAnalyzer
 from paper_trading.intelligence.analyzers.mev_detector import MEVThreatDetector
 from paper_trading.intelligence.analyzers.market_state import MarketStateAnalyzer
+from paper_trading.intelligence.data.price_history import PriceHistory
 
 logger = logging.getLogger(__name__)
 
@@ -66,7 +67,7 @@ class CompositeMarketAnalyzer(BaseAnalyzer):
         token_address: str,
         chain_id: int = 8453,
         trade_size_usd: Decimal = Decimal('1000'),
-        price_history: Optional[List[Dict[str, Any]]] = None,
+        price_history: Optional[Union[PriceHistory, List[Dict[str, Any]]]] = None,
         current_price: Optional[Decimal] = None,
         liquidity_usd: Optional[Decimal] = None,
         volume_24h: Optional[Decimal] = None,
@@ -86,11 +86,11 @@ class RealGasAnalyzer(BaseAnalyzer):
 
             if web3_client:
                 # Get latest block for gas price information
-                latest_block = web3_client.web3.eth.get_block('latest')
+                latest_block = await web3_client.web3.eth.get_block('latest')
 
                 # Extract gas prices (EIP-1559 format)
                 base_fee = Decimal(str(latest_block.get('baseFeePerGas', 0))) / Decimal('1e9')  # Wei to Gwei
-                gas_price = web3_client.web3.eth.gas_price
+                gas_price = await web3_client.web3.eth.gas_price
                 gas_price_gwei = Decimal(str(gas_price)) / Decimal('1e9')
 
                 # Calculate priority fee (for EIP-1559 chains)
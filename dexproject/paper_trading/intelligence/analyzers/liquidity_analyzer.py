@@ -298,7 +298,7 @@ class RealLiquidityAnalyzer(BaseAnalyzer):
                         )
                         
                         # Get pool address for this token pair and fee tier
-                        pool_address = factory_contract.functions.getPool(
+                        pool_address = await factory_contract.functions.getPool(
                             token_address_checksummed,
                             base_token_checksummed,
                             fee_tier
@@ -313,16 +313,16 @@ class RealLiquidityAnalyzer(BaseAnalyzer):
                             )
                             
                             # Get liquidity
-                            liquidity = pool_contract.functions.liquidity().call()
+                            liquidity = await pool_contract.functions.liquidity().call()
                             
                             # Get slot0 for price
-                            slot0 = pool_contract.functions.slot0().call()
+                            slot0 = await pool_contract.functions.slot0().call()
                             sqrt_price_x96 = slot0[0]
                             
                             # Get token0 and token1 from the pool
                             try:
-                                token0 = pool_contract.functions.token0().call()
-                                token1 = pool_contract.functions.token1().call()
+                                token0 = await pool_contract.functions.token0().call()
+                                token1 = await pool_contract.functions.token1().call()
                                 
                                 # Calculate actual TVL using token reserves
                                 liquidity_usd = await self._calculate_pool_tvl_usd(
@@ -442,12 +442,12 @@ class RealLiquidityAnalyzer(BaseAnalyzer):
             )
             
             # Get balances of both tokens in the pool
-            balance0 = token0_contract.functions.balanceOf(pool_address).call()
-            balance1 = token1_contract.functions.balanceOf(pool_address).call()
+            balance0 = await token0_contract.functions.balanceOf(pool_address).call()
+            balance1 = await token1_contract.functions.balanceOf(pool_address).call()
             
             # Get decimals
-            decimals0 = token0_contract.functions.decimals().call()
-            decimals1 = token1_contract.functions.decimals().call()
+            decimals0 = await token0_contract.functions.decimals().call()
+            decimals1 = await token1_contract.functions.decimals().call()
             
             # Convert to human-readable amounts
             amount0 = Decimal(str(balance0)) / Decimal(10 ** decimals0)
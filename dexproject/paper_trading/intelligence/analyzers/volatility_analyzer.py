@@ -17,10 +17,15 @@ from typing import Dict, Any, Optional, List, Union, cast
 
 # Import base analyzer and defaults
 from paper_trading.intelligence.analyzers.base import BaseAnalyzer
+from paper_trading.intelligence.data.price_history import PriceHistory
 from paper_trading.defaults import IntelligenceDefaults
 
 logger = logging.getLogger(__name__)
 
+# Annualization: returns sampled every dt seconds scale by sqrt(SECONDS_PER_YEAR / dt)
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+HOURLY_ANNUALIZATION_FACTOR = Decimal('93.6')  # sqrt(8760 hours per year)
+
 
 class RealVolatilityAnalyzer(BaseAnalyzer):
     """
@@ -57,7 +62,7 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
     async def analyze(
         self,
         token_address: str,
-        price_history: Optional[List[Dict[str, Any]]] = None,
+        price_history: Optional[Union[PriceHistory, List[Dict[str, Any]]]] = None,
         current_price: Decimal = Decimal('0'),
         **kwargs
     ) -> Dict[str, Any]:
@@ -68,7 +73,8 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
             token_address: Token contract address
             price_history: List of historical price data points
                          Each point: {'timestamp': int, 'price': Decimal}
-                         Can also accept a list of Decimal prices directly
+                         Can also accept a list of Decimal prices directly,
+                         or a PriceHistory ring buffer (O(1) statistics)
             current_price: Current token price
             **kwargs: Additional parameters
 
@@ -167,17 +173,19 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
 
     def _calculate_historical_volatility(
         self,
-        price_history: Union[List[Decimal], List[Dict[str, Any]]]
+        price_history: Union[PriceHistory, List[Decimal], List[Dict[str, Any]]]
     ) -> Decimal:
         """
         Calculate historical volatility from price data.
         
-        Handles two formats:
-        - List of Decimal prices directly
-        - List of dicts with 'price' key
+        Handles three formats:
+        - PriceHistory ring buffer (running return statistics, annualized
+          by the buffer's mean sample spacing)
+        - List of Decimal prices directly (assumed hourly)
+        - List of dicts with 'price' key (assumed hourly)
         
         Args:
-            price_history: Either list of Decimal prices or list of dicts with 'price' key
+            price_history: PriceHistory, list of Decimal prices or list of dicts with 'price' key
             
         Returns:
             Volatility as percentage (annualized)
@@ -185,6 +193,15 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
         if not price_history or len(price_history) < 2:
             return Decimal('0')  # Return 0 if insufficient data
         
+        if isinstance(price_history, PriceHistory):
+            std_dev = Decimal(repr(price_history.get_return_std()))
+            interval_seconds = price_history.get_mean_interval_seconds()
+            if interval_seconds is None:
+                annualization = HOURLY_ANNUALIZATION_FACTOR
+            else:
+                annualization = Decimal(repr(math.sqrt(SECONDS_PER_YEAR / interval_seconds)))
+            return std_dev * annualization * Decimal('100')
+        
         # Extract prices - ensure we always get List[Decimal]
         prices: List[Decimal] = []
         
@@ -223,19 +240,20 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
         
         # Annualize (assuming hourly data, convert to annual)
         # sqrt(8760 hours per year) ≈ 93.6
-        annual_volatility = std_dev * Decimal('93.6') * Decimal('100')
+        annual_volatility = std_dev * HOURLY_ANNUALIZATION_FACTOR * Decimal('100')
         
         return annual_volatility
 
     def _determine_trend(
         self,
-        price_history: Union[List[Decimal], List[Dict[str, Any]]],
+        price_history: Union[PriceHistory, List[Decimal], List[Dict[str, Any]]],
         current_price: Decimal
     ) -> str:
         """
         Determine price trend direction.
 
         Accepts either:
+        - PriceHistory (running mean),
         - List[Decimal] (prices), or
         - List[Dict[str, Any]] where each dict has key 'price'.
 
@@ -252,23 +270,28 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
         if not price_history:
             return 'neutral'
 
-        first_item = price_history[0]
-        if isinstance(first_item, dict):
-            dict_history = cast(List[Dict[str, Any]], price_history)
-            prices = [Decimal(str(point['price'])) for point in dict_history]
-        elif isinstance(first_item, Decimal):
-            decimal_history = cast(List[Decimal], price_history)
-            prices = list(decimal_history)
+        if isinstance(price_history, PriceHistory):
+            avg_price = Decimal(repr(price_history.get_mean()))
+            latest_price = price_history.latest_price
         else:
-            prices = [Decimal(str(p)) for p in price_history]
-
-        if not prices:
-            return 'neutral'
-
-        avg_price = sum(prices) / Decimal(len(prices))
+            first_item = price_history[0]
+            if isinstance(first_item, dict):
+                dict_history = cast(List[Dict[str, Any]], price_history)
+                prices = [Decimal(str(point['price'])) for point in dict_history]
+            elif isinstance(first_item, Decimal):
+                decimal_history = cast(List[Decimal], price_history)
+                prices = list(decimal_history)
+            else:
+                prices = [Decimal(str(p)) for p in price_history]
+
+            if not prices:
+                return 'neutral'
+
+            avg_price = sum(prices) / Decimal(len(prices))
+            latest_price = prices[-1]
 
         if current_price == 0:
-            current_price = prices[-1]
+            current_price = latest_price
 
         if avg_price <= 0:
             return 'neutral'
@@ -283,12 +306,13 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
 
     def _calculate_momentum(
         self,
-        price_history: Union[List[Decimal], List[Dict[str, Any]]]
+        price_history: Union[PriceHistory, List[Decimal], List[Dict[str, Any]]]
     ) -> float:
         """
         Calculate price momentum score.
 
         Accepts either:
+        - PriceHistory (oldest vs latest price),
         - List[Decimal] (prices), or
         - List[Dict[str, Any]] where each dict has key 'price'.
 
@@ -298,24 +322,28 @@ class RealVolatilityAnalyzer(BaseAnalyzer):
         if len(price_history) < 2:
             return 0.0
 
-        # Normalize to a list of Decimal prices
-        prices: List[Decimal]
-        first_item = price_history[0]
-
-        if isinstance(first_item, dict):
-            dict_history = cast(List[Dict[str, Any]], price_history)
-            prices = [Decimal(str(point['price'])) for point in dict_history]
-        elif isinstance(first_item, Decimal):
-            decimal_history = cast(List[Decimal], price_history)
-            prices = list(decimal_history)
+        if isinstance(price_history, PriceHistory):
+            first_price = price_history.oldest_price
+            last_price = price_history.latest_price
         else:
-            prices = [Decimal(str(p)) for p in price_history]
-
-        if len(prices) < 2:
-            return 0.0
-
-        first_price = prices[0]
-        last_price = prices[-1]
+            # Normalize to a list of Decimal prices
+            prices: List[Decimal]
+            first_item = price_history[0]
+
+            if isinstance(first_item, dict):
+                dict_history = cast(List[Dict[str, Any]], price_history)
+                prices = [Decimal(str(point['price'])) for point in dict_history]
+            elif isinstance(first_item, Decimal):
+                decimal_history = cast(List[Decimal], price_history)
+                prices = list(decimal_history)
+            else:
+                prices = [Decimal(str(p)) for p in price_history]
+
+            if len(prices) < 2:
+                return 0.0
+
+            first_price = prices[0]
+            last_price = prices[-1]
 
         if first_price == 0:
             return 0.0
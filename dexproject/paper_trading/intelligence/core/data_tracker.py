@@ -61,24 +61,56 @@ class DataTracker:
     def update_price_history(
         self,
         token_symbol: str,
-        current_price: Decimal
+        current_price: Decimal,
+        token_address: str = ''
     ) -> Optional[PriceHistory]:
         """
         Update price history for a token.
 
-        Note: Currently disabled due to unknown PriceHistory interface.
-        To enable: implement proper PriceHistory constructor and methods.
+        Appends to the token's ring buffer (created on first use), which
+        is also what the volatility analyzer reads.
 
         Args:
             token_symbol: Token symbol to track
             current_price: Current price to add to history
+            token_address: Token contract address (used on creation)
 
         Returns:
-            PriceHistory instance or None if disabled
+            PriceHistory instance or None if the price is unusable
         """
-        # Price history tracking disabled - interface unknown
-        # Return None to indicate no history available
-        return None
+        try:
+            if current_price is None or current_price <= 0:
+                return None
+
+            price_history = self.price_history_cache.get(token_symbol)
+            if price_history is None:
+                price_history = PriceHistory(
+                    token_address=token_address,
+                    token_symbol=token_symbol
+                )
+                self.price_history_cache[token_symbol] = price_history
+
+            price_history.append(current_price)
+            return price_history
+
+        except Exception as update_error:
+            self.logger.error(
+                f"[PRICE HISTORY] Error updating {token_symbol}: {update_error}",
+                exc_info=True
+            )
+            return None
+
+    def get_price_history(self, token_symbol: str) -> Optional[PriceHistory]:
+        """
+        Get price history for a token.
+
+        Args:
+            token_symbol: Token symbol to query
+
+        Returns:
+            PriceHistory instance or None if not tracked
+        """
+        return self.price_history_cache.get(token_symbol)
 
     def update_market_context(self, market_context: MarketContext) -> None:
         """
@@ -216,12 +248,14 @@ class DataTracker:
         try:
             if token_symbol:
                 # Clear specific token
+                self.price_history_cache.pop(token_symbol, None)
                 self.market_history.pop(token_symbol, None)
                 self.price_trends.pop(token_symbol, None)
                 self.volatility_tracker.pop(token_symbol, None)
                 self.logger.info(f"[DATA TRACKER] Cleared history for {token_symbol}")
             else:
                 # Clear all
+                self.price_history_cache.clear()
                 self.market_history.clear()
                 self.price_trends.clear()
                 self.volatility_tracker.clear()
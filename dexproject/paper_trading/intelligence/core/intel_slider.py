@@ -33,6 +33,7 @@ from paper_trading.intelligence.config.intel_config import INTEL_CONFIGS, IntelL
 from paper_trading.intelligence.analyzers import CompositeMarketAnalyzer
 from paper_trading.intelligence.strategies.decision_maker import DecisionMaker
 from paper_trading.intelligence.data.ml_features import MLFeatureCollector
+from paper_trading.intelligence.data.price_history import PriceHistory
 
 # Import type utilities
 from paper_trading.utils.type_utils import TypeConverter, MarketDataNormalizer
@@ -416,7 +417,8 @@ class IntelSliderEngine(IntelligenceEngine):
 
     async def analyze_market(
         self,
-        token_address: str
+        token_address: str,
+        price_history: Optional[PriceHistory] = None
     ) -> MarketContext:
         """
         Analyze market conditions for a token.
@@ -426,11 +428,12 @@ class IntelSliderEngine(IntelligenceEngine):
 
         Args:
             token_address: Token contract address to analyze
+            price_history: Tracked price history for volatility analysis
 
         Returns:
             Enhanced market context with analysis results
         """
-        return await self.market_analyzer.analyze_market(token_address)
+        return await self.market_analyzer.analyze_market(token_address, price_history)
 
     async def analyze(
         self,
@@ -460,8 +463,18 @@ class IntelSliderEngine(IntelligenceEngine):
                 f"(Intel Level {self.intel_level})"
             )
 
-            # Step 1: Analyze market conditions
-            enhanced_context = await self.analyze_market(market_context.token_address or "")
+            # Step 1: Record the price and analyze market conditions
+            price_history = None
+            if market_context.current_price > 0:
+                price_history = self.data_tracker.update_price_history(
+                    market_context.token_symbol,
+                    market_context.current_price,
+                    market_context.token_address or ""
+                )
+            enhanced_context = await self.analyze_market(
+                market_context.token_address or "",
+                price_history
+            )
 
             # Update enhanced_context with original context data
             if market_context.token_symbol != "UNKNOWN":
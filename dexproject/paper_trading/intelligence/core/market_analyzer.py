@@ -48,7 +48,8 @@ class MarketAnalyzer:
 
     async def analyze_market(
         self,
-        token_address: str
+        token_address: str,
+        price_history: Optional[PriceHistory] = None
     ) -> MarketContext:
         """
         Analyze market conditions for a token.
@@ -58,6 +59,7 @@ class MarketAnalyzer:
 
         Args:
             token_address: Token contract address to analyze
+            price_history: Tracked price history for volatility analysis
 
         Returns:
             Enhanced market context with analysis results
@@ -80,7 +82,9 @@ class MarketAnalyzer:
                 analysis_result = await self.composite_analyzer.analyze_comprehensive(
                     token_address=token_address,
                     chain_id=self.chain_id,
-                    trade_size_usd=Decimal('1000')
+                    trade_size_usd=Decimal('1000'),
+                    price_history=price_history,
+                    current_price=price_history.latest_price if price_history else None
                 )
             else:
                 analysis_result = await self.composite_analyzer.analyze(
@@ -93,7 +97,7 @@ class MarketAnalyzer:
                 market_context = self.enhance_context_with_analysis(
                     market_context=market_context,
                     analysis_result=analysis_result,
-                    price_history=None
+                    price_history=price_history
                 )
 
             self.logger.info(
@@ -1,212 +1,398 @@
 """
 Price History Tracking for Paper Trading Bot
 
-This module provides the PriceHistory dataclass for tracking historical
+This module provides the PriceHistory ring buffer for tracking historical
 token prices and calculating trends for improved trading decisions.
 
-File: dexproject/paper_trading/intelligence/price_history.py
+Prices and timestamps live in fixed-capacity float64 arrays. Running sums
+kept on append/evict give O(1) mean, variance and volatility (of prices
+and of tick-to-tick returns), and lookback windows use binary search on
+the monotonic timestamps.
+
+File: dexproject/paper_trading/intelligence/data/price_history.py
 """
 
 import logging
+import math
+from array import array
+from datetime import datetime, timedelta, timezone as dt_timezone
 from decimal import Decimal
-from typing import List, Optional
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from typing import Iterable, List, Optional
 
 # Django imports for timezone-aware datetimes
 from django.utils import timezone
 
+from paper_trading.defaults import IntelligenceDefaults
+
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class PriceHistory:
     """
-    Historical price data for a token.
-    
+    Historical price data for a token (fixed-capacity ring buffer).
+
     Used to track price movements and calculate trends for better
-    trading decisions.
-    
+    trading decisions. When full, appending drops the oldest price.
+
     Attributes:
         token_address: Token contract address
         token_symbol: Token symbol (e.g., 'WETH')
-        prices: List of recent prices
-        timestamps: List of timestamps when prices were fetched
+        capacity: Maximum number of prices kept
+        prices: Recent prices, oldest first (materialized list)
+        timestamps: Timestamps when prices were fetched, oldest first
     """
-    
-    token_address: str
-    token_symbol: str
-    prices: List[Decimal]
-    timestamps: List[datetime]
-    
+
+    def __init__(
+        self,
+        token_address: str,
+        token_symbol: str,
+        prices: Optional[Iterable[Decimal]] = None,
+        timestamps: Optional[Iterable[datetime]] = None,
+        capacity: int = IntelligenceDefaults.PRICE_HISTORY_SIZE
+    ) -> None:
+        """
+        Initialize the ring buffer, optionally with existing data.
+
+        Args:
+            token_address: Token contract address
+            token_symbol: Token symbol
+            prices: Optional initial prices, oldest first
+            timestamps: Optional timestamps matching prices
+            capacity: Maximum number of prices kept
+        """
+        self.token_address = token_address
+        self.token_symbol = token_symbol
+        self.capacity = max(capacity, 2)
+
+        self._prices = array('d', [0.0]) * self.capacity
+        self._times = array('d', [0.0]) * self.capacity
+        # Return from the previous price, stored in the newer price's slot
+        self._returns = array('d', [math.nan]) * self.capacity
+        self._start = 0
+        self._count = 0
+        self._latest: Optional[Decimal] = None
+
+        # Running sums of (price - shift) and tick returns
+        self._shift = 0.0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._return_count = 0
+        self._return_sum = 0.0
+        self._return_sum_sq = 0.0
+        self._evictions = 0
+
+        for price, timestamp in zip(prices or [], timestamps or []):
+            self.append(price, timestamp)
+
+    def __len__(self) -> int:
+        """Number of prices held."""
+        return self._count
+
+    # =========================================================================
+    # APPENDING
+    # =========================================================================
+
+    def append(self, price: Decimal, timestamp: Optional[datetime] = None) -> None:
+        """
+        Add a price, evicting the oldest one when full.
+
+        Timestamps must not go backwards; an earlier timestamp is clamped
+        to the latest one so lookbacks can binary-search.
+
+        Args:
+            price: Token price
+            timestamp: When the price was fetched (default: now)
+        """
+        value = float(price)
+        moment = (timestamp or timezone.now()).timestamp()
+
+        if self._count == 0:
+            self._shift = value
+        else:
+            moment = max(moment, self._times[self._slot(self._count - 1)])
+
+        if self._count == self.capacity:
+            self._evict_oldest()
+
+        previous = self._prices[self._slot(self._count - 1)] if self._count else None
+        slot = self._slot(self._count)
+        self._prices[slot] = value
+        self._times[slot] = moment
+        self._count += 1
+        self._latest = price if isinstance(price, Decimal) else Decimal(str(price))
+
+        offset = value - self._shift
+        self._sum += offset
+        self._sum_sq += offset * offset
+
+        tick_return = (value - previous) / previous if previous and previous > 0 else math.nan
+        self._returns[slot] = tick_return
+        if not math.isnan(tick_return):
+            self._return_count += 1
+            self._return_sum += tick_return
+            self._return_sum_sq += tick_return * tick_return
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest price and the return that depended on it."""
+        offset = self._prices[self._start] - self._shift
+        self._sum -= offset
+        self._sum_sq -= offset * offset
+
+        # The second-oldest price's return loses its base
+        next_slot = self._slot(1)
+        tick_return = self._returns[next_slot]
+        if not math.isnan(tick_return):
+            self._return_count -= 1
+            self._return_sum -= tick_return
+            self._return_sum_sq -= tick_return * tick_return
+            self._returns[next_slot] = math.nan
+
+        self._start = (self._start + 1) % self.capacity
+        self._count -= 1
+
+        # Recompute once per buffer turnover to bound float drift (amortized O(1))
+        self._evictions += 1
+        if self._evictions >= self.capacity:
+            self._recompute_sums()
+
+    def _recompute_sums(self) -> None:
+        """Recompute running sums exactly from the buffer."""
+        self._evictions = 0
+        self._shift = self._prices[self._start] if self._count else 0.0
+        self._sum = self._sum_sq = 0.0
+        self._return_count = 0
+        self._return_sum = self._return_sum_sq = 0.0
+
+        for index in range(self._count):
+            slot = self._slot(index)
+            offset = self._prices[slot] - self._shift
+            self._sum += offset
+            self._sum_sq += offset * offset
+            tick_return = self._returns[slot]
+            if index > 0 and not math.isnan(tick_return):
+                self._return_count += 1
+                self._return_sum += tick_return
+                self._return_sum_sq += tick_return * tick_return
+
+    def _slot(self, index: int) -> int:
+        """Array slot of the index-th oldest price."""
+        return (self._start + index) % self.capacity
+
+    # =========================================================================
+    # ACCESSORS
+    # =========================================================================
+
+    @property
+    def prices(self) -> List[Decimal]:
+        """Prices held, oldest first."""
+        return [
+            Decimal(repr(self._prices[self._slot(index)]))
+            for index in range(self._count)
+        ]
+
+    @property
+    def timestamps(self) -> List[datetime]:
+        """Timestamps held, oldest first."""
+        return [
+            datetime.fromtimestamp(self._times[self._slot(index)], tz=dt_timezone.utc)
+            for index in range(self._count)
+        ]
+
+    @property
+    def latest_price(self) -> Optional[Decimal]:
+        """Most recent price as appended, or None if empty."""
+        return self._latest
+
+    @property
+    def oldest_price(self) -> Optional[Decimal]:
+        """Oldest price held, or None if empty."""
+        if not self._count:
+            return None
+        return Decimal(repr(self._prices[self._start]))
+
+    def _index_at_or_before(self, moment: float) -> int:
+        """
+        Binary-search the newest price at or before a time.
+
+        Args:
+            moment: POSIX timestamp
+
+        Returns:
+            Index (0 = oldest) of that price, or -1 if all are newer
+        """
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._times[self._slot(middle)] <= moment:
+                low = middle + 1
+            else:
+                high = middle
+        return low - 1
+
+    # =========================================================================
+    # STATISTICS
+    # =========================================================================
+
+    def get_mean(self) -> Optional[float]:
+        """Mean price held (O(1)), or None if empty."""
+        if not self._count:
+            return None
+        return self._shift + self._sum / self._count
+
+    def get_variance(self) -> float:
+        """Population variance of the prices held (O(1))."""
+        if self._count < 2:
+            return 0.0
+        variance = (self._sum_sq - self._sum * self._sum / self._count) / self._count
+        return max(variance, 0.0)
+
+    def get_return_std(self) -> float:
+        """Population standard deviation of tick-to-tick returns (O(1))."""
+        if not self._return_count:
+            return 0.0
+        mean = self._return_sum / self._return_count
+        variance = self._return_sum_sq / self._return_count - mean * mean
+        return math.sqrt(max(variance, 0.0))
+
+    def get_mean_interval_seconds(self) -> Optional[float]:
+        """Mean spacing between consecutive prices in seconds (O(1)), or None if undefined."""
+        if self._count < 2:
+            return None
+        span = self._times[self._slot(self._count - 1)] - self._times[self._start]
+        return span / (self._count - 1) if span > 0 else None
+
     def get_price_change_percent(self, period_minutes: int = 60) -> Optional[Decimal]:
         """
         Calculate price change percentage over a time period.
-        
+
+        Compares the latest price with the newest price at or before
+        the start of the period.
+
         Args:
             period_minutes: Time period to calculate change over
-            
+
         Returns:
             Price change percentage, or None if insufficient data
         """
         try:
-            if len(self.prices) < 2:
+            if self._count < 2:
                 logger.debug(
                     f"[PRICE HISTORY] Insufficient data for {self.token_symbol} "
-                    f"(need 2+ prices, have {len(self.prices)})"
+                    f"(need 2+ prices, have {self._count})"
                 )
                 return None
-            
+
             # Find price from period_minutes ago
-            cutoff_time = timezone.now() - timedelta(minutes=period_minutes)
-            
-            for i, timestamp in enumerate(self.timestamps):
-                if timestamp <= cutoff_time:
-                    if i < len(self.prices) - 1:
-                        old_price = self.prices[i]
-                        current_price = self.prices[-1]
-                        
-                        if old_price == 0:
-                            logger.warning(
-                                f"[PRICE HISTORY] Zero old price for {self.token_symbol}"
-                            )
-                            return None
-                        
-                        change = ((current_price - old_price) / old_price) * Decimal('100')
-                        
-                        logger.debug(
-                            f"[PRICE HISTORY] {self.token_symbol} change: {change:.2f}% "
-                            f"over {period_minutes}min"
-                        )
-                        
-                        return change
-            
+            cutoff_time = (timezone.now() - timedelta(minutes=period_minutes)).timestamp()
+            index = self._index_at_or_before(cutoff_time)
+
+            if index < 0 or index >= self._count - 1:
+                logger.debug(
+                    f"[PRICE HISTORY] No price data old enough for {self.token_symbol} "
+                    f"({period_minutes}min period)"
+                )
+                return None
+
+            old_price = self._prices[self._slot(index)]
+            current_price = self._prices[self._slot(self._count - 1)]
+
+            if old_price == 0:
+                logger.warning(
+                    f"[PRICE HISTORY] Zero old price for {self.token_symbol}"
+                )
+                return None
+
+            change = Decimal(repr((current_price - old_price) / old_price * 100))
+
             logger.debug(
-                f"[PRICE HISTORY] No price data old enough for {self.token_symbol} "
-                f"({period_minutes}min period)"
+                f"[PRICE HISTORY] {self.token_symbol} change: {change:.2f}% "
+                f"over {period_minutes}min"
             )
-            return None
-            
+
+            return change
+
         except Exception as e:
             logger.error(
                 f"[PRICE HISTORY] Error calculating price change for {self.token_symbol}: {e}",
                 exc_info=True
             )
             return None
-    
+
+    def _last_three(self) -> Optional[List[float]]:
+        """Last three prices, oldest first, or None if fewer are held."""
+        if self._count < 3:
+            logger.debug(
+                f"[PRICE HISTORY] Insufficient data for trend analysis of {self.token_symbol} "
+                f"(need 3+ prices, have {self._count})"
+            )
+            return None
+        return [self._prices[self._slot(self._count - offset)] for offset in (3, 2, 1)]
+
     def is_trending_up(self) -> bool:
         """
         Check if price is in upward trend.
-        
+
         Returns:
             True if last 3 prices are increasing, False otherwise
         """
-        try:
-            if len(self.prices) < 3:
-                logger.debug(
-                    f"[PRICE HISTORY] Insufficient data for trend analysis of {self.token_symbol} "
-                    f"(need 3+ prices, have {len(self.prices)})"
-                )
-                return False
-            
-            # Simple trend: last 3 prices increasing
-            is_up = (
-                self.prices[-1] > self.prices[-2] and
-                self.prices[-2] > self.prices[-3]
-            )
-            
-            if is_up:
-                logger.debug(
-                    f"[PRICE HISTORY] {self.token_symbol} trending UP: "
-                    f"{self.prices[-3]} → {self.prices[-2]} → {self.prices[-1]}"
-                )
-            
-            return is_up
-            
-        except Exception as e:
-            logger.error(
-                f"[PRICE HISTORY] Error checking uptrend for {self.token_symbol}: {e}",
-                exc_info=True
-            )
+        last = self._last_three()
+        if last is None:
             return False
-    
+
+        # Simple trend: last 3 prices increasing
+        is_up = last[2] > last[1] > last[0]
+        if is_up:
+            logger.debug(
+                f"[PRICE HISTORY] {self.token_symbol} trending UP: "
+                f"{last[0]} → {last[1]} → {last[2]}"
+            )
+        return is_up
+
     def is_trending_down(self) -> bool:
         """
         Check if price is in downward trend.
-        
+
         Returns:
             True if last 3 prices are decreasing, False otherwise
         """
-        try:
-            if len(self.prices) < 3:
-                logger.debug(
-                    f"[PRICE HISTORY] Insufficient data for trend analysis of {self.token_symbol} "
-                    f"(need 3+ prices, have {len(self.prices)})"
-                )
-                return False
-            
-            # Simple trend: last 3 prices decreasing
-            is_down = (
-                self.prices[-1] < self.prices[-2] and
-                self.prices[-2] < self.prices[-3]
-            )
-            
-            if is_down:
-                logger.debug(
-                    f"[PRICE HISTORY] {self.token_symbol} trending DOWN: "
-                    f"{self.prices[-3]} → {self.prices[-2]} → {self.prices[-1]}"
-                )
-            
-            return is_down
-            
-        except Exception as e:
-            logger.error(
-                f"[PRICE HISTORY] Error checking downtrend for {self.token_symbol}: {e}",
-                exc_info=True
-            )
+        last = self._last_three()
+        if last is None:
             return False
-    
+
+        # Simple trend: last 3 prices decreasing
+        is_down = last[2] < last[1] < last[0]
+        if is_down:
+            logger.debug(
+                f"[PRICE HISTORY] {self.token_symbol} trending DOWN: "
+                f"{last[0]} → {last[1]} → {last[2]}"
+            )
+        return is_down
+
     def get_volatility(self) -> Decimal:
         """
         Calculate price volatility as percentage standard deviation.
-        
+
         Returns:
             Volatility as a decimal (e.g., 0.15 = 15% volatility)
         """
-        try:
-            if len(self.prices) < 2:
-                logger.debug(
-                    f"[PRICE HISTORY] Insufficient data for volatility of {self.token_symbol}"
-                )
-                return Decimal('0')
-            
-            # Calculate mean
-            mean = sum(self.prices) / len(self.prices)
-            
-            if mean == 0:
-                logger.warning(
-                    f"[PRICE HISTORY] Zero mean price for {self.token_symbol}"
-                )
-                return Decimal('0')
-            
-            # Calculate variance
-            variance = sum((p - mean) ** 2 for p in self.prices) / len(self.prices)
-            
-            # Standard deviation
-            std_dev = variance.sqrt()
-            
-            # Coefficient of variation (relative standard deviation)
-            volatility = std_dev / mean
-            
+        if self._count < 2:
             logger.debug(
-                f"[PRICE HISTORY] {self.token_symbol} volatility: {volatility:.2%}"
+                f"[PRICE HISTORY] Insufficient data for volatility of {self.token_symbol}"
             )
-            
-            return volatility
-            
-        except Exception as e:
-            logger.error(
-                f"[PRICE HISTORY] Error calculating volatility for {self.token_symbol}: {e}",
-                exc_info=True
+            return Decimal('0')
+
+        mean = self.get_mean()
+        if not mean:
+            logger.warning(
+                f"[PRICE HISTORY] Zero mean price for {self.token_symbol}"
             )
-            return Decimal('0')
\ No newline at end of file
+            return Decimal('0')
+
+        # Coefficient of variation (relative standard deviation)
+        volatility = Decimal(repr(math.sqrt(self.get_variance()) / mean))
+
+        logger.debug(
+            f"[PRICE HISTORY] {self.token_symbol} volatility: {volatility:.2%}"
+        )
+
+        return volatility
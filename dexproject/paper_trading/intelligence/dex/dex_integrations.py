@@ -483,7 +483,7 @@ class UniswapV3DEX(BaseDEX):
             )
             
             # Query pool address
-            pool_address = factory_contract.functions.getPool(
+            pool_address = await factory_contract.functions.getPool(
                 token_a,
                 token_b,
                 fee_tier
@@ -508,7 +508,7 @@ class UniswapV3DEX(BaseDEX):
             )
             
             # Query liquidity
-            liquidity = pool_contract.functions.liquidity().call()
+            liquidity = await pool_contract.functions.liquidity().call()
             
             return Decimal(str(liquidity))
         
@@ -17,7 +17,8 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 
 from django.utils import timezone
-from django.core.cache import cache
+
+from paper_trading.services.price_cache import get_price_cache
 
 # Import DEX integrations
 from paper_trading.intelligence.dex_integrations import (
@@ -508,12 +509,12 @@ class DEXPriceComparator:
     ) -> Optional[DEXPriceComparison]:
         """Get cached price comparison."""
         cache_key = self._get_cache_key(token_address)
-        return cache.get(cache_key)
+        return get_price_cache().get(cache_key)
     
     def _cache_comparison(self, comparison: DEXPriceComparison) -> None:
         """Cache price comparison result."""
         cache_key = self._get_cache_key(comparison.token_address)
-        cache.set(cache_key, comparison, self.cache_ttl)
+        get_price_cache().set(cache_key, comparison, self.cache_ttl)
     
     # =========================================================================
     # PERFORMANCE METRICS
@@ -311,7 +311,7 @@ class AerodromeDEX(BaseDEX):
             for is_stable in [False, True]:  # Try volatile, then stable
                 try:
                     # Query pair address
-                    pair_address = factory_contract.functions.getPair(
+                    pair_address = await factory_contract.functions.getPair(
                         token_address,
                         base_token,
                         is_stable
@@ -358,9 +358,9 @@ class AerodromeDEX(BaseDEX):
             )
             
             # Get base token balance in pair
-            base_balance = base_contract.functions.balanceOf(pair_address).call()
-            base_decimals = base_contract.functions.decimals().call()
-            base_symbol = base_contract.functions.symbol().call()
+            base_balance = await base_contract.functions.balanceOf(pair_address).call()
+            base_decimals = await base_contract.functions.decimals().call()
+            base_symbol = await base_contract.functions.symbol().call()
             
             # Convert to decimal amount
             base_amount = Decimal(base_balance) / Decimal(10 ** base_decimals)
@@ -406,11 +406,11 @@ class AerodromeDEX(BaseDEX):
             )
             
             # Get token0 and token1
-            token0 = pair_contract.functions.token0().call()
-            token1 = pair_contract.functions.token1().call()
+            token0 = await pair_contract.functions.token0().call()
+            token1 = await pair_contract.functions.token1().call()
             
             # Get reserves
-            reserves = pair_contract.functions.getReserves().call()
+            reserves = await pair_contract.functions.getReserves().call()
             reserve0 = Decimal(reserves[0])
             reserve1 = Decimal(reserves[1])
             
@@ -427,9 +427,9 @@ class AerodromeDEX(BaseDEX):
                 base_reserve = reserve0
             
             # Get decimals
-            token_decimals = token_contract.functions.decimals().call()
-            base_decimals = base_contract.functions.decimals().call()
-            base_symbol = base_contract.functions.symbol().call()
+            token_decimals = await token_contract.functions.decimals().call()
+            base_decimals = await base_contract.functions.decimals().call()
+            base_symbol = await base_contract.functions.symbol().call()
             
             # Convert to amounts
             token_amount = token_reserve / Decimal(10 ** token_decimals)
@@ -18,7 +18,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 
 from django.utils import timezone
-from django.core.cache import cache
+
+from paper_trading.services.price_cache import get_price_cache
 
 # Import Web3 and blockchain interaction tools
 from engine.web3_client import Web3Client
@@ -291,7 +292,7 @@ class BaseDEX(ABC):
             Cached DEXPrice object, or None if not cached or expired
         """
         cache_key = self._get_cache_key(token_address)
-        cached = cache.get(cache_key)
+        cached = get_price_cache().get(cache_key)
         
         if cached:
             self.cache_hits += 1
@@ -313,7 +314,7 @@ class BaseDEX(ABC):
         """
         if price.success and price.price_usd:
             cache_key = self._get_cache_key(token_address)
-            cache.set(cache_key, price, self.cache_ttl_seconds)
+            get_price_cache().set(cache_key, price, self.cache_ttl_seconds)
     
     # =========================================================================
     # PERFORMANCE TRACKING
@@ -257,7 +257,7 @@ class BaseSwapDEX(BaseDEX):
         for base_token in self.base_tokens:
             try:
                 # Query pair address from factory
-                pair_address = factory_contract.functions.getPair(
+                pair_address = await factory_contract.functions.getPair(
                     token_address,
                     base_token
                 ).call()
@@ -310,9 +310,9 @@ class BaseSwapDEX(BaseDEX):
             )
             
             # Get base token balance in pair
-            base_balance = base_contract.functions.balanceOf(pair_address).call()
-            base_decimals = base_contract.functions.decimals().call()
-            base_symbol = base_contract.functions.symbol().call()
+            base_balance = await base_contract.functions.balanceOf(pair_address).call()
+            base_decimals = await base_contract.functions.decimals().call()
+            base_symbol = await base_contract.functions.symbol().call()
             
             # Convert to decimal amount
             base_amount = Decimal(base_balance) / Decimal(10 ** base_decimals)
@@ -367,11 +367,11 @@ class BaseSwapDEX(BaseDEX):
             )
             
             # Get token0 and token1
-            token0 = pair_contract.functions.token0().call()
-            token1 = pair_contract.functions.token1().call()
+            token0 = await pair_contract.functions.token0().call()
+            token1 = await pair_contract.functions.token1().call()
             
             # Get reserves
-            reserves = pair_contract.functions.getReserves().call()
+            reserves = await pair_contract.functions.getReserves().call()
             reserve0 = Decimal(reserves[0])
             reserve1 = Decimal(reserves[1])
             
@@ -400,9 +400,9 @@ class BaseSwapDEX(BaseDEX):
                 base_reserve = reserve0
             
             # Get decimals
-            token_decimals = token_contract.functions.decimals().call()
-            base_decimals = base_contract.functions.decimals().call()
-            base_symbol = base_contract.functions.symbol().call()
+            token_decimals = await token_contract.functions.decimals().call()
+            base_decimals = await base_contract.functions.decimals().call()
+            base_symbol = await base_contract.functions.symbol().call()
             
             # Convert reserves to decimal amounts
             token_amount = token_reserve / Decimal(10 ** token_decimals)
@@ -328,7 +328,7 @@ class CurveDEX(BaseDEX):
         for stable_address in self.stablecoins:
             try:
                 # Find pool for this pair (try both directions)
-                pool_address = registry_contract.functions.find_pool_for_coins(
+                pool_address = await registry_contract.functions.find_pool_for_coins(
                     token_address,
                     stable_address,
                     0  # First pool found
@@ -337,7 +337,7 @@ class CurveDEX(BaseDEX):
                 # Check if pool exists
                 if not pool_address or pool_address == '0x' + '0' * 40:
                     # Try reverse direction
-                    pool_address = registry_contract.functions.find_pool_for_coins(
+                    pool_address = await registry_contract.functions.find_pool_for_coins(
                         stable_address,
                         token_address,
                         0
@@ -394,8 +394,8 @@ class CurveDEX(BaseDEX):
             
             for i in range(8):  # Max 8 coins in Curve pool
                 try:
-                    coin = pool_contract.functions.coins(i).call()
-                    balance = pool_contract.functions.balances(i).call()
+                    coin = await pool_contract.functions.coins(i).call()
+                    balance = await pool_contract.functions.balances(i).call()
                     
                     if coin.lower() == token_address.lower():
                         token_idx = i
@@ -449,13 +449,13 @@ class CurveDEX(BaseDEX):
                 address=token_address,
                 abi=ERC20_ABI
             )
-            token_decimals = token_contract.functions.decimals().call()
+            token_decimals = await token_contract.functions.decimals().call()
             
             # Calculate exchange rate using get_dy
             # How much stable do we get for 1 token?
             one_token = 10 ** token_decimals
             
-            stable_out = pool_contract.functions.get_dy(
+            stable_out = await pool_contract.functions.get_dy(
                 token_idx,
                 stable_idx,
                 one_token
@@ -466,7 +466,7 @@ class CurveDEX(BaseDEX):
                 address=stable_address,
                 abi=ERC20_ABI
             )
-            stable_decimals = stable_contract.functions.decimals().call()
+            stable_decimals = await stable_contract.functions.decimals().call()
             
             # Price = stable_out / 10^stable_decimals (since stables = $1.00)
             price_usd = Decimal(stable_out) / Decimal(10 ** stable_decimals)
@@ -475,15 +475,15 @@ class CurveDEX(BaseDEX):
             total_liquidity = Decimal('0')
             for i in range(8):
                 try:
-                    balance = pool_contract.functions.balances(i).call()
-                    coin = pool_contract.functions.coins(i).call()
+                    balance = await pool_contract.functions.balances(i).call()
+                    coin = await pool_contract.functions.coins(i).call()
                     
                     # Get coin decimals
                     coin_contract = self.web3_client.web3.eth.contract(
                         address=coin,
                         abi=ERC20_ABI
                     )
-                    decimals = coin_contract.functions.decimals().call()
+                    decimals = await coin_contract.functions.decimals().call()
                     
                     # If it's a stablecoin, add to liquidity
                     if coin.lower() in self.stablecoins:
@@ -494,7 +494,7 @@ class CurveDEX(BaseDEX):
             
             # If no stablecoin balances found, use stable balance * 2
             if total_liquidity == 0:
-                stable_balance = pool_contract.functions.balances(stable_idx).call()
+                stable_balance = await pool_contract.functions.balances(stable_idx).call()
                 total_liquidity = (Decimal(stable_balance) / Decimal(10 ** stable_decimals)) * Decimal('2')
             
             return price_usd, total_liquidity
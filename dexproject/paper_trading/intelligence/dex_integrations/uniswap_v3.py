@@ -253,7 +253,7 @@ class UniswapV3DEX(BaseDEX):
             )
             
             # Query pool address
-            pool_address = factory_contract.functions.getPool(
+            pool_address = await factory_contract.functions.getPool(
                 token_a,
                 token_b,
                 fee_tier
@@ -278,7 +278,7 @@ class UniswapV3DEX(BaseDEX):
             )
             
             # Query liquidity
-            liquidity = pool_contract.functions.liquidity().call()
+            liquidity = await pool_contract.functions.liquidity().call()
             
             return Decimal(str(liquidity))
         
@@ -320,8 +320,8 @@ class UniswapV3DEX(BaseDEX):
             )
             
             # Get token0 and token1
-            token0 = pool_contract.functions.token0().call()
-            token1 = pool_contract.functions.token1().call()
+            token0 = await pool_contract.functions.token0().call()
+            token1 = await pool_contract.functions.token1().call()
             
             # Determine which is our target token
             is_token0 = token0.lower() == token_address.lower()
@@ -337,12 +337,12 @@ class UniswapV3DEX(BaseDEX):
             )
             
             # Get token reserves (balances in pool)
-            token_balance = token_contract.functions.balanceOf(pool_address).call()
-            base_balance = base_contract.functions.balanceOf(pool_address).call()
+            token_balance = await token_contract.functions.balanceOf(pool_address).call()
+            base_balance = await base_contract.functions.balanceOf(pool_address).call()
             
             # Get decimals
-            token_decimals = token_contract.functions.decimals().call()
-            base_decimals = base_contract.functions.decimals().call()
+            token_decimals = await token_contract.functions.decimals().call()
+            base_decimals = await base_contract.functions.decimals().call()
             
             # Convert to decimal amounts
             token_amount = Decimal(token_balance) / Decimal(10 ** token_decimals)
@@ -365,11 +365,11 @@ class UniswapV3DEX(BaseDEX):
             base_token_lower = base_token_address.lower()
             
             # Simple USD conversion (can be enhanced with oracle prices)
-            if 'usdc' in str(base_contract.functions.symbol().call()).lower():
+            if 'usdc' in str(await base_contract.functions.symbol().call()).lower():
                 price_usd = price_in_base
-            elif 'usdt' in str(base_contract.functions.symbol().call()).lower():
+            elif 'usdt' in str(await base_contract.functions.symbol().call()).lower():
                 price_usd = price_in_base
-            elif 'dai' in str(base_contract.functions.symbol().call()).lower():
+            elif 'dai' in str(await base_contract.functions.symbol().call()).lower():
                 price_usd = price_in_base
             else:
                 # Assume WETH at $3000
@@ -377,9 +377,9 @@ class UniswapV3DEX(BaseDEX):
             
             # Calculate liquidity in USD
             # Liquidity = 2 * base_token_value (for symmetric pools)
-            if 'usdc' in str(base_contract.functions.symbol().call()).lower() or \
-               'usdt' in str(base_contract.functions.symbol().call()).lower() or \
-               'dai' in str(base_contract.functions.symbol().call()).lower():
+            if 'usdc' in str(await base_contract.functions.symbol().call()).lower() or \
+               'usdt' in str(await base_contract.functions.symbol().call()).lower() or \
+               'dai' in str(await base_contract.functions.symbol().call()).lower():
                 liquidity_usd = base_amount * Decimal('2')
             else:
                 # WETH pool
@@ -105,6 +105,12 @@ class Command(BaseCommand):
             help='Run bot in background using Celery (optional)'
         )
 
+        parser.add_argument(
+            '--async-loop',
+            action='store_true',
+            help='Run ticks on a single asyncio event loop with overlapped phases'
+        )
+
         parser.add_argument(
             '--session-name',
             type=str,
@@ -263,7 +269,10 @@ class Command(BaseCommand):
                 session = bot.session
 
                 # Run the bot (this blocks until stopped)
-                bot.run()
+                if options['async_loop']:
+                    bot.run_async()
+                else:
+                    bot.run()
 
                 # Get final session state
                 session = bot.session
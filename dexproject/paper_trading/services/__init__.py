@@ -22,6 +22,14 @@ from .price_feed_service import (
     get_default_price_feed_service,
     get_bulk_token_prices_simple,
 )
+from .price_cache import (
+    PriceCache,
+    get_price_cache,
+)
+from .price_feed_client import (
+    PriceFeedClient,
+    get_price_feed_client,
+)
 
 # Import simulator components
 from .simulator import (
@@ -62,6 +70,10 @@ __all__ = [
     'PriceFeedService',
     'get_default_price_feed_service',
     'get_bulk_token_prices_simple',
+    'PriceFeedClient',
+    'get_price_feed_client',
+    'PriceCache',
+    'get_price_cache',
     
     # Simulator Service
     'SimplePaperTradingSimulator',
@@ -0,0 +1,197 @@
+"""
+Delta Stream Encoding for Dashboard WebSocket Updates
+
+Encodes successive snapshots of one dashboard stream (portfolio, account,
+open positions) as a versioned snapshot-plus-delta protocol. The consumer
+keeps one DeltaStream per stream and connection, i.e. the last state sent
+to that client, and pushes only what changed:
+
+    {'type': 'stream_update', 'stream': 'portfolio', 'kind': 'snapshot',
+     'seq': 1, 'row_keys': {'open_positions': 'token_symbol'}, 'data': {...}}
+
+    {'type': 'stream_update', 'stream': 'portfolio', 'kind': 'delta',
+     'seq': 2, 'base_seq': 1, 'changed': {...}, 'removed': [...],
+     'rows': {'open_positions': {'upsert': [...], 'removed': [...], 'order': [...]}}}
+
+List fields named in row_keys are diffed row by row (rows are matched on
+their key field); other fields are compared as whole values. A client
+whose seq does not match a delta's base_seq has missed a frame and asks
+for a resync, which is answered from the stored state.
+
+File: dexproject/paper_trading/services/delta_stream.py
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+STREAM_UPDATE_TYPE = 'stream_update'
+
+
+# =============================================================================
+# DELTA STREAM CLASS
+# =============================================================================
+
+class DeltaStream:
+    """
+    Last-sent state and sequence number of one stream for one client.
+
+    Example usage:
+        stream = DeltaStream('positions', row_keys={'positions': 'position_id'})
+
+        frame = stream.encode({'positions': rows})   # snapshot, then deltas
+        if frame:
+            await consumer.send(text_data=json.dumps(frame))
+
+        # Client reported a gap
+        frame = stream.snapshot_frame()
+    """
+
+    def __init__(self, name: str, row_keys: Optional[Dict[str, str]] = None) -> None:
+        """
+        Initialize an empty stream.
+
+        Args:
+            name: Stream name sent to the client
+            row_keys: List fields diffed per row, mapped to their row key field
+        """
+        self.name = name
+        self.row_keys = row_keys or {}
+        self.seq = 0
+        self.state: Optional[Dict[str, Any]] = None
+
+    def has_state(self) -> bool:
+        """Check whether a snapshot has been sent."""
+        return self.state is not None
+
+    def encode(self, snapshot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Encode a new snapshot against the last state sent.
+
+        Args:
+            snapshot: Full current state of the stream
+
+        Returns:
+            Snapshot frame (first call), delta frame, or None if nothing changed
+        """
+        # Compare in JSON form, as the client sees it
+        snapshot = json.loads(json.dumps(snapshot, default=str))
+
+        if self.state is None:
+            self.state = snapshot
+            self.seq += 1
+            return self.snapshot_frame()
+
+        delta = self._diff(self.state, snapshot)
+        if delta is None:
+            return None
+
+        self.state = snapshot
+        self.seq += 1
+        return {
+            'type': STREAM_UPDATE_TYPE,
+            'stream': self.name,
+            'kind': 'delta',
+            'seq': self.seq,
+            'base_seq': self.seq - 1,
+            **delta
+        }
+
+    def snapshot_frame(self) -> Dict[str, Any]:
+        """
+        Build a snapshot frame of the stored state at the current seq.
+
+        Returns:
+            Snapshot frame
+        """
+        return {
+            'type': STREAM_UPDATE_TYPE,
+            'stream': self.name,
+            'kind': 'snapshot',
+            'seq': self.seq,
+            'row_keys': self.row_keys,
+            'data': self.state,
+        }
+
+    # =========================================================================
+    # DIFFING
+    # =========================================================================
+
+    def _diff(
+        self,
+        old: Dict[str, Any],
+        new: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Diff two snapshots.
+
+        Args:
+            old: Last state sent
+            new: Current state
+
+        Returns:
+            Dictionary with changed, removed and rows entries, or None if equal
+        """
+        changed = {
+            key: value for key, value in new.items()
+            if key not in self.row_keys and (key not in old or old[key] != value)
+        }
+        removed = [key for key in old if key not in new]
+
+        rows = {}
+        for field, row_key in self.row_keys.items():
+            if field not in new:
+                continue
+            field_delta = self._diff_rows(old.get(field) or [], new[field] or [], row_key)
+            if field_delta:
+                rows[field] = field_delta
+
+        if not (changed or removed or rows):
+            return None
+        return {'changed': changed, 'removed': removed, 'rows': rows}
+
+    @staticmethod
+    def _diff_rows(
+        old_rows: List[Dict[str, Any]],
+        new_rows: List[Dict[str, Any]],
+        row_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Diff two row lists matched on row_key.
+
+        Args:
+            old_rows: Rows last sent
+            new_rows: Current rows
+            row_key: Field identifying a row
+
+        Returns:
+            Dictionary with upsert rows, removed keys and (if the client
+            cannot derive it) the new key order, or None if equal
+        """
+        old_by_key = {row.get(row_key): row for row in old_rows}
+        new_keys = [row.get(row_key) for row in new_rows]
+        new_key_set = set(new_keys)
+
+        upsert = [row for row in new_rows if old_by_key.get(row.get(row_key)) != row]
+        removed = [key for key in old_by_key if key not in new_key_set]
+
+        # Clients drop removed rows and append new ones; anything else needs 'order'
+        applied_order = (
+            [key for key in old_by_key if key in new_key_set]
+            + [key for key in new_keys if key not in old_by_key]
+        )
+        reordered = applied_order != new_keys
+
+        if not (upsert or removed or reordered):
+            return None
+
+        delta: Dict[str, Any] = {'upsert': upsert, 'removed': removed}
+        if reordered:
+            delta['order'] = new_keys
+        return delta
+
+
+__all__ = [
+    'STREAM_UPDATE_TYPE',
+    'DeltaStream',
+]
@@ -0,0 +1,284 @@
+"""
+Two-Level Price Cache
+
+Small in-process L1 cache in front of the Django cache backend (Redis in
+production, the L2). The L1 keeps decoded values (e.g. Decimal prices)
+for a sub-second TTL in a bounded LRU, so repeated reads within a tick or
+across components in the same process (bot, order monitor, DEX
+comparator) skip the Redis round trip and the float -> Decimal
+conversion. L2 reads and writes are batched with get_many/set_many.
+
+File: dexproject/paper_trading/services/price_cache.py
+"""
+
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+# L1 entry lifetime (seconds) and size bound
+DEFAULT_L1_TTL_SECONDS = float(getattr(settings, 'PRICE_L1_CACHE_TTL_SECONDS', 0.5))
+DEFAULT_L1_MAX_ENTRIES = int(getattr(settings, 'PRICE_L1_CACHE_MAX_ENTRIES', 2048))
+
+
+def _detach(value: Any) -> Any:
+    """Shallow-copy mutable containers so callers never share an L1 entry."""
+    if isinstance(value, (dict, list, set)):
+        return copy.copy(value)
+    return value
+
+
+# =============================================================================
+# PRICE CACHE CLASS
+# =============================================================================
+
+class PriceCache:
+    """
+    Bounded, short-lived L1 cache over the Django cache backend.
+
+    Example usage:
+        price_cache = get_price_cache()
+
+        prices = price_cache.get_many(keys, decode=lambda value: Decimal(str(value)))
+        price_cache.set_many({key: price}, timeout=60, encode=float)
+    """
+
+    def __init__(
+        self,
+        l1_ttl_seconds: float = DEFAULT_L1_TTL_SECONDS,
+        l1_max_entries: int = DEFAULT_L1_MAX_ENTRIES,
+        backend: Optional[Any] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            l1_ttl_seconds: How long an L1 entry is served
+            l1_max_entries: L1 size; least recently used entries are evicted
+            backend: L2 cache (default: Django's default cache)
+            clock: Monotonic clock in seconds
+        """
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.l1_max_entries = l1_max_entries
+        self.backend = backend if backend is not None else cache
+        self._clock = clock
+
+        # Key -> (expires_at, value)
+        self._l1: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.l1_hits = 0
+        self.l1_misses = 0
+        self.l2_hits = 0
+        self.l2_misses = 0
+
+    # =========================================================================
+    # READS
+    # =========================================================================
+
+    def get_many(
+        self,
+        keys: Iterable[str],
+        decode: Optional[Callable[[Any], Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get cached values, reading L2 once for all L1 misses.
+
+        Args:
+            keys: Cache keys
+            decode: Converts an L2 value before it is returned and kept in L1
+
+        Returns:
+            Dictionary of found keys to values (misses are omitted)
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, Any] = {}
+        missing = []
+
+        now = self._clock()
+        with self._lock:
+            for key in keys:
+                entry = self._l1.get(key)
+                if entry is not None and entry[0] > now:
+                    self._l1.move_to_end(key)
+                    found[key] = _detach(entry[1])
+                else:
+                    if entry is not None:
+                        del self._l1[key]
+                    missing.append(key)
+            self.l1_hits += len(found)
+            self.l1_misses += len(missing)
+
+        if not missing:
+            return found
+
+        try:
+            l2_values = self.backend.get_many(missing)
+        except Exception as e:
+            logger.warning(f"[PRICE CACHE] L2 read failed for {len(missing)} keys: {e}")
+            return found
+
+        decoded = {
+            key: decode(value) if decode else value
+            for key, value in l2_values.items()
+            if value is not None
+        }
+        with self._lock:
+            self.l2_hits += len(decoded)
+            self.l2_misses += len(missing) - len(decoded)
+        self._store_l1(decoded)
+
+        found.update(decoded)
+        return found
+
+    def get(self, key: str, decode: Optional[Callable[[Any], Any]] = None) -> Optional[Any]:
+        """
+        Get one cached value.
+
+        Args:
+            key: Cache key
+            decode: Converts an L2 value before it is returned and kept in L1
+
+        Returns:
+            Cached value or None
+        """
+        return self.get_many([key], decode).get(key)
+
+    # =========================================================================
+    # WRITES
+    # =========================================================================
+
+    def set_many(
+        self,
+        values: Dict[str, Any],
+        timeout: int,
+        encode: Optional[Callable[[Any], Any]] = None
+    ) -> None:
+        """
+        Store values in L1 and, in one call, in L2.
+
+        Args:
+            values: Keys to values (as returned by get_many)
+            timeout: L2 TTL in seconds
+            encode: Converts a value before it is written to L2
+        """
+        if not values:
+            return
+
+        self._store_l1(values, ttl_seconds=min(self.l1_ttl_seconds, timeout))
+
+        try:
+            self.backend.set_many(
+                {key: encode(value) if encode else value for key, value in values.items()},
+                timeout=timeout
+            )
+        except Exception as e:
+            logger.warning(f"[PRICE CACHE] L2 write failed for {len(values)} keys: {e}")
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        timeout: int,
+        encode: Optional[Callable[[Any], Any]] = None
+    ) -> None:
+        """
+        Store one value in L1 and L2.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            timeout: L2 TTL in seconds
+            encode: Converts the value before it is written to L2
+        """
+        self.set_many({key: value}, timeout, encode)
+
+    def clear_l1(self) -> None:
+        """Drop all L1 entries (L2 is untouched)."""
+        with self._lock:
+            self._l1.clear()
+
+    def _store_l1(self, values: Dict[str, Any], ttl_seconds: Optional[float] = None) -> None:
+        """
+        Put values in L1, evicting least recently used entries over the bound.
+
+        Args:
+            values: Keys to values
+            ttl_seconds: Entry lifetime (default: l1_ttl_seconds)
+        """
+        if not values:
+            return
+
+        expires_at = self._clock() + (self.l1_ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            for key, value in values.items():
+                self._l1[key] = (expires_at, _detach(value))
+                self._l1.move_to_end(key)
+            while len(self._l1) > self.l1_max_entries:
+                self._l1.popitem(last=False)
+
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-tier hit statistics.
+
+        L2 rates are over L1 misses, i.e. the reads that reached L2.
+
+        Returns:
+            Dictionary with hit/miss counts and hit rates per tier
+        """
+        with self._lock:
+            l1_total = self.l1_hits + self.l1_misses
+            l2_total = self.l2_hits + self.l2_misses
+            return {
+                'l1_hits': self.l1_hits,
+                'l1_misses': self.l1_misses,
+                'l1_hit_rate_percent': round(self.l1_hits / l1_total * 100, 2) if l1_total else 0,
+                'l1_entries': len(self._l1),
+                'l1_ttl_seconds': self.l1_ttl_seconds,
+                'l2_hits': self.l2_hits,
+                'l2_misses': self.l2_misses,
+                'l2_hit_rate_percent': round(self.l2_hits / l2_total * 100, 2) if l2_total else 0,
+            }
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_price_cache: Optional[PriceCache] = None
+_price_cache_lock = threading.Lock()
+
+
+def get_price_cache() -> PriceCache:
+    """
+    Get the process-wide two-level price cache.
+
+    Returns:
+        Shared PriceCache instance
+    """
+    global _price_cache
+
+    with _price_cache_lock:
+        if _price_cache is None:
+            _price_cache = PriceCache()
+        return _price_cache
+
+
+__all__ = [
+    'PriceCache',
+    'get_price_cache',
+]
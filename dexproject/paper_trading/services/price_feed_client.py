@@ -0,0 +1,446 @@
+"""
+Shared CoinGecko Price Feed Client
+
+Process-wide HTTP client behind every PriceFeedService. It owns one
+aiohttp session (and its connection pool) on a persistent event loop
+thread, so connections survive across services, bot ticks and Celery
+task runs regardless of which loop or thread the caller is on.
+
+Requests are paced by a token bucket instead of a fixed sleep, and all
+price requests made within a short window are merged into bulk
+/simple/price calls: concurrent callers asking for overlapping coins
+share one upstream request.
+
+File: dexproject/paper_trading/services/price_feed_client.py
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import aiohttp
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
+
+# CoinGecko free tier: about one call per 1.5s, with a small burst
+DEFAULT_RATE_PER_SECOND = float(getattr(settings, 'COINGECKO_RATE_LIMIT_PER_SECOND', 1 / 1.5))
+DEFAULT_BURST = int(getattr(settings, 'COINGECKO_RATE_LIMIT_BURST', 3))
+
+# How long requests are collected before one bulk call is made (seconds)
+DEFAULT_MERGE_WINDOW_SECONDS = 0.05
+
+# Coin ids per /simple/price call
+MAX_IDS_PER_REQUEST = 250
+
+# Connection pool and request timeout
+DEFAULT_POOL_SIZE = 10
+DEFAULT_REQUEST_TIMEOUT_SECONDS = 10
+
+
+# =============================================================================
+# TOKEN BUCKET RATE LIMITER
+# =============================================================================
+
+class TokenBucket:
+    """
+    Token bucket rate limiter for an asyncio event loop.
+
+    Holds up to capacity tokens, refilled at rate_per_second; each request
+    takes one token and waits only as long as the next token needs.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: int,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate_per_second: Token refill rate
+            capacity: Maximum tokens (burst size)
+            clock: Monotonic clock in seconds
+        """
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+        # Metrics
+        self.waits = 0
+        self.waited_seconds = 0.0
+
+    def reserve(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, else seconds until one is available
+        """
+        now = self._clock()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate_per_second
+        )
+        self._updated = now
+
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate_per_second
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                wait = self.reserve()
+                if wait <= 0:
+                    return
+                self.waits += 1
+                self.waited_seconds += wait
+                logger.debug(f"[RATE LIMIT] Waiting {wait:.2f}s for a CoinGecko token")
+                await asyncio.sleep(wait)
+
+
+# =============================================================================
+# PRICE FEED CLIENT CLASS
+# =============================================================================
+
+class PriceFeedClient:
+    """
+    Process-wide CoinGecko client with request merging.
+
+    Example usage:
+        client = get_price_feed_client()
+
+        # From any event loop
+        prices = await client.get_prices(['ethereum', 'chainlink'])
+        # Returns: {'ethereum': Decimal('2543.50'), 'chainlink': Decimal('14.20')}
+
+        # From sync code (e.g. a Celery task)
+        result = client.run(service.get_bulk_token_prices(tokens))
+    """
+
+    def __init__(
+        self,
+        base_url: str = COINGECKO_API_BASE,
+        api_key: Optional[str] = None,
+        rate_per_second: float = DEFAULT_RATE_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        merge_window_seconds: float = DEFAULT_MERGE_WINDOW_SECONDS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        request_timeout_seconds: float = DEFAULT_REQUEST_TIMEOUT_SECONDS
+    ) -> None:
+        """
+        Initialize the client; the loop thread and session start on first use.
+
+        Args:
+            base_url: CoinGecko API base URL
+            api_key: Optional CoinGecko demo API key
+            rate_per_second: Upstream calls per second (token refill rate)
+            burst: Upstream calls allowed back to back
+            merge_window_seconds: How long requests are collected per bulk call
+            pool_size: Maximum open connections
+            request_timeout_seconds: Total timeout per upstream call
+        """
+        self.base_url = base_url
+        self.api_key = api_key
+        self.merge_window_seconds = merge_window_seconds
+        self.pool_size = pool_size
+        self.request_timeout_seconds = request_timeout_seconds
+        self.rate_limiter = TokenBucket(rate_per_second, burst)
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Coin id -> future, owned by the client loop
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        # Metrics
+        self.requests = 0
+        self.coins_requested = 0
+        self.merged = 0
+        self.upstream_calls = 0
+        self.upstream_errors = 0
+
+    # =========================================================================
+    # PUBLIC API
+    # =========================================================================
+
+    async def get_prices(self, coin_ids: Iterable[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Get USD prices for CoinGecko coin ids.
+
+        Can be awaited from any event loop; the request runs on the
+        client loop and is merged with other pending requests.
+
+        Args:
+            coin_ids: CoinGecko coin ids
+
+        Returns:
+            Dictionary mapping coin ids to prices (None if unavailable)
+        """
+        coin_ids = list(dict.fromkeys(coin_ids))
+        if not coin_ids:
+            return {}
+
+        loop = self._get_loop()
+        try:
+            on_client_loop = asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_client_loop = False
+
+        if on_client_loop:
+            return await self._request(coin_ids)
+        return await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._request(coin_ids), loop)
+        )
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the client loop from sync code and wait for it.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Result of the coroutine
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """
+        Close the session and stop the client loop.
+
+        Args:
+            timeout: Seconds to wait for the loop thread
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(self._close_session(), loop).result(timeout)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    # =========================================================================
+    # CLIENT LOOP
+    # =========================================================================
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the client loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever,
+                    name='price-feed-client',
+                    daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on the client loop."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout_seconds),
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ttl_dns_cache=300)
+            )
+            logger.debug(f"[PRICE CLIENT] Created pooled session (limit={self.pool_size})")
+        return self._session
+
+    async def _close_session(self) -> None:
+        """Cancel pending requests and close the session."""
+        for future in list(self._pending.values()) + list(self._in_flight.values()):
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    # =========================================================================
+    # REQUEST MERGING
+    # =========================================================================
+
+    async def _request(self, coin_ids: List[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Attach coin ids to the pending bulk call and wait for their prices.
+
+        Coins already pending or in flight share the existing request.
+
+        Args:
+            coin_ids: Unique CoinGecko coin ids
+
+        Returns:
+            Dictionary mapping coin ids to prices
+        """
+        loop = asyncio.get_running_loop()
+        start_window = not self._pending
+
+        futures: Dict[str, asyncio.Future] = {}
+        for coin_id in coin_ids:
+            future = self._pending.get(coin_id) or self._in_flight.get(coin_id)
+            if future is None:
+                future = self._pending[coin_id] = loop.create_future()
+            else:
+                self.merged += 1
+            futures[coin_id] = future
+
+        self.requests += 1
+        self.coins_requested += len(coin_ids)
+
+        if start_window and self._pending:
+            loop.create_task(self._flush_after_window())
+
+        # Shielded: a cancelled caller must not cancel futures other callers share
+        results = await asyncio.gather(*(asyncio.shield(future) for future in futures.values()))
+        return dict(zip(futures.keys(), results))
+
+    async def _flush_after_window(self) -> None:
+        """Collect requests for the merge window, then fetch them in bulk."""
+        if self.merge_window_seconds > 0:
+            await asyncio.sleep(self.merge_window_seconds)
+
+        batch, self._pending = self._pending, {}
+        self._in_flight.update(batch)
+
+        coin_ids = list(batch)
+        try:
+            for start in range(0, len(coin_ids), MAX_IDS_PER_REQUEST):
+                chunk = coin_ids[start:start + MAX_IDS_PER_REQUEST]
+                prices = await self._fetch_upstream(chunk)
+                for coin_id in chunk:
+                    if not batch[coin_id].done():
+                        batch[coin_id].set_result(prices.get(coin_id))
+        finally:
+            for coin_id, future in batch.items():
+                if not future.done():
+                    future.set_result(None)
+                self._in_flight.pop(coin_id, None)
+
+    async def _fetch_upstream(self, coin_ids: List[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Make one rate-limited /simple/price call.
+
+        Args:
+            coin_ids: CoinGecko coin ids (at most MAX_IDS_PER_REQUEST)
+
+        Returns:
+            Dictionary mapping coin ids to prices; empty on failure
+        """
+        await self.rate_limiter.acquire()
+
+        url = f"{self.base_url}/simple/price"
+        params = {'ids': ','.join(coin_ids), 'vs_currencies': 'usd'}
+        headers: Dict[str, str] = {}
+        if self.api_key:
+            headers['x-cg-demo-api-key'] = self.api_key
+
+        self.upstream_calls += 1
+        try:
+            async with self._get_session().get(url, params=params, headers=headers) as response:
+                if response.status == 429:
+                    self.upstream_errors += 1
+                    logger.warning("[PRICE CLIENT] CoinGecko rate limit exceeded")
+                    return {}
+                if response.status != 200:
+                    self.upstream_errors += 1
+                    logger.warning(f"[PRICE CLIENT] CoinGecko API error: {response.status}")
+                    return {}
+
+                data = await response.json()
+
+        except asyncio.TimeoutError:
+            self.upstream_errors += 1
+            logger.warning(f"[PRICE CLIENT] CoinGecko timeout for {len(coin_ids)} coins")
+            return {}
+        except Exception as e:
+            self.upstream_errors += 1
+            logger.error(f"[PRICE CLIENT] CoinGecko request failed: {e}", exc_info=True)
+            return {}
+
+        prices: Dict[str, Optional[Decimal]] = {}
+        for coin_id in coin_ids:
+            entry = data.get(coin_id)
+            if entry and 'usd' in entry:
+                prices[coin_id] = Decimal(str(entry['usd']))
+        logger.debug(
+            f"[PRICE CLIENT] Bulk call returned {len(prices)}/{len(coin_ids)} prices"
+        )
+        return prices
+
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get client metrics.
+
+        Returns:
+            Dictionary with request, merge, upstream call and rate-limit counts
+        """
+        return {
+            'requests': self.requests,
+            'coins_requested': self.coins_requested,
+            'merged': self.merged,
+            'upstream_calls': self.upstream_calls,
+            'upstream_errors': self.upstream_errors,
+            'rate_limit_waits': self.rate_limiter.waits,
+            'rate_limit_waited_seconds': round(self.rate_limiter.waited_seconds, 2),
+        }
+
+
+# =============================================================================
+# SHARED INSTANCE
+# =============================================================================
+
+_price_feed_client: Optional[PriceFeedClient] = None
+_price_feed_client_lock = threading.Lock()
+
+
+def get_price_feed_client() -> PriceFeedClient:
+    """
+    Get the process-wide price feed client.
+
+    Returns:
+        Shared PriceFeedClient instance
+    """
+    global _price_feed_client
+
+    with _price_feed_client_lock:
+        if _price_feed_client is None:
+            _price_feed_client = PriceFeedClient(
+                api_key=getattr(settings, 'COIN_GECKO_API_KEY', None)
+            )
+            logger.info("[PRICE CLIENT] Created shared CoinGecko client")
+        return _price_feed_client
+
+
+__all__ = [
+    'TokenBucket',
+    'PriceFeedClient',
+    'get_price_feed_client',
+]
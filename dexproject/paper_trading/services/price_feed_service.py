@@ -1,1029 +1,965 @@
-"""
-OPTIMIZED Real Price Feed Service for Paper Trading
-
-This is an OPTIMIZED version that reduces CoinGecko API calls by 90% by:
-1. Fetching multiple token prices in a SINGLE API call
-2. Using bulk endpoints instead of per-token requests
-3. Smarter caching strategy
-
-KEY IMPROVEMENTS:
-- 9 tokens = 1 API call (instead of 9 separate calls)
-- Reduces monthly API usage from 10,000/day to ~1,100/day
-- Stays within CoinGecko free tier limits
-
-File: dexproject/paper_trading/services/price_feed_service.py
-"""
-import asyncio
-from contextlib import suppress
-from typing import Any, Awaitable, Callable, Optional
-import logging
-import asyncio
-from decimal import Decimal
-from typing import Optional, Dict, Any, List, Tuple
-from datetime import datetime, timedelta
-import aiohttp
-from django.conf import settings
-from django.core.cache import cache
-
-# Import centralized token addresses from shared constants
-from shared.constants import TOKEN_ADDRESSES_BY_CHAIN
-
-# Import existing Web3 infrastructure
-from shared.web3_utils import (
-    Web3,
-    is_address,
-    to_checksum_ethereum_address
-)
-
-logger = logging.getLogger(__name__)
-
-
-# =============================================================================
-# CACHE CONFIGURATION
-# =============================================================================
-
-# Primary cache TTL (configurable via environment)
-# Default: 60 seconds - balances freshness with API call reduction
-# Can be overridden with PRICE_CACHE_TTL_SECONDS environment variable
-PRICE_CACHE_TTL = int(getattr(settings, 'PRICE_CACHE_TTL_SECONDS', 60))
-
-# Stale cache TTL - how long to keep "stale" cache as backup
-# If API fails, we can serve data up to this age
-STALE_CACHE_TTL = PRICE_CACHE_TTL * 4  # 4 minutes by default
-
-# Cache key prefixes for Redis
-PRICE_CACHE_PREFIX = "token_price"
-STALE_CACHE_PREFIX = "token_price_stale"
-BULK_CACHE_PREFIX = "bulk_token_prices"
-
-# Stablecoin cache TTL (much longer since they don't change)
-STABLECOIN_CACHE_TTL = 3600  # 1 hour
-
-# API endpoints
-COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
-
-# Supported chains for price lookup
-SUPPORTED_CHAINS: Dict[int, str] = {
-    1: "ethereum",      # Ethereum Mainnet
-    8453: "base",       # Base Mainnet
-    11155111: "sepolia",  # Ethereum Sepolia
-    84532: "base-sepolia"  # Base Sepolia
-}
-
-# Known stablecoins (always return $1.00)
-STABLECOINS: Dict[str, Decimal] = {
-    "USDC": Decimal("1.00"),
-    "USDT": Decimal("1.00"),
-    "DAI": Decimal("1.00"),
-}
-
-
-# =============================================================================
-# OPTIMIZED PRICE FEED SERVICE WITH BULK FETCHING
-# =============================================================================
-
-class PriceFeedService:
-    """
-    OPTIMIZED real-time token price fetching service with bulk API calls.
-    
-    KEY OPTIMIZATION: Fetches multiple token prices in a single API call,
-    reducing API usage by 90% compared to per-token requests.
-    
-    Features:
-    - Bulk CoinGecko API calls (1 call for all tokens)
-    - Smart Redis caching (60s fresh + 4min stale for resilience)
-    - Stale-while-revalidate pattern
-    - Cache performance tracking
-    - Multi-chain support
-    - Comprehensive error handling
-    
-    Cache Strategy:
-    - Fresh cache: 60 seconds (configurable)
-    - Stale cache: 4 minutes (fallback during API failures)
-    - Stablecoins: 1 hour (they don't change)
-    - Reduces API calls from 9/update to 1/update (90% reduction)
-    
-    Example usage:
-        service = PriceFeedService(chain_id=84532)
-        
-        # Bulk fetch (RECOMMENDED - 1 API call)
-        prices = await service.get_bulk_token_prices([
-            ('WETH', '0x4200...'),
-            ('USDC', '0x036C...'),
-            ('DAI', '0x50c5...')
-        ])
-        # Returns: {'WETH': Decimal('2543.50'), 'USDC': Decimal('1.00'), ...}
-        
-        # Single token (uses bulk cache if available)
-        price = await service.get_token_price("0xC02...WETH", "WETH")
-        # Returns: Decimal("2543.50")
-    """
-    
-    def __init__(
-        self,
-        chain_id: int,
-        web3_client: Optional[Any] = None
-    ) -> None:
-        """
-        Initialize price feed service for a specific chain.
-        
-        Args:
-            chain_id: Blockchain network ID (e.g., 84532 for Base Sepolia)
-            web3_client: Optional Web3Client for DEX quotes
-        """
-        self.chain_id: int = chain_id
-        self.chain_name: str = self._get_chain_name(chain_id)
-        
-        # Token addresses for this chain (from centralized constants)
-        self.token_addresses: Dict[str, str] = self._get_token_addresses()
-        
-        # Price cache - stores last known prices
-        self.price_cache: Dict[str, Decimal] = {}
-        self.last_update: Dict[str, datetime] = {}
-        
-        # Cache statistics tracking
-        self.cache_hits: int = 0
-        self.cache_misses: int = 0
-        self.stale_cache_hits: int = 0
-        self.api_call_count: int = 0
-        self.bulk_api_calls: int = 0
-        
-        # CoinGecko API Configuration  
-        self.coingecko_base_url: str = "https://api.coingecko.com/api/v3"
-        self.coingecko_api_key: Optional[str] = getattr(settings, 'COIN_GECKO_API_KEY', None)
-        
-        # Rate limiting for CoinGecko free tier
-        self.last_coingecko_call: Optional[datetime] = None
-        self.coingecko_rate_limit_seconds: float = 1.5
-        
-        # Request timeout configuration
-        self.request_timeout_seconds: int = 10
-        
-        # Session holder (lazy initialization)
-        self._session: Optional[aiohttp.ClientSession] = None
-        
-        # Web3 infrastructure for DEX quotes (optional)
-        self.web3_client: Optional[Any] = web3_client
-        self.dex_quotes_enabled: bool = web3_client is not None
-        
-        logger.info(
-            f"[PRICE FEED] Initialized OPTIMIZED service for chain {chain_id} ({self.chain_name}), "
-            f"Bulk fetching: ENABLED, "
-            f"DEX quotes: {'ENABLED' if self.dex_quotes_enabled else 'DISABLED'}"
-        )    
-
-    def _get_chain_name(self, chain_id: int) -> str:
-        """
-        Get human-readable chain name from chain ID.
-        
-        Args:
-            chain_id: Blockchain network ID
-            
-        Returns:
-            Human-readable chain name
-        """
-        chain_names: Dict[int, str] = {
-            1: 'mainnet',
-            5: 'goerli',
-            11155111: 'sepolia',
-            84531: 'base-goerli',
-            84532: 'base-sepolia',
-            8453: 'base-mainnet',
-            137: 'polygon',
-            80001: 'mumbai',
-            42161: 'arbitrum',
-            421613: 'arbitrum-goerli'
-        }
-        return chain_names.get(chain_id, f'chain-{chain_id}')
-
-    def _get_token_addresses(self) -> Dict[str, str]:
-        """
-        Get token addresses for the current chain from centralized constants.
-        
-        Fetches addresses from TOKEN_ADDRESSES_BY_CHAIN and validates them
-        with checksum conversion. Invalid addresses are skipped with a warning
-        rather than crashing the entire service.
-        
-        Returns:
-            Dictionary mapping token symbols to checksummed addresses.
-            Empty dict if no addresses configured for this chain.
-            
-        Notes:
-            - Uses centralized TOKEN_ADDRESSES_BY_CHAIN constant
-            - Automatically checksums all addresses for Web3 compatibility
-            - Skips invalid addresses instead of raising exceptions
-            - Logs warnings for any validation failures
-        
-        Example:
-            >>> service = PriceFeedService(chain_id=84532)
-            >>> addresses = service._get_token_addresses()
-            >>> addresses['WETH']
-            '0x4200000000000000000000000000000000000006'
-        """
-        def _checksum_or_raise(address: str, symbol: str) -> str:
-            """
-            Helper function to checksum an address or raise if invalid.
-            
-            Args:
-                address: The Ethereum address to checksum
-                symbol: The token symbol (for error messages)
-                
-            Returns:
-                Checksummed address string
-                
-            Raises:
-                ValueError: If address is invalid and cannot be checksummed
-            """
-            checksummed = to_checksum_ethereum_address(address)
-            if checksummed is None:
-                raise ValueError(f"Invalid address for {symbol}: {address}")
-            return checksummed
-        
-        # Get addresses from centralized constants for this chain
-        chain_tokens: Dict[str, str] = TOKEN_ADDRESSES_BY_CHAIN.get(self.chain_id, {})
-        
-        # Log if no addresses found for this chain
-        if not chain_tokens:
-            logger.warning(
-                f"[PRICE FEED] No token addresses configured for chain {self.chain_id} "
-                f"in TOKEN_ADDRESSES_BY_CHAIN constant"
-            )
-            return {}
-        
-        # Checksum all addresses for Web3 compatibility
-        checksummed_tokens: Dict[str, str] = {}
-        for symbol, address in chain_tokens.items():
-            try:
-                checksummed_tokens[symbol] = _checksum_or_raise(address, symbol)
-            except ValueError as e:
-                # Skip invalid addresses with warning instead of crashing
-                logger.warning(
-                    f"[PRICE FEED] Skipping invalid address for {symbol} "
-                    f"on chain {self.chain_id}: {e}"
-                )
-                continue
-        
-        # Log success
-        logger.info(
-            f"[PRICE FEED] Loaded {len(checksummed_tokens)} token addresses "
-            f"for chain {self.chain_id}: {', '.join(checksummed_tokens.keys())}"
-        )
-        
-        return checksummed_tokens
-
-    from typing import Optional, Dict
-
-    def _get_coingecko_id(self, token_symbol: str, address: str, chain_id: int) -> Optional[str]:
-        """
-        Resolve a CoinGecko ID for a given token on a specific chain.
-
-        Prefer explicit per-chain address mappings; if not found, use a conservative
-        symbol fallback for well-known assets. Returns None when unresolved.
-
-        Args:
-            token_symbol: Token symbol (e.g., 'WETH', 'USDC', 'DAI', 'cbETH')
-            address: Token contract address on the given chain (checksum or lower)
-            chain_id: EVM chain id (e.g., 8453 for Base mainnet, 1 for Ethereum)
-
-        Returns:
-            CoinGecko asset id string or None if unknown.
-        """
-        sym = (token_symbol or "").strip().upper()
-        addr = (address or "").strip().lower()
-
-        # --- Explicit per-chain address mappings ---
-        per_chain: Dict[int, Dict[str, str]] = {
-            # Base mainnet (8453)
-            8453: {
-                # WETH on Base
-                "0x4200000000000000000000000000000000000006": "weth",
-                # USDC (native) on Base
-                "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": "usd-coin",
-                # DAI on Base
-                "0x50c57259e8bbb31c10c1e2a9f98c171d7290d3e1": "dai",
-                # cbETH on Base
-                "0x2ae3f1ec7f1f5012cfe0f2108faadf6f0b9adcc1": "coinbase-wrapped-staked-eth",
-                
-                # Week 1 additions - Base native tokens
-                # WBTC on Base
-                "0x0555e30da8f98308edb960aa94c0db47230d2b9c": "wrapped-bitcoin",
-                # DEGEN on Base
-                "0x4ed4e862860bed51a9570b96d89af5e1b0efefed": "degen-base",
-                # TOSHI on Base
-                "0xac1bd2486aaf3b5c0fc3fd868558b082a531b2b4": "toshi",
-                # BRETT on Base
-                "0x532f27101965dd16442e59d40670faf5ebb142e4": "based-brett",
-                # USDbC (Bridged USDC) on Base
-                "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": "bridged-usd-coin-base",
-                "0x940181a94a35a4569e4529a3cdfb74e38fd98631": "aerodrome-finance",  # AERO
-                "0x0b3e328455c4059eeb9e3f84b5543f74e24e7e1b": "virtual-protocol",   # VIRTUAL
-                "0x58d97b57bb95320f9a05dc918aef65434969c2b2": "morpho-blue",        # MORPHO
-                "0xcbb7c0000ab88b473b1f5afd9ef808440eed33bf": "coinbase-wrapped-btc",      # cbBTC
-                "0xa88594d404727625a9437c3f886c7643872296ae": "moonwell",                   # WELL
-                "0x1c7a460413dd4e964f96d8dfc56e7223ce88cd85": "seamless-protocol",         # SEAM
-                "0xf6e932ca12afa26665dc4dde7e27be02a7c02e50": "mochi-2",                    # MOCHI
-                "0x27d2decb4bfc9c76f0309b8e88dec3a601fe25a8": "bald",                       # BALD
-                "0x7f12d13b34f5f4f0a9449c16bcd42f0da47af200": "normie",                     # NORMIE
-                "0x9a26f5433671751c3276a065f57e5a02d2817973": "keycat",                     # KEYCAT
-                "0x0578d8a44db98b23bf096a382e016e29a5ce0ffe": "higher",                     # HIGHER
-                "0x4621b7a9c75199271f773ebd9a499dbd165c3191": "dola-usd",                   # DOLA
-                "0x60a3e35cc302bfa44cb288bc5a4f316fdb1adb42": "euro-coin",                  # EURC
-                "0xba5e6fa2f33f3955f0cef50c63dcc84861eab663": "based",                      # BASED
-                "0xa3d1a8deb97b111454b294e2324efad13a9d8396": "overnight-finance",          # OVN
-                "0xeb466342c4d449bc9f53a865d5cb90586f405215": "axlusdc",                    # axlUSDC
-                
-            },
-            # Ethereum mainnet (1)
-            1: {
-                "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": "weth",
-                "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48": "usd-coin",
-                "0x6b175474e89094c44da98b954eedeac495271d0f": "dai",
-                "0xbe9895146f7af43049ca1c1ae358b0541ea49704": "coinbase-wrapped-staked-eth",
-            },
-        }
-
-        mapping = per_chain.get(chain_id, {})
-        if addr in mapping:
-            return mapping[addr]
-
-        # --- Conservative symbol fallback (only unambiguous for our set) ---
-        symbol_fallback: Dict[str, str] = {
-            "WETH": "weth",
-            "USDC": "usd-coin",
-            "DAI": "dai",
-            "CBETH": "coinbase-wrapped-staked-eth",
-            
-            # Week 1 additions
-            "WBTC": "wrapped-bitcoin",
-            "DEGEN": "degen-base",
-            "TOSHI": "toshi",
-            "BRETT": "based-brett",
-            "USDBC": "bridged-usd-coin-base",            
-            "CBBTC": "coinbase-wrapped-btc",
-            "WELL": "moonwell",
-            "SEAM": "seamless-protocol",
-            "MOCHI": "mochi-2",
-            "BALD": "bald",
-            "NORMIE": "normie",
-            "KEYCAT": "keycat",
-            "HIGHER": "higher",
-            "DOLA": "dola-usd",
-            "EURC": "euro-coin",
-            "BASED": "based",
-            "OVN": "overnight-finance",
-            "AXLUSDC": "axlusdc",
-            
-            
-        }
-        if sym in symbol_fallback:
-            return symbol_fallback[sym]
-
-        # Unknown → let caller decide (e.g., skip and log once)
-        return None
-
-    async def _get_or_create_session(self) -> aiohttp.ClientSession:
-        """
-        Get or create aiohttp session (lazy initialization).
-        
-        This prevents memory leaks by reusing the same session across requests.
-        CRITICAL: Also detects if event loop has changed (from async_to_sync wrapper)
-        and creates a new session if needed.
-        
-        Returns:
-            Active aiohttp ClientSession
-        """
-        try:
-            # Check if we need a new session
-            needs_new_session = False
-            
-            if self._session is None:
-                needs_new_session = True
-            elif self._session.closed:
-                needs_new_session = True
-            else:
-                # CRITICAL FIX: Check if the session's loop is still running
-                # This handles the case where async_to_sync creates new loops
-                try:
-                    session_loop = self._session._loop
-                    current_loop = asyncio.get_running_loop()
-                    
-                    # If loops don't match, we need a new session
-                    if session_loop != current_loop:
-                        logger.debug(
-                            "[PRICE FEED] Event loop changed, closing old session"
-                        )
-                        await self._session.close()
-                        needs_new_session = True
-                except Exception:
-                    # If we can't check, be safe and create new session
-                    needs_new_session = True
-            
-            if needs_new_session:
-                timeout = aiohttp.ClientTimeout(total=self.request_timeout_seconds)
-                self._session = aiohttp.ClientSession(timeout=timeout)
-                logger.debug("[PRICE FEED] Created new aiohttp session")
-            
-            return self._session
-            
-        except Exception as e:
-            logger.error(f"[PRICE FEED] Error creating session: {e}", exc_info=True)
-            # Fallback: always create fresh session on error
-            timeout = aiohttp.ClientTimeout(total=self.request_timeout_seconds)
-            self._session = aiohttp.ClientSession(timeout=timeout)
-            return self._session
-
-
-
-
-
-
-
-
-    async def close(self) -> None:
-        """
-        Close aiohttp session and cleanup resources.
-        
-        Should be called when service is no longer needed to prevent resource leaks.
-        """
-        if self._session and not self._session.closed:
-            await self._session.close()
-            logger.debug("[PRICE FEED] Closed aiohttp session")            
-            
-    def _run_async(self, coro: Awaitable[Any]) -> Any:
-        """
-        Safely run async coroutine from sync code.
-        
-        This handles event loop management properly to avoid
-        "Event loop is closed" errors across multiple calls.
-        
-        Args:
-            coro: Async coroutine to run
-            
-        Returns:
-            Result from the coroutine
-        """
-        try:
-            # Try to get the current running loop
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            # No loop running - we need to create one
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    # Loop exists but is closed - create new one
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                # No loop at all - create new one
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        
-        # Run the coroutine
-        if loop.is_running():
-            # Already in async context - just await
-            return coro
-        else:
-            # Not in async context - run until complete
-            return loop.run_until_complete(coro)
-
-    # =========================================================================
-    # PUBLIC API METHODS
-    # =========================================================================
-    async def get_token_price(
-        self,
-        token_address: str,
-        token_symbol: str
-    ) -> Optional[Decimal]:
-        """
-        Get current price for a single token with caching.
-        
-        This method checks cache first, then falls back to API if needed.
-        For multiple tokens, use get_bulk_token_prices() instead for better performance.
-        
-        Args:
-            token_address: Token contract address
-            token_symbol: Token symbol (e.g., 'WETH', 'USDC')
-            
-        Returns:
-            Token price in USD as Decimal, or None if unavailable
-            
-        Example:
-            >>> price = await service.get_token_price(
-            ...     "0x4200000000000000000000000000000000000006",
-            ...     "WETH"
-            ... )
-            >>> print(f"${price:.2f}")
-            $2543.50
-        """
-        # Check if it's a stablecoin (instant return)
-        if token_symbol.upper() in STABLECOINS:
-            logger.debug(f"[PRICE FEED] {token_symbol} is stablecoin, returning $1.00")
-            return STABLECOINS[token_symbol.upper()]
-        
-        # Try fresh cache first
-        cached_price = self._get_cached_price(token_address)
-        if cached_price is not None:
-            return cached_price
-        
-        # Cache miss - fetch from API
-        logger.debug(
-            f"[PRICE FEED] Cache miss for {token_symbol}, fetching from API"
-        )
-        
-        try:
-            price = await self._fetch_from_coingecko(token_symbol, token_address)
-            
-            if price is not None:
-                # Cache the new price
-                self._cache_price(token_address, price)
-                self.api_call_count += 1
-                return price
-            else:
-                # API failed - try stale cache as fallback
-                stale_price = self._get_stale_cached_price(token_address)
-                if stale_price is not None:
-                    logger.info(
-                        f"[PRICE FEED] Using stale cache for {token_symbol} "
-                        f"(API unavailable)"
-                    )
-                    return stale_price
-                
-                logger.warning(
-                    f"[PRICE FEED] No price available for {token_symbol} "
-                    f"(API failed, no cache)"
-                )
-                return None
-                
-        except Exception as e:
-            logger.error(
-                f"[PRICE FEED] Error fetching price for {token_symbol}: {e}",
-                exc_info=True
-            )
-            
-            # Try stale cache on error
-            stale_price = self._get_stale_cached_price(token_address)
-            if stale_price is not None:
-                logger.info(
-                    f"[PRICE FEED] Using stale cache for {token_symbol} (error recovery)"
-                )
-                return stale_price
-            
-            return None
-
-    async def get_bulk_token_prices(
-        self,
-        tokens: List[Tuple[str, str]]
-    ) -> Dict[str, Optional[Decimal]]:
-        """
-        Get prices for multiple tokens in a single API call (RECOMMENDED).
-        
-        This is the OPTIMIZED way to fetch prices - uses 1 API call instead of N.
-        
-        Args:
-            tokens: List of (symbol, address) tuples
-            
-        Returns:
-            Dictionary mapping symbols to prices (or None if unavailable)
-            
-        Example:
-            >>> prices = await service.get_bulk_token_prices([
-            ...     ('WETH', '0x4200...'),
-            ...     ('USDC', '0x036C...'),
-            ...     ('DAI', '0x50c5...')
-            ... ])
-            >>> prices
-            {'WETH': Decimal('2543.50'), 'USDC': Decimal('1.00'), 'DAI': Decimal('1.00')}
-        """
-        if not tokens:
-            logger.warning("[PRICE FEED] get_bulk_token_prices called with empty list")
-            return {}
-        
-        logger.info(
-            f"[PRICE FEED] Fetching bulk prices for {len(tokens)} tokens: "
-            f"{', '.join(sym for sym, _ in tokens)}"
-        )
-        
-        results: Dict[str, Optional[Decimal]] = {}
-        tokens_to_fetch: List[Tuple[str, str]] = []
-        
-        # Step 1: Check cache for each token
-        for symbol, address in tokens:
-            # Stablecoins always return $1.00
-            if symbol.upper() in STABLECOINS:
-                results[symbol] = STABLECOINS[symbol.upper()]
-                logger.debug(f"[PRICE FEED] {symbol} is stablecoin")
-                continue
-            
-            # Check fresh cache
-            cached_price = self._get_cached_price(address)
-            if cached_price is not None:
-                results[symbol] = cached_price
-                logger.debug(f"[PRICE FEED] Cache hit for {symbol}")
-            else:
-                # Need to fetch this token
-                tokens_to_fetch.append((symbol, address))
-        
-        # Step 2: Fetch uncached tokens in bulk (1 API call)
-        if tokens_to_fetch:
-            logger.info(
-                f"[PRICE FEED] Need to fetch {len(tokens_to_fetch)} tokens from API: "
-                f"{', '.join(sym for sym, _ in tokens_to_fetch)}"
-            )
-            
-            try:
-                fetched_prices = await self._fetch_bulk_from_coingecko(tokens_to_fetch)
-                self.bulk_api_calls += 1
-                
-                # Cache and add fetched prices to results
-                for symbol, price in fetched_prices.items():
-                    if price is not None:
-                        # Find address for this symbol
-                        address = next(
-                            (addr for sym, addr in tokens_to_fetch if sym == symbol),
-                            None
-                        )
-                        if address:
-                            self._cache_price(address, price)
-                        results[symbol] = price
-                    else:
-                        # Try stale cache as fallback
-                        address = next(
-                            (addr for sym, addr in tokens_to_fetch if sym == symbol),
-                            None
-                        )
-                        if address:
-                            stale_price = self._get_stale_cached_price(address)
-                            results[symbol] = stale_price
-                        else:
-                            results[symbol] = None
-                            
-            except Exception as e:
-                logger.error(
-                    f"[PRICE FEED] Bulk fetch failed: {e}",
-                    exc_info=True
-                )
-                
-                # Fallback to stale cache for failed tokens
-                for symbol, address in tokens_to_fetch:
-                    if symbol not in results:
-                        stale_price = self._get_stale_cached_price(address)
-                        results[symbol] = stale_price
-        
-        # Log summary
-        successful = sum(1 for p in results.values() if p is not None)
-        logger.info(
-            f"[PRICE FEED] Bulk fetch complete: {successful}/{len(tokens)} prices retrieved"
-        )
-        
-        return results
-
-    # =========================================================================
-    # COINGECKO API METHODS
-    # =========================================================================
-
-    async def _enforce_rate_limit(self) -> None:
-        """
-        Enforce rate limiting for CoinGecko API calls.
-        
-        Waits if necessary to respect the rate limit.
-        """
-        if self.last_coingecko_call is not None:
-            elapsed = (datetime.now() - self.last_coingecko_call).total_seconds()
-            
-            if elapsed < self.coingecko_rate_limit_seconds:
-                wait_time = self.coingecko_rate_limit_seconds - elapsed
-                logger.debug(f"[RATE LIMIT] Waiting {wait_time:.2f}s")
-                await asyncio.sleep(wait_time)
-        
-        self.last_coingecko_call = datetime.now()
-
-    async def _fetch_from_coingecko(
-        self,        
-        token_symbol: str,
-        token_address: str
-    ) -> Optional[Decimal]:
-        """
-        Fetch single token price from CoinGecko API.
-        
-        Args:
-            token_symbol: Token symbol
-            token_address: Token contract address
-            
-        Returns:
-            Price in USD or None if unavailable
-        """
-        try:
-            await self._enforce_rate_limit()
-            
-            # Get CoinGecko ID for this token
-            coin_id = self._get_coingecko_id(token_symbol, token_address, self.chain_id)  # ✅ All 3 params
-            if not coin_id:
-                logger.debug(f"[PRICE FEED] No CoinGecko ID for {token_symbol}")
-                return None
-            
-            url = f"{self.coingecko_base_url}/simple/price"
-            params = {
-                'ids': coin_id,
-                'vs_currencies': 'usd'
-            }
-
-            # Build headers with API key (Demo tier)
-            headers: Dict[str, str] = {}
-            if self.coingecko_api_key:
-                headers['x-cg-demo-api-key'] = self.coingecko_api_key
-                logger.debug(f"[PRICE FEED] Using CoinGecko API key for {token_symbol}")
-
-            # Use reusable session to prevent memory leaks
-            session = await self._get_or_create_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    if coin_id in data and 'usd' in data[coin_id]:
-                        price_usd = Decimal(str(data[coin_id]['usd']))
-                        logger.info(
-                            f"[PRICE FEED] ✅ Fetched price for {token_symbol}: "
-                            f"${price_usd:.2f}"
-                        )
-                        return price_usd
-                elif response.status == 429:
-                    logger.warning(
-                        "[PRICE FEED] CoinGecko rate limit exceeded"
-                    )
-                    return None
-                else:
-                    logger.debug(
-                        f"[PRICE FEED] CoinGecko API error: {response.status}"
-                    )
-                    return None
-                        
-        except asyncio.TimeoutError:
-            logger.debug(f"[PRICE FEED] CoinGecko timeout for {token_symbol}")
-            return None
-        except RuntimeError as e:
-            if "Event loop is closed" in str(e):
-                logger.debug(
-                    f"[PRICE FEED] Event loop closed for {token_symbol}, "
-                    f"skipping CoinGecko"
-                )
-                return None
-            raise
-        except Exception as e:
-            logger.error(
-                f"[PRICE FEED] CoinGecko API error: {e}",
-                exc_info=True
-            )
-            return None
-
-    async def _fetch_bulk_from_coingecko(
-        self,
-        tokens: List[Tuple[str, str]]
-    ) -> Dict[str, Optional[Decimal]]:
-        """
-        Fetch multiple token prices in a single CoinGecko API call.
-        
-        This is the KEY OPTIMIZATION that reduces API usage by 90%.
-        
-        Args:
-            tokens: List of (symbol, address) tuples to fetch
-            
-        Returns:
-            Dictionary mapping symbols to prices
-        """
-        if not tokens:
-            return {}
-        
-        try:
-            await self._enforce_rate_limit()
-            
-            # Build list of CoinGecko IDs
-            coin_ids: List[str] = []
-            symbol_to_coin_id: Dict[str, str] = {}
-            
-            for symbol, address in tokens:
-                coin_id = self._get_coingecko_id(symbol, address, self.chain_id)
-                if coin_id:
-                    coin_ids.append(coin_id)
-                    symbol_to_coin_id[coin_id] = symbol
-            
-            if not coin_ids:
-                logger.warning("[PRICE FEED] No valid CoinGecko IDs in bulk request")
-                return {symbol: None for symbol, _ in tokens}
-            
-            # Make single bulk API call
-            url = f"{self.coingecko_base_url}/simple/price"
-            params = {
-                'ids': ','.join(coin_ids),
-                'vs_currencies': 'usd'
-            }
-            
-            headers: Dict[str, str] = {}
-            if self.coingecko_api_key:
-                headers['x-cg-demo-api-key'] = self.coingecko_api_key
-            
-            session = await self._get_or_create_session()
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    results: Dict[str, Optional[Decimal]] = {}
-                    for coin_id, symbol in symbol_to_coin_id.items():
-                        if coin_id in data and 'usd' in data[coin_id]:
-                            price = Decimal(str(data[coin_id]['usd']))
-                            results[symbol] = price
-                            logger.debug(
-                                f"[PRICE FEED] Bulk fetch: {symbol} = ${price:.2f}"
-                            )
-                        else:
-                            results[symbol] = None
-                    
-                    logger.info(
-                        f"[PRICE FEED] ✅ Bulk fetch succeeded: "
-                        f"{len(results)}/{len(tokens)} prices"
-                    )
-                    return results
-                    
-                elif response.status == 429:
-                    logger.warning("[PRICE FEED] CoinGecko rate limit in bulk fetch")
-                    return {symbol: None for symbol, _ in tokens}
-                else:
-                    logger.warning(
-                        f"[PRICE FEED] CoinGecko bulk fetch error: {response.status}"
-                    )
-                    return {symbol: None for symbol, _ in tokens}
-                    
-        except Exception as e:
-            logger.error(
-                f"[PRICE FEED] Bulk fetch exception: {e}",
-                exc_info=True
-            )
-            return {symbol: None for symbol, _ in tokens}
-
-    # =========================================================================
-    # CACHING METHODS (ENHANCED WITH STALE-WHILE-REVALIDATE)
-    # =========================================================================
-    def _get_cached_price(self, token_address: str) -> Optional[Decimal]:
-        """
-        Get cached price from Redis with fresh/stale distinction.
-        
-        Args:
-            token_address: Token contract address
-            
-        Returns:
-            Cached price or None if not in fresh cache
-        """
-        try:
-            # Try fresh cache first
-            cache_key = f"{PRICE_CACHE_PREFIX}:{self.chain_id}:{token_address.lower()}"
-            cached_value = cache.get(cache_key)
-
-            if cached_value is not None:
-                self.cache_hits += 1
-                logger.debug(
-                    f"[CACHE HIT] Fresh price for {token_address[:10]}: "
-                    f"${cached_value:.2f}"
-                )
-                return Decimal(str(cached_value))
-            
-            # Fresh cache miss
-            self.cache_misses += 1
-            return None
-            
-        except Exception as e:
-            logger.warning(f"[PRICE FEED] Cache retrieval error: {e}")
-            return None
-    
-    def _get_stale_cached_price(self, token_address: str) -> Optional[Decimal]:
-        """
-        Get stale cached price as fallback when API fails.
-        
-        Args:
-            token_address: Token contract address
-            
-        Returns:
-            Stale cached price or None if not available
-        """
-        try:
-            stale_key = f"{STALE_CACHE_PREFIX}:{self.chain_id}:{token_address.lower()}"
-            stale_value = cache.get(stale_key)
-            
-            if stale_value is not None:
-                self.stale_cache_hits += 1
-                logger.info(
-                    f"[STALE CACHE] Using stale price for {token_address[:10]}: "
-                    f"${stale_value:.2f} (API unavailable)"
-                )
-                return Decimal(str(stale_value))
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"[PRICE FEED] Stale cache retrieval error: {e}")
-            return None
-    
-    def _cache_price(self, token_address: str, price: Decimal) -> None:
-        """
-        Cache price in Redis with both fresh and stale TTLs.
-        
-        Args:
-            token_address: Token contract address
-            price: Price to cache
-        """
-        try:
-            # Store in fresh cache
-            fresh_key = f"{PRICE_CACHE_PREFIX}:{self.chain_id}:{token_address.lower()}"
-            cache.set(fresh_key, float(price), timeout=PRICE_CACHE_TTL)
-            
-            # Also store in stale cache with longer TTL
-            stale_key = f"{STALE_CACHE_PREFIX}:{self.chain_id}:{token_address.lower()}"
-            cache.set(stale_key, float(price), timeout=STALE_CACHE_TTL)
-            
-            logger.debug(
-                f"[CACHE SET] Cached price for {token_address[:10]}: "
-                f"${price:.2f} (Fresh: {PRICE_CACHE_TTL}s, Stale: {STALE_CACHE_TTL}s)"
-            )
-            
-        except Exception as e:
-            logger.warning(f"[PRICE FEED] Cache storage error: {e}")
-    
-    def get_cache_statistics(self) -> Dict[str, Any]:
-        """
-        Get cache performance statistics.
-        
-        Returns:
-            Dictionary containing cache metrics and performance data
-        """
-        total_requests = self.cache_hits + self.cache_misses
-        hit_rate = (self.cache_hits / total_requests * 100) if total_requests > 0 else 0
-        
-        return {
-            'cache_hits': self.cache_hits,
-            'cache_misses': self.cache_misses,
-            'stale_cache_hits': self.stale_cache_hits,
-            'total_requests': total_requests,
-            'hit_rate_percent': round(hit_rate, 2),
-            'api_calls': self.api_call_count,
-            'bulk_api_calls': self.bulk_api_calls,
-            'cache_ttl_seconds': PRICE_CACHE_TTL,
-            'stale_ttl_seconds': STALE_CACHE_TTL,
-            'api_call_reduction': f"{100 - (self.api_call_count / max(total_requests, 1) * 100):.1f}%"
-        }
-
-
-# =============================================================================
-# HELPER FUNCTIONS (for easy usage)
-# =============================================================================
-
-# Global instance (singleton pattern)
-_default_price_feed_service: Optional[PriceFeedService] = None
-
-
-def get_default_price_feed_service() -> PriceFeedService:
-    """
-    Get or create the default price feed service instance.
-    
-    Returns:
-        Singleton PriceFeedService instance
-    """
-    global _default_price_feed_service
-    
-    if _default_price_feed_service is None:
-        chain_id = getattr(settings, 'DEFAULT_CHAIN_ID', 84532)
-        _default_price_feed_service = PriceFeedService(chain_id=chain_id)
-        logger.info(
-            f"[PRICE FEED] Created OPTIMIZED default service for chain {chain_id}"
-        )
-    
-    return _default_price_feed_service
-
-
-async def get_bulk_token_prices_simple(
-    tokens: List[Tuple[str, str]],
-    chain_id: int = 84532
-) -> Dict[str, Optional[Decimal]]:
-    """
-    Simple helper function to fetch multiple token prices quickly.
-    
-    This is the RECOMMENDED way to fetch prices for paper trading.
-    
-    Args:
-        tokens: List of (symbol, address) tuples
-        chain_id: Blockchain network ID (default: Base Sepolia)
-    
-    Returns:
-        Dictionary mapping symbols to prices
-    
-    Example:
-        prices = await get_bulk_token_prices_simple([
-            ("WETH", "0x4200000000000000000000000000000000000006"),
-            ("USDC", "0x036CbD53842c5426634e7929541eC2318f3dCF7e"),
-            ("DAI", "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb")
-        ])
-        # Returns: {'WETH': Decimal('2543.50'), 'USDC': Decimal('1.00'), ...}
-    """
-    service = PriceFeedService(chain_id=chain_id)
-    try:
-        prices = await service.get_bulk_token_prices(tokens)
-        return prices
-    finally:
-        await service.close()
\ No newline at end of file
+"""
+OPTIMIZED Real Price Feed Service for Paper Trading
+
+This is an OPTIMIZED version that reduces CoinGecko API calls by 90% by:
+1. Fetching multiple token prices in a SINGLE API call
+2. Using bulk endpoints instead of per-token requests
+3. Smarter caching strategy
+4. Sending all upstream calls through the shared PriceFeedClient, which
+   keeps one connection pool per process, rate-limits with a token
+   bucket and merges concurrent requests into bulk calls
+5. Reading the Redis cache through the shared two-level PriceCache
+   (sub-second in-process L1, batched get_many/set_many for Redis)
+
+KEY IMPROVEMENTS:
+- 9 tokens = 1 API call (instead of 9 separate calls)
+- Reduces monthly API usage from 10,000/day to ~1,100/day
+- Stays within CoinGecko free tier limits
+
+File: dexproject/paper_trading/services/price_feed_service.py
+"""
+import logging
+import threading
+from decimal import Decimal
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime, timedelta
+from django.conf import settings
+
+from .price_cache import PriceCache, get_price_cache
+from .price_feed_client import PriceFeedClient, get_price_feed_client
+
+# Import centralized token addresses from shared constants
+from shared.constants import TOKEN_ADDRESSES_BY_CHAIN
+
+# Import existing Web3 infrastructure
+from shared.web3_utils import (
+    Web3,
+    is_address,
+    to_checksum_ethereum_address
+)
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# CACHE CONFIGURATION
+# =============================================================================
+
+# Primary cache TTL (configurable via environment)
+# Default: 60 seconds - balances freshness with API call reduction
+# Can be overridden with PRICE_CACHE_TTL_SECONDS environment variable
+PRICE_CACHE_TTL = int(getattr(settings, 'PRICE_CACHE_TTL_SECONDS', 60))
+
+# Stale cache TTL - how long to keep "stale" cache as backup
+# If API fails, we can serve data up to this age
+STALE_CACHE_TTL = PRICE_CACHE_TTL * 4  # 4 minutes by default
+
+# Cache key prefixes for Redis
+PRICE_CACHE_PREFIX = "token_price"
+STALE_CACHE_PREFIX = "token_price_stale"
+BULK_CACHE_PREFIX = "bulk_token_prices"
+
+# Stablecoin cache TTL (much longer since they don't change)
+STABLECOIN_CACHE_TTL = 3600  # 1 hour
+
+# API endpoints
+COINGECKO_API_BASE = "https://api.coingecko.com/api/v3"
+
+# Supported chains for price lookup
+SUPPORTED_CHAINS: Dict[int, str] = {
+    1: "ethereum",      # Ethereum Mainnet
+    8453: "base",       # Base Mainnet
+    11155111: "sepolia",  # Ethereum Sepolia
+    84532: "base-sepolia"  # Base Sepolia
+}
+
+# Known stablecoins (always return $1.00)
+STABLECOINS: Dict[str, Decimal] = {
+    "USDC": Decimal("1.00"),
+    "USDT": Decimal("1.00"),
+    "DAI": Decimal("1.00"),
+}
+
+
+# =============================================================================
+# OPTIMIZED PRICE FEED SERVICE WITH BULK FETCHING
+# =============================================================================
+
+class PriceFeedService:
+    """
+    OPTIMIZED real-time token price fetching service with bulk API calls.
+    
+    KEY OPTIMIZATION: Fetches multiple token prices in a single API call,
+    reducing API usage by 90% compared to per-token requests.
+    
+    Features:
+    - Bulk CoinGecko API calls (1 call for all tokens)
+    - Smart Redis caching (60s fresh + 4min stale for resilience)
+    - Shared in-process L1 cache in front of Redis
+    - Stale-while-revalidate pattern
+    - Cache performance tracking
+    - Multi-chain support
+    - Comprehensive error handling
+    - Shared, pooled and rate-limited upstream client (PriceFeedClient)
+    
+    Cache Strategy:
+    - Fresh cache: 60 seconds (configurable)
+    - Stale cache: 4 minutes (fallback during API failures)
+    - Stablecoins: 1 hour (they don't change)
+    - Reduces API calls from 9/update to 1/update (90% reduction)
+    
+    Example usage:
+        service = PriceFeedService(chain_id=84532)
+        
+        # Bulk fetch (RECOMMENDED - 1 API call)
+        prices = await service.get_bulk_token_prices([
+            ('WETH', '0x4200...'),
+            ('USDC', '0x036C...'),
+            ('DAI', '0x50c5...')
+        ])
+        # Returns: {'WETH': Decimal('2543.50'), 'USDC': Decimal('1.00'), ...}
+        
+        # Single token (uses bulk cache if available)
+        price = await service.get_token_price("0xC02...WETH", "WETH")
+        # Returns: Decimal("2543.50")
+    """
+    
+    def __init__(
+        self,
+        chain_id: int,
+        web3_client: Optional[Any] = None
+    ) -> None:
+        """
+        Initialize price feed service for a specific chain.
+        
+        Args:
+            chain_id: Blockchain network ID (e.g., 84532 for Base Sepolia)
+            web3_client: Optional Web3Client for DEX quotes
+        """
+        self.chain_id: int = chain_id
+        self.chain_name: str = self._get_chain_name(chain_id)
+        
+        # Token addresses for this chain (from centralized constants)
+        self.token_addresses: Dict[str, str] = self._get_token_addresses()
+        
+        # Price cache - stores last known prices
+        self.price_cache: Dict[str, Decimal] = {}
+        self.last_update: Dict[str, datetime] = {}
+        
+        # Cache statistics tracking
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self.stale_cache_hits: int = 0
+        self.api_call_count: int = 0
+        self.bulk_api_calls: int = 0
+        
+        # Shared CoinGecko client (connection pool, rate limit, request merging)
+        self.client: PriceFeedClient = get_price_feed_client()
+        
+        # Shared two-level cache (process L1 in front of Redis)
+        self.price_cache: PriceCache = get_price_cache()
+        
+        # Web3 infrastructure for DEX quotes (optional)
+        self.web3_client: Optional[Any] = web3_client
+        self.dex_quotes_enabled: bool = web3_client is not None
+        
+        logger.info(
+            f"[PRICE FEED] Initialized OPTIMIZED service for chain {chain_id} ({self.chain_name}), "
+            f"Bulk fetching: ENABLED, "
+            f"DEX quotes: {'ENABLED' if self.dex_quotes_enabled else 'DISABLED'}"
+        )    
+
+    def _get_chain_name(self, chain_id: int) -> str:
+        """
+        Get human-readable chain name from chain ID.
+        
+        Args:
+            chain_id: Blockchain network ID
+            
+        Returns:
+            Human-readable chain name
+        """
+        chain_names: Dict[int, str] = {
+            1: 'mainnet',
+            5: 'goerli',
+            11155111: 'sepolia',
+            84531: 'base-goerli',
+            84532: 'base-sepolia',
+            8453: 'base-mainnet',
+            137: 'polygon',
+            80001: 'mumbai',
+            42161: 'arbitrum',
+            421613: 'arbitrum-goerli'
+        }
+        return chain_names.get(chain_id, f'chain-{chain_id}')
+
+    def _get_token_addresses(self) -> Dict[str, str]:
+        """
+        Get token addresses for the current chain from centralized constants.
+        
+        Fetches addresses from TOKEN_ADDRESSES_BY_CHAIN and validates them
+        with checksum conversion. Invalid addresses are skipped with a warning
+        rather than crashing the entire service.
+        
+        Returns:
+            Dictionary mapping token symbols to checksummed addresses.
+            Empty dict if no addresses configured for this chain.
+            
+        Notes:
+            - Uses centralized TOKEN_ADDRESSES_BY_CHAIN constant
+            - Automatically checksums all addresses for Web3 compatibility
+            - Skips invalid addresses instead of raising exceptions
+            - Logs warnings for any validation failures
+        
+        Example:
+            >>> service = PriceFeedService(chain_id=84532)
+            >>> addresses = service._get_token_addresses()
+            >>> addresses['WETH']
+            '0x4200000000000000000000000000000000000006'
+        """
+        def _checksum_or_raise(address: str, symbol: str) -> str:
+            """
+            Helper function to checksum an address or raise if invalid.
+            
+            Args:
+                address: The Ethereum address to checksum
+                symbol: The token symbol (for error messages)
+                
+            Returns:
+                Checksummed address string
+                
+            Raises:
+                ValueError: If address is invalid and cannot be checksummed
+            """
+            checksummed = to_checksum_ethereum_address(address)
+            if checksummed is None:
+                raise ValueError(f"Invalid address for {symbol}: {address}")
+            return checksummed
+        
+        # Get addresses from centralized constants for this chain
+        chain_tokens: Dict[str, str] = TOKEN_ADDRESSES_BY_CHAIN.get(self.chain_id, {})
+        
+        # Log if no addresses found for this chain
+        if not chain_tokens:
+            logger.warning(
+                f"[PRICE FEED] No token addresses configured for chain {self.chain_id} "
+                f"in TOKEN_ADDRESSES_BY_CHAIN constant"
+            )
+            return {}
+        
+        # Checksum all addresses for Web3 compatibility
+        checksummed_tokens: Dict[str, str] = {}
+        for symbol, address in chain_tokens.items():
+            try:
+                checksummed_tokens[symbol] = _checksum_or_raise(address, symbol)
+            except ValueError as e:
+                # Skip invalid addresses with warning instead of crashing
+                logger.warning(
+                    f"[PRICE FEED] Skipping invalid address for {symbol} "
+                    f"on chain {self.chain_id}: {e}"
+                )
+                continue
+        
+        # Log success
+        logger.info(
+            f"[PRICE FEED] Loaded {len(checksummed_tokens)} token addresses "
+            f"for chain {self.chain_id}: {', '.join(checksummed_tokens.keys())}"
+        )
+        
+        return checksummed_tokens
+
+    from typing import Optional, Dict
+
+    def _get_coingecko_id(self, token_symbol: str, address: str, chain_id: int) -> Optional[str]:
+        """
+        Resolve a CoinGecko ID for a given token on a specific chain.
+
+        Prefer explicit per-chain address mappings; if not found, use a conservative
+        symbol fallback for well-known assets. Returns None when unresolved.
+
+        Args:
+            token_symbol: Token symbol (e.g., 'WETH', 'USDC', 'DAI', 'cbETH')
+            address: Token contract address on the given chain (checksum or lower)
+            chain_id: EVM chain id (e.g., 8453 for Base mainnet, 1 for Ethereum)
+
+        Returns:
+            CoinGecko asset id string or None if unknown.
+        """
+        sym = (token_symbol or "").strip().upper()
+        addr = (address or "").strip().lower()
+
+        # --- Explicit per-chain address mappings ---
+        per_chain: Dict[int, Dict[str, str]] = {
+            # Base mainnet (8453)
+            8453: {
+                # WETH on Base
+                "0x4200000000000000000000000000000000000006": "weth",
+                # USDC (native) on Base
+                "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": "usd-coin",
+                # DAI on Base
+                "0x50c57259e8bbb31c10c1e2a9f98c171d7290d3e1": "dai",
+                # cbETH on Base
+                "0x2ae3f1ec7f1f5012cfe0f2108faadf6f0b9adcc1": "coinbase-wrapped-staked-eth",
+                
+                # Week 1 additions - Base native tokens
+                # WBTC on Base
+                "0x0555e30da8f98308edb960aa94c0db47230d2b9c": "wrapped-bitcoin",
+                # DEGEN on Base
+                "0x4ed4e862860bed51a9570b96d89af5e1b0efefed": "degen-base",
+                # TOSHI on Base
+                "0xac1bd2486aaf3b5c0fc3fd868558b082a531b2b4": "toshi",
+                # BRETT on Base
+                "0x532f27101965dd16442e59d40670faf5ebb142e4": "based-brett",
+                # USDbC (Bridged USDC) on Base
+                "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": "bridged-usd-coin-base",
+                "0x940181a94a35a4569e4529a3cdfb74e38fd98631": "aerodrome-finance",  # AERO
+                "0x0b3e328455c4059eeb9e3f84b5543f74e24e7e1b": "virtual-protocol",   # VIRTUAL
+                "0x58d97b57bb95320f9a05dc918aef65434969c2b2": "morpho-blue",        # MORPHO
+                "0xcbb7c0000ab88b473b1f5afd9ef808440eed33bf": "coinbase-wrapped-btc",      # cbBTC
+                "0xa88594d404727625a9437c3f886c7643872296ae": "moonwell",                   # WELL
+                "0x1c7a460413dd4e964f96d8dfc56e7223ce88cd85": "seamless-protocol",         # SEAM
+                "0xf6e932ca12afa26665dc4dde7e27be02a7c02e50": "mochi-2",                    # MOCHI
+                "0x27d2decb4bfc9c76f0309b8e88dec3a601fe25a8": "bald",                       # BALD
+                "0x7f12d13b34f5f4f0a9449c16bcd42f0da47af200": "normie",                     # NORMIE
+                "0x9a26f5433671751c3276a065f57e5a02d2817973": "keycat",                     # KEYCAT
+                "0x0578d8a44db98b23bf096a382e016e29a5ce0ffe": "higher",                     # HIGHER
+                "0x4621b7a9c75199271f773ebd9a499dbd165c3191": "dola-usd",                   # DOLA
+                "0x60a3e35cc302bfa44cb288bc5a4f316fdb1adb42": "euro-coin",                  # EURC
+                "0xba5e6fa2f33f3955f0cef50c63dcc84861eab663": "based",                      # BASED
+                "0xa3d1a8deb97b111454b294e2324efad13a9d8396": "overnight-finance",          # OVN
+                "0xeb466342c4d449bc9f53a865d5cb90586f405215": "axlusdc",                    # axlUSDC
+                
+            },
+            # Ethereum mainnet (1)
+            1: {
+                "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2": "weth",
+                "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48": "usd-coin",
+                "0x6b175474e89094c44da98b954eedeac495271d0f": "dai",
+                "0xbe9895146f7af43049ca1c1ae358b0541ea49704": "coinbase-wrapped-staked-eth",
+            },
+        }
+
+        mapping = per_chain.get(chain_id, {})
+        if addr in mapping:
+            return mapping[addr]
+
+        # --- Conservative symbol fallback (only unambiguous for our set) ---
+        symbol_fallback: Dict[str, str] = {
+            "WETH": "weth",
+            "USDC": "usd-coin",
+            "DAI": "dai",
+            "CBETH": "coinbase-wrapped-staked-eth",
+            
+            # Week 1 additions
+            "WBTC": "wrapped-bitcoin",
+            "DEGEN": "degen-base",
+            "TOSHI": "toshi",
+            "BRETT": "based-brett",
+            "USDBC": "bridged-usd-coin-base",            
+            "CBBTC": "coinbase-wrapped-btc",
+            "WELL": "moonwell",
+            "SEAM": "seamless-protocol",
+            "MOCHI": "mochi-2",
+            "BALD": "bald",
+            "NORMIE": "normie",
+            "KEYCAT": "keycat",
+            "HIGHER": "higher",
+            "DOLA": "dola-usd",
+            "EURC": "euro-coin",
+            "BASED": "based",
+            "OVN": "overnight-finance",
+            "AXLUSDC": "axlusdc",
+            
+            
+        }
+        if sym in symbol_fallback:
+            return symbol_fallback[sym]
+
+        # Unknown → let caller decide (e.g., skip and log once)
+        return None
+
+    async def close(self) -> None:
+        """
+        Release resources held by this service.
+        
+        Kept for callers that close services when done. The connection
+        pool belongs to the shared PriceFeedClient and stays open for
+        other services and later calls.
+        """
+        logger.debug("[PRICE FEED] Service closed (shared client stays open)")
+
+    def get_bulk_token_prices_sync(
+        self,
+        tokens: List[Tuple[str, str]],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Optional[Decimal]]:
+        """
+        Get bulk token prices from sync code (e.g. Celery tasks).
+        
+        Cache lookups and write-back run in the calling thread; only the
+        upstream fetch of cache misses runs on the shared client's event
+        loop, so blocking cache round trips never hold up its merge window
+        or rate limiter.
+        
+        Args:
+            tokens: List of (symbol, address) tuples
+            timeout: Seconds to wait for the upstream fetch (None waits indefinitely)
+            
+        Returns:
+            Dictionary mapping lowercased addresses to prices (or None if unavailable)
+        """
+        if not tokens:
+            return {}
+        
+        results, tokens_to_fetch = self._lookup_cached_prices(tokens)
+        
+        if tokens_to_fetch:
+            fetched_prices: Dict[str, Optional[Decimal]] = {}
+            try:
+                fetched_prices = self.client.run(
+                    self._fetch_bulk_from_coingecko(tokens_to_fetch), timeout
+                )
+                self.bulk_api_calls += 1
+            except Exception as e:
+                logger.error(f"[PRICE FEED] Bulk fetch failed: {e}", exc_info=True)
+            self._store_fetched_prices(results, tokens_to_fetch, fetched_prices)
+        
+        return results
+
+    # =========================================================================
+    # PUBLIC API METHODS
+    # =========================================================================
+    async def get_token_price(
+        self,
+        token_address: str,
+        token_symbol: str
+    ) -> Optional[Decimal]:
+        """
+        Get current price for a single token with caching.
+        
+        This method checks cache first, then falls back to API if needed.
+        For multiple tokens, use get_bulk_token_prices() instead for better performance.
+        
+        Args:
+            token_address: Token contract address
+            token_symbol: Token symbol (e.g., 'WETH', 'USDC')
+            
+        Returns:
+            Token price in USD as Decimal, or None if unavailable
+            
+        Example:
+            >>> price = await service.get_token_price(
+            ...     "0x4200000000000000000000000000000000000006",
+            ...     "WETH"
+            ... )
+            >>> print(f"${price:.2f}")
+            $2543.50
+        """
+        # Check if it's a stablecoin (instant return)
+        if token_symbol.upper() in STABLECOINS:
+            logger.debug(f"[PRICE FEED] {token_symbol} is stablecoin, returning $1.00")
+            return STABLECOINS[token_symbol.upper()]
+        
+        # Try fresh cache first
+        cached_price = self._get_cached_price(token_address)
+        if cached_price is not None:
+            return cached_price
+        
+        # Cache miss - fetch from API
+        logger.debug(
+            f"[PRICE FEED] Cache miss for {token_symbol}, fetching from API"
+        )
+        
+        try:
+            price = await self._fetch_from_coingecko(token_symbol, token_address)
+            
+            if price is not None:
+                # Cache the new price
+                self._cache_price(token_address, price)
+                self.api_call_count += 1
+                return price
+            else:
+                # API failed - try stale cache as fallback
+                stale_price = self._get_stale_cached_price(token_address)
+                if stale_price is not None:
+                    logger.info(
+                        f"[PRICE FEED] Using stale cache for {token_symbol} "
+                        f"(API unavailable)"
+                    )
+                    return stale_price
+                
+                logger.warning(
+                    f"[PRICE FEED] No price available for {token_symbol} "
+                    f"(API failed, no cache)"
+                )
+                return None
+                
+        except Exception as e:
+            logger.error(
+                f"[PRICE FEED] Error fetching price for {token_symbol}: {e}",
+                exc_info=True
+            )
+            
+            # Try stale cache on error
+            stale_price = self._get_stale_cached_price(token_address)
+            if stale_price is not None:
+                logger.info(
+                    f"[PRICE FEED] Using stale cache for {token_symbol} (error recovery)"
+                )
+                return stale_price
+            
+            return None
+
+    async def get_bulk_token_prices(
+        self,
+        tokens: List[Tuple[str, str]]
+    ) -> Dict[str, Optional[Decimal]]:
+        """
+        Get prices for multiple tokens in a single API call (RECOMMENDED).
+        
+        This is the OPTIMIZED way to fetch prices - uses 1 API call instead of N.
+        
+        Args:
+            tokens: List of (symbol, address) tuples
+            
+        Returns:
+            Dictionary mapping symbols to prices (or None if unavailable)
+            
+        Example:
+            >>> prices = await service.get_bulk_token_prices([
+            ...     ('WETH', '0x4200...'),
+            ...     ('USDC', '0x036C...'),
+            ...     ('DAI', '0x50c5...')
+            ... ])
+            >>> prices
+            {'WETH': Decimal('2543.50'), 'USDC': Decimal('1.00'), 'DAI': Decimal('1.00')}
+        """
+        if not tokens:
+            logger.warning("[PRICE FEED] get_bulk_token_prices called with empty list")
+            return {}
+        
+        logger.info(
+            f"[PRICE FEED] Fetching bulk prices for {len(tokens)} tokens: "
+            f"{', '.join(sym for sym, _ in tokens)}"
+        )
+        
+        results, tokens_to_fetch = self._lookup_cached_prices(tokens)
+        
+        # Fetch uncached tokens in bulk (1 API call)
+        if tokens_to_fetch:
+            fetched_prices: Dict[str, Optional[Decimal]] = {}
+            try:
+                fetched_prices = await self._fetch_bulk_from_coingecko(tokens_to_fetch)
+                self.bulk_api_calls += 1
+            except Exception as e:
+                logger.error(
+                    f"[PRICE FEED] Bulk fetch failed: {e}",
+                    exc_info=True
+                )
+            self._store_fetched_prices(results, tokens_to_fetch, fetched_prices)
+        
+        return {symbol: results.get(address.lower()) for symbol, address in tokens}
+
+    def _lookup_cached_prices(
+        self,
+        tokens: List[Tuple[str, str]]
+    ) -> Tuple[Dict[str, Optional[Decimal]], List[Tuple[str, str]]]:
+        """
+        Resolve stablecoins and fresh cache hits (one cache lookup).
+        
+        Args:
+            tokens: List of (symbol, address) tuples
+            
+        Returns:
+            Prices by lowercased address, and the tokens still to fetch
+        """
+        results: Dict[str, Optional[Decimal]] = {}
+        candidates: List[Tuple[str, str]] = []
+        for symbol, address in tokens:
+            # Stablecoins always return $1.00
+            if symbol.upper() in STABLECOINS:
+                results[address.lower()] = STABLECOINS[symbol.upper()]
+                logger.debug(f"[PRICE FEED] {symbol} is stablecoin")
+                continue
+            candidates.append((symbol, address))
+        
+        cached_prices = self._get_cached_prices([address for _, address in candidates])
+        tokens_to_fetch: List[Tuple[str, str]] = []
+        for symbol, address in candidates:
+            cached_price = cached_prices.get(address.lower())
+            if cached_price is not None:
+                results[address.lower()] = cached_price
+                logger.debug(f"[PRICE FEED] Cache hit for {symbol}")
+            else:
+                tokens_to_fetch.append((symbol, address))
+        
+        if tokens_to_fetch:
+            logger.info(
+                f"[PRICE FEED] Need to fetch {len(tokens_to_fetch)} tokens from API: "
+                f"{', '.join(sym for sym, _ in tokens_to_fetch)}"
+            )
+        return results, tokens_to_fetch
+
+    def _store_fetched_prices(
+        self,
+        results: Dict[str, Optional[Decimal]],
+        tokens_to_fetch: List[Tuple[str, str]],
+        fetched_prices: Dict[str, Optional[Decimal]]
+    ) -> None:
+        """
+        Add fetched prices to results and cache them (one batched write);
+        tokens still without a price fall back to the stale cache.
+        
+        Args:
+            results: Prices by lowercased address (updated in place)
+            tokens_to_fetch: Tokens that missed the fresh cache
+            fetched_prices: Upstream prices by lowercased address
+        """
+        fresh_prices = {
+            address: price for address, price in fetched_prices.items() if price is not None
+        }
+        results.update(fresh_prices)
+        self._cache_prices(fresh_prices)
+        
+        unpriced = [
+            address.lower() for _, address in tokens_to_fetch
+            if results.get(address.lower()) is None
+        ]
+        if unpriced:
+            stale_prices = self._get_stale_cached_prices(unpriced)
+            for address in unpriced:
+                results[address] = stale_prices.get(address)
+        
+        successful = sum(1 for _, address in tokens_to_fetch if results.get(address.lower()) is not None)
+        logger.info(
+            f"[PRICE FEED] Bulk fetch complete: {successful}/{len(tokens_to_fetch)} "
+            f"uncached prices retrieved"
+        )
+
+    # =========================================================================
+    # COINGECKO API METHODS
+    # =========================================================================
+
+    async def _fetch_from_coingecko(
+        self,        
+        token_symbol: str,
+        token_address: str
+    ) -> Optional[Decimal]:
+        """
+        Fetch single token price from CoinGecko API.
+        
+        Args:
+            token_symbol: Token symbol
+            token_address: Token contract address
+            
+        Returns:
+            Price in USD or None if unavailable
+        """
+        # Get CoinGecko ID for this token
+        coin_id = self._get_coingecko_id(token_symbol, token_address, self.chain_id)  # ✅ All 3 params
+        if not coin_id:
+            logger.debug(f"[PRICE FEED] No CoinGecko ID for {token_symbol}")
+            return None
+        
+        try:
+            # Merged with any concurrent requests by the shared client
+            prices = await self.client.get_prices([coin_id])
+        except Exception as e:
+            logger.error(
+                f"[PRICE FEED] CoinGecko API error: {e}",
+                exc_info=True
+            )
+            return None
+        
+        price_usd = prices.get(coin_id)
+        if price_usd is not None:
+            logger.info(
+                f"[PRICE FEED] ✅ Fetched price for {token_symbol}: "
+                f"${price_usd:.2f}"
+            )
+        return price_usd
+
+    async def _fetch_bulk_from_coingecko(
+        self,
+        tokens: List[Tuple[str, str]]
+    ) -> Dict[str, Optional[Decimal]]:
+        """
+        Fetch multiple token prices in a single CoinGecko API call.
+        
+        This is the KEY OPTIMIZATION that reduces API usage by 90%.
+        
+        Args:
+            tokens: List of (symbol, address) tuples to fetch
+            
+        Returns:
+            Dictionary mapping lowercased addresses to prices
+        """
+        if not tokens:
+            return {}
+        
+        results: Dict[str, Optional[Decimal]] = {address.lower(): None for _, address in tokens}
+        
+        # Build list of CoinGecko IDs (tokens sharing a symbol keep their own address)
+        coin_id_by_address: Dict[str, str] = {}
+        for symbol, address in tokens:
+            coin_id = self._get_coingecko_id(symbol, address, self.chain_id)
+            if coin_id:
+                coin_id_by_address[address.lower()] = coin_id
+        
+        if not coin_id_by_address:
+            logger.warning("[PRICE FEED] No valid CoinGecko IDs in bulk request")
+            return results
+        
+        try:
+            # One bulk call, shared with any concurrent requests
+            prices = await self.client.get_prices(set(coin_id_by_address.values()))
+        except Exception as e:
+            logger.error(
+                f"[PRICE FEED] Bulk fetch exception: {e}",
+                exc_info=True
+            )
+            return results
+        
+        for address, coin_id in coin_id_by_address.items():
+            price = prices.get(coin_id)
+            results[address] = price
+            if price is not None:
+                logger.debug(
+                    f"[PRICE FEED] Bulk fetch: {address[:10]} = ${price:.2f}"
+                )
+        
+        logger.info(
+            f"[PRICE FEED] ✅ Bulk fetch succeeded: "
+            f"{sum(1 for p in results.values() if p is not None)}/{len(tokens)} prices"
+        )
+        return results
+
+    # =========================================================================
+    # CACHING METHODS (ENHANCED WITH STALE-WHILE-REVALIDATE)
+    # =========================================================================
+    def _get_cached_prices(self, token_addresses: List[str]) -> Dict[str, Decimal]:
+        """
+        Get fresh cached prices for several tokens in one cache lookup.
+        
+        Args:
+            token_addresses: Token contract addresses
+            
+        Returns:
+            Dictionary mapping lowercased addresses to cached prices (hits only)
+        """
+        if not token_addresses:
+            return {}
+        
+        try:
+            prices = self._read_price_keys(PRICE_CACHE_PREFIX, token_addresses)
+        except Exception as e:
+            logger.warning(f"[PRICE FEED] Cache retrieval error: {e}")
+            return {}
+        
+        self.cache_hits += len(prices)
+        self.cache_misses += len({address.lower() for address in token_addresses}) - len(prices)
+        for address, price in prices.items():
+            logger.debug(f"[CACHE HIT] Fresh price for {address[:10]}: ${price:.2f}")
+        return prices
+    
+    def _get_cached_price(self, token_address: str) -> Optional[Decimal]:
+        """
+        Get cached price with fresh/stale distinction.
+        
+        Args:
+            token_address: Token contract address
+            
+        Returns:
+            Cached price or None if not in fresh cache
+        """
+        return self._get_cached_prices([token_address]).get(token_address.lower())
+    
+    def _get_stale_cached_prices(self, token_addresses: List[str]) -> Dict[str, Decimal]:
+        """
+        Get stale cached prices as fallback when API fails, in one lookup.
+        
+        Args:
+            token_addresses: Token contract addresses
+            
+        Returns:
+            Dictionary mapping lowercased addresses to stale prices (hits only)
+        """
+        if not token_addresses:
+            return {}
+        
+        try:
+            prices = self._read_price_keys(STALE_CACHE_PREFIX, token_addresses)
+        except Exception as e:
+            logger.warning(f"[PRICE FEED] Stale cache retrieval error: {e}")
+            return {}
+        
+        self.stale_cache_hits += len(prices)
+        for address, price in prices.items():
+            logger.info(
+                f"[STALE CACHE] Using stale price for {address[:10]}: "
+                f"${price:.2f} (API unavailable)"
+            )
+        return prices
+    
+    def _get_stale_cached_price(self, token_address: str) -> Optional[Decimal]:
+        """
+        Get stale cached price as fallback when API fails.
+        
+        Args:
+            token_address: Token contract address
+            
+        Returns:
+            Stale cached price or None if not available
+        """
+        return self._get_stale_cached_prices([token_address]).get(token_address.lower())
+    
+    def _cache_prices(self, prices: Dict[str, Decimal]) -> None:
+        """
+        Cache prices with both fresh and stale TTLs (one batched write per TTL).
+        
+        Args:
+            prices: Dictionary mapping token addresses to prices
+        """
+        if not prices:
+            return
+        
+        try:
+            for prefix, timeout in (
+                (PRICE_CACHE_PREFIX, PRICE_CACHE_TTL),
+                (STALE_CACHE_PREFIX, STALE_CACHE_TTL)
+            ):
+                self.price_cache.set_many(
+                    {
+                        self._price_cache_key(prefix, address): price
+                        for address, price in prices.items()
+                    },
+                    timeout=timeout,
+                    encode=float
+                )
+            
+            logger.debug(
+                f"[CACHE SET] Cached {len(prices)} prices "
+                f"(Fresh: {PRICE_CACHE_TTL}s, Stale: {STALE_CACHE_TTL}s)"
+            )
+            
+        except Exception as e:
+            logger.warning(f"[PRICE FEED] Cache storage error: {e}")
+    
+    def _cache_price(self, token_address: str, price: Decimal) -> None:
+        """
+        Cache price with both fresh and stale TTLs.
+        
+        Args:
+            token_address: Token contract address
+            price: Price to cache
+        """
+        self._cache_prices({token_address: price})
+    
+    def _price_cache_key(self, prefix: str, token_address: str) -> str:
+        """Build the cache key for a token price."""
+        return f"{prefix}:{self.chain_id}:{token_address.lower()}"
+    
+    def _read_price_keys(self, prefix: str, token_addresses: List[str]) -> Dict[str, Decimal]:
+        """
+        Read prices for addresses under one key prefix through the two-level cache.
+        
+        Args:
+            prefix: Cache key prefix (fresh or stale)
+            token_addresses: Token contract addresses
+            
+        Returns:
+            Dictionary mapping lowercased addresses to prices (hits only)
+        """
+        key_to_address = {
+            self._price_cache_key(prefix, address): address.lower()
+            for address in token_addresses
+        }
+        cached = self.price_cache.get_many(
+            key_to_address,
+            decode=lambda value: Decimal(str(value))
+        )
+        return {key_to_address[key]: price for key, price in cached.items()}
+    
+    def get_cache_statistics(self) -> Dict[str, Any]:
+        """
+        Get cache performance statistics.
+        
+        Returns:
+            Dictionary containing cache metrics and performance data
+        """
+        total_requests = self.cache_hits + self.cache_misses
+        hit_rate = (self.cache_hits / total_requests * 100) if total_requests > 0 else 0
+        
+        return {
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'stale_cache_hits': self.stale_cache_hits,
+            'total_requests': total_requests,
+            'hit_rate_percent': round(hit_rate, 2),
+            'api_calls': self.api_call_count,
+            'bulk_api_calls': self.bulk_api_calls,
+            'cache_ttl_seconds': PRICE_CACHE_TTL,
+            'stale_ttl_seconds': STALE_CACHE_TTL,
+            'api_call_reduction': f"{100 - (self.api_call_count / max(total_requests, 1) * 100):.1f}%",
+            # Per-tier hit rates of the process-wide two-level cache
+            **self.price_cache.get_stats()
+        }
+
+
+# =============================================================================
+# HELPER FUNCTIONS (for easy usage)
+# =============================================================================
+
+# Global instances per chain (singleton pattern)
+_price_feed_services: Dict[int, PriceFeedService] = {}
+_price_feed_services_lock = threading.Lock()
+
+
+def get_default_price_feed_service(chain_id: Optional[int] = None) -> PriceFeedService:
+    """
+    Get or create the shared price feed service for a chain.
+    
+    Args:
+        chain_id: Blockchain network ID (default: settings.DEFAULT_CHAIN_ID)
+    
+    Returns:
+        Singleton PriceFeedService instance for the chain
+    """
+    if chain_id is None:
+        chain_id = getattr(settings, 'DEFAULT_CHAIN_ID', 84532)
+    
+    with _price_feed_services_lock:
+        if chain_id not in _price_feed_services:
+            _price_feed_services[chain_id] = PriceFeedService(chain_id=chain_id)
+            logger.info(
+                f"[PRICE FEED] Created OPTIMIZED default service for chain {chain_id}"
+            )
+        return _price_feed_services[chain_id]
+
+
+async def get_bulk_token_prices_simple(
+    tokens: List[Tuple[str, str]],
+    chain_id: int = 84532
+) -> Dict[str, Optional[Decimal]]:
+    """
+    Simple helper function to fetch multiple token prices quickly.
+    
+    This is the RECOMMENDED way to fetch prices for paper trading.
+    
+    Args:
+        tokens: List of (symbol, address) tuples
+        chain_id: Blockchain network ID (default: Base Sepolia)
+    
+    Returns:
+        Dictionary mapping symbols to prices
+    
+    Example:
+        prices = await get_bulk_token_prices_simple([
+            ("WETH", "0x4200000000000000000000000000000000000006"),
+            ("USDC", "0x036CbD53842c5426634e7929541eC2318f3dCF7e"),
+            ("DAI", "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb")
+        ])
+        # Returns: {'WETH': Decimal('2543.50'), 'USDC': Decimal('1.00'), ...}
+    """
+    service = get_default_price_feed_service(chain_id)
+    return await service.get_bulk_token_prices(tokens)
\ No newline at end of file
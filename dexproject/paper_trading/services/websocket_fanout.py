@@ -0,0 +1,254 @@
+"""
+WebSocket Fan-Out for Paper Trading Notifications
+
+Collects channel-layer messages per room over a short window and sends
+them as one frame per room from a persistent sender event loop, instead of
+one group_send (and one async_to_sync bridge) per message on the caller's
+thread.
+
+Within a window, snapshot messages (portfolio, bot status, performance)
+supersede earlier ones of the same type, so only the latest is sent. A
+window holding a single message sends it unchanged; several are wrapped
+in a 'batch.update' frame that PaperTradingConsumer.batch_update unpacks.
+
+File: dexproject/paper_trading/services/websocket_fanout.py
+"""
+
+import asyncio
+import logging
+import threading
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Collection window per room (seconds); 0 sends each message on its own
+DEFAULT_BATCH_WINDOW_SECONDS = float(
+    getattr(settings, 'PAPER_TRADING_WS_BATCH_WINDOW_SECONDS', 0.25)
+)
+
+# Channel-layer type of batched frames (handled by consumer.batch_update)
+BATCH_MESSAGE_TYPE = 'batch.update'
+
+# Snapshot message types where only the latest in a window matters
+COALESCED_MESSAGE_TYPES = frozenset({
+    'portfolio.update',
+    'bot.status.update',
+    'performance.update',
+})
+
+
+# =============================================================================
+# ROOM FAN-OUT CLASS
+# =============================================================================
+
+class RoomFanout:
+    """
+    Per-room message coalescing and batching on a persistent sender loop.
+
+    publish() is thread-safe and never blocks on the channel layer; the
+    sender loop runs on a daemon thread started on first use.
+
+    Example usage:
+        fanout = RoomFanout(get_channel_layer())
+        fanout.publish('paper_trading_<account_id>', {'type': 'portfolio.update', 'data': {...}})
+
+        # On shutdown: send what is pending and stop the sender
+        fanout.close()
+    """
+
+    def __init__(
+        self,
+        channel_layer: Any,
+        batch_window_seconds: float = DEFAULT_BATCH_WINDOW_SECONDS
+    ) -> None:
+        """
+        Initialize the fan-out.
+
+        Args:
+            channel_layer: Channels layer used for group_send
+            batch_window_seconds: How long a room collects messages before sending
+        """
+        self.channel_layer = channel_layer
+        self.batch_window_seconds = batch_window_seconds
+
+        self._pending: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._loop_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Metrics
+        self.published = 0
+        self.superseded = 0
+        self.frames_sent = 0
+        self.messages_sent = 0
+        self.send_errors = 0
+
+    # =========================================================================
+    # PUBLISHING
+    # =========================================================================
+
+    def publish(self, room_group_name: str, message: Dict[str, Any]) -> None:
+        """
+        Queue a channel-layer message for a room.
+
+        Args:
+            room_group_name: Channel layer group
+            message: Channel layer message ('type' plus payload)
+        """
+        with self._lock:
+            pending = self._pending.get(room_group_name)
+            first = pending is None
+            if first:
+                pending = self._pending[room_group_name] = []
+
+            if message['type'] in COALESCED_MESSAGE_TYPES:
+                for index, queued in enumerate(pending):
+                    if queued['type'] == message['type']:
+                        del pending[index]
+                        self.superseded += 1
+                        break
+
+            pending.append(message)
+            self.published += 1
+
+        # The first message of a window schedules the room's send
+        if first:
+            asyncio.run_coroutine_threadsafe(
+                self._send_room_after_window(room_group_name),
+                self._get_loop()
+            )
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """
+        Send every room's pending messages now and wait for the sends.
+
+        Args:
+            timeout: Seconds to wait per room
+        """
+        with self._lock:
+            rooms = list(self._pending)
+        if not rooms:
+            return
+
+        loop = self._get_loop()
+        for room_group_name in rooms:
+            future = asyncio.run_coroutine_threadsafe(self._send_room(room_group_name), loop)
+            try:
+                future.result(timeout)
+            except Exception as e:
+                logger.warning(f"[WS FANOUT] Flush of {room_group_name} did not complete: {e}")
+
+    def close(self) -> None:
+        """Flush pending messages and stop the sender loop."""
+        self.flush()
+        with self._loop_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        # Windows still waiting have nothing left to send
+        asyncio.run_coroutine_threadsafe(self._cancel_windows(), loop).result(5.0)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5.0)
+        if not thread.is_alive():
+            loop.close()
+
+    # =========================================================================
+    # SENDER LOOP
+    # =========================================================================
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the sender loop, starting its thread on first use."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever,
+                    name='ws-fanout',
+                    daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    async def _send_room_after_window(self, room_group_name: str) -> None:
+        """Wait out the room's collection window, then send it."""
+        if self.batch_window_seconds > 0:
+            await asyncio.sleep(self.batch_window_seconds)
+        await self._send_room(room_group_name)
+
+    async def _cancel_windows(self) -> None:
+        """Cancel every other task on the sender loop."""
+        current = asyncio.current_task()
+        for task in asyncio.all_tasks():
+            if task is not current:
+                task.cancel()
+
+    async def _send_room(self, room_group_name: str) -> None:
+        """
+        Send a room's pending messages as one frame.
+
+        Args:
+            room_group_name: Channel layer group
+        """
+        with self._lock:
+            messages = self._pending.pop(room_group_name, None)
+        if not messages:
+            return
+
+        if len(messages) == 1:
+            frame = messages[0]
+        else:
+            frame = {'type': BATCH_MESSAGE_TYPE, 'messages': messages}
+
+        try:
+            await self.channel_layer.group_send(room_group_name, frame)
+        except Exception as e:
+            self.send_errors += 1
+            logger.error(
+                f"[WS FANOUT] Failed to send {len(messages)} messages to {room_group_name}: {e}",
+                exc_info=True
+            )
+            return
+
+        self.frames_sent += 1
+        self.messages_sent += len(messages)
+        logger.debug(
+            f"[WS FANOUT] Sent {len(messages)} messages to {room_group_name}: "
+            f"{[message['type'] for message in messages]}"
+        )
+
+    # =========================================================================
+    # METRICS
+    # =========================================================================
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get fan-out metrics.
+
+        Returns:
+            Dictionary with published/superseded/sent counts and pending rooms
+        """
+        with self._lock:
+            pending_rooms = len(self._pending)
+        return {
+            'published': self.published,
+            'superseded': self.superseded,
+            'frames_sent': self.frames_sent,
+            'messages_sent': self.messages_sent,
+            'send_errors': self.send_errors,
+            'pending_rooms': pending_rooms,
+            'batch_window_seconds': self.batch_window_seconds,
+        }
+
+
+__all__ = [
+    'BATCH_MESSAGE_TYPE',
+    'COALESCED_MESSAGE_TYPES',
+    'RoomFanout',
+]
@@ -10,6 +10,8 @@ Key improvements:
 - Support for all message types
 - Generic send method for flexibility
 - Proper UUID handling
+- Messages are coalesced per room and sent in batches by a persistent
+  sender (see websocket_fanout.py)
 
 File: dexproject/paper_trading/services/websocket_service.py
 """
@@ -23,7 +25,8 @@ from datetime import datetime
 from enum import Enum
 
 from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
+
+from paper_trading.services.websocket_fanout import RoomFanout
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,9 @@ class WebSocketNotificationService:
         """
         self.channel_layer = get_channel_layer()
         
+        # Per-room batching on a persistent sender loop
+        self.fanout = RoomFanout(self.channel_layer) if self.channel_layer else None
+        
         # Log warning if channel layer is not available
         if not self.channel_layer:
             logger.warning(
@@ -87,6 +93,8 @@ class WebSocketNotificationService:
         Generic method to send any type of update to WebSocket clients.
     
         This is the core method that all other send methods use internally.
+        The message is queued on the room's fan-out and sent with the room's
+        other messages of the current batch window.
     
         Args:
             account_id: Account UUID (string or UUID object)
@@ -95,7 +103,7 @@ class WebSocketNotificationService:
             include_timestamp: Whether to add timestamp to message
         
         Returns:
-            True if message sent successfully, False otherwise
+            True if message was queued successfully, False otherwise
         """
         # Check if channel layer is available
         if not self.channel_layer:
@@ -122,14 +130,8 @@ class WebSocketNotificationService:
             if include_timestamp and 'timestamp' not in serialized_data:
                 serialized_data['timestamp'] = datetime.now().isoformat()
             
-            # DEBUG: Log what we're sending
-            logger.info(
-                f"SENDING WebSocket message to room {room_group_name}: "
-                f"type={message_type} -> {message_type.replace('_', '.')}"
-            )
-        
-            # Send message to room group
-            async_to_sync(self.channel_layer.group_send)(
+            # Queue message for the room group
+            self.fanout.publish(
                 room_group_name,
                 {
                     'type': message_type.replace('_', '.'),  # Django Channels convention
@@ -137,8 +139,8 @@ class WebSocketNotificationService:
                 }
             )
         
-            logger.info(
-                f"SENT WebSocket update: type={message_type}, "
+            logger.debug(
+                f"Queued WebSocket update: type={message_type}, "
                 f"room={room_group_name}, data_keys={list(serialized_data.keys())}"
             )
             return True
@@ -431,6 +433,20 @@ class WebSocketNotificationService:
         """
         return self.channel_layer is not None
     
+    def flush(self) -> None:
+        """Send all queued messages now (e.g. before shutdown)."""
+        if self.fanout:
+            self.fanout.flush()
+    
+    def get_fanout_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get batching statistics of the fan-out.
+        
+        Returns:
+            Fan-out metrics or None if the channel layer is not configured
+        """
+        return self.fanout.get_stats() if self.fanout else None
+    
     def get_room_members_count(self, account_id: Union[str, uuid.UUID]) -> Optional[int]:
         """
         Get approximate count of connected clients for an account.
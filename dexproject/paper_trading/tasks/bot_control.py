@@ -15,7 +15,6 @@ File: paper_trading/tasks/bot_control.py
 """
 
 import logging
-import asyncio
 from typing import Dict, Any, Optional, List, Tuple
 from decimal import Decimal
 from datetime import timedelta
@@ -31,7 +30,7 @@ from paper_trading.models import (
 )
 # CIRCULAR IMPORT FIX: Removed 'from paper_trading.bot import EnhancedPaperTradingBot'
 # This import is now done inside run_paper_trading_bot() function to break circular dependency
-from paper_trading.services.price_feed_service import PriceFeedService
+from paper_trading.services.price_feed_service import get_default_price_feed_service
 
 logger = logging.getLogger(__name__)
 
@@ -557,8 +556,8 @@ def update_position_prices_task(
     logger.info(f"[POSITION_PRICE_UPDATE] Starting position price updates for chain {chain_id}")
 
     try:
-        # Initialize price feed service
-        price_service = PriceFeedService(chain_id=chain_id)
+        # Shared price feed service (pooled client survives across runs)
+        price_service = get_default_price_feed_service(chain_id)
 
         # Get all open positions
         open_positions = PaperPosition.objects.filter(
@@ -577,20 +576,24 @@ def update_position_prices_task(
         total_positions = open_positions.count()
         logger.info(f"[POSITION_PRICE_UPDATE] Found {total_positions} open positions to update")
 
-        # Collect all unique token addresses
-        token_addresses = list(set(pos.token_address for pos in open_positions))
-        logger.info(f"[POSITION_PRICE_UPDATE] Fetching prices for {len(token_addresses)} unique tokens")
+        # Collect all unique tokens
+        tokens = list({
+            pos.token_address.lower(): (pos.token_symbol, pos.token_address)
+            for pos in open_positions
+        }.values())
+        logger.info(f"[POSITION_PRICE_UPDATE] Fetching prices for {len(tokens)} unique tokens")
 
-        # Fetch all prices in bulk (much more efficient than individual calls)
+        # Fetch all prices in one bulk call (much more efficient than individual calls)
         token_prices = {}
         try:
-            for token_address in token_addresses:
-                price_data = price_service.get_token_price(token_address)
-                if price_data and price_data.get('price_usd'):
-                    token_prices[token_address.lower()] = Decimal(str(price_data['price_usd']))
+            prices = price_service.get_bulk_token_prices_sync(tokens, timeout=60)
+            for _, token_address in tokens:
+                price = prices.get(token_address.lower())
+                if price is not None:
+                    token_prices[token_address.lower()] = price
                     logger.debug(
                         f"[POSITION_PRICE_UPDATE] Fetched price for {token_address[:10]}...: "
-                        f"${price_data['price_usd']}"
+                        f"${price}"
                     )
         except Exception as price_error:
             logger.error(f"[POSITION_PRICE_UPDATE] Error fetching prices: {price_error}", exc_info=True)
@@ -713,22 +716,12 @@ def update_single_position_price(
                 'error': error_msg
             }
 
-        # Initialize price service
-        price_service = PriceFeedService(chain_id=chain_id)
-
-        # Fetch price
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-        try:
-            price = loop.run_until_complete(
-                price_service.get_token_price(
-                    position.token_address,
-                    position.token_symbol
-                )
-            )
-        finally:
-            loop.close()
+        # Fetch price on the shared price feed client's loop
+        price_service = get_default_price_feed_service(chain_id)
+        price = price_service.get_bulk_token_prices_sync(
+            [(position.token_symbol, position.token_address)],
+            timeout=60
+        ).get(position.token_address.lower())
 
         if price is None:
             error_msg = f"Failed to fetch price for {position.token_symbol}"
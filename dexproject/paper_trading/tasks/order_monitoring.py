@@ -40,7 +40,7 @@ from paper_trading.constants import (
 
 # Import services
 from paper_trading.services.order_manager import OrderManager
-from paper_trading.services.price_feed_service import PriceFeedService
+from paper_trading.services.price_feed_service import get_default_price_feed_service
 # from paper_trading.services.websocket_service import send_paper_trading_update
 
 logger = logging.getLogger(__name__)
@@ -82,8 +82,8 @@ def monitor_orders_task(
     logger.info("[ORDER_MONITOR] Starting order monitoring cycle")
     
     try:
-        # Initialize price feed service
-        price_service = PriceFeedService(chain_id=chain_id)
+        # Shared price feed service (pooled client survives across runs)
+        price_service = get_default_price_feed_service(chain_id)
         
         # Tracking statistics
         stats = {
@@ -116,20 +116,23 @@ def monitor_orders_task(
         total_orders = active_orders.count()
         logger.info(f"[ORDER_MONITOR] Monitoring {total_orders} active orders")
         
-        # Collect unique token addresses for bulk price fetching
-        token_addresses = list(set(order.token_address for order in active_orders))
-        logger.info(f"[ORDER_MONITOR] Fetching prices for {len(token_addresses)} unique tokens")
+        # Collect unique tokens for bulk price fetching
+        tokens = list({
+            order.token_address.lower(): (order.token_symbol, order.token_address)
+            for order in active_orders
+        }.values())
+        logger.info(f"[ORDER_MONITOR] Fetching prices for {len(tokens)} unique tokens")
         
-        # Fetch all prices in bulk (efficient)
+        # Fetch all prices in one bulk call (efficient)
         token_prices: Dict[str, Decimal] = {}
         try:
-            for token_address in token_addresses:
-                price_data = price_service.get_token_price(token_address)
-                if price_data and price_data.get('price_usd'):
-                    token_prices[token_address.lower()] = Decimal(str(price_data['price_usd']))
+            prices = price_service.get_bulk_token_prices_sync(tokens, timeout=60)
+            for _, token_address in tokens:
+                price = prices.get(token_address.lower())
+                if price is not None:
+                    token_prices[token_address.lower()] = price
                     logger.debug(
-                        f"[ORDER_MONITOR] Price for {token_address[:10]}...: "
-                        f"${price_data['price_usd']}"
+                        f"[ORDER_MONITOR] Price for {token_address[:10]}...: ${price}"
                     )
         except Exception as price_error:
             logger.error(f"[ORDER_MONITOR] Error fetching prices: {price_error}", exc_info=True)
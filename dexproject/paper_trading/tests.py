@@ -4,10 +4,39 @@ Paper Trading Tests
 File: dexproject/paper_trading/tests.py
 """
 
-from django.test import TestCase
+import asyncio
+import json
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import mock
+
+from django.db.models.signals import post_save
+from django.utils import timezone
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth.models import User
 from decimal import Decimal
-from .models import PaperTradingAccount, PaperTrade
+from types import SimpleNamespace
+from web3 import AsyncWeb3
+from web3.providers.async_base import AsyncJSONBaseProvider
+from .constants import DecisionType
+from .consumers import PaperTradingConsumer
+from .models import PaperAIThoughtLog, PaperTradingAccount, PaperTrade, PaperPosition
+from .bot.positions import PositionManager
+from .bot.buy import market_analyzer
+from .bot.enhanced_bot import next_tick_deadline
+from .bot.shared.thought_log_writer import ThoughtLogWriter
+from .bot.shared.tick_context import TICK_QUERY_BUDGET
+from .intelligence.analyzers.gas_analyzer import RealGasAnalyzer
+from .intelligence.analyzers.volatility_analyzer import RealVolatilityAnalyzer
+from .intelligence.core.data_tracker import DataTracker
+from .intelligence.data.price_history import PriceHistory
+from .services.delta_stream import DeltaStream
+from .services.price_cache import PriceCache
+from .services.price_feed_client import PriceFeedClient, TokenBucket
+from .services.websocket_fanout import RoomFanout
 
 
 class PaperTradingAccountTestCase(TestCase):
@@ -53,3 +82,845 @@ class PaperTradingAccountTestCase(TestCase):
         )
         self.assertEqual(self.account.total_trades, 0)
         self.assertEqual(self.account.reset_count, 1)
+
+
+class PositionPriceUpdateTestCase(TestCase):
+    """Test the bulk per-tick position price update."""
+
+    def setUp(self):
+        """Set up an account with open and closed positions."""
+        user = User.objects.create_user(username='bulkuser', password='testpass123')
+        self.account = PaperTradingAccount.objects.create(user=user, name='Bulk Account')
+        for i in range(5):
+            PaperPosition.objects.create(
+                account=self.account,
+                token_address='0x' + f'{i:040x}',
+                token_symbol=f'TK{i}',
+                quantity=Decimal('10'),
+                total_invested_usd=Decimal('100'),
+                current_price_usd=Decimal('10')
+            )
+        PaperPosition.objects.create(
+            account=self.account,
+            token_address='0x' + 'f' * 40,
+            token_symbol='OLD',
+            is_open=False,
+            realized_pnl_usd=Decimal('7.50')
+        )
+        self.manager = PositionManager(account=self.account)
+        self.manager.load_positions()
+
+    def test_prices_persisted_with_constant_queries(self):
+        """All positions and the account P&L are written in one transaction."""
+        token_list = [{'symbol': f'TK{i}', 'price': Decimal('12')} for i in range(4)]
+        token_list.append({'symbol': 'TK4', 'price': 0})
+
+        # SAVEPOINT, bulk UPDATE, realized P&L aggregate, account UPDATE, RELEASE
+        with self.assertNumQueries(5):
+            updated = self.manager.update_position_prices(token_list)
+
+        self.assertEqual(updated, 4)
+        position = PaperPosition.objects.get(account=self.account, token_symbol='TK0')
+        self.assertEqual(position.current_value_usd, Decimal('120.00'))
+        self.assertEqual(position.unrealized_pnl_usd, Decimal('20.00'))
+        # Invalid price leaves the position untouched
+        untouched = PaperPosition.objects.get(account=self.account, token_symbol='TK4')
+        self.assertEqual(untouched.current_value_usd, Decimal('0'))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.total_profit_loss_usd, Decimal('87.50'))
+
+
+class TickPriceManager:
+    """Simulation-mode price manager stand-in with fixed prices."""
+
+    def __init__(self, symbols):
+        self.tokens = [
+            {'symbol': symbol, 'address': '0x' + f'{i:040x}', 'price': Decimal('12')}
+            for i, symbol in enumerate(symbols)
+        ]
+
+    def update_prices(self):
+        pass
+
+    def get_all_tokens(self):
+        return self.tokens
+
+    def get_token_price(self, symbol):
+        return next((token for token in self.tokens if token['symbol'] == symbol), None)
+
+    def get_price_history(self, symbol, limit=24):
+        return []
+
+
+class TickQueryBudgetTestCase(TestCase):
+    """Test that a tick's query count does not grow with open positions."""
+
+    def setUp(self):
+        """Set up an account and an engine that holds and skips everything."""
+        user = User.objects.create_user(username='tickuser', password='testpass123')
+        self.account = PaperTradingAccount.objects.create(user=user, name='Tick Account')
+
+        self.engine = mock.MagicMock(intel_level=5)
+        self.engine.make_decision = mock.AsyncMock(return_value=self.decision(DecisionType.HOLD))
+        self.engine.analyze = mock.AsyncMock(return_value=self.decision(DecisionType.SKIP))
+
+    def decision(self, action):
+        """Build a trading decision stand-in with the given action."""
+        return mock.Mock(
+            action=action,
+            primary_reasoning='test',
+            overall_confidence=Decimal('50'),
+            risk_score=Decimal('50'),
+            opportunity_score=Decimal('50'),
+            position_size_usd=Decimal('0')
+        )
+
+    def run_tick(self, position_count):
+        """Run one tick with position_count open positions; return its query count."""
+        symbols = [f'TK{i}' for i in range(position_count)]
+        for i, symbol in enumerate(symbols):
+            PaperPosition.objects.create(
+                account=self.account,
+                token_address='0x' + f'{i:040x}',
+                token_symbol=symbol,
+                quantity=Decimal('10'),
+                total_invested_usd=Decimal('100'),
+                average_entry_price_usd=Decimal('10'),
+                current_price_usd=Decimal('10')
+            )
+
+        with mock.patch.object(market_analyzer, 'ARBITRAGE_AVAILABLE', False):
+            analyzer = market_analyzer.MarketAnalyzer(
+                account=self.account,
+                session=mock.MagicMock(),
+                intelligence_engine=self.engine
+            )
+        position_manager = PositionManager(account=self.account)
+        price_manager = TickPriceManager(symbols + ['NEW0', 'NEW1'])
+        with mock.patch.object(market_analyzer, 'websocket_service'):
+            analyzer.tick(price_manager, position_manager, mock.MagicMock())
+
+        self.assertEqual(self.engine.make_decision.await_count, position_count)
+        self.engine.make_decision.reset_mock()
+        # Sell and safety-net thoughts per position, one per new token: queued, not written
+        self.assertEqual(analyzer.thought_writer.get_stats()['pending'], 2 * position_count + 2)
+        return analyzer.last_tick_queries
+
+    def test_query_count_independent_of_positions(self):
+        """Ticks with 1 and 4 open positions stay within the same budget."""
+        few = self.run_tick(1)
+        PaperPosition.objects.all().delete()
+        many = self.run_tick(4)
+
+        self.assertLessEqual(many, TICK_QUERY_BUDGET)
+        self.assertEqual(few, many)
+
+    def test_exact_query_count(self):
+        """A tick without trades issues a fixed, single-counted set of queries."""
+        # Account and open positions snapshot; flush: bulk price update,
+        # realized P&L sum, account P&L update, inside the test's savepoint
+        self.assertEqual(self.run_tick(3), 7)
+
+    def test_prices_flushed_at_end_of_tick(self):
+        """Deferred price updates and the account P&L are written by the flush."""
+        self.run_tick(2)
+
+        position = PaperPosition.objects.get(account=self.account, token_symbol='TK0')
+        self.assertEqual(position.current_value_usd, Decimal('120.00'))
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.total_profit_loss_usd, Decimal('40.00'))
+
+
+class ThoughtLogWriterTestCase(TestCase):
+    """Test the buffered thought-log writer."""
+
+    def setUp(self):
+        """Set up an account and count post_save notifications."""
+        user = User.objects.create_user(username='thoughtuser', password='testpass123')
+        self.account = PaperTradingAccount.objects.create(user=user, name='Thought Account')
+        self.notified = []
+        post_save.connect(self.on_save, sender=PaperAIThoughtLog)
+        self.addCleanup(post_save.disconnect, self.on_save, sender=PaperAIThoughtLog)
+
+    def on_save(self, sender, instance, created, **kwargs):
+        self.notified.append((instance.token_symbol, created))
+
+    def thought(self, action, symbol='TK'):
+        """Build an unsaved thought log."""
+        return PaperAIThoughtLog(
+            account=self.account,
+            decision_type=action,
+            token_symbol=symbol,
+            token_address='0x' + '0' * 40,
+            confidence_level='MEDIUM',
+            confidence_percent=Decimal('50'),
+            risk_score=Decimal('50'),
+            opportunity_score=Decimal('50'),
+            primary_reasoning='test'
+        )
+
+    def test_full_batch_written_with_one_insert(self):
+        """Records queue until the batch size, then are bulk inserted."""
+        writer = ThoughtLogWriter(max_batch_size=3)
+        with self.assertNumQueries(0):
+            writer.submit(self.thought('SKIP', 'A'))
+            writer.submit(self.thought('HOLD', 'B'))
+        with self.assertNumQueries(1):
+            writer.submit(self.thought('BUY', 'C'))
+
+        self.assertEqual(PaperAIThoughtLog.objects.filter(account=self.account).count(), 3)
+        self.assertEqual(self.notified, [('A', True), ('B', True), ('C', True)])
+        self.assertEqual(writer.get_stats()['flushed'], 3)
+
+    def test_low_value_sampling(self):
+        """HOLD/SKIP thoughts are sampled; other decisions are always kept."""
+        writer = ThoughtLogWriter(low_value_sample_rate=0.0)
+
+        self.assertFalse(writer.submit(self.thought('HOLD')))
+        self.assertFalse(writer.submit(self.thought('SKIP')))
+        self.assertTrue(writer.submit(self.thought('SELL')))
+        self.assertEqual((writer.sampled_out, writer.get_stats()['pending']), (2, 1))
+
+    def test_backpressure_when_queue_full(self):
+        """A full queue drops low-value thoughts and flushes for the rest."""
+        writer = ThoughtLogWriter(max_batch_size=10, max_queue_size=2)
+        writer.submit(self.thought('SKIP', 'A'))
+        writer.submit(self.thought('SKIP', 'B'))
+
+        self.assertFalse(writer.submit(self.thought('SKIP', 'C')))
+        self.assertTrue(writer.submit(self.thought('BUY', 'D')))
+
+        stats = writer.get_stats()
+        self.assertEqual((stats['dropped'], stats['flushed'], stats['pending']), (1, 2, 1))
+        writer.stop()
+        self.assertEqual(
+            set(PaperAIThoughtLog.objects.values_list('token_symbol', flat=True)),
+            {'A', 'B', 'D'}
+        )
+
+
+class ThoughtLogWorkerTestCase(SimpleTestCase):
+    """Test the thought-log writer's background worker."""
+
+    def test_worker_flushes_on_interval_and_stop(self):
+        """Queued records are written by the worker without a full batch."""
+        writer = ThoughtLogWriter(flush_interval_seconds=0.01)
+        batches = []
+        writer._write_batch = batches.append
+        writer.start()
+        try:
+            writer.submit(mock.Mock(decision_type='BUY'))
+            for _ in range(100):
+                if batches:
+                    break
+                time.sleep(0.01)
+            writer.submit(mock.Mock(decision_type='SELL'))
+        finally:
+            writer.stop()
+
+        self.assertEqual(sum(len(batch) for batch in batches), 2)
+        self.assertFalse(writer.is_running())
+
+
+class RecordingChannelLayer:
+    """Channel layer stand-in that records group sends."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def group_send(self, group, message):
+        self.sent.append((group, message))
+
+
+class RoomFanoutTestCase(SimpleTestCase):
+    """Test per-room coalescing and batching of WebSocket messages."""
+
+    def setUp(self):
+        self.layer = RecordingChannelLayer()
+        self.fanout = RoomFanout(self.layer, batch_window_seconds=60)
+        self.addCleanup(self.fanout.close)
+
+    def test_room_messages_batched_and_snapshots_superseded(self):
+        """One frame per room; only the latest portfolio snapshot is kept."""
+        self.fanout.publish('room_a', {'type': 'portfolio.update', 'data': {'v': 1}})
+        self.fanout.publish('room_a', {'type': 'thought.log.created', 'data': {'id': 1}})
+        self.fanout.publish('room_a', {'type': 'portfolio.update', 'data': {'v': 2}})
+        self.fanout.publish('room_a', {'type': 'thought.log.created', 'data': {'id': 2}})
+        self.fanout.publish('room_b', {'type': 'position.updated', 'data': {}})
+        self.fanout.flush()
+
+        sent = dict(self.layer.sent)
+        self.assertEqual(len(self.layer.sent), 2)
+        self.assertEqual(sent['room_a']['type'], 'batch.update')
+        self.assertEqual(
+            [(message['type'], message['data']) for message in sent['room_a']['messages']],
+            [
+                ('thought.log.created', {'id': 1}),
+                ('portfolio.update', {'v': 2}),
+                ('thought.log.created', {'id': 2}),
+            ]
+        )
+        # A lone message is sent unwrapped
+        self.assertEqual(sent['room_b'], {'type': 'position.updated', 'data': {}})
+        self.assertEqual(self.fanout.get_stats()['superseded'], 1)
+
+    def test_window_elapses_without_flush(self):
+        """The sender loop sends a room once its window has elapsed."""
+        self.fanout.batch_window_seconds = 0.01
+        self.fanout.publish('room_a', {'type': 'alert.message', 'data': {}})
+        for _ in range(100):
+            if self.layer.sent:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(self.layer.sent, [('room_a', {'type': 'alert.message', 'data': {}})])
+
+
+class ConsumerBatchTestCase(SimpleTestCase):
+    """Test that PaperTradingConsumer unpacks batched frames."""
+
+    def test_batch_dispatched_in_order(self):
+        """Each batched message reaches its handler; unknown types are skipped."""
+        consumer = PaperTradingConsumer()
+        consumer.send = mock.AsyncMock()
+
+        asyncio.run(consumer.batch_update({
+            'type': 'batch.update',
+            'messages': [
+                {'type': 'thought.log.created', 'data': {'id': 1}},
+                {'type': 'no.such.handler', 'data': {}},
+                {'type': 'position.updated', 'data': {'token': 'WETH'}},
+            ]
+        }))
+
+        sent_types = [call.kwargs['text_data'] for call in consumer.send.await_args_list]
+        self.assertEqual(len(sent_types), 2)
+        self.assertIn('"thought_log_created"', sent_types[0])
+        self.assertIn('"position_updated"', sent_types[1])
+
+
+class DeltaStreamTestCase(SimpleTestCase):
+    """Test snapshot-plus-delta encoding of dashboard streams."""
+
+    def setUp(self):
+        self.stream = DeltaStream('portfolio', row_keys={'open_positions': 'token_symbol'})
+        self.state = {
+            'portfolio_value': 1000.0,
+            'tick_count': 1,
+            'open_positions': [
+                {'token_symbol': 'WETH', 'current_value_usd': 500.0},
+                {'token_symbol': 'USDC', 'current_value_usd': 100.0},
+            ],
+        }
+
+    def test_first_frame_is_snapshot(self):
+        """The first encode sends the full state."""
+        frame = self.stream.encode(self.state)
+        self.assertEqual(frame['kind'], 'snapshot')
+        self.assertEqual(frame['seq'], 1)
+        self.assertEqual(frame['data'], self.state)
+
+    def test_delta_carries_changed_fields_and_rows(self):
+        """Only changed fields and rows are sent, based on the previous seq."""
+        self.stream.encode(self.state)
+        self.state['tick_count'] = 2
+        self.state['open_positions'] = [
+            {'token_symbol': 'WETH', 'current_value_usd': 510.0},
+            {'token_symbol': 'LINK', 'current_value_usd': 50.0},
+        ]
+
+        frame = self.stream.encode(self.state)
+
+        self.assertEqual(frame['kind'], 'delta')
+        self.assertEqual((frame['seq'], frame['base_seq']), (2, 1))
+        self.assertEqual(frame['changed'], {'tick_count': 2})
+        rows = frame['rows']['open_positions']
+        self.assertEqual([row['token_symbol'] for row in rows['upsert']], ['WETH', 'LINK'])
+        self.assertEqual(rows['removed'], ['USDC'])
+        self.assertNotIn('order', rows)
+
+    def test_unchanged_state_sends_nothing(self):
+        """Encoding the same state again produces no frame and keeps seq."""
+        self.stream.encode(self.state)
+        self.assertIsNone(self.stream.encode(dict(self.state)))
+        self.assertEqual(self.stream.seq, 1)
+
+    def test_reorder_sends_order(self):
+        """A row order the client cannot derive is sent explicitly."""
+        self.stream.encode(self.state)
+        self.state['open_positions'] = list(reversed(self.state['open_positions']))
+
+        rows = self.stream.encode(self.state)['rows']['open_positions']
+
+        self.assertEqual(rows['upsert'], [])
+        self.assertEqual(rows['order'], ['USDC', 'WETH'])
+
+
+class ConsumerStreamTestCase(SimpleTestCase):
+    """Test delta streaming and resync in PaperTradingConsumer."""
+
+    def setUp(self):
+        self.consumer = PaperTradingConsumer()
+        self.consumer.send = mock.AsyncMock()
+
+    def sent_frames(self):
+        return [json.loads(call.kwargs['text_data']) for call in self.consumer.send.await_args_list]
+
+    def test_portfolio_broadcasts_are_delta_encoded(self):
+        """Repeated portfolio broadcasts send a snapshot, then deltas."""
+        data = {'portfolio_value': 1000.0, 'open_positions': [], 'tick_count': 1}
+
+        async def broadcast():
+            await self.consumer.portfolio_update({'type': 'portfolio.update', 'data': data})
+            await self.consumer.portfolio_update(
+                {'type': 'portfolio.update', 'data': dict(data, tick_count=2)}
+            )
+            await self.consumer.portfolio_update(
+                {'type': 'portfolio.update', 'data': dict(data, tick_count=2)}
+            )
+
+        asyncio.run(broadcast())
+
+        frames = self.sent_frames()
+        self.assertEqual([frame['kind'] for frame in frames], ['snapshot', 'delta'])
+        self.assertEqual(frames[1]['changed'], {'tick_count': 2})
+
+    def test_resync_resends_stored_state(self):
+        """A resync request is answered from the last state sent."""
+        data = {'portfolio_value': 1000.0, 'open_positions': []}
+
+        async def resync():
+            await self.consumer.portfolio_update({'type': 'portfolio.update', 'data': data})
+            await self.consumer.receive(json.dumps({'type': 'resync', 'stream': 'portfolio'}))
+
+        asyncio.run(resync())
+
+        snapshot = self.sent_frames()[-1]
+        self.assertEqual((snapshot['kind'], snapshot['seq']), ('snapshot', 1))
+        self.assertEqual(snapshot['data'], data)
+
+    def test_position_request_replies_unchanged(self):
+        """Requesting unchanged positions gets an 'unchanged' frame, not the rows."""
+        positions = [{'position_id': 'p1', 'token_symbol': 'WETH', 'quantity': 1.0}]
+        self.consumer.get_open_positions = mock.AsyncMock(return_value=positions)
+
+        async def request_twice():
+            await self.consumer.send_open_positions()
+            await self.consumer.send_open_positions()
+
+        asyncio.run(request_twice())
+
+        frames = self.sent_frames()
+        self.assertEqual(frames[0]['data'], {'positions': positions})
+        self.assertEqual(frames[1], {
+            'type': 'stream_update', 'stream': 'positions', 'kind': 'unchanged', 'seq': 1
+        })
+
+
+class TokenBucketTestCase(SimpleTestCase):
+    """Test the CoinGecko token bucket rate limiter."""
+
+    def test_burst_then_refill(self):
+        """A full bucket allows a burst, then waits for the refill rate."""
+        now = [0.0]
+        bucket = TokenBucket(rate_per_second=0.5, capacity=2, clock=lambda: now[0])
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 2.0)
+
+        now[0] = 2.0
+        self.assertEqual(bucket.reserve(), 0.0)
+
+
+class PriceFeedClientTestCase(SimpleTestCase):
+    """Test request merging in the shared price feed client."""
+
+    def setUp(self):
+        self.client = PriceFeedClient(merge_window_seconds=0.05)
+        self.upstream_calls = []
+
+        async def fetch_upstream(coin_ids):
+            self.upstream_calls.append(sorted(coin_ids))
+            return {coin_id: Decimal('1.5') for coin_id in coin_ids if coin_id != 'unknown'}
+
+        self.client._fetch_upstream = fetch_upstream
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_concurrent_requests_share_one_call(self):
+        """Overlapping requests from one loop become one bulk call."""
+        async def request():
+            return await asyncio.gather(
+                self.client.get_prices(['ethereum', 'chainlink']),
+                self.client.get_prices(['ethereum', 'unknown']),
+            )
+
+        first, second = asyncio.run(request())
+
+        self.assertEqual(self.upstream_calls, [['chainlink', 'ethereum', 'unknown']])
+        self.assertEqual(first, {'ethereum': Decimal('1.5'), 'chainlink': Decimal('1.5')})
+        self.assertEqual(second, {'ethereum': Decimal('1.5'), 'unknown': None})
+
+    def test_sync_callers_on_other_loops_are_merged(self):
+        """Requests from separate event loops (e.g. tasks) reuse the client loop."""
+        results = {}
+
+        def request(name, coin_ids):
+            results[name] = asyncio.run(self.client.get_prices(coin_ids))
+
+        threads = [
+            threading.Thread(target=request, args=('a', ['ethereum'])),
+            threading.Thread(target=request, args=('b', ['chainlink'])),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.upstream_calls), 1)
+        self.assertEqual(results['b'], {'chainlink': Decimal('1.5')})
+
+
+class RecordingCacheBackend:
+    """Django cache stand-in that records batched calls."""
+
+    def __init__(self):
+        self.data = {}
+        self.calls = []
+
+    def get_many(self, keys):
+        self.calls.append(('get_many', sorted(keys)))
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    def set_many(self, values, timeout=None):
+        self.calls.append(('set_many', sorted(values)))
+        self.data.update(values)
+
+
+class PriceCacheTestCase(SimpleTestCase):
+    """Test the two-level (process L1 + Django cache L2) price cache."""
+
+    def setUp(self):
+        self.now = [0.0]
+        self.backend = RecordingCacheBackend()
+        self.price_cache = PriceCache(
+            l1_ttl_seconds=0.5,
+            l1_max_entries=2,
+            backend=self.backend,
+            clock=lambda: self.now[0]
+        )
+        self.decode = lambda value: Decimal(str(value))
+
+    def test_l1_serves_repeat_reads(self):
+        """L2 is read once for all misses; repeats within the TTL stay in L1."""
+        self.backend.data = {'a': 1.5, 'b': 2.0}
+
+        first = self.price_cache.get_many(['a', 'b', 'c'], decode=self.decode)
+        second = self.price_cache.get_many(['a', 'b'], decode=self.decode)
+
+        self.assertEqual(first, {'a': Decimal('1.5'), 'b': Decimal('2.0')})
+        self.assertEqual(second, first)
+        self.assertEqual(self.backend.calls, [('get_many', ['a', 'b', 'c'])])
+
+        stats = self.price_cache.get_stats()
+        self.assertEqual((stats['l1_hits'], stats['l2_hits'], stats['l2_misses']), (2, 2, 1))
+
+    def test_l1_expires_and_is_bounded(self):
+        """Expired entries go back to L2; the LRU bound evicts old keys."""
+        self.price_cache.set_many({'a': Decimal('1'), 'b': Decimal('2')}, timeout=60, encode=float)
+        self.assertEqual(self.backend.data, {'a': 1.0, 'b': 2.0})
+
+        self.now[0] = 1.0
+        self.price_cache.get('a', decode=self.decode)
+        self.assertEqual(self.backend.calls[-1], ('get_many', ['a']))
+
+        self.price_cache.set_many({'c': Decimal('3')}, timeout=60, encode=float)
+        self.price_cache.get_many(['a', 'b', 'c'])
+        self.assertEqual(self.backend.calls[-1], ('get_many', ['b']))
+
+
+    def test_l1_entries_are_not_shared_with_callers(self):
+        """Mutating a returned or stored dict does not change the cached entry."""
+        quote = {'price': Decimal('1.5'), 'source': 'coingecko'}
+        self.price_cache.set('q', quote, timeout=60)
+        quote['price'] = Decimal('0')
+
+        cached = self.price_cache.get('q')
+        cached['price'] = Decimal('99')
+
+        self.assertEqual(self.price_cache.get('q')['price'], Decimal('1.5'))
+
+class PriceFeedServiceCacheTestCase(SimpleTestCase):
+    """Test that bulk price lookups batch their cache round trips."""
+
+    def test_bulk_prices_use_batched_cache_calls(self):
+        """A bulk lookup reads fresh prices once and writes fetched prices once per TTL."""
+        from .services import price_feed_service
+
+        backend = RecordingCacheBackend()
+        service = price_feed_service.PriceFeedService(chain_id=84532)
+        service.price_cache = PriceCache(backend=backend)
+        backend.data[service._price_cache_key(price_feed_service.PRICE_CACHE_PREFIX, '0xAA')] = 10.0
+
+        async def fetch_bulk(tokens):
+            return {address.lower(): Decimal('20') for _, address in tokens}
+
+        service._fetch_bulk_from_coingecko = fetch_bulk
+        prices = asyncio.run(service.get_bulk_token_prices([
+            ('AAA', '0xAA'), ('BBB', '0xBB'), ('CCC', '0xCC'), ('USDC', '0xUS'),
+        ]))
+
+        self.assertEqual(prices, {
+            'USDC': Decimal('1.00'), 'AAA': Decimal('10.0'),
+            'BBB': Decimal('20'), 'CCC': Decimal('20'),
+        })
+        self.assertEqual([call[0] for call in backend.calls], ['get_many', 'set_many', 'set_many'])
+        self.assertEqual(service.get_cache_statistics()['l2_hits'], 1)
+
+    def test_sync_bulk_prices_keyed_by_address_with_cache_io_in_caller(self):
+        """Same-symbol tokens keep their own prices; only the fetch runs on the client loop."""
+        from .services import price_feed_service
+
+        caller = threading.get_ident()
+        cache_threads = []
+
+        class ThreadRecordingBackend(RecordingCacheBackend):
+            def get_many(self, keys):
+                cache_threads.append(threading.get_ident())
+                return super().get_many(keys)
+
+            def set_many(self, values, timeout=None):
+                cache_threads.append(threading.get_ident())
+                super().set_many(values, timeout)
+
+        class StubClient:
+            def __init__(self):
+                self.threads = []
+
+            async def get_prices(self, coin_ids):
+                self.threads.append(threading.get_ident())
+                return {'pepe-a': Decimal('1'), 'pepe-b': Decimal('2')}
+
+            def run(self, coro, timeout=None):
+                with ThreadPoolExecutor(max_workers=1) as loop_thread:
+                    return loop_thread.submit(asyncio.run, coro).result(timeout)
+
+        service = price_feed_service.PriceFeedService(chain_id=84532)
+        service.price_cache = PriceCache(backend=ThreadRecordingBackend())
+        service.client = StubClient()
+        service._get_coingecko_id = lambda symbol, address, chain_id: {'0xAA': 'pepe-a', '0xBB': 'pepe-b'}[address]
+
+        prices = service.get_bulk_token_prices_sync([('PEPE', '0xAA'), ('PEPE', '0xBB'), ('USDC', '0xUS')])
+
+        self.assertEqual(prices, {'0xaa': Decimal('1'), '0xbb': Decimal('2'), '0xus': Decimal('1.00')})
+        self.assertTrue(cache_threads)
+        self.assertEqual(set(cache_threads), {caller})
+        self.assertNotIn(caller, service.client.threads)
+
+
+class PriceHistoryTestCase(SimpleTestCase):
+    """Test the ring-buffer price history and its running statistics."""
+
+    def fill(self, prices, capacity=8, spacing_minutes=1):
+        start = timezone.now() - timedelta(minutes=spacing_minutes * len(prices))
+        history = PriceHistory('0xabc', 'ABC', capacity=capacity)
+        for index, price in enumerate(prices):
+            history.append(Decimal(str(price)), start + timedelta(minutes=spacing_minutes * index))
+        return history
+
+    def test_running_stats_match_full_scan_after_wraparound(self):
+        """Mean, variance and return std track the window held after evictions."""
+        prices = [100, 102, 0, 99, 105, 104, 110, 108, 107, 111, 115, 113, 120, 118, 121, 119, 125]
+        history = self.fill(prices, capacity=8)
+        window = [float(price) for price in prices[-8:]]
+
+        mean = sum(window) / len(window)
+        variance = sum((price - mean) ** 2 for price in window) / len(window)
+        returns = [(b - a) / a for a, b in zip(window, window[1:])]
+        return_mean = sum(returns) / len(returns)
+        return_std = math.sqrt(sum((r - return_mean) ** 2 for r in returns) / len(returns))
+
+        self.assertEqual(len(history), 8)
+        self.assertEqual(history.prices, [Decimal(str(float(price))) for price in prices[-8:]])
+        self.assertAlmostEqual(history.get_mean(), mean)
+        self.assertAlmostEqual(history.get_variance(), variance)
+        self.assertAlmostEqual(history.get_return_std(), return_std)
+        self.assertAlmostEqual(float(history.get_volatility()), math.sqrt(variance) / mean)
+        self.assertTrue(self.fill([1, 2, 3]).is_trending_up())
+        self.assertTrue(self.fill([3, 2, 1]).is_trending_down())
+
+    def test_price_change_uses_sample_at_cutoff(self):
+        """The lookback compares against the newest price at or before the cutoff."""
+        history = self.fill([100, 110, 120, 132], capacity=8, spacing_minutes=10)
+
+        self.assertAlmostEqual(float(history.get_price_change_percent(15)), 10.0)
+        self.assertIsNone(history.get_price_change_percent(60))
+        self.assertIsNone(self.fill([100]).get_price_change_percent(5))
+
+    def test_tracker_feeds_volatility_analyzer(self):
+        """DataTracker keeps one history per token that the analyzer reads directly."""
+        tracker = DataTracker()
+        for price in (100, 101, 99, 103):
+            history = tracker.update_price_history('ABC', Decimal(str(price)), '0xabc')
+        self.assertIs(tracker.get_price_history('ABC'), history)
+        self.assertIsNone(tracker.update_price_history('ABC', Decimal('0')))
+
+        # Hourly samples annualize the same way as a plain (hourly) price list
+        hourly = self.fill([100, 101, 99, 103], spacing_minutes=60)
+        analyzer = RealVolatilityAnalyzer()
+        as_list = [Decimal(str(price)) for price in (100, 101, 99, 103)]
+        result = asyncio.run(analyzer.analyze('0xabc', price_history=hourly))
+        expected = asyncio.run(analyzer.analyze('0xabc', price_history=as_list))
+
+        self.assertEqual(asyncio.run(analyzer.analyze('0xabc', price_history=history))['data_points'], 4)
+        self.assertEqual(result['data_points'], 4)
+        self.assertAlmostEqual(result['volatility_percent'], expected['volatility_percent'], places=1)
+        self.assertEqual(result['trend_direction'], expected['trend_direction'])
+        self.assertAlmostEqual(result['price_momentum'], expected['price_momentum'])
+
+    def test_volatility_annualized_by_sample_spacing(self):
+        """Returns are annualized by the buffer's actual sample spacing."""
+        prices = [100, 101, 99, 103, 102]
+        per_tick = self.fill(prices, spacing_minutes=0.25)
+        hourly = self.fill(prices, spacing_minutes=60)
+        self.assertAlmostEqual(per_tick.get_mean_interval_seconds(), 15.0, places=3)
+        self.assertIsNone(self.fill([100]).get_mean_interval_seconds())
+
+        analyzer = RealVolatilityAnalyzer()
+        per_tick_vol = analyzer._calculate_historical_volatility(per_tick)
+        hourly_vol = analyzer._calculate_historical_volatility(hourly)
+        expected = per_tick.get_return_std() * math.sqrt(365 * 24 * 3600 / 15.0) * 100
+
+        self.assertAlmostEqual(float(per_tick_vol), expected, delta=expected * 1e-4)
+        self.assertAlmostEqual(float(per_tick_vol / hourly_vol), math.sqrt(240), places=2)
+
+
+class TickSchedulingTestCase(SimpleTestCase):
+    """Test the fixed-rate tick schedule used by run_async()."""
+
+    def test_on_time_tick_keeps_deadline(self):
+        """Ticks finishing early keep the fixed-rate deadline."""
+        self.assertEqual(next_tick_deadline(30.0, 22.5, 15.0), (30.0, 0))
+
+    def test_overrun_runs_next_tick_immediately(self):
+        """A tick finishing late does not shift later deadlines."""
+        self.assertEqual(next_tick_deadline(30.0, 34.0, 15.0), (30.0, 0))
+
+    def test_long_overrun_skips_missed_ticks(self):
+        """Slots that passed entirely during an overrun are skipped."""
+        self.assertEqual(next_tick_deadline(30.0, 62.0, 15.0), (60.0, 2))
+
+
+class FakePriceManager:
+    """Real-mode price manager stand-in that counts bulk fetches."""
+
+    use_real_prices = True
+
+    def __init__(self):
+        self.fetches = 0
+        self.applied = []
+
+    async def fetch_bulk_prices(self):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        return {'WETH': Decimal(self.fetches)}
+
+    async def update_all_prices(self, prefetched_prices=None):
+        self.applied.append(prefetched_prices or await self.fetch_bulk_prices())
+
+
+class AsyncTickTestCase(SimpleTestCase):
+    """Test MarketAnalyzer.tick_async phase overlap and timings."""
+
+    def setUp(self):
+        """Build an analyzer whose ORM-bound phases are stubbed out."""
+        with mock.patch.object(market_analyzer, 'ARBITRAGE_AVAILABLE', False):
+            self.analyzer = market_analyzer.MarketAnalyzer(
+                account=mock.MagicMock(),
+                session=mock.MagicMock(),
+                intelligence_engine=mock.MagicMock()
+            )
+        self.analyzer._refresh_positions = mock.MagicMock()
+        self.analyzer._update_pending_transactions = mock.MagicMock()
+        self.analyzer._trading_allowed = mock.MagicMock(return_value=True)
+        self.analyzer._run_sell_path = mock.MagicMock(side_effect=lambda *args: time.sleep(0.05))
+        self.analyzer._run_buy_path = mock.MagicMock(return_value=0)
+        self.analyzer._run_status_phase = mock.MagicMock()
+        self.price_manager = FakePriceManager()
+
+    def test_next_prices_prefetched_during_sell_phase(self):
+        """The next tick's prices are fetched while sells run, then applied."""
+        async def run():
+            loop = asyncio.get_running_loop()
+            await self.analyzer.tick_async(self.price_manager, None, None, next_tick_at=loop.time())
+            prefetched_during_tick = self.analyzer._price_prefetch.done()
+            await self.analyzer.tick_async(self.price_manager, None, None)
+            return prefetched_during_tick
+
+        self.assertTrue(asyncio.run(run()))
+        self.assertEqual(self.price_manager.fetches, 2)
+        self.assertEqual(self.price_manager.applied, [{'WETH': Decimal(1)}, {'WETH': Decimal(2)}])
+
+    def test_failed_or_cancelled_prefetch_falls_back_to_fresh_prices(self):
+        """A prefetch that raised or was cancelled does not skip the price update."""
+        async def failing_prefetch():
+            raise ConnectionError('upstream down')
+
+        async def run():
+            self.analyzer._price_prefetch = asyncio.create_task(failing_prefetch())
+            await self.analyzer.tick_async(self.price_manager, None, None)
+
+            self.analyzer._price_prefetch = asyncio.create_task(asyncio.sleep(10))
+            await asyncio.sleep(0)
+            self.analyzer._price_prefetch.cancel()
+            await self.analyzer.tick_async(self.price_manager, None, None)
+
+        asyncio.run(run())
+
+        self.assertEqual(self.price_manager.applied, [{'WETH': Decimal(1)}, {'WETH': Decimal(2)}])
+
+    def test_phase_timings_reported(self):
+        """Every phase of the tick is timed."""
+        asyncio.run(self.analyzer.tick_async(self.price_manager, None, None))
+
+        self.assertEqual(
+            set(self.analyzer.last_tick_timings),
+            {'prices', 'pending_tx', 'positions', 'sell', 'buy', 'status', 'total'}
+        )
+        self.assertGreaterEqual(self.analyzer.last_tick_timings['sell'], 50)
+
+
+class StubRpcProvider(AsyncJSONBaseProvider):
+    """AsyncWeb3 provider answering from a method -> result table."""
+
+    def __init__(self, results):
+        super().__init__()
+        self.results = results
+        self.methods = []
+
+    async def make_request(self, method, params):
+        self.methods.append(method)
+        return {'jsonrpc': '2.0', 'id': 1, 'result': self.results[method]}
+
+
+class RealGasAnalyzerTestCase(SimpleTestCase):
+    """Gas analysis reads the chain through the async Web3 client."""
+
+    def test_reads_gas_from_provider(self):
+        provider = StubRpcProvider({
+            'eth_getBlockByNumber': {'number': hex(100), 'baseFeePerGas': hex(2 * 10 ** 9)},
+            'eth_gasPrice': hex(3 * 10 ** 9),
+        })
+        analyzer = RealGasAnalyzer()
+        client = SimpleNamespace(web3=AsyncWeb3(provider))
+
+        with mock.patch.object(analyzer, '_ensure_web3_client', mock.AsyncMock(return_value=client)):
+            result = asyncio.run(analyzer.analyze('0x' + '1' * 40, chain_id=8453))
+
+        self.assertEqual(result['data_source'], 'blockchain_rpc')
+        self.assertEqual(result['gas_price_gwei'], 3.0)
+        self.assertEqual(result['base_fee_gwei'], 2.0)
+        self.assertEqual(result['priority_fee_gwei'], 1.0)
+        self.assertEqual(provider.methods, ['eth_getBlockByNumber', 'eth_gasPrice'])
@@ -0,0 +1,136 @@
+"""
+Mempool Record Memory Benchmark
+
+Measures the memory footprint and garbage collection cost of holding a large
+pending transaction pool. Compares the previous record layout (a dataclass with
+Decimal amounts, hex-string calldata and datetime timestamps) with the compact
+slotted MempoolTransaction record now shared by the monitor and MEV engine.
+
+Usage:
+    python scripts/benchmark_mempool_memory.py [--size 50000]
+
+File: scripts/benchmark_mempool_memory.py
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, List, Optional
+
+# Add Django project to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django
+
+# Configure Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.mempool.monitor import MempoolTransaction
+
+
+SELECTORS = ['7ff36ab5', '18cbafe5', '38ed1739', '414bf389', 'c04b8d59']
+
+
+@dataclass
+class LegacyMempoolTransaction:
+    """Record layout used before the compact records (for comparison only)."""
+    hash: str
+    from_address: str
+    to_address: Optional[str]
+    value: Decimal
+    gas_price: Decimal
+    gas_limit: int
+    nonce: int
+    data: str
+    first_seen: datetime
+    last_seen: datetime
+    is_dex_interaction: bool = False
+    dex_name: Optional[str] = None
+    target_token: Optional[str] = None
+    swap_amount_in: Optional[Decimal] = None
+    swap_amount_out: Optional[Decimal] = None
+
+
+def legacy_record(i: int, rng: random.Random, start: datetime) -> LegacyMempoolTransaction:
+    """Build one record in the legacy layout."""
+    seen = start + timedelta(milliseconds=i)
+    return LegacyMempoolTransaction(
+        hash=f"0x{i:064x}",
+        from_address=f"0x{rng.randrange(10 ** 6):040x}",
+        to_address=f"0x{rng.randrange(200):040x}",
+        value=Decimal(rng.randint(10 ** 15, 10 ** 19)),
+        gas_price=Decimal(rng.randint(5, 200) * 10 ** 9),
+        gas_limit=200000,
+        nonce=i,
+        data='0x' + rng.choice(SELECTORS) + 'ab' * 196,
+        first_seen=seen,
+        last_seen=seen,
+        is_dex_interaction=True,
+        swap_amount_in=Decimal(rng.randint(10 ** 15, 10 ** 19)),
+    )
+
+
+def compact_record(i: int, rng: random.Random, start: float) -> MempoolTransaction:
+    """Build one record in the compact layout, as the monitor's parsers do."""
+    seen = start + i / 1000
+    return MempoolTransaction(
+        hash=f"0x{i:064x}",
+        from_address=f"0x{rng.randrange(10 ** 6):040x}",
+        to_address=f"0x{rng.randrange(200):040x}",
+        value=rng.randint(10 ** 15, 10 ** 19),
+        gas_price=rng.randint(5, 200) * 10 ** 9,
+        gas_limit=200000,
+        nonce=i,
+        data=bytes.fromhex(rng.choice(SELECTORS) + 'ab' * 196),
+        first_seen=seen,
+        last_seen=seen,
+        is_dex_interaction=True,
+        swap_amount_in=rng.randint(10 ** 15, 10 ** 19),
+    )
+
+
+def measure(label: str, size: int, factory: Callable, start) -> None:
+    """Report retained memory and full-collection time for one layout."""
+    rng = random.Random(42)
+    gc.collect()
+    tracemalloc.start()
+    records: List = [factory(i, rng, start) for i in range(size)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    gc_start = time.perf_counter()
+    for _ in range(5):
+        gc.collect()
+    gc_ms = (time.perf_counter() - gc_start) * 1000 / 5
+
+    print(
+        f"{label:>10} {retained / (1024 * 1024):>12.1f} "
+        f"{retained / size:>12.0f} {gc_ms:>14.2f}"
+    )
+    del records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mempool record memory")
+    parser.add_argument('--size', type=int, default=50000)
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"MEMPOOL RECORD MEMORY ({args.size} transactions)")
+    print("=" * 60)
+    print(f"{'layout':>10} {'total MiB':>12} {'bytes/tx':>12} {'full gc ms':>14}")
+
+    measure('legacy', args.size, legacy_record, datetime.utcnow())
+    measure('compact', args.size, compact_record, time.monotonic())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+MEV Detection Benchmark
+
+Measures MEV threat detection latency as the pending transaction pool grows
+from 1k to 50k transactions. Compares detection against the indexed mempool
+(PendingTransactionIndex, as maintained by MempoolMonitor) with detection
+against a plain transaction list, which costs a full pass over the pool.
+
+Usage:
+    python scripts/benchmark_mev_detection.py [--targets 200] [--sizes 1000 5000 ...]
+
+File: scripts/benchmark_mev_detection.py
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+# Add Django project to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django
+
+# Configure Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.mempool.index import PendingTransactionIndex
+from engine.mempool.protection import MEVProtectionEngine, PendingTransaction
+
+
+DEFAULT_SIZES = [1000, 5000, 10000, 25000, 50000]
+
+SELECTORS = [
+    '0x7ff36ab5',  # swapExactETHForTokens
+    '0x18cbafe5',  # swapExactTokensForETH
+    '0x38ed1739',  # swapExactTokensForTokens
+    '0x414bf389',  # exactInputSingle
+    '0xc04b8d59',  # exactInput
+    '0xf305d719',  # addLiquidityETH
+]
+
+
+class BenchmarkConfig:
+    """Minimal engine configuration for the protection engine."""
+
+    chain_configs = {1: {'name': 'Ethereum', 'chain_id': 1}}
+
+
+def build_mempool(size: int, rng: random.Random) -> List[PendingTransaction]:
+    """Generate a synthetic mempool of DEX transactions."""
+    routers = [f"0x{i:040x}" for i in range(1, 201)]
+    senders = [f"0x{i:040x}" for i in range(10_000, 10_000 + max(size // 4, 10))]
+    start = datetime.utcnow() - timedelta(seconds=300)
+
+    mempool = []
+    for i in range(size):
+        mempool.append(PendingTransaction(
+            hash=f"0x{i:064x}",
+            from_address=rng.choice(senders),
+            to_address=rng.choice(routers),
+            value=Decimal(rng.randint(10 ** 15, 10 ** 19)),
+            gas_price=Decimal(rng.randint(5, 200) * 10 ** 9),
+            gas_limit=200000,
+            nonce=i,
+            data=rng.choice(SELECTORS) + '00' * 32,
+            timestamp=start + timedelta(milliseconds=i * 5),
+            is_dex_interaction=True,
+        ))
+    return mempool
+
+
+async def time_detection(engine: MEVProtectionEngine, targets, mempool) -> float:
+    """Return average detection latency in milliseconds."""
+    start = time.perf_counter()
+    for target in targets:
+        await engine._detect_mev_threats(target, mempool)
+    return (time.perf_counter() - start) * 1000 / len(targets)
+
+
+async def run_benchmark(sizes: List[int], target_count: int) -> None:
+    """Run the detection benchmark across pool sizes."""
+    rng = random.Random(42)
+    engine = MEVProtectionEngine(BenchmarkConfig())
+
+    print("=" * 72)
+    print("MEV DETECTION LATENCY (ms per target transaction)")
+    print("=" * 72)
+    print(f"{'pool size':>10} {'indexed':>12} {'full pass':>12} {'speedup':>10} {'index build':>14}")
+
+    for size in sizes:
+        mempool = build_mempool(size, rng)
+
+        build_start = time.perf_counter()
+        index = PendingTransactionIndex.from_transactions(mempool)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        # Most recently seen transactions are the ones analyzed on arrival
+        targets = mempool[-target_count:]
+
+        indexed_ms = await time_detection(engine, targets, index)
+        full_ms = await time_detection(engine, targets[:max(target_count // 10, 1)], mempool)
+
+        print(
+            f"{size:>10} {indexed_ms:>12.3f} {full_ms:>12.3f} "
+            f"{full_ms / max(indexed_ms, 1e-9):>9.1f}x {build_ms:>12.1f}ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark indexed MEV detection")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--targets', type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.sizes, args.targets))
+
+
+if __name__ == '__main__':
+    main()
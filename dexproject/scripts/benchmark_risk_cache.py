@@ -0,0 +1,128 @@
+"""
+Fast Risk Cache Lookup Benchmark
+
+Measures memory-tier lookup latency of FastRiskCache at 1k, 10k and 100k
+entries. Compares the previous memory tier (dict plus a deque of keys,
+reordered with deque.remove on every hit and a full statistics.mean per
+lookup) with the OrderedDict LRU now used by FastRiskCache.get_token_risk.
+
+Usage:
+    python scripts/benchmark_risk_cache.py [--lookups 5000]
+
+File: scripts/benchmark_risk_cache.py
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from collections import deque
+from typing import Dict, List
+
+# Add Django project to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django
+
+# Configure Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.cache.risk_cache import FastRiskCache
+
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+class LegacyMemoryTier:
+    """Memory tier as implemented before the O(1) LRU (for comparison only)."""
+
+    def __init__(self):
+        self.memory_cache: Dict[str, dict] = {}
+        self.access_order: deque = deque()
+        self.retrieval_times: deque = deque(maxlen=1000)
+
+    def store(self, cache_key: str, value: dict) -> None:
+        self.memory_cache[cache_key] = value
+        if cache_key in self.access_order:
+            self.access_order.remove(cache_key)
+        self.access_order.append(cache_key)
+
+    def get(self, cache_key: str):
+        start_time = time.perf_counter()
+        if cache_key in self.memory_cache:
+            entry = self.memory_cache[cache_key]
+            if cache_key in self.access_order:
+                self.access_order.remove(cache_key)
+            self.access_order.append(cache_key)
+            self.retrieval_times.append((time.perf_counter() - start_time) * 1000)
+            statistics.mean(self.retrieval_times)
+            return entry
+        return None
+
+
+def token(i: int) -> str:
+    return '0x' + f'{i:040x}'
+
+
+def summarize(label: str, size: int, samples_us: List[float]) -> None:
+    samples_us.sort()
+    p99 = samples_us[int(len(samples_us) * 0.99)]
+    print(f"{label:>8} {size:>9,} {statistics.mean(samples_us):>12.2f} {p99:>12.2f}")
+
+
+def bench_legacy(size: int, lookups: int) -> None:
+    tier = LegacyMemoryTier()
+    for i in range(size):
+        tier.store(f"risk:1:{token(i)}", {'overall_risk_score': 10})
+
+    rng = random.Random(42)
+    samples = []
+    for _ in range(lookups):
+        key = f"risk:1:{token(rng.randrange(size))}"
+        start = time.perf_counter()
+        tier.get(key)
+        samples.append((time.perf_counter() - start) * 1e6)
+    summarize('legacy', size, samples)
+
+
+async def bench_lru(size: int, lookups: int) -> None:
+    cache = FastRiskCache(chain_id=1)
+    cache.max_memory_entries = size
+    for i in range(size):
+        await cache.store_risk_data(token(i), {'overall_risk_score': 10, 'risk_level': 'low'})
+
+    rng = random.Random(42)
+    samples = []
+    for _ in range(lookups):
+        address = token(rng.randrange(size))
+        start = time.perf_counter()
+        await cache.get_token_risk(address)
+        samples.append((time.perf_counter() - start) * 1e6)
+    summarize('lru', size, samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark FastRiskCache memory-tier lookups")
+    parser.add_argument('--lookups', type=int, default=5000)
+    args = parser.parse_args()
+
+    # Keep per-entry debug logging out of the measurements
+    import logging
+    logging.disable(logging.INFO)
+
+    print("=" * 60)
+    print(f"FAST RISK CACHE LOOKUPS ({args.lookups} random hits per size)")
+    print("=" * 60)
+    print(f"{'tier':>8} {'entries':>9} {'mean us':>12} {'p99 us':>12}")
+
+    for size in SIZES:
+        bench_legacy(size, args.lookups)
+        asyncio.run(bench_lru(size, args.lookups))
+
+
+if __name__ == '__main__':
+    main()
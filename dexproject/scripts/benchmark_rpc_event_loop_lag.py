@@ -0,0 +1,144 @@
+"""
+RPC Event Loop Lag Benchmark
+
+Measures how much JSON-RPC calls stall the engine's event loop. A local stub
+JSON-RPC server answers every call after a fixed delay while a sampler task
+records how late a periodic 10ms timer wakes up. Compares the previous
+pattern (sync Web3 HTTPProvider called inside a coroutine) with the pooled
+AsyncJsonRpcTransport behind AsyncWeb3.
+
+Usage:
+    python scripts/benchmark_rpc_event_loop_lag.py [--calls 200] [--delay-ms 20]
+
+File: scripts/benchmark_rpc_event_loop_lag.py
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Awaitable, Callable, List
+
+# Add Django project to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django
+
+# Configure Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from aiohttp import web
+from web3 import AsyncWeb3, Web3
+
+from engine.rpc_transport import AsyncJsonRpcProvider, AsyncJsonRpcTransport
+
+
+SAMPLE_INTERVAL = 0.01
+
+
+def start_stub_server(delay: float) -> str:
+    """
+    Start a JSON-RPC stub on its own thread and event loop.
+
+    Running the server off the measured loop means a blocking client call
+    really stalls the loop under test, as it would against a remote node.
+    """
+    ready = threading.Event()
+    address = {}
+
+    async def handle(request):
+        body = await request.json()
+        await asyncio.sleep(delay)
+        return web.json_response({'jsonrpc': '2.0', 'id': body['id'], 'result': hex(1234)})
+
+    async def serve() -> None:
+        app = web.Application()
+        app.router.add_post('/', handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        address['url'] = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        ready.set()
+        await asyncio.Event().wait()
+
+    threading.Thread(target=lambda: asyncio.run(serve()), daemon=True).start()
+    ready.wait()
+    return address['url']
+
+
+async def sample_lag(lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late a periodic timer fires while the workload runs."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + SAMPLE_INTERVAL
+        await asyncio.sleep(SAMPLE_INTERVAL)
+        lags.append(max(0.0, loop.time() - expected))
+
+
+async def measure(label: str, workload: Callable[[], Awaitable[None]], calls: int) -> None:
+    """Run a workload next to the lag sampler and print the results."""
+    lags: List[float] = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_lag(lags, stop))
+    await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await workload()
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await sampler
+
+    lags_ms = sorted(lag * 1000 for lag in lags) or [0.0]
+    p99 = lags_ms[min(len(lags_ms) - 1, int(len(lags_ms) * 0.99))]
+    print(
+        f"{label:>12} {statistics.mean(lags_ms):>10.2f} {p99:>10.2f} "
+        f"{lags_ms[-1]:>10.2f} {calls / elapsed:>12.1f}"
+    )
+
+
+async def run(url: str, calls: int, concurrency: int) -> None:
+    # Before: sync Web3 HTTPProvider called inside a coroutine
+    sync_w3 = Web3(Web3.HTTPProvider(url))
+
+    async def sync_workload() -> None:
+        for _ in range(calls):
+            sync_w3.eth.block_number
+            # Other coroutines only run between calls
+            await asyncio.sleep(0)
+
+    # After: pooled async transport behind AsyncWeb3
+    transport = AsyncJsonRpcTransport(url, name='stub', max_concurrency=concurrency)
+    async_w3 = AsyncWeb3(AsyncJsonRpcProvider(transport))
+
+    async def async_workload() -> None:
+        await asyncio.gather(*(async_w3.eth.block_number for _ in range(calls)))
+
+    print(f"{'transport':>12} {'mean ms':>10} {'p99 ms':>10} {'max ms':>10} {'calls/s':>12}")
+    await measure('sync-web3', sync_workload, calls)
+    await measure('async-pool', async_workload, calls)
+
+    await transport.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark event loop lag of RPC transports")
+    parser.add_argument('--calls', type=int, default=200, help="RPC calls per transport")
+    parser.add_argument('--delay-ms', type=float, default=20, help="Stub server response delay")
+    parser.add_argument('--concurrency', type=int, default=8, help="Async transport in-flight limit")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"RPC EVENT LOOP LAG ({args.calls} calls, {args.delay_ms:.0f}ms server delay)")
+    print("=" * 60)
+    url = start_stub_server(args.delay_ms / 1000)
+    asyncio.run(run(url, args.calls, args.concurrency))
+
+
+if __name__ == '__main__':
+    main()
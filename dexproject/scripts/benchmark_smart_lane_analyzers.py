@@ -0,0 +1,105 @@
+"""
+Smart Lane Analyzer Pool Benchmark
+
+Measures risk-analysis throughput (analyses per second) of the Smart Lane
+pipeline on a repeated token set. Compares building every analyzer per
+category per analysis, as the pipeline did before the analyzer pool (so
+the analyzers' result caches are always empty), with the long-lived
+per-chain analyzers now used by SmartLanePipeline._analyze_risk_category.
+Pooled analyses share one TokenContextLoader per analysis, as in the
+pipeline, and report the data round trips they needed.
+
+Usage:
+    python scripts/benchmark_smart_lane_analyzers.py [--tokens 5] [--rounds 4]
+
+File: scripts/benchmark_smart_lane_analyzers.py
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List
+
+# Add Django project to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django
+
+# Configure Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.smart_lane import DEFAULT_CONFIG
+from engine.smart_lane.analyzers import clear_analyzer_pool, create_analyzer
+from engine.smart_lane.pipeline import SmartLanePipeline
+from engine.smart_lane.token_context import TOKEN_CONTEXT_KEY, TokenContextLoader
+
+
+def token(i: int) -> str:
+    return '0x' + f'{i + 1:040x}'
+
+
+async def analyze_fresh(token_address: str) -> None:
+    """Run every risk category with newly built analyzers (pre-pool behavior)."""
+    await asyncio.gather(*[
+        create_analyzer(category, 1).analyze(token_address, {})
+        for category in DEFAULT_CONFIG.enabled_categories
+    ])
+
+
+async def bench(label: str, tokens: List[str], rounds: int, analyze) -> None:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for token_address in tokens:
+            await analyze(token_address)
+    elapsed = time.perf_counter() - start
+
+    analyses = len(tokens) * rounds
+    print(f"{label:>8} {analyses:>9} {elapsed:>10.2f} {analyses / elapsed:>14.1f}")
+
+
+async def run(token_count: int, rounds: int) -> None:
+    tokens = [token(i) for i in range(token_count)]
+
+    await bench('fresh', tokens, rounds, analyze_fresh)
+
+    clear_analyzer_pool()
+    pipeline = SmartLanePipeline(config=DEFAULT_CONFIG, chain_id=1, enable_caching=False)
+    round_trips = []
+
+    async def analyze_pooled(token_address: str) -> None:
+        loader = TokenContextLoader(token_address, 1)
+        await pipeline._execute_parallel_risk_analysis(token_address, {TOKEN_CONTEXT_KEY: loader})
+        round_trips.append(loader.get_stats()['round_trips'])
+
+    await bench('pooled', tokens, rounds, analyze_pooled)
+    pipeline.thread_pool.shutdown()
+
+    print(f"\nPooled analyzer cache hit ratio: "
+          f"{pipeline.get_performance_metrics()['analyzer_cache_hit_ratio']:.1%}")
+    print(f"Pooled data round trips per analysis: {sum(round_trips) / len(round_trips):.1f} "
+          f"(first round {sum(round_trips[:token_count]) / token_count:.1f})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Smart Lane analyzer reuse")
+    parser.add_argument('--tokens', type=int, default=5)
+    parser.add_argument('--rounds', type=int, default=4)
+    args = parser.parse_args()
+
+    # Keep per-analysis logging out of the measurements
+    import logging
+    logging.disable(logging.WARNING)
+
+    print("=" * 60)
+    print(f"SMART LANE RISK ANALYSIS ({args.tokens} tokens x {args.rounds} rounds)")
+    print("=" * 60)
+    print(f"{'mode':>8} {'analyses':>9} {'seconds':>10} {'analyses/s':>14}")
+
+    asyncio.run(run(args.tokens, args.rounds))
+
+
+if __name__ == '__main__':
+    main()
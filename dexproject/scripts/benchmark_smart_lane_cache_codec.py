@@ -0,0 +1,147 @@
+"""
+Smart Lane Cache Codec Benchmark
+
+Measures encode/decode throughput and payload size of Smart Lane cache
+entries: the previous JSON format (json.dumps of _serialize_analysis,
+json.loads + _deserialize_analysis on every hit) against the binary
+cache_codec format, with full and summary-only decoding.
+
+Usage:
+    python scripts/benchmark_smart_lane_cache_codec.py [--iterations 2000]
+
+File: scripts/benchmark_smart_lane_cache_codec.py
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+# Add Django project to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django
+
+# Configure Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'dexproject.settings')
+django.setup()
+
+from engine.smart_lane import (
+    DecisionConfidence, RiskCategory, RiskScore, SmartLaneAction,
+    SmartLaneAnalysis, TechnicalSignal
+)
+from engine.smart_lane.cache import SmartLaneCache
+from engine.smart_lane.cache_codec import (
+    MSGPACK_AVAILABLE, decode_analysis, decode_summary, encode_analysis
+)
+
+
+def build_analysis() -> SmartLaneAnalysis:
+    """Analysis shaped like a pipeline result (8 categories, 3 timeframes)."""
+    return SmartLaneAnalysis(
+        token_address='0x' + 'a1' * 20,
+        chain_id=1,
+        analysis_id='benchmark',
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        risk_scores={
+            category: RiskScore(
+                category=category,
+                score=0.1 * index,
+                confidence=0.8,
+                details={
+                    'indicators': [
+                        {'name': f'indicator_{i}', 'severity': 'MEDIUM', 'score': i / 10,
+                         'evidence': {'samples': list(range(8))}}
+                        for i in range(6)
+                    ],
+                    'metrics': {f'metric_{i}': i * 1.5 for i in range(20)},
+                    'data_source': 'mock'
+                },
+                analysis_time_ms=120.0,
+                warnings=[f'{category.value} warning {i}' for i in range(3)]
+            )
+            for index, category in enumerate(RiskCategory)
+        },
+        overall_risk_score=0.35,
+        overall_confidence=0.8,
+        technical_signals=[
+            TechnicalSignal(timeframe, 'BUY', 0.7, {'rsi': 41.0, 'macd': 0.2},
+                            {'support': 0.95, 'resistance': 1.1}, 0.6)
+            for timeframe in ('5m', '30m', '4h')
+        ],
+        technical_summary={'overall_signal': 'BUY', 'signal_count': 3},
+        recommended_action=SmartLaneAction.PARTIAL_BUY,
+        position_size_percent=2.5,
+        confidence_level=DecisionConfidence.MEDIUM,
+        stop_loss_percent=8.0,
+        take_profit_targets=[10.0, 25.0, 50.0],
+        max_hold_time_hours=24,
+        total_analysis_time_ms=850.0,
+        cache_hit_ratio=0.0,
+        data_freshness_score=1.0,
+        critical_warnings=[],
+        informational_notes=['AI Thought Log: ' + 'reasoning step. ' * 40]
+    )
+
+
+def legacy_json(cache: SmartLaneCache, analysis: SmartLaneAnalysis) -> str:
+    """Previous entry format (enums inside RiskScore dicts made plain json.dumps fail)."""
+    return json.dumps(cache._serialize_analysis(analysis), default=lambda value: value.value)
+
+
+def rate(operation: Callable[[], object], iterations: int) -> float:
+    """Operations per second."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        operation()
+    return iterations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Smart Lane cache entry encodings")
+    parser.add_argument('--iterations', type=int, default=2000)
+    args = parser.parse_args()
+
+    # Keep logging out of the measurements
+    import logging
+    logging.disable(logging.WARNING)
+
+    analysis = build_analysis()
+    cache = SmartLaneCache(chain_id=1)
+
+    json_entry = legacy_json(cache, analysis)
+    binary_entry = encode_analysis(analysis)
+    uncompressed_entry = encode_analysis(analysis, compress_threshold_bytes=sys.maxsize)
+
+    rows = [
+        ('json', len(json_entry.encode()),
+         rate(lambda: legacy_json(cache, analysis), args.iterations),
+         rate(lambda: cache._deserialize_analysis(json.loads(json_entry)), args.iterations)),
+        ('binary', len(uncompressed_entry),
+         rate(lambda: encode_analysis(analysis, compress_threshold_bytes=sys.maxsize), args.iterations),
+         rate(lambda: decode_analysis(uncompressed_entry), args.iterations)),
+        ('binary+z', len(binary_entry),
+         rate(lambda: encode_analysis(analysis), args.iterations),
+         rate(lambda: decode_analysis(binary_entry), args.iterations)),
+        ('summary', len(binary_entry),
+         None,
+         rate(lambda: decode_summary(binary_entry), args.iterations)),
+    ]
+
+    print("=" * 60)
+    print(f"SMART LANE CACHE ENTRY CODEC ({args.iterations} iterations)")
+    print(f"body: {'msgpack' if MSGPACK_AVAILABLE else 'json'}, compression: zlib")
+    print("=" * 60)
+    print(f"{'format':>9} {'bytes':>8} {'encode/s':>12} {'decode/s':>12}")
+    for name, size, encode_rate, decode_rate in rows:
+        encode_text = f"{encode_rate:>12,.0f}" if encode_rate else f"{'-':>12}"
+        print(f"{name:>9} {size:>8} {encode_text} {decode_rate:>12,.0f}")
+    print("\nNote: the JSON decode leaves risk scores and technical signals as dicts; "
+          "the binary decode rebuilds them.")
+
+
+if __name__ == '__main__':
+    main()
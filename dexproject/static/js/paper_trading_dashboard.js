@@ -8,6 +8,8 @@
  * - Kept 30s metrics backup polling only
  * - WebSocket is primary update method
  * - FIXED: Initialize thought counter on page load to count existing thoughts
+ * - Portfolio, account and positions arrive as delta streams (snapshot, then
+ *   changed fields/rows with a seq); a gap in seq requests a resync
  */
 
 // ========================================
@@ -33,7 +35,8 @@ window.paperTradingDashboard = {
         thoughtCount: 0,
         updateIntervals: [],
         websocket: null,
-        wsConnected: false
+        wsConnected: false,
+        streams: {}                // Delta stream state: name -> {seq, rowKeys, data}
     }
 };
 
@@ -81,6 +84,7 @@ function handleWebSocketOpen(event) {
 
     console.log('WebSocket connected successfully');
     state.wsConnected = true;
+    state.streams = {};            // A new connection starts every stream with a snapshot
     config.reconnectAttempts = 0;
     config.reconnectDelay = 1000;
 
@@ -156,6 +160,11 @@ function handleWebSocketMessage(event) {
                 handlePortfolioUpdate(message.data);
                 break;
 
+            // Delta-encoded portfolio/account/positions streams
+            case 'stream_update':
+                handleStreamUpdate(message);
+                break;
+
             case 'performance_update':
             case 'performance.update':
                 console.log('Performance update:', message.data);
@@ -494,6 +503,113 @@ function handlePortfolioUpdate(data) {
     console.log(`Portfolio Update: Total=$${totalPortfolio.toFixed(2)}, Return=${returnPercent.toFixed(2)}%, P&L=$${totalPnL?.toFixed(2) || 'N/A'}, WinRate=${winRate?.toFixed(1) || 'N/A'}%`);
 }
 
+/**
+ * Handle a delta stream frame: store a snapshot, apply a delta on top of
+ * the state it was based on, or request a resync if a frame was missed
+ */
+function handleStreamUpdate(message) {
+    const { state } = window.paperTradingDashboard;
+    const name = message.stream;
+    const stream = state.streams[name];
+
+    if (message.kind === 'snapshot') {
+        state.streams[name] = {
+            seq: message.seq,
+            rowKeys: message.row_keys || {},
+            data: message.data || {}
+        };
+    } else if (message.kind === 'delta') {
+        if (stream && stream.resyncPending) {
+            return;                // The snapshot we asked for is on its way
+        }
+        if (!stream || message.base_seq !== stream.seq) {
+            console.warn(`Stream ${name} gap: have seq ${stream ? stream.seq : 'none'}, delta based on ${message.base_seq}`);
+            requestStreamResync(name);
+            return;
+        }
+        applyStreamDelta(stream, message);
+        stream.seq = message.seq;
+    } else {
+        // 'unchanged': nothing to render unless we are behind
+        if (!stream || (!stream.resyncPending && message.seq !== stream.seq)) {
+            requestStreamResync(name);
+        }
+        return;
+    }
+
+    renderStream(name, state.streams[name].data);
+}
+
+/**
+ * Apply a delta frame's changed fields and row changes to a stream's state
+ */
+function applyStreamDelta(stream, delta) {
+    const data = Object.assign({}, stream.data, delta.changed || {});
+
+    for (const key of delta.removed || []) {
+        delete data[key];
+    }
+
+    for (const [field, rowsDelta] of Object.entries(delta.rows || {})) {
+        const rowKey = stream.rowKeys[field];
+        const removed = new Set(rowsDelta.removed || []);
+        const rows = (data[field] || []).filter(row => !removed.has(row[rowKey]));
+        const indexByKey = new Map(rows.map((row, index) => [row[rowKey], index]));
+
+        for (const row of rowsDelta.upsert || []) {
+            if (indexByKey.has(row[rowKey])) {
+                rows[indexByKey.get(row[rowKey])] = row;
+            } else {
+                indexByKey.set(row[rowKey], rows.length);
+                rows.push(row);
+            }
+        }
+
+        if (rowsDelta.order) {
+            const rowByKey = new Map(rows.map(row => [row[rowKey], row]));
+            data[field] = rowsDelta.order.map(key => rowByKey.get(key)).filter(Boolean);
+        } else {
+            data[field] = rows;
+        }
+    }
+
+    stream.data = data;
+}
+
+/**
+ * Render a stream's current state with the matching handler
+ */
+function renderStream(name, data) {
+    switch (name) {
+        case 'portfolio':
+            handlePortfolioUpdate(data);
+            break;
+        case 'account':
+            handleAccountUpdated(data);
+            break;
+        case 'positions':
+            updatePositionsTable(data.positions || []);
+            break;
+        default:
+            console.log('Unknown stream:', name);
+    }
+}
+
+/**
+ * Ask the server to resend a stream's full state
+ */
+function requestStreamResync(name) {
+    const { state } = window.paperTradingDashboard;
+
+    state.streams[name] = { seq: null, rowKeys: {}, data: null, resyncPending: true };
+    if (state.websocket && state.websocket.readyState === WebSocket.OPEN) {
+        state.websocket.send(JSON.stringify({
+            type: 'resync',
+            stream: name
+        }));
+    }
+}
+
 /**
  * Handle performance metrics update
  */
@@ -419,7 +419,7 @@ class DEXRouterService:
             )
             
             # Check current allowance
-            current_allowance = token_contract.functions.allowance(
+            current_allowance = await token_contract.functions.allowance(
                 from_address, spender
             ).call()
             
@@ -435,7 +435,7 @@ class DEXRouterService:
             max_uint256 = 2**256 - 1
             approve_function = token_contract.functions.approve(spender, max_uint256)
             
-            approve_tx = approve_function.build_transaction({
+            approve_tx = await approve_function.build_transaction({
                 'from': from_address,
                 'gas': 100000,  # Standard gas limit for approval
                 'gasPrice': int(swap_params.gas_price_gwei * Decimal('1e9')) if swap_params.gas_price_gwei else None
@@ -485,7 +485,7 @@ class DEXRouterService:
                     'sqrtPriceLimitX96': 0
                 })
                 
-                tx_data = function_call.build_transaction({
+                tx_data = await function_call.build_transaction({
                     'from': from_address,
                     'value': swap_params.amount_in,
                     'gas': swap_params.gas_limit or 300000,
@@ -514,7 +514,7 @@ class DEXRouterService:
                     'sqrtPriceLimitX96': 0
                 })
                 
-                tx_data = function_call.build_transaction({
+                tx_data = await function_call.build_transaction({
                     'from': from_address,
                     'gas': swap_params.gas_limit or 300000,
                     'gasPrice': int(swap_params.gas_price_gwei * Decimal('1e9')) if swap_params.gas_price_gwei else None
@@ -542,7 +542,7 @@ class DEXRouterService:
                     'sqrtPriceLimitX96': 0
                 })
                 
-                tx_data = function_call.build_transaction({
+                tx_data = await function_call.build_transaction({
                     'from': from_address,
                     'gas': swap_params.gas_limit or 350000,  # Higher gas for token-token swaps
                     'gasPrice': int(swap_params.gas_price_gwei * Decimal('1e9')) if swap_params.gas_price_gwei else None
@@ -582,7 +582,7 @@ class DEXRouterService:
                     swap_params.deadline
                 )
                 
-                tx_data = function_call.build_transaction({
+                tx_data = await function_call.build_transaction({
                     'from': from_address,
                     'value': swap_params.amount_in,
                     'gas': swap_params.gas_limit or 250000,
@@ -608,7 +608,7 @@ class DEXRouterService:
                     swap_params.deadline
                 )
                 
-                tx_data = function_call.build_transaction({
+                tx_data = await function_call.build_transaction({
                     'from': from_address,
                     'gas': swap_params.gas_limit or 250000,
                     'gasPrice': int(swap_params.gas_price_gwei * Decimal('1e9')) if swap_params.gas_price_gwei else None
@@ -633,7 +633,7 @@ class DEXRouterService:
                     swap_params.deadline
                 )
                 
-                tx_data = function_call.build_transaction({
+                tx_data = await function_call.build_transaction({
                     'from': from_address,
                     'gas': swap_params.gas_limit or 300000,
                     'gasPrice': int(swap_params.gas_price_gwei * Decimal('1e9')) if swap_params.gas_price_gwei else None
@@ -660,7 +660,7 @@ class DEXRouterService:
     async def _broadcast_transaction(self, signed_tx: SignedTransaction) -> HexStr:
         """Broadcast signed transaction to the network."""
         try:
-            tx_hash = self.web3_client.web3.eth.send_raw_transaction(
+            tx_hash = await self.web3_client.web3.eth.send_raw_transaction(
                 signed_tx.signed_transaction
             )
             
@@ -680,7 +680,7 @@ class DEXRouterService:
         try:
             self.logger.info(f"⏳ Waiting for confirmation: {tx_hash[:10]}...")
             
-            receipt = self.web3_client.web3.eth.wait_for_transaction_receipt(
+            receipt = await self.web3_client.web3.eth.wait_for_transaction_receipt(
                 tx_hash, timeout=timeout_seconds
             )
             
@@ -36,6 +36,8 @@ from shared.web3_utils import (
     require_web3
 )
 
+from engine.utils import ChainConfig, ProviderConfig, ProviderManager
+
 from .models import SIWESession, Wallet, WalletBalance, WalletTransaction, WalletActivity
 
 logger = logging.getLogger(__name__)
@@ -415,6 +417,9 @@ class WalletService:
         
         # Initialize Web3 providers for supported chains
         self.web3_providers = {}
+        
+        # Batching provider managers for balance refreshes (created lazily)
+        self.provider_managers: Dict[int, ProviderManager] = {}
         self.supported_chains = {
             1: "Ethereum Mainnet",
             84532: "Base Sepolia", 
@@ -468,6 +473,21 @@ class WalletService:
         """Get Web3 instance for a specific chain."""
         return self.web3_providers.get(chain_id)
     
+    async def _get_provider_manager(self, chain_id: int) -> Optional[ProviderManager]:
+        """Get the batching provider manager for a chain, creating it on first use."""
+        if chain_id not in self.provider_managers:
+            rpc_url = self._get_rpc_url_for_chain(chain_id)
+            if not rpc_url:
+                return None
+            chain_config = ChainConfig(
+                chain_id=chain_id,
+                name=self.supported_chains.get(chain_id, str(chain_id)),
+                rpc_providers=[ProviderConfig(name=f"wallet_{chain_id}", url=rpc_url)]
+            )
+            # Construction tests the provider synchronously; keep it off the loop
+            self.provider_managers[chain_id] = await sync_to_async(ProviderManager)(chain_config)
+        return self.provider_managers[chain_id]
+    
     async def authenticate_wallet(
         self,
         wallet_address: str,
@@ -715,6 +735,53 @@ class WalletService:
             logger.error(f"Failed to get token balance: {e}")
             return None
     
+    async def get_balances_batch(
+        self,
+        wallet_address: str,
+        chain_id: int,
+        token_addresses: List[str]
+    ) -> Dict[str, Optional[int]]:
+        """
+        Get the native balance and many ERC20 balances in one JSON-RPC batch.
+        
+        Args:
+            wallet_address: Wallet address to check
+            chain_id: Chain ID
+            token_addresses: Token contracts to read balanceOf from
+            
+        Returns:
+            Raw balances keyed by token address ('ETH' for native); None
+            where the individual read failed
+        """
+        if not self.web3_available:
+            logger.warning("Web3 not available - cannot get wallet balances")
+            return {}
+        
+        wallet_checksum = to_checksum_ethereum_address(wallet_address)
+        provider_manager = await self._get_provider_manager(chain_id)
+        if not wallet_checksum or not provider_manager:
+            logger.error(f"Cannot refresh balances for {wallet_address} on chain {chain_id}")
+            return {}
+        
+        # balanceOf(address) selector followed by the padded owner address
+        balance_of_data = '0x70a08231' + wallet_checksum[2:].lower().rjust(64, '0')
+        keys = ['ETH'] + list(token_addresses)
+        calls = [('eth_getBalance', [wallet_checksum, 'latest'])] + [
+            ('eth_call', [{'to': token_address, 'data': balance_of_data}, 'latest'])
+            for token_address in token_addresses
+        ]
+        
+        results = await provider_manager.batch_rpc(calls)
+        
+        balances: Dict[str, Optional[int]] = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, Exception) or not result or result == '0x':
+                logger.debug(f"Balance read failed for {key} on chain {chain_id}: {result}")
+                balances[key] = None
+            else:
+                balances[key] = int(result, 16)
+        return balances
+    
     async def monitor_wallet_transactions(
         self,
         wallet_address: str,
@@ -751,6 +818,9 @@ class WalletService:
         """
         Update all balances for a wallet.
         
+        The native balance and every tracked token balance on the primary
+        chain are refreshed with a single batched JSON-RPC request.
+        
         Args:
             wallet: Wallet instance to update
             
@@ -758,28 +828,56 @@ class WalletService:
             True if successful, False otherwise
         """
         try:
-            # Get native balance for primary chain
-            if self.web3_available:
-                balance = await self.get_wallet_balance(
-                    wallet.address,
-                    wallet.primary_chain_id
+            if not self.web3_available:
+                return False
+            
+            chain_id = wallet.primary_chain_id
+            token_rows = await sync_to_async(list)(
+                WalletBalance.objects.filter(wallet=wallet, chain_id=chain_id).exclude(token_address='ETH')
+            )
+            balances = await self.get_balances_batch(
+                wallet.address, chain_id, [row.token_address for row in token_rows]
+            )
+            now = timezone.now()
+            
+            for row in token_rows:
+                balance_wei = balances.get(row.token_address)
+                if balance_wei is None:
+                    row.is_stale = True
+                    row.update_error = "Balance read failed"
+                    continue
+                row.balance_wei = str(balance_wei)
+                row.balance_formatted = Decimal(balance_wei) / Decimal(10 ** row.token_decimals)
+                row.last_updated = now
+                row.is_stale = False
+                row.update_error = ''
+            
+            if token_rows:
+                await sync_to_async(WalletBalance.objects.bulk_update)(
+                    token_rows,
+                    ['balance_wei', 'balance_formatted', 'last_updated', 'is_stale', 'update_error']
                 )
-                
-                if balance is not None:
-                    # Update or create balance record
-                    await sync_to_async(WalletBalance.objects.update_or_create)(
-                        wallet=wallet,
-                        chain_id=wallet.primary_chain_id,
-                        token_address=None,  # Native token
-                        defaults={
-                            'balance': balance,
-                            'balance_usd': balance * Decimal('0')  # Would need price feed
-                        }
-                    )
-                    logger.info(f"Updated balance for wallet {wallet.address}")
-                    return True
             
-            return False
+            native_wei = balances.get('ETH')
+            if native_wei is None:
+                return False
+            
+            await sync_to_async(WalletBalance.objects.update_or_create)(
+                wallet=wallet,
+                chain_id=chain_id,
+                token_address='ETH',  # Native token
+                defaults={
+                    'token_symbol': 'ETH',
+                    'token_name': 'Ether',
+                    'balance_wei': str(native_wei),
+                    'balance_formatted': Decimal(native_wei) / Decimal(10 ** 18),
+                    'last_updated': now,
+                    'is_stale': False,
+                    'update_error': ''
+                }
+            )
+            logger.info(f"Updated {len(token_rows) + 1} balances for wallet {wallet.address}")
+            return True
             
         except Exception as e:
             logger.error(f"Failed to update wallet balances: {e}")